@@ -0,0 +1 @@
+var json_ADMIN_1_3 = {"type":"FeatureCollection","name":"ADMIN_1_3","features":[{"type":"Feature","properties":{"ADMIN_1":"Хмельницька область","COD_1":"UA68000000000099709"},"geometry":{"type":"LineString","coordinates":[[26.61686,48.45411],[26.56193,48.45685],[26.48778,48.54474],[26.44383,48.53925],[26.43284,48.54749],[26.40812,48.542],[26.3834,48.56397],[26.37517,48.54474],[26.35869,48.542],[26.36418,48.55848],[26.33671,48.56946],[26.36143,48.58594],[26.34221,48.58594],[26.32573,48.61066],[26.29277,48.62165],[26.32298,48.62714],[26.32023,48.63538],[26.28727,48.64087],[26.3065,48.65735],[26.27354,48.64637],[26.27629,48.67383],[26.24882,48.66834],[26.24608,48.68482],[26.22136,48.68482],[26.23784,48.69855],[26.2296,48.70679],[26.24333,48.737],[26.2241,48.75074],[26.24608,48.75348],[26.2296,48.76172],[26.23784,48.77546],[26.21586,48.78095],[26.20762,48.79743],[26.21586,48.80017],[26.23234,48.78919],[26.22685,48.81391],[26.25157,48.80841],[26.25706,48.81665],[26.24882,48.82215],[26.23509,48.8194],[26.22136,48.84687],[26.19938,48.85785],[26.21312,48.86609],[26.20488,48.8963],[26.2241,48.91004],[26.21312,48.91278],[26.19664,48.90454],[26.1829,48.91553],[26.19664,48.91828],[26.20762,48.95673],[26.17741,48.97321],[26.21312,48.98145],[26.17741,48.99518],[26.21586,49.00617],[26.19664,49.02539],[26.20762,49.03638],[26.1829,49.05835],[26.21586,49.07209],[26.19114,49.07758],[26.20488,49.13251],[26.19114,49.15723],[26.21037,49.16272],[26.1884,49.17371],[26.19664,49.1847],[26.1829,49.19568],[26.20762,49.23139],[26.20213,49.24512],[26.24333,49.24237],[26.24333,49.25611],[26.25706,49.26435],[26.24333,49.27808],[26.25706,49.27808],[26.24882,49.28632],[26.25981,49.28907],[26.22685,49.33026],[26.2296,49.34949],[26.24333,49.34674],[26.23234,49.35773],[26.24608,49.36872],[26.21861,49.37696],[26.23509,49.40168],[26.19389,49.42914],[26.19114,49.47858],[26.14171,49.50879],[26.17466,49.54999],[26.19114,49.55548],[26.20213,49.54724],[26.21861,49.54999],[26.19938,49.61042],[26.23234,49.63788],[26.26256,49.63788],[26.25981,49.65436],[26.27354,49.65711],[26.24333,49.69281],[26.19114,49.71479],[26.21312,49.73401],[26.24333,49.745],[26.24058,49.77521],[26.22685,49.7807],[26.21586,49.81092],[26.17741,49.84662],[26.20213,49.86585],[26.13347,49.89881],[26.13896,49.91254],[26.16642,49.92353],[26.14171,49.97296],[26.17192,49.99494],[26.20213,49.99219],[26.21037,50.01691],[26.17466,50.02515],[26.22685,50.04712],[26.22136,50.06086],[26.20213,50.06635],[26.19938,50.09656],[26.27354,50.10205],[26.27354,50.11304],[26.23509,50.13227],[26.24333,50.14325],[26.2241,50.14325],[26.20762,50.15424],[26.22136,50.17896],[26.23784,50.17347],[26.28727,50.18445],[26.32298,50.23114],[26.3889,50.2641],[26.43834,50.26136],[26.45756,50.2696],[26.46031,50.25861],[26.50151,50.26136],[26.49601,50.27509],[26.50425,50.28608],[26.51249,50.28058],[26.507,50.28608],[26.52348,50.29432],[26.52623,50.31079],[26.56193,50.31629],[26.55369,50.33002],[26.58665,50.33826],[26.60313,50.36847],[26.64708,50.36573],[26.65806,50.39319],[26.68278,50.39045],[26.69102,50.42066],[26.71299,50.41791],[26.71849,50.44538],[26.73771,50.44538],[26.73497,50.47834],[26.74595,50.47834],[26.74321,50.46186],[26.78715,50.46735],[26.7899,50.47559],[26.76243,50.4701],[26.76518,50.48932],[26.77891,50.50306],[26.81736,50.50306],[26.82835,50.52228],[26.85582,50.50855],[26.89976,50.547],[26.98216,50.52228],[27.01787,50.55799],[27.0728,50.54975],[27.06456,50.56073],[27.07829,50.58271],[27.10301,50.58271],[27.11674,50.59369],[27.13048,50.5882],[27.12224,50.57721],[27.13048,50.56073],[27.19639,50.56073],[27.20738,50.53052],[27.25956,50.51404],[27.2678,50.49207],[27.30076,50.49207],[27.24858,50.39319],[27.31999,50.36847],[27.3145,50.33277],[27.36393,50.33277],[27.41612,50.30805],[27.41887,50.29706],[27.39415,50.28882],[27.42161,50.27234],[27.44359,50.27509],[27.44359,50.26136],[27.48204,50.25586],[27.49028,50.23938],[27.52049,50.22565],[27.54246,50.24488],[27.59739,50.25861],[27.5919,50.21466],[27.60838,50.21466],[27.61113,50.19544],[27.62211,50.19818],[27.62211,50.17072],[27.64134,50.17347],[27.63585,50.1872],[27.66331,50.19269],[27.66057,50.17072],[27.67705,50.15699],[27.6331,50.146],[27.62486,50.12128],[27.63859,50.11579],[27.62486,50.11304],[27.63035,50.10205],[27.61662,50.08557],[27.66881,50.07734],[27.68254,50.03339],[27.65782,50.02515],[27.64134,50.03614],[27.61113,50.00592],[27.56993,50.01966],[27.54521,50.01142],[27.57542,49.94825],[27.54796,49.93451],[27.54796,49.9043],[27.56169,49.90155],[27.56718,49.90979],[27.59465,49.89057],[27.62486,49.89331],[27.61113,49.87683],[27.62761,49.84937],[27.62211,49.84113],[27.65782,49.79718],[27.66881,49.80817],[27.7155,49.80542],[27.72648,49.79993],[27.70451,49.76972],[27.74846,49.75598],[27.78142,49.72852],[27.81712,49.73401],[27.83635,49.72852],[27.80613,49.70929],[27.81163,49.70105],[27.76219,49.69831],[27.76494,49.66535],[27.81163,49.64338],[27.81163,49.61866],[27.80064,49.6214],[27.75944,49.57746],[27.7924,49.55274],[27.78416,49.5445],[27.79515,49.53077],[27.77318,49.51978],[27.74296,49.53077],[27.73472,49.49506],[27.7924,49.48682],[27.77592,49.47583],[27.76494,49.47858],[27.74571,49.45111],[27.7512,49.44013],[27.80613,49.44013],[27.82811,49.4209],[27.85283,49.4264],[27.8336,49.39069],[27.81163,49.38794],[27.82811,49.36872],[27.81163,49.36597],[27.85832,49.32752],[27.86107,49.28083],[27.85008,49.26435],[27.87205,49.24512],[27.85557,49.23688],[27.86656,49.21216],[27.89403,49.20942],[27.89952,49.18744],[27.85283,49.17096],[27.81437,49.19019],[27.7924,49.17646],[27.7924,49.1847],[27.77592,49.19019],[27.78142,49.17371],[27.7512,49.15998],[27.7567,49.15448],[27.74022,49.138],[27.72099,49.14624],[27.68528,49.14075],[27.64134,49.16822],[27.60289,49.16272],[27.59739,49.13526],[27.57817,49.12152],[27.53422,49.138],[27.53148,49.12427],[27.50676,49.13251],[27.49302,49.12152],[27.50676,49.11054],[27.47929,49.08857],[27.50401,49.06934],[27.44359,49.07209],[27.42711,49.05286],[27.41612,49.05561],[27.38041,49.00617],[27.41887,48.97046],[27.41612,48.95398],[27.40239,48.95124],[27.3914,48.9375],[27.39415,48.9018],[27.41612,48.88257],[27.41063,48.81116],[27.42711,48.79743],[27.40239,48.77271],[27.41063,48.76722],[27.38865,48.76447],[27.41612,48.73975],[27.39964,48.72876],[27.41337,48.69855],[27.38865,48.68207],[27.37217,48.62989],[27.35295,48.62989],[27.32274,48.60242],[27.28154,48.62165],[27.25682,48.62165],[27.24309,48.61066],[27.25956,48.58319],[27.25132,48.56946],[27.17167,48.58319],[27.08928,48.55848],[26.99589,48.57221],[26.98216,48.59143],[26.96568,48.5777],[26.92448,48.5777],[26.90251,48.55024],[26.88054,48.542],[26.84208,48.55848],[26.82011,48.58045],[26.82286,48.60517],[26.80089,48.60791],[26.77891,48.59143],[26.79539,48.56397],[26.77891,48.54749],[26.76243,48.55024],[26.7487,48.58045],[26.72673,48.58869],[26.72123,48.57495],[26.74321,48.55848],[26.72947,48.53376],[26.70201,48.5365],[26.66081,48.56122],[26.62236,48.55573],[26.62236,48.5365],[26.67454,48.53925],[26.71299,48.49805],[26.69652,48.48706],[26.66905,48.48432],[26.63334,48.50629],[26.61137,48.50629],[26.6251,48.46784],[26.61686,48.45411]]}},{"type":"Feature","properties":{"ADMIN_1":"Волинська область","COD_1":"UA07000000000024379"},"geometry":{"type":"MultiLineString","coordinates":[[[24.58714,50.49482],[24.59538,50.49756],[24.58714,50.50031],[24.58714,50.49482]],[[25.16667,50.33002],[25.13096,50.31903],[25.13096,50.31079],[25.10899,50.31354],[25.10075,50.29981],[25.11174,50.28608],[25.05681,50.29981],[25.05955,50.34101],[25.01561,50.34101],[24.94145,50.39045],[24.93046,50.37671],[24.93596,50.3465],[24.88652,50.34375],[24.88652,50.35749],[24.86729,50.36023],[24.85905,50.34925],[24.7794,50.33826],[24.71623,50.34375],[24.72172,50.37397],[24.70799,50.38495],[24.6558,50.40143],[24.65306,50.40967],[24.59538,50.41516],[24.59813,50.45636],[24.58165,50.45911],[24.59813,50.46735],[24.59813,50.47834],[24.58714,50.49207],[24.55418,50.49482],[24.55693,50.5113],[24.52946,50.55249],[24.48826,50.55524],[24.44981,50.53876],[24.40587,50.56073],[24.39763,50.57447],[24.41411,50.58545],[24.38115,50.61017],[24.36192,50.59644],[24.32347,50.59919],[24.31248,50.57172],[24.21361,50.59095],[24.20262,50.61292],[24.17241,50.61567],[24.16417,50.63214],[24.17241,50.63489],[24.15043,50.64588],[24.12022,50.64862],[24.11198,50.63764],[24.09825,50.63764],[24.07902,50.64313],[24.09001,50.65412],[24.08177,50.67334],[24.06254,50.67884],[24.07078,50.72004],[24.04332,50.71454],[24.01585,50.72278],[24.02409,50.75025],[24.0131,50.75574],[24.02409,50.76673],[23.98015,50.76947],[23.95817,50.79419],[23.98839,50.83814],[24.101,50.83539],[24.13395,50.84912],[24.14494,50.86835],[24.11473,50.8711],[24.08726,50.89032],[24.05156,50.89032],[23.97191,50.95075],[23.95817,50.9892],[23.9362,51.00568],[23.91423,51.00843],[23.9362,51.01392],[23.91697,51.02765],[23.93071,51.03864],[23.91148,51.04139],[23.91148,51.07434],[23.88402,51.08258],[23.87578,51.07709],[23.87028,51.09357],[23.85655,51.09906],[23.84831,51.12378],[23.87028,51.12928],[23.87028,51.14301],[23.86204,51.15674],[23.82359,51.16223],[23.80711,51.18421],[23.78514,51.1897],[23.75767,51.21167],[23.73845,51.21167],[23.72746,51.26111],[23.6945,51.28858],[23.64506,51.29132],[23.63682,51.32703],[23.65605,51.33802],[23.66429,51.36548],[23.68626,51.36823],[23.67802,51.37647],[23.68901,51.38745],[23.67802,51.39295],[23.70274,51.40393],[23.6945,51.41492],[23.70274,51.42041],[23.67802,51.42865],[23.68626,51.44513],[23.64781,51.44788],[23.64506,51.45887],[23.67528,51.4726],[23.66978,51.48084],[23.6588,51.49182],[23.63682,51.48633],[23.6176,51.50281],[23.66704,51.50006],[23.67802,51.50556],[23.63682,51.5495],[23.66154,51.56873],[23.66154,51.58521],[23.63133,51.59345],[23.60661,51.62091],[23.67802,51.65387],[23.70274,51.64838],[23.78239,51.66761],[23.78788,51.64014],[23.82634,51.64563],[23.90873,51.6319],[23.88127,51.60718],[23.88127,51.59345],[23.92796,51.59894],[23.99663,51.57972],[24.07628,51.61817],[24.12022,51.66761],[24.26854,51.71704],[24.32072,51.75],[24.296,51.80768],[24.3372,51.84613],[24.33995,51.86536],[24.38939,51.88184],[24.55967,51.89008],[24.62559,51.90381],[24.67228,51.89283],[24.71348,51.89557],[24.74919,51.88184],[24.80961,51.91205],[24.83433,51.91205],[24.84257,51.89557],[24.91398,51.91755],[24.93321,51.89008],[24.96342,51.89557],[24.98539,51.89008],[24.99913,51.89557],[24.99638,51.9148],[25.08153,51.94776],[25.14195,51.95325],[25.19139,51.96973],[25.22709,51.96149],[25.2628,51.96973],[25.34245,51.93128],[25.41111,51.92304],[25.46605,51.92029],[25.48802,51.93128],[25.50725,51.92304],[25.52647,51.93952],[25.59239,51.92304],[25.59514,51.9148],[25.62809,51.90381],[25.70775,51.89557],[25.63908,51.84888],[25.65007,51.81867],[25.63084,51.80494],[25.65831,51.78296],[25.65007,51.76648],[25.66929,51.77198],[25.68303,51.7555],[25.64183,51.68134],[25.60887,51.64014],[25.58964,51.64563],[25.57866,51.62366],[25.56767,51.6319],[25.52922,51.6319],[25.53196,51.61267],[25.55668,51.62366],[25.56492,51.60169],[25.57866,51.60993],[25.59788,51.57972],[25.59514,51.56324],[25.56492,51.53852],[25.59514,51.52478],[25.55119,51.51929],[25.55668,51.50006],[25.61162,51.5083],[25.60338,51.49457],[25.6226,51.49457],[25.61711,51.47809],[25.64183,51.47809],[25.63633,51.43964],[25.64732,51.41767],[25.67204,51.41767],[25.68852,51.40668],[25.705,51.38471],[25.69127,51.38471],[25.69401,51.37647],[25.72423,51.38196],[25.72423,51.40119],[25.75993,51.40119],[25.75444,51.38196],[25.7819,51.37372],[25.80662,51.37372],[25.83134,51.38745],[25.84507,51.37647],[25.82585,51.36823],[25.83409,51.36274],[25.82036,51.34626],[25.83409,51.32978],[25.86979,51.31879],[25.88902,51.29407],[25.90001,51.29956],[25.89177,51.29132],[25.93571,51.27484],[25.9467,51.23365],[25.99614,51.22815],[26.06205,51.18146],[26.06755,51.1485],[26.00438,51.12378],[25.94121,51.11829],[25.94395,51.08533],[25.9824,51.07709],[26.01811,51.08258],[26.08677,51.05237],[26.106,51.00568],[26.08677,51.00293],[26.08403,50.97272],[25.96592,50.95624],[26.00163,50.93427],[25.99064,50.8656],[26.01262,50.8656],[26.04008,50.84088],[26.02086,50.82166],[25.90001,50.8299],[25.87254,50.73926],[25.87803,50.70905],[25.86979,50.68708],[25.8231,50.64588],[25.84507,50.63214],[25.8286,50.61841],[25.79289,50.66785],[25.77366,50.67609],[25.70775,50.6706],[25.72148,50.68433],[25.69676,50.70356],[25.69401,50.72553],[25.60612,50.71729],[25.59788,50.71454],[25.60063,50.69532],[25.57866,50.70081],[25.47429,50.67334],[25.46879,50.67884],[25.46055,50.66236],[25.40562,50.66785],[25.37816,50.68982],[25.3864,50.65686],[25.35344,50.64862],[25.35069,50.64038],[25.3864,50.6294],[25.40013,50.61017],[25.32872,50.61292],[25.31224,50.6294],[25.29301,50.6294],[25.30125,50.57996],[25.31773,50.58271],[25.32048,50.56897],[25.29576,50.53876],[25.25731,50.53327],[25.19139,50.54151],[25.19139,50.55249],[25.12272,50.55249],[25.12272,50.52777],[25.15843,50.5058],[25.15019,50.46735],[25.08427,50.47559],[25.1392,50.46186],[25.15294,50.44263],[25.1392,50.4289],[25.15843,50.4289],[25.16942,50.39594],[25.19688,50.39319],[25.21061,50.38221],[25.19413,50.36298],[25.17766,50.36298],[25.16942,50.37946],[25.14195,50.36847],[25.1447,50.34375],[25.16667,50.33002]]]}},{"type":"Feature","properties":{"ADMIN_1":"Миколаївська область","COD_1":"UA48000000000039575"},"geometry":{"type":"MultiLineString","coordinates":[[[31.4124,46.60291],[31.4124,46.59467],[31.4069,46.60016],[31.4124,46.60291]],[[31.90129,46.55072],[31.86284,46.52326],[31.8491,46.50129],[31.81889,46.49579],[31.80516,46.47931],[31.73924,46.48755],[31.69804,46.46558],[31.69529,46.44635],[31.75847,46.39692],[31.77769,46.36945],[31.7722,46.36396],[31.6486,46.47931],[31.52501,46.56171],[31.51402,46.58094],[31.54973,46.60016],[31.51951,46.61664],[31.48106,46.62763],[31.42888,46.62488],[31.42338,46.63037],[31.40965,46.61939],[31.3657,46.62213],[31.34923,46.60016],[31.28605,46.61115],[31.24211,46.61115],[31.17619,46.62763],[31.1707,46.65509],[31.18718,46.65784],[31.17894,46.70728],[31.15971,46.71827],[31.15147,46.74024],[31.1652,46.7732],[31.15147,46.79792],[31.15696,46.83088],[31.10478,46.84735],[31.0883,46.88581],[31.03886,46.89954],[31.01689,46.96546],[31.09105,46.9737],[31.0883,46.98194],[31.13774,46.99018],[31.14049,46.97919],[31.24486,46.99018],[31.22838,47.02039],[31.29155,47.02314],[31.29429,47.04511],[31.30528,47.04786],[31.29429,47.08081],[31.30253,47.08356],[31.26957,47.17145],[31.25035,47.1687],[31.2476,47.17694],[31.20091,47.17145],[31.19816,47.15497],[31.11027,47.15497],[31.11027,47.18793],[31.11851,47.18793],[31.12401,47.17694],[31.15696,47.17969],[31.14598,47.21814],[31.17894,47.22364],[31.1707,47.26484],[31.01964,47.24012],[31.00865,47.27033],[30.98668,47.26758],[30.99217,47.28955],[30.90703,47.27582],[30.89329,47.31977],[30.87407,47.31702],[30.86583,47.3335],[30.90977,47.34449],[30.89879,47.36097],[30.88505,47.35822],[30.87407,47.39942],[30.89329,47.40216],[30.8878,47.42688],[30.85209,47.42139],[30.84935,47.44336],[30.86583,47.44336],[30.85209,47.50379],[30.88231,47.50653],[30.87681,47.54499],[30.83287,47.53675],[30.82737,47.55048],[30.77244,47.54499],[30.7697,47.55323],[30.75596,47.55048],[30.74498,47.57795],[30.77794,47.58344],[30.77244,47.62189],[30.79167,47.63562],[30.78892,47.64936],[30.70927,47.63837],[30.72026,47.60816],[30.65983,47.59992],[30.66533,47.63288],[30.61863,47.62464],[30.61314,47.63562],[30.47032,47.61914],[30.46483,47.64112],[30.42088,47.63288],[30.38792,47.75373],[30.42363,47.76197],[30.41539,47.78669],[30.44011,47.78943],[30.43736,47.80042],[30.42363,47.82239],[30.33024,47.80866],[30.29728,47.92401],[30.30827,47.92951],[30.2451,47.96796],[30.25059,47.98169],[30.22587,48.01191],[30.25883,48.02015],[30.25609,48.02838],[30.23411,48.06134],[30.22587,48.05585],[30.20665,48.06684],[30.23411,48.07233],[30.24785,48.08881],[30.28355,48.08606],[30.28904,48.09705],[30.32475,48.0943],[30.31376,48.10529],[30.3275,48.09705],[30.35771,48.10254],[30.35771,48.11353],[30.31376,48.11628],[30.30827,48.14374],[30.3275,48.14649],[30.3275,48.16022],[30.3687,48.17395],[30.41264,48.16297],[30.43736,48.17395],[30.46757,48.16297],[30.49504,48.17121],[30.50602,48.15747],[30.528,48.17945],[30.55546,48.15473],[30.61589,48.15747],[30.62138,48.16571],[30.65709,48.17121],[30.6461,48.18494],[30.71751,48.19593],[30.72026,48.18769],[30.78618,48.19043],[30.79167,48.16846],[30.81364,48.16846],[30.81913,48.18769],[30.84935,48.18494],[30.85484,48.16022],[30.90153,48.16022],[30.93174,48.16571],[30.93174,48.18494],[30.98942,48.18494],[30.98118,48.22339],[31.05259,48.23163],[31.05534,48.22065],[31.13774,48.22889],[31.14049,48.22065],[31.16246,48.22339],[31.19267,48.19318],[31.18168,48.17945],[31.20091,48.16846],[31.22014,48.17121],[31.23662,48.11628],[31.32451,48.13825],[31.33,48.11353],[31.36845,48.11902],[31.37944,48.13275],[31.39592,48.10804],[31.42064,48.11078],[31.41789,48.12177],[31.48655,48.13001],[31.49754,48.08606],[31.47557,48.08332],[31.47007,48.06409],[31.4893,48.06409],[31.49205,48.05036],[31.50853,48.05585],[31.50853,48.06958],[31.54973,48.06958],[31.54149,48.10804],[31.55797,48.11078],[31.56895,48.09705],[31.58543,48.10529],[31.58268,48.13001],[31.63487,48.1355],[31.64311,48.11628],[31.68431,48.11902],[31.69529,48.0943],[31.76671,48.10254],[31.78319,48.04212],[31.72825,48.03662],[31.75297,47.94324],[31.78044,47.95972],[31.84361,47.96247],[31.8546,47.91578],[31.87657,47.91852],[31.8903,47.86634],[31.85734,47.86359],[31.8546,47.84711],[31.86833,47.82239],[31.82713,47.8169],[31.83537,47.79218],[31.83812,47.78119],[31.96171,47.79767],[31.95897,47.80866],[32.0551,47.8169],[32.06059,47.80317],[32.07707,47.80591],[32.0908,47.78119],[32.11003,47.78394],[32.11827,47.75647],[32.13475,47.75922],[32.14024,47.74823],[32.15397,47.76197],[32.15947,47.75098],[32.23088,47.75922],[32.22264,47.79218],[32.23912,47.79493],[32.23637,47.81415],[32.30504,47.82514],[32.36271,47.78943],[32.39567,47.80042],[32.40117,47.79493],[32.42314,47.80042],[32.42863,47.78943],[32.62364,47.81415],[32.6566,47.81964],[32.67857,47.8526],[32.66484,47.87183],[32.68681,47.87183],[32.67582,47.90754],[32.6566,47.90479],[32.65111,47.92127],[32.74449,47.93225],[32.73625,47.95148],[32.6978,47.94599],[32.68956,47.98169],[32.78569,47.99268],[32.81041,47.9762],[32.89555,47.98444],[32.87083,48.03113],[32.91478,48.03113],[32.91203,48.03662],[32.94499,48.04212],[32.95323,48.03662],[32.99168,48.04761],[33.00541,47.98993],[32.99443,47.97345],[33.00816,47.93775],[32.99168,47.935],[33.00541,47.91303],[33.07957,47.92127],[33.08507,47.88556],[33.06859,47.88282],[33.08232,47.83338],[33.0576,47.83063],[33.06859,47.78394],[33.04936,47.78119],[33.07133,47.73999],[32.97246,47.72351],[32.99717,47.6164],[32.95872,47.59442],[33.09605,47.59717],[33.0933,47.57795],[33.09605,47.52576],[33.14,47.54224],[33.14824,47.51477],[33.12352,47.50928],[33.13725,47.41864],[33.07133,47.41315],[33.07133,47.47632],[33.04661,47.46808],[33.05485,47.44336],[33.03288,47.44062],[33.03837,47.42414],[33.02739,47.42414],[33.03837,47.38019],[33.12077,47.38843],[33.14,47.32526],[33.10154,47.31977],[33.10429,47.27857],[33.14,47.27307],[33.18394,47.23737],[33.12626,47.23188],[33.14274,47.2099],[33.13176,47.20441],[33.11528,47.20441],[33.09605,47.22364],[33.06584,47.22089],[33.06584,47.19892],[33.03837,47.18793],[33.03837,47.17969],[33.0164,47.17969],[33.00541,47.19617],[32.99992,47.19068],[32.96147,47.19068],[32.95048,47.16321],[32.8983,47.11377],[32.91478,47.10553],[32.91478,47.08631],[33.02739,47.03962],[33.05211,47.06983],[33.07408,47.06159],[33.10154,47.10004],[33.08232,47.10828],[33.10429,47.13575],[33.15648,47.11652],[33.02189,46.9737],[32.95048,47.00391],[32.934,46.98468],[32.94774,46.94623],[32.9752,46.94898],[32.98069,46.9325],[32.92302,46.92701],[32.92576,46.91053],[32.84062,46.89954],[32.83787,46.88306],[32.84611,46.88031],[32.91752,46.88306],[32.92027,46.86658],[32.94499,46.86933],[32.95048,46.85834],[32.81315,46.83911],[32.7747,46.83088],[32.76646,46.81989],[32.76371,46.82813],[32.70054,46.81989],[32.68681,46.86109],[32.58519,46.85559],[32.57145,46.87207],[32.54674,46.86933],[32.54948,46.88306],[32.54124,46.88306],[32.54124,46.8501],[32.52476,46.84735],[32.53026,46.82264],[32.46983,46.81714],[32.46434,46.84186],[32.36546,46.82813],[32.3737,46.80066],[32.34074,46.79517],[32.22813,46.84461],[32.24736,46.82264],[32.20891,46.80616],[32.21989,46.77045],[32.17045,46.76221],[32.1732,46.75122],[32.05784,46.74573],[32.06059,46.72925],[32.07432,46.72925],[32.08806,46.68256],[32.00566,46.67707],[32.0084,46.66608],[31.98643,46.66333],[31.93974,46.62488],[31.9315,46.58094],[31.90129,46.55072]]]}},{"type":"Feature","properties":{"ADMIN_1":"Рівненська область","COD_1":"UA56000000000066151"},"geometry":{"type":"LineString","coordinates":[[25.44957,50.12952],[25.45506,50.11579],[25.48527,50.11304],[25.48802,50.10205],[25.45506,50.09381],[25.45781,50.08283],[25.43858,50.07184],[25.43034,50.05262],[25.36442,50.04712],[25.34794,50.00318],[25.32048,50.01691],[25.19688,50.13227],[25.20237,50.16797],[25.21611,50.17896],[25.16667,50.20917],[25.19139,50.24762],[25.20787,50.24762],[25.20512,50.28058],[25.16392,50.29157],[25.12822,50.28333],[25.11174,50.28608],[25.10075,50.29981],[25.10899,50.31354],[25.13096,50.31079],[25.13096,50.31903],[25.16667,50.33002],[25.1447,50.34375],[25.14195,50.36847],[25.16942,50.37946],[25.17766,50.36298],[25.19413,50.36298],[25.21061,50.38221],[25.19688,50.39319],[25.16942,50.39594],[25.15843,50.4289],[25.1392,50.4289],[25.15294,50.44263],[25.1392,50.46186],[25.08427,50.47559],[25.15019,50.46735],[25.15843,50.5058],[25.12272,50.52777],[25.12272,50.55249],[25.19139,50.55249],[25.19139,50.54151],[25.25731,50.53327],[25.29576,50.53876],[25.32048,50.56897],[25.31773,50.58271],[25.30125,50.57996],[25.29301,50.6294],[25.31224,50.6294],[25.32872,50.61292],[25.40013,50.61017],[25.3864,50.6294],[25.35069,50.64038],[25.35344,50.64862],[25.3864,50.65686],[25.37816,50.68982],[25.40562,50.66785],[25.46055,50.66236],[25.46879,50.67884],[25.47429,50.67334],[25.57866,50.70081],[25.60063,50.69532],[25.59788,50.71454],[25.60612,50.71729],[25.69401,50.72553],[25.69676,50.70356],[25.72148,50.68433],[25.70775,50.6706],[25.77366,50.67609],[25.79289,50.66785],[25.8286,50.61841],[25.84507,50.63214],[25.8231,50.64588],[25.86979,50.68708],[25.87803,50.70905],[25.87254,50.73926],[25.90001,50.8299],[26.02086,50.82166],[26.04008,50.84088],[26.01262,50.8656],[25.99064,50.8656],[26.00163,50.93427],[25.96592,50.95624],[26.08403,50.97272],[26.08677,51.00293],[26.106,51.00568],[26.08677,51.05237],[26.01811,51.08258],[25.9824,51.07709],[25.94395,51.08533],[25.94121,51.11829],[26.00438,51.12378],[26.06755,51.1485],[26.06205,51.18146],[25.99614,51.22815],[25.9467,51.23365],[25.93571,51.27484],[25.89177,51.29132],[25.90001,51.29956],[25.88902,51.29407],[25.86979,51.31879],[25.83409,51.32978],[25.82036,51.34626],[25.83409,51.36274],[25.82585,51.36823],[25.84507,51.37647],[25.83134,51.38745],[25.80662,51.37372],[25.7819,51.37372],[25.75444,51.38196],[25.75993,51.40119],[25.72423,51.40119],[25.72423,51.38196],[25.69401,51.37647],[25.69127,51.38471],[25.705,51.38471],[25.68852,51.40668],[25.67204,51.41767],[25.64732,51.41767],[25.63633,51.43964],[25.64183,51.47809],[25.61711,51.47809],[25.6226,51.49457],[25.60338,51.49457],[25.61162,51.5083],[25.55668,51.50006],[25.55119,51.51929],[25.59514,51.52478],[25.56492,51.53852],[25.59514,51.56324],[25.59788,51.57972],[25.57866,51.60993],[25.56492,51.60169],[25.55668,51.62366],[25.53196,51.61267],[25.52922,51.6319],[25.56767,51.6319],[25.57866,51.62366],[25.58964,51.64563],[25.60887,51.64014],[25.64183,51.68134],[25.68303,51.7555],[25.66929,51.77198],[25.65007,51.76648],[25.65831,51.78296],[25.63084,51.80494],[25.65007,51.81867],[25.63908,51.84888],[25.70775,51.89557],[25.62809,51.90381],[25.59514,51.9148],[25.59239,51.92304],[25.70775,51.9148],[25.77916,51.92029],[25.76542,51.9505],[25.7819,51.9505],[25.8231,51.94226],[25.81761,51.92853],[25.8286,51.92304],[25.92747,51.9148],[25.9879,51.93128],[26.04008,51.92578],[26.04832,51.9148],[26.09501,51.91205],[26.14171,51.8736],[26.15819,51.87635],[26.15544,51.86536],[26.27629,51.87085],[26.30375,51.85987],[26.37242,51.86261],[26.39439,51.87909],[26.39439,51.8324],[26.42735,51.8324],[26.43834,51.81867],[26.4658,51.81317],[26.4658,51.79944],[26.54545,51.7967],[26.55095,51.81317],[26.5894,51.82141],[26.59215,51.82965],[26.69102,51.82416],[26.7075,51.81043],[26.72947,51.81592],[26.75145,51.80494],[26.75419,51.77198],[26.79265,51.76374],[26.7899,51.75824],[26.84758,51.76648],[26.87504,51.75],[26.9492,51.73627],[26.98216,51.76099],[26.99315,51.75824],[26.99864,51.77198],[27.20189,51.77472],[27.20738,51.65937],[27.25407,51.66761],[27.27604,51.65387],[27.24034,51.60169],[27.34196,51.60718],[27.35844,51.61542],[27.39415,51.60443],[27.48753,51.60993],[27.47929,51.59619],[27.49852,51.58796],[27.52049,51.60718],[27.50676,51.62641],[27.51774,51.63739],[27.53422,51.62366],[27.54521,51.63739],[27.62211,51.60443],[27.64958,51.61542],[27.68254,51.60993],[27.72374,51.60169],[27.72923,51.5907],[27.72099,51.56049],[27.67705,51.53852],[27.67705,51.51929],[27.66331,51.51654],[27.66881,51.49732],[27.64958,51.50281],[27.62486,51.48359],[27.57817,51.47809],[27.58366,51.42865],[27.60014,51.4314],[27.61387,51.40393],[27.58366,51.40119],[27.53697,51.42865],[27.52598,51.44239],[27.53422,51.45337],[27.50401,51.45337],[27.49577,51.37372],[27.52598,51.36548],[27.52873,51.3545],[27.49028,51.31604],[27.44084,51.31055],[27.46007,51.26386],[27.44633,51.25562],[27.4738,51.23639],[27.39964,51.20069],[27.39689,51.17047],[27.36393,51.14301],[27.36668,51.09632],[27.32274,51.07984],[27.32548,51.04139],[27.22111,51.0304],[27.22661,51.00843],[27.19914,51.00019],[27.22386,50.95349],[27.23759,50.94525],[27.21562,50.92054],[27.25682,50.89582],[27.2321,50.83539],[27.24309,50.8299],[27.2321,50.79694],[27.24309,50.79145],[27.24309,50.76947],[27.27055,50.76398],[27.26231,50.74475],[27.2733,50.72553],[27.24583,50.67334],[27.20463,50.6651],[27.21287,50.64038],[27.18815,50.62116],[27.22386,50.60468],[27.21562,50.5882],[27.2321,50.56623],[27.19639,50.56073],[27.13048,50.56073],[27.12224,50.57721],[27.13048,50.5882],[27.11674,50.59369],[27.10301,50.58271],[27.07829,50.58271],[27.06456,50.56073],[27.0728,50.54975],[27.01787,50.55799],[26.98216,50.52228],[26.89976,50.547],[26.85582,50.50855],[26.82835,50.52228],[26.81736,50.50306],[26.77891,50.50306],[26.76518,50.48932],[26.76243,50.4701],[26.7899,50.47559],[26.78715,50.46735],[26.74321,50.46186],[26.74595,50.47834],[26.73497,50.47834],[26.73771,50.44538],[26.71849,50.44538],[26.71299,50.41791],[26.69102,50.42066],[26.68278,50.39045],[26.65806,50.39319],[26.64708,50.36573],[26.60313,50.36847],[26.58665,50.33826],[26.55369,50.33002],[26.56193,50.31629],[26.52623,50.31079],[26.52348,50.29432],[26.507,50.28608],[26.51249,50.28058],[26.50425,50.28608],[26.49601,50.27509],[26.50151,50.26136],[26.46031,50.25861],[26.45756,50.2696],[26.43834,50.26136],[26.3889,50.2641],[26.32298,50.23114],[26.28727,50.18445],[26.23784,50.17347],[26.22136,50.17896],[26.18016,50.19818],[26.18565,50.2284],[26.21312,50.23114],[26.22136,50.26685],[26.19114,50.2641],[26.16368,50.23114],[26.0648,50.25861],[26.00987,50.2284],[25.96318,50.25586],[25.93571,50.25586],[25.87803,50.22016],[25.85881,50.19269],[25.8231,50.18171],[25.76268,50.17896],[25.72972,50.1872],[25.72148,50.17347],[25.68577,50.17621],[25.62535,50.15149],[25.57591,50.17621],[25.55394,50.15149],[25.47703,50.16523],[25.44957,50.15149],[25.44957,50.12952]]}},{"type":"Feature","properties":{"ADMIN_1":"Львівська область","COD_1":"UA46000000000026241"},"geometry":{"type":"MultiLineString","coordinates":[[[24.58714,50.49482],[24.58714,50.50031],[24.59538,50.49756],[24.58714,50.49482]],[[24.27952,49.28357],[24.27952,49.28357]],[[24.28502,49.28907],[24.28502,49.28907]],[[23.98289,49.13526],[23.96916,49.138],[23.93345,49.12152],[23.90324,49.09955],[23.82908,49.11328],[23.80162,49.10505],[23.78514,49.11878],[23.77415,49.11328],[23.75767,49.12152],[23.72471,49.09681],[23.71098,49.1023],[23.69175,49.09681],[23.67253,49.03638],[23.64781,49.02265],[23.63682,49.03089],[23.62309,49.02539],[23.62309,49.01441],[23.56541,48.97321],[23.58464,48.95673],[23.56267,48.91004],[23.5764,48.88807],[23.60661,48.88257],[23.60661,48.87708],[23.5764,48.86609],[23.57365,48.84687],[23.55168,48.82215],[23.57914,48.78369],[23.54619,48.72602],[23.51048,48.73426],[23.47203,48.71778],[23.39787,48.73151],[23.36216,48.76996],[23.32646,48.75348],[23.28526,48.77546],[23.26878,48.76172],[23.20286,48.75898],[23.16716,48.81665],[23.1342,48.83313],[23.13145,48.85236],[23.09575,48.86335],[23.05729,48.84687],[23.02159,48.84687],[22.99962,48.83039],[22.98588,48.83588],[22.9694,48.87433],[22.89799,48.90454],[22.87877,48.93201],[22.87327,48.95673],[22.91996,48.97046],[22.91447,48.98969],[22.88975,49.00617],[22.8925,49.0199],[22.87327,49.03089],[22.88151,49.03638],[22.86778,49.03913],[22.87327,49.05561],[22.86503,49.06659],[22.8925,49.09406],[22.86229,49.09955],[22.8513,49.11603],[22.83207,49.11054],[22.81559,49.12976],[22.79362,49.138],[22.78813,49.15723],[22.73869,49.15723],[22.75517,49.18195],[22.7332,49.18195],[22.71946,49.16547],[22.70848,49.17371],[22.74693,49.21491],[22.71397,49.22589],[22.72221,49.24237],[22.73869,49.24787],[22.74693,49.36322],[22.69749,49.49506],[22.65904,49.5033],[22.63981,49.53077],[22.67552,49.54999],[22.69749,49.58295],[22.78264,49.65711],[22.80461,49.69281],[22.84855,49.70929],[22.89799,49.75049],[22.90074,49.76697],[22.96116,49.80542],[22.9694,49.83838],[22.99687,49.84113],[23.09025,49.92078],[23.11497,49.95649],[23.21385,50.03064],[23.2166,50.04712],[23.27977,50.08557],[23.27977,50.09931],[23.31273,50.11304],[23.46928,50.21741],[23.58189,50.26685],[23.63957,50.31903],[23.68626,50.33277],[23.70823,50.37946],[23.80436,50.40418],[23.99663,50.41242],[24.00486,50.43439],[24.03508,50.44538],[24.07078,50.50306],[24.09276,50.56073],[24.09825,50.63764],[24.11198,50.63764],[24.12022,50.64862],[24.15043,50.64588],[24.17241,50.63489],[24.16417,50.63214],[24.17241,50.61567],[24.20262,50.61292],[24.21361,50.59095],[24.31248,50.57172],[24.32347,50.59919],[24.36192,50.59644],[24.38115,50.61017],[24.41411,50.58545],[24.39763,50.57447],[24.40587,50.56073],[24.44981,50.53876],[24.48826,50.55524],[24.52946,50.55249],[24.55693,50.5113],[24.55418,50.49482],[24.58714,50.49207],[24.59813,50.47834],[24.59813,50.46735],[24.58165,50.45911],[24.59813,50.45636],[24.59538,50.41516],[24.65306,50.40967],[24.6558,50.40143],[24.70799,50.38495],[24.72172,50.37397],[24.71623,50.34375],[24.7794,50.33826],[24.85905,50.34925],[24.86729,50.36023],[24.88652,50.35749],[24.88652,50.34375],[24.93596,50.3465],[24.93046,50.37671],[24.94145,50.39045],[25.01561,50.34101],[25.05955,50.34101],[25.05681,50.29981],[25.11174,50.28608],[25.12822,50.28333],[25.16392,50.29157],[25.20512,50.28058],[25.20787,50.24762],[25.19139,50.24762],[25.16667,50.20917],[25.21611,50.17896],[25.20237,50.16797],[25.19688,50.13227],[25.32048,50.01691],[25.34794,50.00318],[25.40288,49.9867],[25.41111,49.97022],[25.40288,49.94825],[25.42759,49.94275],[25.42759,49.93726],[25.3864,49.93177],[25.37541,49.91254],[25.38914,49.89606],[25.37541,49.86859],[25.29851,49.85486],[25.28752,49.8274],[25.25731,49.83838],[25.23808,49.82465],[25.17491,49.83838],[25.15019,49.83289],[25.13646,49.81366],[25.08427,49.8274],[25.08976,49.78345],[25.07329,49.76972],[25.1035,49.75598],[25.11174,49.74225],[25.06779,49.71204],[25.0211,49.73401],[24.99638,49.69556],[24.98814,49.64338],[24.98265,49.63788],[24.96068,49.64338],[24.95518,49.61591],[24.93321,49.61591],[24.94145,49.61042],[24.903,49.61316],[24.90574,49.59668],[24.87004,49.61042],[24.86455,49.59943],[24.83433,49.59943],[24.83433,49.5857],[24.82884,49.59394],[24.80137,49.58844],[24.79039,49.57196],[24.72172,49.56922],[24.72172,49.49781],[24.69975,49.49231],[24.6558,49.50605],[24.63933,49.49781],[24.57066,49.53351],[24.50474,49.51429],[24.48826,49.54724],[24.44981,49.5445],[24.43333,49.53626],[24.43882,49.51154],[24.40037,49.49506],[24.41685,49.47309],[24.41136,49.44562],[24.35917,49.43189],[24.37291,49.42914],[24.37565,49.41266],[24.38939,49.40992],[24.38664,49.39618],[24.40587,49.39344],[24.43059,49.37421],[24.40037,49.36322],[24.40037,49.33576],[24.38115,49.30829],[24.35917,49.32203],[24.34269,49.31104],[24.3015,49.31653],[24.29875,49.29456],[24.30424,49.27808],[24.33995,49.29181],[24.36467,49.28083],[24.33995,49.24237],[24.35917,49.23413],[24.44706,49.23139],[24.43333,49.21765],[24.43608,49.17371],[24.41685,49.16822],[24.38389,49.19019],[24.35643,49.1847],[24.28227,49.16822],[24.23558,49.1435],[24.20811,49.14899],[24.19713,49.138],[24.21361,49.13251],[24.17241,49.1435],[24.16417,49.12702],[24.13945,49.1435],[24.08452,49.14899],[24.0598,49.14624],[24.02134,49.11603],[23.98289,49.13526]]]}},{"type":"Feature","properties":{"ADMIN_1":"Дніпропетровська область","COD_1":"UA12000000000090473"},"geometry":{"type":"MultiLineString","coordinates":[[[36.58421,47.84711],[36.47435,47.82514],[36.32329,47.83887],[36.33427,47.81964],[36.27659,47.8169],[36.26561,47.83338],[36.1887,47.83612],[36.1942,47.8581],[36.17772,47.8581],[36.17772,47.84986],[36.10081,47.84162],[36.10081,47.84986],[36.07335,47.84711],[36.05412,47.88007],[36.08159,47.88282],[36.08708,47.86084],[36.12004,47.86359],[36.13652,47.8938],[36.12278,47.8993],[36.10905,47.94049],[36.08433,47.92951],[36.07335,47.96521],[36.05137,47.95972],[36.04863,47.96521],[36.0706,47.97071],[36.06236,48.00092],[36.04039,48.00367],[36.03489,48.0174],[36.06511,48.02564],[36.05137,48.0586],[35.97447,48.04212],[35.9882,48.0586],[35.97447,48.0586],[35.96898,48.07508],[35.98546,48.08606],[35.96623,48.0943],[35.81517,48.06684],[35.80693,48.0998],[35.74376,48.0943],[35.70256,48.14099],[35.52403,48.07508],[35.5103,48.09705],[35.42241,48.0998],[35.41691,48.11078],[35.34001,48.12452],[35.29332,48.14374],[35.24388,48.1355],[35.19719,48.14099],[35.15873,48.12726],[35.09831,48.13001],[35.05711,48.11902],[35.03788,48.09705],[34.98845,48.08881],[34.9857,48.09705],[34.91429,48.09156],[34.91704,48.13001],[34.85386,48.13275],[34.87584,48.05585],[34.84013,48.05036],[34.84562,48.01465],[34.85936,48.01465],[34.87034,47.98169],[34.9033,47.98719],[34.91704,47.93225],[34.88133,47.92951],[34.87584,47.94324],[34.84837,47.93775],[34.85112,47.92127],[34.80168,47.91578],[34.81541,47.86359],[34.8621,47.88007],[34.87034,47.84986],[34.89781,47.8526],[34.9033,47.83063],[34.87858,47.8169],[34.89232,47.75922],[34.95823,47.77021],[34.95549,47.71253],[34.93077,47.71253],[34.93901,47.67682],[34.90605,47.67408],[34.91704,47.63288],[34.93351,47.63562],[34.94175,47.60266],[34.93351,47.59168],[34.92528,47.59442],[34.93626,47.58344],[34.92802,47.58069],[34.9445,47.5752],[34.93626,47.56971],[34.95274,47.57245],[34.95823,47.56421],[34.92253,47.55597],[34.96098,47.56147],[34.95823,47.53949],[34.92802,47.52576],[34.8621,47.51477],[34.79893,47.53675],[34.73851,47.53949],[34.64787,47.55872],[34.57646,47.56147],[34.46934,47.53125],[34.29905,47.51752],[34.22764,47.4928],[34.13975,47.47632],[34.17546,47.46808],[33.95299,47.4571],[33.93651,47.51752],[33.64262,47.48456],[33.63713,47.51477],[33.58769,47.50104],[33.57945,47.53125],[33.58769,47.55872],[33.60966,47.56147],[33.57945,47.59992],[33.47233,47.58619],[33.48607,47.54499],[33.32402,47.52301],[33.34874,47.4928],[33.31578,47.48182],[33.31028,47.50104],[33.28007,47.51752],[33.28282,47.54499],[33.24162,47.53125],[33.2169,47.534],[33.23338,47.57795],[33.17021,47.56696],[33.0933,47.57795],[33.09605,47.59717],[32.95872,47.59442],[32.99717,47.6164],[32.97246,47.72351],[33.07133,47.73999],[33.04936,47.78119],[33.06859,47.78394],[33.0576,47.83063],[33.08232,47.83338],[33.06859,47.88282],[33.08507,47.88556],[33.07957,47.92127],[33.00541,47.91303],[32.99168,47.935],[33.00816,47.93775],[32.99443,47.97345],[33.00541,47.98993],[33.02189,47.98444],[33.03563,48.03388],[33.10704,48.04212],[33.10978,48.06134],[33.14274,48.06409],[33.15373,48.04212],[33.14274,48.07782],[33.22514,48.09156],[33.22239,48.10529],[33.23613,48.11353],[33.18394,48.10529],[33.1812,48.11902],[33.23338,48.12726],[33.21141,48.17121],[33.24437,48.17395],[33.24711,48.15198],[33.27183,48.15473],[33.27733,48.10254],[33.29381,48.10254],[33.31578,48.12452],[33.29106,48.14923],[33.43113,48.17121],[33.43113,48.18769],[33.49705,48.20142],[33.49705,48.21241],[33.48607,48.21515],[33.49705,48.2179],[33.4998,48.23163],[33.51353,48.23163],[33.51079,48.2179],[33.54649,48.23438],[33.53001,48.27558],[33.51353,48.27832],[33.51628,48.32776],[33.47508,48.32776],[33.47783,48.34973],[33.46135,48.34973],[33.47233,48.36896],[33.46959,48.38819],[33.49705,48.39368],[33.48607,48.40467],[33.47233,48.54474],[33.48332,48.54749],[33.48057,48.55848],[33.51079,48.55848],[33.51079,48.56946],[33.58494,48.57495],[33.59044,48.55848],[33.6234,48.56671],[33.60966,48.59967],[33.65086,48.59967],[33.66185,48.58594],[33.71403,48.61066],[33.74424,48.61615],[33.76347,48.62714],[33.75523,48.65735],[33.80192,48.66285],[33.80467,48.68756],[33.74974,48.68207],[33.74699,48.69306],[33.73051,48.69306],[33.68107,48.72327],[33.6179,48.72876],[33.60692,48.75074],[33.58494,48.75348],[33.5822,48.79743],[33.60142,48.79743],[33.6179,48.78644],[33.65635,48.79193],[33.67283,48.81391],[33.68931,48.80841],[33.71678,48.81391],[33.72502,48.78919],[33.76896,48.80017],[33.77171,48.79193],[33.79368,48.79468],[33.81016,48.80292],[33.8184,48.77546],[33.85136,48.76996],[33.84861,48.80292],[33.89805,48.9018],[33.92552,48.88257],[34.02165,48.8606],[34.06559,48.82489],[34.10954,48.82489],[34.12327,48.81391],[34.11778,48.79193],[34.13151,48.77546],[34.17546,48.7782],[34.20567,48.75898],[34.28532,48.7425],[34.29356,48.72052],[34.31279,48.74799],[34.31004,48.76722],[34.343,48.78369],[34.32377,48.79193],[34.29905,48.78369],[34.29631,48.8194],[34.33751,48.8194],[34.343,48.82764],[34.32377,48.82764],[34.32652,48.84412],[34.35124,48.84687],[34.35124,48.85785],[34.33476,48.85511],[34.33751,48.87159],[34.29905,48.8963],[34.31279,48.94025],[34.35399,48.9842],[34.32652,48.99793],[34.35948,49.03363],[34.41441,49.05561],[34.40068,49.09406],[34.46385,49.06385],[34.47484,49.07483],[34.49955,49.0611],[34.51603,49.07209],[34.55723,49.05561],[34.57371,49.06385],[34.56547,49.07209],[34.57371,49.09406],[34.59294,49.09406],[34.59019,49.11054],[34.64787,49.13251],[34.66435,49.11878],[34.69456,49.13526],[34.7083,49.12976],[34.73851,49.1435],[34.76872,49.1435],[34.76048,49.16822],[34.80443,49.1792],[34.81267,49.16547],[34.82914,49.17646],[34.81816,49.18744],[34.84288,49.19019],[34.9033,49.17646],[34.89232,49.16822],[34.8676,49.16822],[34.89232,49.14899],[34.91978,49.15723],[34.92528,49.18195],[34.94725,49.19568],[35.01866,49.15174],[35.04338,49.15448],[35.05711,49.17646],[35.07634,49.17096],[35.08732,49.14075],[35.09556,49.15448],[35.12028,49.16272],[35.145,49.14899],[35.15873,49.15998],[35.19444,49.15998],[35.21092,49.15174],[35.18895,49.14075],[35.2274,49.12702],[35.18895,49.11054],[35.2274,49.09955],[35.23839,49.11328],[35.25761,49.11328],[35.27684,49.09131],[35.27958,49.09681],[35.30705,49.09131],[35.31254,49.07758],[35.30156,49.06934],[35.33452,49.0611],[35.34276,49.04462],[35.38395,49.02814],[35.40593,49.02814],[35.40593,49.01441],[35.43889,49.01166],[35.43614,49.00342],[35.46086,48.99793],[35.45537,48.98969],[35.48832,48.9787],[35.48558,48.97321],[35.5103,48.9842],[35.57347,48.97321],[35.5872,48.98694],[35.62565,48.9842],[35.63115,48.96222],[35.64763,48.97321],[35.69432,48.96772],[35.69706,48.943],[35.71354,48.94849],[35.72453,48.96497],[35.73826,48.96497],[35.73826,48.95124],[35.752,48.94574],[35.75749,48.95398],[35.77397,48.94849],[35.79045,48.95398],[35.80143,48.943],[35.79319,48.93476],[35.80967,48.92652],[35.80967,48.943],[35.8289,48.94849],[35.85362,48.94574],[35.85637,48.95673],[35.87834,48.96222],[35.88383,48.97596],[35.93876,48.97046],[35.94426,48.9787],[35.93052,48.9787],[35.93876,48.99793],[35.99095,48.96772],[35.97722,48.95948],[36.00468,48.94574],[35.99644,48.94025],[36.04313,48.91553],[36.01292,48.88807],[36.04039,48.87433],[36.01841,48.85511],[36.07609,48.83313],[36.06511,48.80841],[36.13102,48.80567],[36.15849,48.78369],[36.15849,48.76722],[36.13926,48.76447],[36.16124,48.74799],[36.14201,48.72327],[36.28209,48.6601],[36.25187,48.62439],[36.31779,48.58594],[36.2711,48.54474],[36.29582,48.53101],[36.32329,48.55573],[36.35624,48.53101],[36.41942,48.60791],[36.44139,48.61341],[36.42766,48.61615],[36.44139,48.62714],[36.42216,48.63538],[36.44688,48.63263],[36.48259,48.66285],[36.59245,48.60242],[36.65562,48.61066],[36.67485,48.62439],[36.73802,48.62714],[36.74626,48.59693],[36.77922,48.59967],[36.78746,48.56671],[36.85887,48.56946],[36.88359,48.542],[36.90281,48.542],[36.90556,48.52002],[36.85063,48.51728],[36.85612,48.48706],[36.82866,48.48432],[36.85063,48.4184],[36.82591,48.41565],[36.8369,48.40741],[36.82042,48.40467],[36.82866,48.36896],[36.81218,48.36896],[36.80943,48.34699],[36.81767,48.31128],[36.86986,48.31678],[36.8726,48.30579],[36.91105,48.30854],[36.93577,48.19318],[36.89457,48.19043],[36.88633,48.1767],[36.8726,48.18494],[36.89732,48.07782],[36.85887,48.0531],[36.85612,48.03388],[36.81218,48.04212],[36.80394,48.0531],[36.74351,48.05036],[36.74901,48.06134],[36.71879,48.08332],[36.66386,48.08881],[36.65288,48.0998],[36.6364,48.0943],[36.65013,48.08881],[36.62266,48.08332],[36.60069,48.09156],[36.58146,48.08057],[36.5897,48.0531],[36.57322,48.03937],[36.59245,48.02015],[36.56773,48.01191],[36.58696,48.00092],[36.57597,47.99817],[36.58421,47.95697],[36.62816,47.96247],[36.63914,47.92127],[36.5897,47.92127],[36.59245,47.91028],[36.54301,47.90479],[36.54851,47.87732],[36.57597,47.88007],[36.58421,47.84711]],[[36.18321,48.66834],[36.18321,48.66834],[36.18321,48.66834]]]}},{"type":"Feature","properties":{"ADMIN_1":"Луганська область","COD_1":"UA44000000000018893"},"geometry":{"type":"LineString","coordinates":[[39.44066,47.85535],[39.43791,47.83887],[39.41319,47.83063],[39.38847,47.87183],[39.35551,47.87183],[39.2429,47.86634],[39.23741,47.8526],[39.11107,47.84162],[39.10832,47.8526],[39.0836,47.8526],[39.07536,47.87183],[39.06437,47.8938],[39.09184,47.94049],[39.07261,47.95148],[39.05613,47.94599],[39.03691,47.95697],[39.03965,48.00641],[38.83641,48.01465],[38.82542,48.03113],[38.83366,48.03388],[38.81169,48.04761],[38.82817,48.0586],[38.83366,48.08057],[38.81718,48.06409],[38.8007,48.07508],[38.81718,48.08332],[38.8062,48.08881],[38.81993,48.11628],[38.69633,48.14374],[38.69359,48.15747],[38.66612,48.15747],[38.67161,48.16297],[38.63591,48.16022],[38.6002,48.17121],[38.61393,48.20417],[38.58922,48.22614],[38.58922,48.25086],[38.57548,48.26734],[38.42717,48.27832],[38.42717,48.30579],[38.4409,48.31678],[38.43266,48.33875],[38.45738,48.3415],[38.46837,48.36072],[38.48759,48.36072],[38.46837,48.37995],[38.44639,48.3772],[38.43266,48.44861],[38.38322,48.42939],[38.37224,48.44312],[38.34202,48.43763],[38.31181,48.45685],[38.32005,48.46509],[38.28984,48.47608],[38.30632,48.47608],[38.29808,48.49256],[38.32005,48.50904],[38.27336,48.54474],[38.26237,48.63813],[38.22941,48.63538],[38.22667,48.65186],[38.26512,48.65735],[38.26787,48.66285],[38.28709,48.66559],[38.28434,48.68207],[38.31456,48.68482],[38.30357,48.70954],[38.32554,48.71503],[38.32005,48.73426],[38.28434,48.737],[38.26512,48.75074],[38.28434,48.77271],[38.27885,48.80292],[38.3173,48.80567],[38.31456,48.82764],[38.27336,48.82489],[38.25963,48.84137],[38.22117,48.83863],[38.22667,48.9375],[38.19371,48.92652],[38.14152,48.93201],[38.13328,48.92377],[38.09208,48.94025],[38.05363,48.94025],[38.03715,48.92377],[38.03441,48.93476],[38.00694,48.94574],[38.02891,48.97321],[38.05363,48.96497],[38.05363,48.98694],[38.09758,48.99244],[38.05363,49.05835],[38.0811,49.14624],[38.04265,49.15174],[38.0399,49.12702],[37.92729,49.1435],[37.89158,49.15998],[37.90257,49.16547],[37.89433,49.17371],[37.93553,49.19294],[37.91905,49.20667],[37.94377,49.21491],[37.93278,49.2204],[37.88884,49.21216],[37.8751,49.23413],[37.86686,49.24512],[37.91081,49.25885],[37.89982,49.26984],[37.9575,49.28632],[37.94926,49.3028],[37.88334,49.31379],[37.87785,49.32752],[37.89708,49.40442],[37.87785,49.41816],[37.8751,49.44562],[37.84489,49.44562],[37.85038,49.48682],[37.83665,49.49231],[37.84764,49.51978],[37.88609,49.51978],[37.92729,49.54175],[37.92729,49.54724],[37.88609,49.54999],[37.89982,49.57471],[37.95201,49.56922],[37.93278,49.59119],[37.94377,49.61042],[37.97398,49.61042],[37.97947,49.6269],[37.99595,49.62964],[37.98771,49.64063],[37.99595,49.64887],[38.04539,49.65711],[38.02617,49.6626],[38.01243,49.67633],[38.01243,49.69556],[37.9987,49.70105],[38.01793,49.71204],[37.97398,49.70929],[37.95201,49.73127],[37.97673,49.76697],[37.98222,49.75598],[37.9987,49.75324],[38.03715,49.78345],[38.05363,49.78345],[38.05363,49.79169],[38.00969,49.81366],[38.01793,49.83838],[38.07286,49.83564],[38.09208,49.84662],[38.03166,49.89881],[38.05913,49.92353],[38.12504,49.94275],[38.12779,49.92078],[38.22117,49.97846],[38.18547,50.0224],[38.17997,50.08008],[38.27611,50.07459],[38.31456,50.08832],[38.32829,50.08557],[38.35026,50.03614],[38.35026,50.00592],[38.41618,49.9812],[38.43266,50.00043],[38.46837,49.99494],[38.46562,49.98395],[38.47935,49.98395],[38.48759,49.96473],[38.52604,49.95923],[38.58098,49.97846],[38.61668,49.97571],[38.64689,49.95649],[38.67985,49.97296],[38.67985,50.00592],[38.68809,50.00592],[38.71556,49.9812],[38.68535,49.96198],[38.69359,49.93451],[38.7238,49.92627],[38.73478,49.9043],[38.76774,49.89606],[38.78972,49.87958],[38.82267,49.87958],[38.85014,49.86585],[38.90233,49.86859],[38.91881,49.85761],[38.90507,49.84937],[38.90782,49.8274],[38.92979,49.79718],[38.94902,49.79718],[39.02043,49.8219],[39.06712,49.81641],[39.18248,49.88782],[39.22642,49.83838],[39.22917,49.80817],[39.25114,49.77796],[39.2841,49.75598],[39.37748,49.73951],[39.44615,49.76148],[39.61094,49.73401],[39.59172,49.72028],[39.66038,49.61591],[39.75102,49.59668],[39.8087,49.55548],[39.83891,49.56372],[39.8911,49.55823],[39.93229,49.57196],[39.95152,49.59668],[40.05864,49.60767],[40.06413,49.59943],[40.13554,49.61591],[40.13829,49.59668],[40.1685,49.56922],[40.03941,49.51978],[40.02842,49.45386],[40.11357,49.3852],[40.19871,49.34674],[40.18223,49.3028],[40.18498,49.28083],[40.22892,49.2616],[40.22069,49.25061],[40.18773,49.23963],[40.13829,49.23963],[40.07786,49.18744],[40.03117,49.1792],[39.93779,49.08307],[39.93779,49.05561],[39.88011,49.06385],[39.81144,49.0611],[39.7675,49.03913],[39.69334,49.05011],[39.67137,49.04187],[39.6851,49.03363],[39.66313,49.00067],[39.67686,48.98969],[39.70433,48.99793],[39.7263,48.97596],[39.75102,48.98694],[39.77849,48.95124],[39.77574,48.92102],[39.81968,48.90729],[39.82792,48.88532],[39.83891,48.90454],[39.85264,48.89081],[39.92405,48.8963],[39.95427,48.87433],[39.99272,48.86884],[40.00371,48.9018],[40.03392,48.91553],[40.06138,48.91004],[40.08061,48.87159],[39.97624,48.79468],[39.80046,48.84137],[39.7675,48.76722],[39.74553,48.76722],[39.74827,48.77271],[39.73729,48.76447],[39.7263,48.75074],[39.74003,48.7425],[39.70707,48.71778],[39.72355,48.68207],[39.70158,48.66834],[39.71531,48.65461],[39.69334,48.64911],[39.69334,48.63538],[39.66038,48.61066],[39.68785,48.58594],[39.74827,48.59143],[39.75377,48.58319],[39.79222,48.59418],[39.82243,48.58594],[39.82243,48.5777],[39.8499,48.56671],[39.86638,48.50629],[39.84715,48.5008],[39.84715,48.47608],[39.89659,48.44861],[39.88835,48.44312],[39.91856,48.39643],[39.90483,48.39093],[39.92405,48.37445],[39.94053,48.38819],[39.93229,48.36347],[39.94603,48.35523],[39.91856,48.3415],[39.8444,48.33326],[39.84166,48.31128],[39.8856,48.30854],[39.91032,48.29206],[39.91581,48.27008],[39.95152,48.30304],[39.98997,48.31678],[40.02018,48.2536],[40.00645,48.24262],[40.0092,48.22614],[39.94328,48.22889],[39.93779,48.17945],[39.91032,48.17945],[39.90208,48.14099],[39.87187,48.11628],[39.86912,48.08057],[39.83342,48.06684],[39.88286,48.05036],[39.88286,48.04212],[39.77849,48.03937],[39.79222,48.01191],[39.81419,48.00092],[39.82518,47.95423],[39.80595,47.95148],[39.8087,47.93775],[39.79496,47.92127],[39.79496,47.87183],[39.76201,47.87183],[39.76475,47.84711],[39.73729,47.82788],[39.62742,47.83887],[39.52031,47.82514],[39.47636,47.86084],[39.44066,47.85535]]}},{"type":"Feature","properties":{"ADMIN_1":"Сумська область","COD_1":"UA59000000000057109"},"geometry":{"type":"LineString","coordinates":[[34.70006,50.14875],[34.70006,50.11304],[34.68083,50.10755],[34.67534,50.13227],[34.66435,50.11029],[34.62864,50.11304],[34.59019,50.12677],[34.57371,50.12128],[34.54625,50.13227],[34.52427,50.17621],[34.57097,50.22565],[34.5435,50.24762],[34.52702,50.25037],[34.52702,50.23938],[34.51329,50.24762],[34.51878,50.28058],[34.45561,50.28608],[34.40068,50.31903],[34.41166,50.33551],[34.37596,50.35749],[34.38969,50.36573],[34.28807,50.41242],[34.25511,50.43714],[34.24962,50.51953],[34.2194,50.53327],[34.12053,50.5113],[34.10954,50.48108],[34.09855,50.48108],[34.08207,50.48932],[34.10405,50.50306],[34.06559,50.51679],[34.05461,50.51404],[34.05736,50.50306],[34.04912,50.50855],[34.02714,50.50031],[34.00792,50.52228],[33.95573,50.547],[33.91453,50.51404],[33.89256,50.53327],[33.81291,50.51679],[33.81566,50.50855],[33.84587,50.50306],[33.84312,50.49207],[33.78819,50.47834],[33.78544,50.46186],[33.73326,50.45911],[33.57121,50.49482],[33.53825,50.48932],[33.53276,50.48108],[33.4998,50.49207],[33.48607,50.48108],[33.46409,50.49207],[33.43388,50.48383],[33.43388,50.47559],[33.41191,50.50031],[33.3762,50.49756],[33.37346,50.52228],[33.31852,50.51953],[33.31852,50.53327],[33.27733,50.55249],[33.24162,50.53876],[33.23613,50.5113],[33.22239,50.50306],[33.19218,50.50855],[33.17845,50.52228],[33.15098,50.52228],[33.14549,50.5113],[33.11802,50.5058],[33.10154,50.51679],[33.06584,50.51953],[33.04936,50.54151],[33.10154,50.59095],[33.12352,50.59644],[33.10429,50.60193],[33.11802,50.64862],[33.14549,50.65412],[33.15098,50.69257],[33.13725,50.7118],[33.24162,50.73102],[33.21141,50.73651],[33.20866,50.7475],[33.18944,50.7475],[33.15648,50.79145],[33.17021,50.79969],[33.15648,50.82715],[33.18394,50.84912],[33.17021,50.85187],[33.18394,50.86835],[33.17021,50.88758],[33.20042,50.89032],[33.21141,50.90131],[33.19767,50.92054],[33.20042,50.96173],[33.13725,50.96173],[33.11802,51.00568],[33.07683,50.99195],[33.07957,50.98096],[33.04112,50.99195],[33.0576,51.02216],[33.08507,51.03864],[33.06035,51.04963],[33.06859,51.06885],[33.03837,51.0716],[33.04112,51.08258],[32.94224,51.09082],[32.99168,51.14301],[32.96147,51.16223],[32.98619,51.18421],[32.97795,51.18695],[33.04112,51.20618],[33.03013,51.22815],[33.06859,51.25562],[33.0576,51.26661],[33.07683,51.29132],[33.04112,51.29132],[33.07683,51.3133],[33.06859,51.33252],[33.07683,51.34076],[33.03563,51.349],[33.04112,51.36823],[33.0164,51.39569],[33.04661,51.40943],[33.0576,51.40393],[33.03837,51.3902],[33.06035,51.38196],[33.06035,51.37098],[33.10978,51.36823],[33.10978,51.38196],[33.09056,51.3902],[33.13176,51.38471],[33.1345,51.39844],[33.12077,51.40393],[33.1345,51.41767],[33.11253,51.42865],[33.13725,51.46711],[33.13725,51.49457],[33.19218,51.50556],[33.19218,51.5138],[33.18669,51.53852],[33.15648,51.555],[33.15922,51.56873],[33.20591,51.56873],[33.22239,51.57972],[33.19218,51.58246],[33.15373,51.60993],[33.15373,51.64289],[33.12626,51.64563],[33.14549,51.66486],[33.14,51.67585],[33.16472,51.68134],[33.14549,51.68958],[33.15922,51.68958],[33.17296,51.70057],[33.15648,51.70331],[33.14,51.72528],[33.10429,51.74726],[33.0933,51.77472],[33.08507,51.76923],[33.07957,51.77472],[33.10154,51.78296],[33.12077,51.81043],[33.14549,51.81592],[33.12352,51.86261],[33.1345,51.85987],[33.14549,51.87909],[33.1812,51.88459],[33.17296,51.90107],[33.18669,51.91205],[33.21415,51.91205],[33.22239,51.90381],[33.25261,51.92578],[33.26909,51.91755],[33.30479,51.93402],[33.35423,51.93128],[33.37071,51.95325],[33.39543,51.95325],[33.3817,51.97522],[33.37346,51.97248],[33.37346,51.97797],[33.35148,51.98621],[33.33775,52.00818],[33.30479,52.01368],[33.31852,52.01642],[33.31852,52.0329],[33.35698,52.03015],[33.40367,52.05213],[33.41191,52.0329],[33.43113,52.02466],[33.46409,52.03839],[33.4998,52.03839],[33.4998,52.09058],[33.49156,52.08234],[33.43937,52.08783],[33.44487,52.09607],[33.40916,52.1153],[33.4174,52.12354],[33.3405,52.14826],[33.32951,52.14002],[33.3405,52.13453],[33.32402,52.13727],[33.33775,52.1565],[33.31028,52.18946],[33.33226,52.20319],[33.31578,52.21418],[33.32402,52.22242],[33.33226,52.21418],[33.35148,52.21967],[33.36796,52.2334],[33.35972,52.25812],[33.36522,52.25263],[33.38444,52.26636],[33.3762,52.27735],[33.39268,52.29108],[33.38719,52.29657],[33.40092,52.30481],[33.38719,52.3158],[33.40092,52.31305],[33.42839,52.34601],[33.44761,52.34327],[33.43937,52.3515],[33.45585,52.36524],[33.51903,52.35425],[33.51353,52.33503],[33.49156,52.33228],[33.47783,52.3158],[33.50529,52.30481],[33.56022,52.30207],[33.56297,52.31305],[33.54374,52.32404],[33.5822,52.31031],[33.5767,52.31855],[33.60692,52.33503],[33.65635,52.34052],[33.68382,52.357],[33.71678,52.36249],[33.72502,52.35425],[33.78544,52.36798],[33.83763,52.35974],[33.85411,52.33228],[33.84038,52.32129],[33.87608,52.30756],[33.92003,52.30481],[33.94475,52.28284],[33.93925,52.24988],[33.99968,52.22791],[33.99968,52.21143],[34.01616,52.20319],[34.05186,52.20044],[34.06559,52.18396],[34.05461,52.17023],[34.11503,52.14002],[34.10954,52.12354],[34.08757,52.10981],[34.09581,52.08509],[34.06285,52.0741],[34.07933,52.07135],[34.1013,52.04114],[34.09581,52.00544],[34.12877,52.00544],[34.13975,51.99994],[34.12877,51.98621],[34.1425,51.96698],[34.18919,51.96698],[34.20292,51.93952],[34.2249,51.92853],[34.2194,51.92029],[34.2606,51.90931],[34.25786,51.89008],[34.24412,51.88184],[34.3018,51.88733],[34.41441,51.82691],[34.40617,51.78846],[34.43638,51.76374],[34.43913,51.74451],[34.4199,51.72254],[34.36223,51.71155],[34.31004,51.71979],[34.29081,51.70606],[34.23314,51.69782],[34.21391,51.70331],[34.20567,51.69507],[34.15898,51.68683],[34.12602,51.68958],[34.07933,51.66761],[34.10405,51.66486],[34.11229,51.64838],[34.12877,51.64289],[34.16722,51.64563],[34.18095,51.59619],[34.21116,51.60169],[34.21666,51.57422],[34.23863,51.58521],[34.2606,51.53302],[34.29631,51.53302],[34.30729,51.51929],[34.29081,51.51105],[34.29081,51.48084],[34.2661,51.47535],[34.24412,51.45612],[34.25511,51.43964],[34.22215,51.42865],[34.22215,51.41767],[34.22764,51.39844],[34.24687,51.40119],[34.27159,51.38196],[34.29356,51.38745],[34.28532,51.37372],[34.30455,51.37921],[34.33751,51.36548],[34.33751,51.35724],[34.31553,51.34351],[34.31553,51.32978],[34.28257,51.33527],[34.28257,51.31055],[34.27159,51.31604],[34.2661,51.29956],[34.23863,51.29132],[34.25511,51.28308],[34.23039,51.26386],[34.30455,51.23914],[34.33201,51.23914],[34.3842,51.27484],[34.48857,51.24463],[34.51329,51.24189],[34.52427,51.25287],[34.54075,51.25287],[34.57921,51.23365],[34.60118,51.25287],[34.6616,51.24738],[34.66984,51.19794],[34.71653,51.17047],[34.73027,51.18146],[34.77147,51.17597],[34.7852,51.18421],[34.83464,51.17047],[34.83464,51.18421],[34.8621,51.19794],[34.87584,51.19245],[34.89781,51.19245],[34.9033,51.20343],[34.93626,51.20893],[34.95274,51.22815],[34.98021,51.23365],[35.03788,51.21717],[35.03788,51.20343],[35.0681,51.2309],[35.12028,51.2309],[35.15049,51.22266],[35.13951,51.21717],[35.12578,51.16223],[35.13951,51.15125],[35.14226,51.13477],[35.17521,51.12104],[35.16423,51.11005],[35.17796,51.09906],[35.17247,51.08808],[35.15599,51.09082],[35.14775,51.08258],[35.16423,51.08258],[35.18895,51.05512],[35.21367,51.04688],[35.24388,51.06336],[35.27409,51.05786],[35.3043,51.07709],[35.32628,51.07709],[35.351,51.06336],[35.37571,51.0661],[35.40593,51.04688],[35.40043,51.0304],[35.40867,51.02765],[35.37571,51.00843],[35.32353,51.01392],[35.351,50.97272],[35.32628,50.948],[35.33177,50.93427],[35.37297,50.93152],[35.36747,50.92603],[35.39219,50.92328],[35.40043,50.91504],[35.40318,50.90406],[35.38121,50.89582],[35.40318,50.87934],[35.38121,50.8711],[35.40593,50.86286],[35.41966,50.84363],[35.41142,50.80243],[35.44987,50.78321],[35.48832,50.77771],[35.46361,50.73377],[35.47184,50.72553],[35.45811,50.68708],[35.49656,50.67884],[35.48558,50.65686],[35.46361,50.6651],[35.39219,50.64862],[35.42515,50.60193],[35.38945,50.57996],[35.4279,50.56348],[35.43614,50.53052],[35.47734,50.48658],[35.55424,50.45362],[35.57072,50.45636],[35.56248,50.45911],[35.57072,50.4646],[35.5872,50.44812],[35.58445,50.39594],[35.61192,50.37397],[35.60093,50.36847],[35.62565,50.35199],[35.68333,50.3465],[35.69157,50.3465],[35.68882,50.33551],[35.66136,50.32727],[35.65037,50.31079],[35.62291,50.31903],[35.6284,50.32453],[35.59269,50.33002],[35.57347,50.31903],[35.51579,50.31629],[35.53502,50.30255],[35.52403,50.28882],[35.5048,50.29981],[35.49656,50.29157],[35.45811,50.31629],[35.43889,50.31629],[35.42241,50.33551],[35.40867,50.32178],[35.37846,50.32178],[35.38121,50.29432],[35.32902,50.31903],[35.29606,50.28882],[35.32902,50.27509],[35.29881,50.26136],[35.26585,50.2641],[35.26036,50.23389],[35.23839,50.23664],[35.23564,50.2284],[35.19719,50.23938],[35.19169,50.2284],[35.14775,50.24213],[35.1038,50.21466],[35.07084,50.20642],[35.07634,50.20093],[35.04338,50.16523],[35.02965,50.16523],[35.03239,50.17896],[34.96098,50.18445],[34.97197,50.15699],[34.93901,50.15149],[34.84837,50.16523],[34.83189,50.15699],[34.79893,50.15973],[34.76597,50.146],[34.74125,50.146],[34.74949,50.15699],[34.73576,50.15973],[34.70006,50.14875]]}},{"type":"Feature","properties":{"ADMIN_1":"Автономна Республіка Крим","COD_1":"UA01000000000013043"},"geometry":{"type":"MultiLineString","coordinates":[[[33.17845,45.79816],[33.1757,45.80365],[33.18394,45.80915],[33.17845,45.79816]],[[33.60417,44.59516],[33.60142,44.60065],[33.60966,44.58692],[33.60417,44.59516]],[[36.53752,45.2818],[36.57597,45.24884],[36.52653,45.2873],[36.53752,45.2818]],[[33.75523,44.39191],[33.72777,44.39191],[33.70579,44.42212],[33.67283,44.41663],[33.65086,44.42762],[33.63438,44.47156],[33.59868,44.49628],[33.59868,44.50452],[33.62065,44.51551],[33.59593,44.52375],[33.57945,44.51001],[33.59318,44.51276],[33.59593,44.50452],[33.59318,44.49079],[33.55473,44.48804],[33.52177,44.50177],[33.48607,44.49903],[33.46684,44.521],[33.40092,44.55945],[33.37895,44.58142],[33.40367,44.58966],[33.41191,44.5622],[33.41465,44.58692],[33.43937,44.57318],[33.42564,44.58142],[33.43113,44.5979],[33.44487,44.57044],[33.45036,44.58692],[33.46135,44.57044],[33.50255,44.57593],[33.52726,44.54847],[33.53001,44.58692],[33.54374,44.58966],[33.57121,44.57318],[33.5822,44.57593],[33.57121,44.61438],[33.60142,44.60614],[33.60142,44.61438],[33.56846,44.62262],[33.57396,44.62812],[33.56022,44.62812],[33.55748,44.6446],[33.541,44.6446],[33.53825,44.64734],[33.54924,44.7215],[33.5355,44.79016],[33.55198,44.8396],[33.57121,44.83686],[33.59868,44.85059],[33.61241,44.91925],[33.60417,44.99616],[33.5822,45.05109],[33.54924,45.09778],[33.48881,45.15271],[33.42839,45.18842],[33.38719,45.19666],[33.35148,45.17469],[33.30479,45.17194],[33.28282,45.14722],[33.26085,45.14722],[33.22514,45.17743],[33.14824,45.20215],[33.06584,45.27631],[32.98344,45.32849],[32.90928,45.36145],[32.85435,45.36969],[32.75548,45.3642],[32.65111,45.31476],[32.49455,45.34772],[32.51378,45.37519],[32.48082,45.39441],[32.5385,45.45484],[32.58519,45.47956],[32.6923,45.5235],[32.6978,45.50977],[32.71153,45.51526],[32.71153,45.529],[32.79118,45.56195],[32.80217,45.55371],[32.81865,45.55921],[32.82963,45.54822],[32.84611,45.57843],[32.82139,45.58667],[32.90379,45.63611],[33.06859,45.70478],[33.14274,45.72126],[33.17021,45.78992],[33.20317,45.75971],[33.25261,45.75147],[33.35148,45.78443],[33.42564,45.83387],[33.46409,45.8476],[33.41465,45.82563],[33.42564,45.82288],[33.42839,45.83112],[33.44761,45.82288],[33.49705,45.85859],[33.50255,45.83936],[33.52726,45.8476],[33.54374,45.83387],[33.56846,45.86957],[33.5767,45.86682],[33.61241,45.89154],[33.63987,45.87232],[33.65635,45.87232],[33.68382,45.84211],[33.68107,45.90802],[33.69481,45.90528],[33.72777,45.92725],[33.76347,45.92176],[33.7827,45.93824],[33.76622,45.93274],[33.74974,45.94922],[33.69481,45.95472],[33.65635,45.95472],[33.63438,45.94098],[33.6179,45.94648],[33.63163,45.96296],[33.61516,46.05359],[33.64262,46.08106],[33.61516,46.13599],[33.63713,46.14148],[33.62614,46.18268],[33.61516,46.22663],[33.64537,46.22937],[33.7415,46.18543],[33.78544,46.20191],[33.84038,46.20191],[34.0189,46.11127],[34.07933,46.11951],[34.13701,46.10028],[34.16447,46.06458],[34.24412,46.05359],[34.33201,46.07007],[34.39518,46.02338],[34.43089,45.97119],[34.49955,45.93549],[34.55723,45.99591],[34.60942,45.99866],[34.66435,45.97394],[34.80168,45.88056],[34.79893,45.80915],[34.96922,45.76795],[35.08183,45.62513],[35.30705,45.40815],[35.41417,45.32849],[35.51579,45.28455],[35.61467,45.31476],[35.71904,45.33399],[35.76298,45.37519],[35.74925,45.39167],[35.82066,45.43286],[35.8289,45.4466],[35.81791,45.45758],[35.84538,45.47406],[35.87285,45.46582],[35.84538,45.4466],[35.88658,45.40815],[35.93876,45.38068],[35.9882,45.36969],[36.0294,45.37793],[36.06236,45.39716],[36.0706,45.43836],[36.08159,45.4466],[36.17497,45.47132],[36.28483,45.4823],[36.32603,45.47132],[36.34526,45.4823],[36.41392,45.4466],[36.44688,45.45758],[36.47709,45.45484],[36.52928,45.42737],[36.554,45.42463],[36.57322,45.4411],[36.5952,45.43836],[36.61442,45.42188],[36.60893,45.40815],[36.64738,45.38343],[36.62816,45.36695],[36.59794,45.34772],[36.54576,45.34497],[36.50181,45.3642],[36.48259,45.36145],[36.46061,45.33673],[36.4716,45.33948],[36.47435,45.32575],[36.49357,45.31751],[36.41667,45.2818],[36.42766,45.25708],[36.42766,45.27631],[36.43864,45.27082],[36.40294,45.21314],[36.40568,45.17469],[36.42491,45.12525],[36.45237,45.09504],[36.37547,45.05933],[36.25187,45.05109],[36.22441,45.02912],[36.03215,45.05109],[35.9525,45.01264],[35.9113,45.02088],[35.83989,44.9989],[35.77946,45.06482],[35.7053,45.10053],[35.59269,45.13074],[35.51579,45.1225],[35.44438,45.09504],[35.38945,45.05384],[35.38945,45.02637],[35.42515,45.01264],[35.35649,44.98792],[35.35374,44.97419],[35.37022,44.95496],[35.38945,44.95496],[35.38395,44.94672],[35.32078,44.96869],[35.29332,44.96045],[35.26036,44.96595],[35.23564,44.91651],[35.19444,44.91101],[35.15599,44.89453],[35.12852,44.82312],[35.08183,44.79291],[35.04612,44.80115],[35.05162,44.81488],[35.02965,44.83136],[34.98845,44.83136],[34.96373,44.8396],[34.91704,44.82862],[34.9088,44.81488],[34.87309,44.82312],[34.72203,44.80939],[34.60392,44.77369],[34.45836,44.71051],[34.41716,44.67481],[34.37047,44.59241],[34.34849,44.58142],[34.34575,44.54847],[34.30729,44.55396],[34.27708,44.54023],[34.24962,44.50727],[34.16722,44.49628],[34.12877,44.43036],[34.06559,44.42212],[34.03538,44.40564],[33.97221,44.39191],[33.8596,44.40839],[33.7772,44.38642],[33.75523,44.39191]],[[33.50529,45.85859],[33.51353,45.86408],[33.51353,45.86133],[33.50529,45.85859]],[[33.52452,45.86957],[33.52726,45.87232],[33.52452,45.86957]],[[33.5355,45.87781],[33.53001,45.87506],[33.541,45.88056],[33.5355,45.87781]],[[33.50804,45.85309],[33.50255,45.85309],[33.50255,45.85584],[33.50804,45.85309]],[[33.50804,45.85859],[33.51079,45.85584],[33.50529,45.85584],[33.50804,45.85859]]]}},{"type":"Feature","properties":{"ADMIN_1":"Донецька область","COD_1":"UA14000000000091971"},"geometry":{"type":"LineString","coordinates":[[37.02366,47.06708],[36.98521,47.08081],[37.01268,47.08905],[37.00169,47.12751],[36.98246,47.12476],[36.94951,47.15772],[36.93577,47.16596],[36.92204,47.16046],[36.91929,47.17145],[36.90831,47.16596],[36.90007,47.1742],[36.88908,47.17145],[36.85338,47.19892],[36.93028,47.20716],[36.93028,47.20166],[36.96324,47.20166],[36.92479,47.31977],[36.94401,47.31977],[36.94676,47.31153],[37.02641,47.31427],[37.0374,47.30054],[37.08409,47.31427],[37.09233,47.33075],[37.12254,47.34174],[37.10606,47.37744],[37.14726,47.38019],[37.16099,47.34174],[37.20494,47.35547],[37.19395,47.3747],[37.24888,47.4571],[37.24614,47.46808],[37.18846,47.46808],[37.1967,47.47907],[37.18022,47.48456],[37.15825,47.45435],[37.08409,47.49555],[37.0731,47.49555],[37.02092,47.55323],[37.00169,47.53949],[36.97972,47.56147],[36.96599,47.55323],[36.94401,47.5752],[36.89457,47.54499],[36.8314,47.62464],[36.76549,47.59992],[36.76549,47.60816],[36.74901,47.60541],[36.74626,47.62189],[36.76549,47.62464],[36.76549,47.63288],[36.72429,47.63013],[36.71879,47.66034],[36.77372,47.66309],[36.79295,47.68506],[36.7133,47.67957],[36.69957,47.73175],[36.68583,47.73175],[36.6721,47.79218],[36.58696,47.78394],[36.58696,47.8169],[36.59794,47.8169],[36.60893,47.84162],[36.60344,47.84986],[36.58421,47.84711],[36.57597,47.88007],[36.54851,47.87732],[36.54301,47.90479],[36.59245,47.91028],[36.5897,47.92127],[36.63914,47.92127],[36.62816,47.96247],[36.58421,47.95697],[36.57597,47.99817],[36.58696,48.00092],[36.56773,48.01191],[36.59245,48.02015],[36.57322,48.03937],[36.5897,48.0531],[36.58146,48.08057],[36.60069,48.09156],[36.62266,48.08332],[36.65013,48.08881],[36.6364,48.0943],[36.65288,48.0998],[36.66386,48.08881],[36.71879,48.08332],[36.74901,48.06134],[36.74351,48.05036],[36.80394,48.0531],[36.81218,48.04212],[36.85612,48.03388],[36.85887,48.0531],[36.89732,48.07782],[36.8726,48.18494],[36.88633,48.1767],[36.89457,48.19043],[36.93577,48.19318],[36.91105,48.30854],[36.8726,48.30579],[36.86986,48.31678],[36.81767,48.31128],[36.80943,48.34699],[36.81218,48.36896],[36.82866,48.36896],[36.82042,48.40467],[36.8369,48.40741],[36.82591,48.41565],[36.85063,48.4184],[36.82866,48.48432],[36.85612,48.48706],[36.85063,48.51728],[36.90556,48.52002],[36.90281,48.542],[36.88359,48.542],[36.85887,48.56946],[36.78746,48.56671],[36.77922,48.59967],[36.74626,48.59693],[36.73802,48.62714],[36.71055,48.69306],[36.72703,48.69306],[36.73527,48.70404],[36.70781,48.76722],[36.68858,48.77546],[36.72154,48.80567],[36.76823,48.79743],[36.7902,48.80292],[36.78746,48.78095],[36.82042,48.77271],[36.83964,48.77271],[36.85338,48.80017],[36.96599,48.79468],[37.03465,48.74524],[37.04289,48.76722],[37.02366,48.76722],[36.9962,48.78644],[37.00718,48.80292],[37.01817,48.80292],[37.02366,48.81665],[37.0786,48.81665],[37.09782,48.84961],[37.14451,48.84137],[37.14177,48.83313],[37.19121,48.81391],[37.19395,48.87983],[37.21592,48.89081],[37.22416,48.91004],[37.26536,48.90729],[37.26811,48.92377],[37.32853,48.92102],[37.33128,48.93476],[37.30656,48.94849],[37.32029,48.95673],[37.29558,48.97046],[37.32579,48.9842],[37.31205,48.98969],[37.34501,49.00342],[37.36699,48.99244],[37.37523,49.02539],[37.39171,49.02539],[37.38621,49.04737],[37.41642,49.0611],[37.44938,49.0611],[37.45213,49.05286],[37.4796,49.05835],[37.50706,49.06934],[37.48784,49.1023],[37.58397,49.12702],[37.54277,49.14624],[37.56474,49.14075],[37.55375,49.16822],[37.50157,49.18744],[37.56199,49.22864],[37.61418,49.23413],[37.84215,49.20118],[37.85313,49.22589],[37.8751,49.23413],[37.88884,49.21216],[37.93278,49.2204],[37.94377,49.21491],[37.91905,49.20667],[37.93553,49.19294],[37.89433,49.17371],[37.90257,49.16547],[37.89158,49.15998],[37.92729,49.1435],[38.0399,49.12702],[38.04265,49.15174],[38.0811,49.14624],[38.05363,49.05835],[38.09758,48.99244],[38.05363,48.98694],[38.05363,48.96497],[38.02891,48.97321],[38.00694,48.94574],[38.03441,48.93476],[38.03715,48.92377],[38.05363,48.94025],[38.09208,48.94025],[38.13328,48.92377],[38.14152,48.93201],[38.19371,48.92652],[38.22667,48.9375],[38.22117,48.83863],[38.25963,48.84137],[38.27336,48.82489],[38.31456,48.82764],[38.3173,48.80567],[38.27885,48.80292],[38.28434,48.77271],[38.26512,48.75074],[38.28434,48.737],[38.32005,48.73426],[38.32554,48.71503],[38.30357,48.70954],[38.31456,48.68482],[38.28434,48.68207],[38.28709,48.66559],[38.26787,48.66285],[38.26512,48.65735],[38.22667,48.65186],[38.22941,48.63538],[38.26237,48.63813],[38.27336,48.54474],[38.32005,48.50904],[38.29808,48.49256],[38.30632,48.47608],[38.28984,48.47608],[38.32005,48.46509],[38.31181,48.45685],[38.34202,48.43763],[38.37224,48.44312],[38.38322,48.42939],[38.43266,48.44861],[38.44639,48.3772],[38.46837,48.37995],[38.48759,48.36072],[38.46837,48.36072],[38.45738,48.3415],[38.43266,48.33875],[38.4409,48.31678],[38.42717,48.30579],[38.42717,48.27832],[38.57548,48.26734],[38.58922,48.25086],[38.58922,48.22614],[38.61393,48.20417],[38.6002,48.17121],[38.63591,48.16022],[38.67161,48.16297],[38.66612,48.15747],[38.69359,48.15747],[38.69633,48.14374],[38.81993,48.11628],[38.8062,48.08881],[38.81718,48.08332],[38.8007,48.07508],[38.81718,48.06409],[38.83366,48.08057],[38.82817,48.0586],[38.81169,48.04761],[38.83366,48.03388],[38.82542,48.03113],[38.83641,48.01465],[39.03965,48.00641],[39.03691,47.95697],[39.05613,47.94599],[39.07261,47.95148],[39.09184,47.94049],[39.06437,47.8938],[39.07536,47.87183],[38.87761,47.87732],[38.87761,47.86634],[38.8419,47.86634],[38.8419,47.8526],[38.82542,47.84436],[38.82817,47.81964],[38.78972,47.8169],[38.78422,47.78669],[38.79521,47.77295],[38.78972,47.73725],[38.77049,47.72351],[38.77324,47.68506],[38.73478,47.67957],[38.73478,47.70154],[38.66612,47.6988],[38.66612,47.66858],[38.63041,47.66858],[38.61668,47.64386],[38.45738,47.64386],[38.45738,47.6164],[38.35026,47.6164],[38.35026,47.5752],[38.31181,47.5752],[38.30632,47.54773],[38.28434,47.54499],[38.28709,47.47907],[38.30082,47.47358],[38.30357,47.39392],[38.28709,47.39118],[38.28709,47.3747],[38.25413,47.37195],[38.22117,47.32801],[38.22117,47.30603],[38.33653,47.30603],[38.3228,47.28131],[38.33104,47.26209],[38.28709,47.2566],[38.28984,47.24012],[38.23216,47.22913],[38.24315,47.21814],[38.22941,47.11927],[38.18547,47.09455],[38.13603,47.0506],[38.1223,47.04511],[38.13603,47.05609],[38.11406,47.08905],[38.06462,47.11103],[38.03715,47.0918],[37.98771,47.10004],[37.97123,47.09455],[37.98222,47.08631],[37.89982,47.11103],[37.79271,47.08631],[37.71306,47.08081],[37.62791,47.09455],[37.58671,47.07807],[37.57298,47.10004],[37.57298,47.08631],[37.5208,47.07257],[37.30931,46.87207],[37.29283,46.86658],[37.32304,46.88581],[37.32029,46.91053],[37.28184,46.93799],[37.2379,46.95172],[37.16649,46.91602],[37.06212,46.88306],[37.02092,46.92701],[37.09233,46.9682],[37.10331,46.95996],[37.14177,46.98194],[37.08958,47.00666],[37.12529,47.03962],[37.09782,47.05884],[37.08134,47.04786],[37.02366,47.06708]]}},{"type":"Feature","properties":{"ADMIN_1":"Полтавська область","COD_1":"UA53000000000028050"},"geometry":{"type":"LineString","coordinates":[[33.24711,49.08033],[33.22789,49.08582],[33.20042,49.07483],[33.18669,49.09681],[33.15922,49.09681],[33.15922,49.12976],[33.12077,49.17371],[33.10154,49.1847],[33.03288,49.1847],[33.01091,49.20392],[32.99443,49.20118],[32.98344,49.20942],[32.98344,49.23963],[32.92851,49.22864],[32.89006,49.23139],[32.85985,49.24512],[32.81315,49.24787],[32.76371,49.23139],[32.71428,49.25611],[32.65934,49.24787],[32.63463,49.25885],[32.60716,49.25336],[32.59617,49.27533],[32.46708,49.32752],[32.47807,49.3385],[32.45884,49.34674],[32.51103,49.40717],[32.54124,49.38245],[32.59343,49.37696],[32.67582,49.35224],[32.73625,49.35224],[32.73625,49.37146],[32.71153,49.3852],[32.6923,49.3852],[32.67857,49.40168],[32.67857,49.4264],[32.65111,49.43463],[32.67308,49.44837],[32.66758,49.46759],[32.67857,49.49781],[32.71153,49.50055],[32.74998,49.52253],[32.75273,49.5802],[32.70329,49.60218],[32.71428,49.61316],[32.70054,49.64887],[32.70878,49.65436],[32.66484,49.68183],[32.5742,49.7038],[32.57145,49.75324],[32.55497,49.77246],[32.51378,49.77521],[32.50279,49.80542],[32.4506,49.79718],[32.43687,49.8219],[32.3737,49.87409],[32.39293,49.88507],[32.40391,49.87409],[32.43413,49.88782],[32.4149,49.9043],[32.42863,49.93177],[32.41765,49.93451],[32.42863,49.95923],[32.37919,49.9812],[32.36546,50.03339],[32.34349,50.03614],[32.34349,50.05262],[32.3325,50.05811],[32.31328,50.03888],[32.26109,50.08283],[32.27757,50.09656],[32.2501,50.11304],[32.30504,50.12128],[32.29954,50.14051],[32.17595,50.16523],[32.16221,50.1872],[32.11278,50.21192],[32.12651,50.22565],[32.11827,50.2284],[32.08806,50.24762],[32.10179,50.27784],[32.08256,50.28333],[32.14024,50.3053],[32.12925,50.31629],[32.15123,50.33826],[32.14299,50.34925],[32.21989,50.35749],[32.2556,50.3465],[32.26933,50.35199],[32.2556,50.35199],[32.26384,50.36298],[32.25285,50.37397],[32.2913,50.37946],[32.29954,50.39869],[32.32426,50.40418],[32.32152,50.4234],[32.33799,50.4289],[32.36271,50.42615],[32.36821,50.41516],[32.39842,50.40692],[32.40117,50.41242],[32.44511,50.39869],[32.4918,50.39869],[32.48356,50.37122],[32.52476,50.3465],[32.56047,50.35749],[32.63463,50.35749],[32.63188,50.36573],[32.67033,50.36847],[32.67033,50.35749],[32.74174,50.35199],[32.74998,50.36023],[32.76097,50.34925],[32.79393,50.3465],[32.80217,50.35749],[32.78569,50.36298],[32.78843,50.37122],[32.83787,50.37397],[32.91203,50.40418],[32.91203,50.4234],[32.9395,50.4289],[32.934,50.43714],[32.96971,50.44812],[32.97246,50.47559],[33.0164,50.4701],[33.02189,50.50031],[33.04387,50.50306],[33.06584,50.51953],[33.10154,50.51679],[33.11802,50.5058],[33.14549,50.5113],[33.15098,50.52228],[33.17845,50.52228],[33.19218,50.50855],[33.22239,50.50306],[33.23613,50.5113],[33.24162,50.53876],[33.27733,50.55249],[33.31852,50.53327],[33.31852,50.51953],[33.37346,50.52228],[33.3762,50.49756],[33.41191,50.50031],[33.43388,50.47559],[33.43388,50.48383],[33.46409,50.49207],[33.48607,50.48108],[33.4998,50.49207],[33.53276,50.48108],[33.53825,50.48932],[33.57121,50.49482],[33.73326,50.45911],[33.78544,50.46186],[33.78819,50.47834],[33.84312,50.49207],[33.84587,50.50306],[33.81566,50.50855],[33.81291,50.51679],[33.89256,50.53327],[33.91453,50.51404],[33.95573,50.547],[34.00792,50.52228],[34.02714,50.50031],[34.04912,50.50855],[34.05736,50.50306],[34.05461,50.51404],[34.06559,50.51679],[34.10405,50.50306],[34.08207,50.48932],[34.09855,50.48108],[34.10954,50.48108],[34.12053,50.5113],[34.2194,50.53327],[34.24962,50.51953],[34.25511,50.43714],[34.28807,50.41242],[34.38969,50.36573],[34.37596,50.35749],[34.41166,50.33551],[34.40068,50.31903],[34.45561,50.28608],[34.51878,50.28058],[34.51329,50.24762],[34.52702,50.23938],[34.52702,50.25037],[34.5435,50.24762],[34.57097,50.22565],[34.52427,50.17621],[34.54625,50.13227],[34.57371,50.12128],[34.59019,50.12677],[34.62864,50.11304],[34.66435,50.11029],[34.67534,50.13227],[34.68083,50.10755],[34.70006,50.11304],[34.70006,50.14875],[34.73576,50.15973],[34.74949,50.15699],[34.74125,50.146],[34.76597,50.146],[34.79893,50.15973],[34.83189,50.15699],[34.84837,50.16523],[34.93901,50.15149],[34.93626,50.09656],[34.95549,50.09381],[34.96373,50.07459],[34.93901,50.06086],[34.85661,49.9867],[34.86485,49.96473],[34.87584,49.96198],[34.85661,49.94825],[34.89232,49.93177],[34.91154,49.93451],[34.97197,49.88507],[34.98021,49.89057],[35.01591,49.87683],[35.03514,49.88782],[35.06535,49.88507],[35.04612,49.87134],[35.0681,49.85761],[35.12028,49.85212],[35.13951,49.86036],[35.21916,49.83014],[35.22191,49.80817],[35.19993,49.79993],[35.21092,49.78894],[35.20543,49.75873],[35.22465,49.73676],[35.26036,49.73401],[35.2631,49.71753],[35.24113,49.71204],[35.25486,49.70929],[35.24388,49.69281],[35.33177,49.68183],[35.3455,49.66535],[35.43339,49.67359],[35.42515,49.65711],[35.48558,49.57196],[35.40318,49.55548],[35.4279,49.54999],[35.4279,49.52527],[35.48558,49.51703],[35.49107,49.50879],[35.48008,49.48407],[35.33177,49.5033],[35.31529,49.45661],[35.36473,49.44837],[35.34825,49.40442],[35.37846,49.39893],[35.27958,49.31928],[35.28782,49.29731],[35.27134,49.27808],[35.24113,49.29731],[35.09282,49.30005],[35.07634,49.31653],[35.03788,49.33301],[35.02415,49.32477],[34.98021,49.25061],[35.01866,49.15174],[34.94725,49.19568],[34.92528,49.18195],[34.91978,49.15723],[34.89232,49.14899],[34.8676,49.16822],[34.89232,49.16822],[34.9033,49.17646],[34.84288,49.19019],[34.81816,49.18744],[34.82914,49.17646],[34.81267,49.16547],[34.80443,49.1792],[34.76048,49.16822],[34.76872,49.1435],[34.73851,49.1435],[34.7083,49.12976],[34.69456,49.13526],[34.66435,49.11878],[34.64787,49.13251],[34.59019,49.11054],[34.59294,49.09406],[34.57371,49.09406],[34.56547,49.07209],[34.57371,49.06385],[34.55723,49.05561],[34.51603,49.07209],[34.49955,49.0611],[34.47484,49.07483],[34.46385,49.06385],[34.40068,49.09406],[34.41441,49.05561],[34.35948,49.03363],[34.32652,48.99793],[34.35399,48.9842],[34.31279,48.94025],[34.29905,48.8963],[34.33751,48.87159],[34.33476,48.85511],[34.35124,48.85785],[34.35124,48.84687],[34.32652,48.84412],[34.32377,48.82764],[34.343,48.82764],[34.33751,48.8194],[34.29631,48.8194],[34.29905,48.78369],[34.32377,48.79193],[34.343,48.78369],[34.31004,48.76722],[34.31279,48.74799],[34.29356,48.72052],[34.28532,48.7425],[34.20567,48.75898],[34.17546,48.7782],[34.13151,48.77546],[34.11778,48.79193],[34.12327,48.81391],[34.10954,48.82489],[34.06559,48.82489],[34.02165,48.8606],[33.92552,48.88257],[33.89805,48.9018],[33.81566,48.9375],[33.7003,48.94574],[33.66459,48.97596],[33.63713,48.97596],[33.59044,48.91828],[33.56846,48.91828],[33.57396,48.91004],[33.54649,48.91278],[33.53825,48.93201],[33.49705,48.92652],[33.47508,48.91278],[33.47508,48.95124],[33.43113,48.95673],[33.42839,48.943],[33.40092,48.95398],[33.40092,48.92652],[33.35423,48.95398],[33.32127,48.94849],[33.31303,48.95948],[33.32402,48.96222],[33.29655,49.01166],[33.32676,49.02539],[33.32127,49.0611],[33.26085,49.09131],[33.28831,49.09681],[33.30479,49.11878],[33.26909,49.13526],[33.26085,49.15174],[33.24162,49.16547],[33.24711,49.08033]]}},{"type":"Feature","properties":{"ADMIN_1":"Кіровоградська область","COD_1":"UA35000000000016081"},"geometry":{"type":"LineString","coordinates":[[31.83537,47.79218],[31.82713,47.8169],[31.86833,47.82239],[31.8546,47.84711],[31.85734,47.86359],[31.8903,47.86634],[31.87657,47.91852],[31.8546,47.91578],[31.84361,47.96247],[31.78044,47.95972],[31.75297,47.94324],[31.72825,48.03662],[31.78319,48.04212],[31.76671,48.10254],[31.69529,48.0943],[31.68431,48.11902],[31.64311,48.11628],[31.63487,48.1355],[31.58268,48.13001],[31.58543,48.10529],[31.56895,48.09705],[31.55797,48.11078],[31.54149,48.10804],[31.54973,48.06958],[31.50853,48.06958],[31.50853,48.05585],[31.49205,48.05036],[31.4893,48.06409],[31.47007,48.06409],[31.47557,48.08332],[31.49754,48.08606],[31.48655,48.13001],[31.41789,48.12177],[31.42064,48.11078],[31.39592,48.10804],[31.37944,48.13275],[31.36845,48.11902],[31.33,48.11353],[31.32451,48.13825],[31.23662,48.11628],[31.22014,48.17121],[31.20091,48.16846],[31.18168,48.17945],[31.19267,48.19318],[31.16246,48.22339],[31.14049,48.22065],[31.13774,48.22889],[31.05534,48.22065],[31.05259,48.23163],[30.98118,48.22339],[30.98942,48.18494],[30.93174,48.18494],[30.93174,48.16571],[30.90153,48.16022],[30.85484,48.16022],[30.84935,48.18494],[30.81913,48.18769],[30.81364,48.16846],[30.79167,48.16846],[30.78618,48.19043],[30.72026,48.18769],[30.71751,48.19593],[30.6461,48.18494],[30.65709,48.17121],[30.62138,48.16571],[30.61589,48.15747],[30.55546,48.15473],[30.528,48.17945],[30.50602,48.15747],[30.49504,48.17121],[30.46757,48.16297],[30.43736,48.17395],[30.41264,48.16297],[30.3687,48.17395],[30.3275,48.16022],[30.3275,48.14649],[30.30827,48.14374],[30.26158,48.14923],[30.23961,48.14099],[30.18742,48.15473],[30.15172,48.14374],[30.06657,48.14649],[30.04735,48.15198],[30.02537,48.18494],[30.0034,48.18494],[30.00889,48.20691],[29.98967,48.22889],[29.97593,48.2179],[29.92924,48.23438],[29.89079,48.18494],[29.8441,48.21241],[29.79466,48.20142],[29.78093,48.20966],[29.77269,48.27283],[29.75071,48.28931],[29.75071,48.3003],[29.76445,48.29755],[29.78093,48.31403],[29.78367,48.33051],[29.8029,48.33326],[29.80015,48.34973],[29.81114,48.34973],[29.78642,48.36896],[29.87156,48.41565],[29.86332,48.42664],[29.95671,48.45136],[29.95396,48.46234],[29.96495,48.4596],[29.96769,48.47058],[30.05009,48.48157],[30.11326,48.45136],[30.14348,48.47333],[30.1627,48.50354],[30.22038,48.47882],[30.25609,48.48981],[30.25334,48.50629],[30.38517,48.52826],[30.40165,48.57495],[30.45384,48.58319],[30.4868,48.56397],[30.56645,48.56671],[30.5692,48.59143],[30.55821,48.59418],[30.57194,48.60517],[30.53074,48.62714],[30.55272,48.65461],[30.59941,48.66285],[30.61039,48.69855],[30.57469,48.72052],[30.61039,48.71778],[30.63786,48.75074],[30.69829,48.76722],[30.75047,48.76172],[30.75322,48.76996],[30.80266,48.75623],[30.8109,48.76996],[30.83287,48.75074],[30.88231,48.74524],[30.89604,48.74524],[30.90153,48.76172],[30.94548,48.75898],[30.94273,48.77271],[30.96745,48.76172],[31.03611,48.76172],[31.05809,48.75348],[31.06633,48.737],[31.08555,48.73151],[31.10203,48.73975],[31.11302,48.72876],[31.12126,48.73975],[31.15696,48.7425],[31.17619,48.76172],[31.21464,48.75623],[31.21739,48.76722],[31.25035,48.76722],[31.26133,48.74799],[31.31077,48.75898],[31.33,48.72602],[31.35472,48.72876],[31.35746,48.7425],[31.38493,48.72876],[31.39317,48.74799],[31.39317,48.73426],[31.4124,48.75623],[31.42338,48.7425],[31.43712,48.75348],[31.42338,48.76447],[31.46733,48.78919],[31.52775,48.80292],[31.52775,48.81665],[31.55797,48.83039],[31.55797,48.86335],[31.58268,48.87433],[31.56621,48.89905],[31.58268,48.91278],[31.59367,48.90729],[31.57994,48.88807],[31.60191,48.9018],[31.64036,48.90729],[31.64036,48.9018],[31.6898,48.8963],[31.69804,48.93201],[31.75023,48.92652],[31.80516,48.94849],[31.82164,48.9375],[31.91777,48.90729],[31.92051,48.87983],[31.94523,48.90729],[32.00291,48.91278],[32.02763,48.93201],[32.0496,48.91553],[32.09355,48.91828],[32.08806,48.90454],[32.09904,48.9018],[32.10454,48.91004],[32.14573,48.91278],[32.15397,48.94574],[32.132,48.95124],[32.13475,48.96497],[32.17869,48.97321],[32.18693,48.99518],[32.21715,48.98694],[32.23362,49.05835],[32.26384,49.0611],[32.26109,49.07758],[32.28306,49.08033],[32.28306,49.08582],[32.2968,49.07209],[32.31602,49.08033],[32.36546,49.07209],[32.37095,49.03913],[32.39567,49.02539],[32.41765,49.02814],[32.44236,49.05286],[32.4506,49.03913],[32.47258,49.03363],[32.47532,49.00617],[32.4973,49.01166],[32.52202,48.94025],[32.55223,48.943],[32.5385,48.96772],[32.57695,48.95948],[32.58244,48.95124],[32.60716,48.96497],[32.61265,48.95398],[32.67857,48.95673],[32.67582,48.98694],[32.69505,48.9842],[32.6978,48.97321],[32.73076,48.9787],[32.7335,48.96497],[32.84611,48.98145],[32.84337,48.98969],[32.87358,48.99244],[32.87083,49.00067],[32.82963,49.00891],[32.84337,49.02539],[32.82963,49.07483],[32.8159,49.07483],[32.89555,49.09406],[32.89006,49.12702],[32.77745,49.14075],[32.75822,49.16822],[32.85985,49.24512],[32.89006,49.23139],[32.92851,49.22864],[32.98344,49.23963],[32.98344,49.20942],[32.99443,49.20118],[33.01091,49.20392],[33.03288,49.1847],[33.10154,49.1847],[33.12077,49.17371],[33.15922,49.12976],[33.15922,49.09681],[33.18669,49.09681],[33.20042,49.07483],[33.22789,49.08582],[33.24711,49.08033],[33.24162,49.16547],[33.26085,49.15174],[33.26909,49.13526],[33.30479,49.11878],[33.28831,49.09681],[33.26085,49.09131],[33.32127,49.0611],[33.32676,49.02539],[33.29655,49.01166],[33.32402,48.96222],[33.31303,48.95948],[33.32127,48.94849],[33.35423,48.95398],[33.40092,48.92652],[33.40092,48.95398],[33.42839,48.943],[33.43113,48.95673],[33.47508,48.95124],[33.47508,48.91278],[33.49705,48.92652],[33.53825,48.93201],[33.54649,48.91278],[33.57396,48.91004],[33.56846,48.91828],[33.59044,48.91828],[33.63713,48.97596],[33.66459,48.97596],[33.7003,48.94574],[33.81566,48.9375],[33.89805,48.9018],[33.84861,48.80292],[33.85136,48.76996],[33.8184,48.77546],[33.81016,48.80292],[33.79368,48.79468],[33.77171,48.79193],[33.76896,48.80017],[33.72502,48.78919],[33.71678,48.81391],[33.68931,48.80841],[33.67283,48.81391],[33.65635,48.79193],[33.6179,48.78644],[33.60142,48.79743],[33.5822,48.79743],[33.58494,48.75348],[33.60692,48.75074],[33.6179,48.72876],[33.68107,48.72327],[33.73051,48.69306],[33.74699,48.69306],[33.74974,48.68207],[33.80467,48.68756],[33.80192,48.66285],[33.75523,48.65735],[33.76347,48.62714],[33.74424,48.61615],[33.71403,48.61066],[33.66185,48.58594],[33.65086,48.59967],[33.60966,48.59967],[33.6234,48.56671],[33.59044,48.55848],[33.58494,48.57495],[33.51079,48.56946],[33.51079,48.55848],[33.48057,48.55848],[33.48332,48.54749],[33.47233,48.54474],[33.48607,48.40467],[33.49705,48.39368],[33.46959,48.38819],[33.47233,48.36896],[33.46135,48.34973],[33.47783,48.34973],[33.47508,48.32776],[33.51628,48.32776],[33.51353,48.27832],[33.53001,48.27558],[33.54649,48.23438],[33.51079,48.2179],[33.51353,48.23163],[33.4998,48.23163],[33.49705,48.2179],[33.48607,48.21515],[33.49705,48.21241],[33.49705,48.20142],[33.43113,48.18769],[33.43113,48.17121],[33.29106,48.14923],[33.31578,48.12452],[33.29381,48.10254],[33.27733,48.10254],[33.27183,48.15473],[33.24711,48.15198],[33.24437,48.17395],[33.21141,48.17121],[33.23338,48.12726],[33.1812,48.11902],[33.18394,48.10529],[33.23613,48.11353],[33.22239,48.10529],[33.22514,48.09156],[33.14274,48.07782],[33.15373,48.04212],[33.14274,48.06409],[33.10978,48.06134],[33.10704,48.04212],[33.03563,48.03388],[33.02189,47.98444],[33.00541,47.98993],[32.99168,48.04761],[32.95323,48.03662],[32.94499,48.04212],[32.91203,48.03662],[32.91478,48.03113],[32.87083,48.03113],[32.89555,47.98444],[32.81041,47.9762],[32.78569,47.99268],[32.68956,47.98169],[32.6978,47.94599],[32.73625,47.95148],[32.74449,47.93225],[32.65111,47.92127],[32.6566,47.90479],[32.67582,47.90754],[32.68681,47.87183],[32.66484,47.87183],[32.67857,47.8526],[32.6566,47.81964],[32.62364,47.81415],[32.42863,47.78943],[32.42314,47.80042],[32.40117,47.79493],[32.39567,47.80042],[32.36271,47.78943],[32.30504,47.82514],[32.23637,47.81415],[32.23912,47.79493],[32.22264,47.79218],[32.23088,47.75922],[32.15947,47.75098],[32.15397,47.76197],[32.14024,47.74823],[32.13475,47.75922],[32.11827,47.75647],[32.11003,47.78394],[32.0908,47.78119],[32.07707,47.80591],[32.06059,47.80317],[32.0551,47.8169],[31.95897,47.80866],[31.96171,47.79767],[31.83812,47.78119],[31.83537,47.79218]]}},{"type":"Feature","properties":{"ADMIN_1":"Закарпатська область","COD_1":"UA21000000000011690"},"geometry":{"type":"LineString","coordinates":[[24.26854,47.90754],[24.22459,47.89655],[24.19713,47.91578],[24.11473,47.91578],[24.09825,47.935],[24.06254,47.95423],[24.03233,47.94873],[24.00761,47.96796],[23.98289,47.95972],[23.9774,47.96796],[23.95543,47.96521],[23.94169,47.94873],[23.88402,47.94324],[23.86479,47.93225],[23.84556,47.94324],[23.82084,47.98169],[23.77141,47.99543],[23.66704,47.98444],[23.6176,48.00916],[23.56541,48.00367],[23.52971,48.02015],[23.50224,47.96796],[23.46104,47.97345],[23.43358,47.98993],[23.4171,47.98719],[23.40062,48.00092],[23.33195,48.02015],[23.3347,48.03662],[23.28801,48.04761],[23.27702,48.06134],[23.29075,48.07233],[23.26878,48.08606],[23.26878,48.0998],[23.2523,48.0998],[23.24681,48.09156],[23.18913,48.09705],[23.1754,48.11902],[23.11497,48.08606],[23.12321,48.07782],[23.10673,48.06684],[23.11223,48.0531],[23.09849,48.04486],[23.10948,48.03662],[23.09025,48.02015],[23.09025,48.00641],[23.06553,48.00641],[23.01335,47.98993],[22.97764,48.00916],[22.9282,48.02015],[22.91996,48.00641],[22.93644,47.99543],[22.94743,47.96796],[22.89525,47.95423],[22.8925,47.96796],[22.87877,47.96247],[22.86778,47.9762],[22.84031,47.98169],[22.83757,47.99268],[22.88151,48.03662],[22.88151,48.05585],[22.87053,48.05036],[22.85679,48.07782],[22.83482,48.08057],[22.82658,48.11628],[22.81559,48.11628],[22.80736,48.10529],[22.80186,48.12177],[22.77165,48.12177],[22.77165,48.10804],[22.75517,48.11902],[22.73594,48.11902],[22.67277,48.09156],[22.59038,48.10804],[22.59861,48.11628],[22.58763,48.14099],[22.59861,48.14649],[22.56016,48.18219],[22.57115,48.19593],[22.5327,48.20966],[22.51347,48.22614],[22.51622,48.23713],[22.49699,48.23987],[22.50248,48.24811],[22.48875,48.2536],[22.45854,48.24262],[22.43382,48.2536],[22.40086,48.24811],[22.38438,48.23438],[22.33769,48.27832],[22.33769,48.30854],[22.31297,48.32502],[22.31846,48.35523],[22.26628,48.36072],[22.23881,48.38819],[22.26628,48.41016],[22.23332,48.41016],[22.20585,48.42664],[22.15642,48.40192],[22.14268,48.40467],[22.13719,48.43213],[22.17015,48.58869],[22.18937,48.61066],[22.24156,48.62714],[22.2498,48.64637],[22.30198,48.67658],[22.34044,48.68482],[22.36241,48.73151],[22.34318,48.75074],[22.34593,48.76722],[22.38713,48.80017],[22.37614,48.83313],[22.38438,48.86609],[22.42009,48.88532],[22.42558,48.92926],[22.47502,48.97596],[22.47777,48.99244],[22.54368,49.00617],[22.53819,49.02265],[22.55192,49.03089],[22.55192,49.08033],[22.58488,49.09681],[22.62608,49.08033],[22.63981,49.05835],[22.68101,49.03913],[22.71672,49.05286],[22.75517,49.04187],[22.76616,49.05286],[22.81285,49.02539],[22.83482,49.02539],[22.84855,49.00342],[22.88975,49.00617],[22.91447,48.98969],[22.91996,48.97046],[22.87327,48.95673],[22.87877,48.93201],[22.89799,48.90454],[22.9694,48.87433],[22.98588,48.83588],[22.99962,48.83039],[23.02159,48.84687],[23.05729,48.84687],[23.09575,48.86335],[23.13145,48.85236],[23.1342,48.83313],[23.16716,48.81665],[23.20286,48.75898],[23.26878,48.76172],[23.28526,48.77546],[23.32646,48.75348],[23.36216,48.76996],[23.39787,48.73151],[23.47203,48.71778],[23.51048,48.73426],[23.54619,48.72602],[23.59288,48.71778],[23.59837,48.70404],[23.63133,48.70404],[23.63682,48.68482],[23.70549,48.63813],[23.73295,48.63813],[23.74669,48.64637],[23.78788,48.64087],[23.79612,48.63263],[23.78514,48.61066],[23.79338,48.59143],[23.80436,48.58045],[23.83183,48.57495],[23.84556,48.55848],[23.88127,48.55298],[23.90599,48.56397],[23.92796,48.55298],[23.91423,48.5365],[23.92521,48.51178],[23.90873,48.48157],[23.92521,48.46509],[23.96641,48.4596],[24.00212,48.50629],[24.03233,48.5008],[24.12297,48.53376],[24.13395,48.52277],[24.11473,48.49805],[24.13945,48.48157],[24.12571,48.45136],[24.14494,48.43488],[24.15318,48.38819],[24.18065,48.37445],[24.18065,48.36347],[24.20811,48.36621],[24.25755,48.34973],[24.28776,48.37995],[24.28502,48.39643],[24.30424,48.39643],[24.34819,48.38269],[24.35643,48.35248],[24.41685,48.33326],[24.44432,48.30304],[24.48826,48.28107],[24.48552,48.24262],[24.52122,48.23713],[24.54594,48.21515],[24.51024,48.18769],[24.51848,48.17395],[24.50474,48.15198],[24.52397,48.14374],[24.52946,48.12452],[24.59813,48.08881],[24.62834,48.04761],[24.57341,48.01465],[24.56242,47.96796],[24.55143,47.95972],[24.52672,47.96247],[24.51298,47.95148],[24.43608,47.97071],[24.39488,47.95423],[24.38115,47.92676],[24.34544,47.91578],[24.32621,47.92676],[24.26854,47.90754]]}},{"type":"Feature","properties":{"ADMIN_1":"Херсонська область","COD_1":"UA65000000000030969"},"geometry":{"type":"MultiLineString","coordinates":[[[35.22465,46.22388],[35.23839,46.21839],[35.18895,46.15522],[35.14775,46.125],[34.98021,46.07831],[34.99119,46.10578],[35.02965,46.12775],[35.02965,46.14423],[35.13676,46.16071],[35.21367,46.18817],[35.22465,46.22388]],[[32.63463,46.05634],[32.77745,46.03162],[32.80491,46.03162],[32.86534,46.06183],[32.91478,46.03711],[32.94224,46.04535],[32.97795,46.02887],[33.03288,46.02887],[33.08232,46.01514],[33.03288,46.0069],[32.91478,46.01239],[32.72526,46.03711],[32.42039,46.0893],[32.08531,46.1662],[31.83812,46.19916],[31.62114,46.24036],[31.55522,46.27057],[31.52226,46.30353],[31.51127,46.33924],[31.51951,46.36396],[31.53599,46.36945],[31.53599,46.30078],[31.56621,46.26508],[31.61564,46.24585],[31.67332,46.25135],[31.76396,46.32001],[31.80516,46.331],[31.80516,46.47931],[31.81889,46.49579],[31.8491,46.50129],[31.86284,46.52326],[31.90129,46.55072],[31.9315,46.58094],[31.93974,46.62488],[31.98643,46.66333],[32.0084,46.66608],[32.00566,46.67707],[32.08806,46.68256],[32.07432,46.72925],[32.06059,46.72925],[32.05784,46.74573],[32.1732,46.75122],[32.17045,46.76221],[32.21989,46.77045],[32.20891,46.80616],[32.24736,46.82264],[32.22813,46.84461],[32.34074,46.79517],[32.3737,46.80066],[32.36546,46.82813],[32.46434,46.84186],[32.46983,46.81714],[32.53026,46.82264],[32.52476,46.84735],[32.54124,46.8501],[32.54124,46.88306],[32.54948,46.88306],[32.54674,46.86933],[32.57145,46.87207],[32.58519,46.85559],[32.68681,46.86109],[32.70054,46.81989],[32.76371,46.82813],[32.76646,46.81989],[32.7747,46.83088],[32.81315,46.83911],[32.95048,46.85834],[32.94499,46.86933],[32.92027,46.86658],[32.91752,46.88306],[32.84611,46.88031],[32.83787,46.88306],[32.84062,46.89954],[32.92576,46.91053],[32.92302,46.92701],[32.98069,46.9325],[32.9752,46.94898],[32.94774,46.94623],[32.934,46.98468],[32.95048,47.00391],[33.02189,46.9737],[33.15648,47.11652],[33.10429,47.13575],[33.08232,47.10828],[33.10154,47.10004],[33.07408,47.06159],[33.05211,47.06983],[33.02739,47.03962],[32.91478,47.08631],[32.91478,47.10553],[32.8983,47.11377],[32.95048,47.16321],[32.96147,47.19068],[32.99992,47.19068],[33.00541,47.19617],[33.0164,47.17969],[33.03837,47.17969],[33.03837,47.18793],[33.06584,47.19892],[33.06584,47.22089],[33.09605,47.22364],[33.11528,47.20441],[33.13176,47.20441],[33.14274,47.2099],[33.12626,47.23188],[33.18394,47.23737],[33.14,47.27307],[33.10429,47.27857],[33.10154,47.31977],[33.14,47.32526],[33.12077,47.38843],[33.03837,47.38019],[33.02739,47.42414],[33.03837,47.42414],[33.03288,47.44062],[33.05485,47.44336],[33.04661,47.46808],[33.07133,47.47632],[33.07133,47.41315],[33.13725,47.41864],[33.12352,47.50928],[33.14824,47.51477],[33.14,47.54224],[33.09605,47.52576],[33.0933,47.57795],[33.17021,47.56696],[33.23338,47.57795],[33.2169,47.534],[33.24162,47.53125],[33.28282,47.54499],[33.28007,47.51752],[33.31028,47.50104],[33.31578,47.48182],[33.34874,47.4928],[33.32402,47.52301],[33.48607,47.54499],[33.47233,47.58619],[33.57945,47.59992],[33.60966,47.56147],[33.58769,47.55872],[33.57945,47.53125],[33.58769,47.50104],[33.63713,47.51477],[33.64262,47.48456],[33.93651,47.51752],[33.95299,47.4571],[34.17546,47.46808],[34.23314,47.47358],[34.2606,47.36097],[34.27159,47.36097],[34.3018,47.27033],[34.32927,47.28955],[34.40068,47.28681],[34.40068,47.29779],[34.4199,47.30054],[34.41441,47.32251],[34.51329,47.33625],[34.51603,47.31977],[34.48033,47.31427],[34.48033,47.30329],[34.48857,47.27857],[34.51878,47.28406],[34.52977,47.2511],[34.49132,47.24561],[34.51878,47.10553],[34.55174,47.10553],[34.56822,47.02314],[34.59294,47.02588],[34.59843,46.99292],[34.6204,46.99292],[34.62315,46.9737],[34.68083,46.97919],[34.68632,46.95722],[34.73851,46.96271],[34.75224,46.88031],[34.80443,46.88306],[34.81541,46.82813],[34.75773,46.82264],[34.76597,46.78144],[34.74949,46.78144],[34.74949,46.75672],[34.73576,46.75672],[34.73576,46.74848],[34.65886,46.74024],[34.6616,46.7265],[34.6259,46.72376],[34.63139,46.68805],[34.68083,46.6908],[34.68358,46.67707],[34.74675,46.68256],[34.75773,46.62763],[34.71379,46.61939],[34.72203,46.58094],[34.74949,46.58368],[34.75773,46.55072],[34.88957,46.56446],[34.88957,46.50678],[34.94725,46.51227],[34.94725,46.50403],[35.02141,46.47931],[35.05436,46.48206],[35.07634,46.38044],[35.05986,46.37494],[35.07359,46.30078],[35.1038,46.30078],[35.03514,46.26233],[34.89506,46.24036],[34.83189,46.20465],[34.80992,46.16071],[34.8264,46.12775],[34.87309,45.94373],[34.96922,45.76795],[34.79893,45.80915],[34.80168,45.88056],[34.66435,45.97394],[34.60942,45.99866],[34.55723,45.99591],[34.49955,45.93549],[34.43089,45.97119],[34.39518,46.02338],[34.33201,46.07007],[34.24412,46.05359],[34.16447,46.06458],[34.13701,46.10028],[34.07933,46.11951],[34.0189,46.11127],[33.84038,46.20191],[33.78544,46.20191],[33.7415,46.18543],[33.64537,46.22937],[33.61516,46.22663],[33.62614,46.18268],[33.63713,46.14148],[33.61516,46.13599],[33.58494,46.15796],[33.57121,46.13874],[33.54649,46.13599],[33.5355,46.11676],[33.51079,46.12226],[33.51628,46.09754],[33.56572,46.07557],[33.51353,46.08106],[33.49431,46.07282],[33.49156,46.05359],[33.51903,46.03162],[33.50255,46.02887],[33.46135,46.05085],[33.42289,46.03986],[33.43663,46.02887],[33.42289,46.02887],[33.36522,46.07557],[33.37071,46.0893],[33.34324,46.09754],[33.32951,46.11676],[33.30754,46.0893],[33.32127,46.07557],[33.28557,46.07557],[33.28007,46.09754],[33.30479,46.09204],[33.31028,46.11402],[33.28282,46.13324],[33.24986,46.13874],[33.21415,46.1305],[33.20591,46.10578],[33.20591,46.13874],[33.22789,46.15522],[33.19767,46.17444],[33.18394,46.15522],[33.1345,46.125],[33.08507,46.13599],[33.06859,46.15247],[33.03013,46.15522],[33.01365,46.12226],[33.04112,46.11402],[32.91203,46.10578],[32.86534,46.11676],[32.79393,46.11402],[32.76921,46.12226],[32.67582,46.10028],[32.62364,46.10303],[32.5385,46.07557],[32.54399,46.06733],[32.63463,46.05634]]]}},{"type":"Feature","properties":{"ADMIN_1":"Запорізька область","COD_1":"UA23000000000064947"},"geometry":{"type":"LineString","coordinates":[[35.44438,46.43537],[35.23839,46.21839],[35.22465,46.22388],[35.1038,46.30078],[35.07359,46.30078],[35.05986,46.37494],[35.07634,46.38044],[35.05436,46.48206],[35.02141,46.47931],[34.94725,46.50403],[34.94725,46.51227],[34.88957,46.50678],[34.88957,46.56446],[34.75773,46.55072],[34.74949,46.58368],[34.72203,46.58094],[34.71379,46.61939],[34.75773,46.62763],[34.74675,46.68256],[34.68358,46.67707],[34.68083,46.6908],[34.63139,46.68805],[34.6259,46.72376],[34.6616,46.7265],[34.65886,46.74024],[34.73576,46.74848],[34.73576,46.75672],[34.74949,46.75672],[34.74949,46.78144],[34.76597,46.78144],[34.75773,46.82264],[34.81541,46.82813],[34.80443,46.88306],[34.75224,46.88031],[34.73851,46.96271],[34.68632,46.95722],[34.68083,46.97919],[34.62315,46.9737],[34.6204,46.99292],[34.59843,46.99292],[34.59294,47.02588],[34.56822,47.02314],[34.55174,47.10553],[34.51878,47.10553],[34.49132,47.24561],[34.52977,47.2511],[34.51878,47.28406],[34.48857,47.27857],[34.48033,47.30329],[34.48033,47.31427],[34.51603,47.31977],[34.51329,47.33625],[34.41441,47.32251],[34.4199,47.30054],[34.40068,47.29779],[34.40068,47.28681],[34.32927,47.28955],[34.3018,47.27033],[34.27159,47.36097],[34.2606,47.36097],[34.23314,47.47358],[34.17546,47.46808],[34.13975,47.47632],[34.22764,47.4928],[34.29905,47.51752],[34.46934,47.53125],[34.57646,47.56147],[34.64787,47.55872],[34.73851,47.53949],[34.79893,47.53675],[34.8621,47.51477],[34.92802,47.52576],[34.95823,47.53949],[34.96098,47.56147],[34.92253,47.55597],[34.95823,47.56421],[34.95274,47.57245],[34.93626,47.56971],[34.9445,47.5752],[34.92802,47.58069],[34.93626,47.58344],[34.92528,47.59442],[34.93351,47.59168],[34.94175,47.60266],[34.93351,47.63562],[34.91704,47.63288],[34.90605,47.67408],[34.93901,47.67682],[34.93077,47.71253],[34.95549,47.71253],[34.95823,47.77021],[34.89232,47.75922],[34.87858,47.8169],[34.9033,47.83063],[34.89781,47.8526],[34.87034,47.84986],[34.8621,47.88007],[34.81541,47.86359],[34.80168,47.91578],[34.85112,47.92127],[34.84837,47.93775],[34.87584,47.94324],[34.88133,47.92951],[34.91704,47.93225],[34.9033,47.98719],[34.87034,47.98169],[34.85936,48.01465],[34.84562,48.01465],[34.84013,48.05036],[34.87584,48.05585],[34.85386,48.13275],[34.91704,48.13001],[34.91429,48.09156],[34.9857,48.09705],[34.98845,48.08881],[35.03788,48.09705],[35.05711,48.11902],[35.09831,48.13001],[35.15873,48.12726],[35.19719,48.14099],[35.24388,48.1355],[35.29332,48.14374],[35.34001,48.12452],[35.41691,48.11078],[35.42241,48.0998],[35.5103,48.09705],[35.52403,48.07508],[35.70256,48.14099],[35.74376,48.0943],[35.80693,48.0998],[35.81517,48.06684],[35.96623,48.0943],[35.98546,48.08606],[35.96898,48.07508],[35.97447,48.0586],[35.9882,48.0586],[35.97447,48.04212],[36.05137,48.0586],[36.06511,48.02564],[36.03489,48.0174],[36.04039,48.00367],[36.06236,48.00092],[36.0706,47.97071],[36.04863,47.96521],[36.05137,47.95972],[36.07335,47.96521],[36.08433,47.92951],[36.10905,47.94049],[36.12278,47.8993],[36.13652,47.8938],[36.12004,47.86359],[36.08708,47.86084],[36.08159,47.88282],[36.05412,47.88007],[36.07335,47.84711],[36.10081,47.84986],[36.10081,47.84162],[36.17772,47.84986],[36.17772,47.8581],[36.1942,47.8581],[36.1887,47.83612],[36.26561,47.83338],[36.27659,47.8169],[36.33427,47.81964],[36.32329,47.83887],[36.47435,47.82514],[36.58421,47.84711],[36.60344,47.84986],[36.60893,47.84162],[36.59794,47.8169],[36.58696,47.8169],[36.58696,47.78394],[36.6721,47.79218],[36.68583,47.73175],[36.69957,47.73175],[36.7133,47.67957],[36.79295,47.68506],[36.77372,47.66309],[36.71879,47.66034],[36.72429,47.63013],[36.76549,47.63288],[36.76549,47.62464],[36.74626,47.62189],[36.74901,47.60541],[36.76549,47.60816],[36.76549,47.59992],[36.8314,47.62464],[36.89457,47.54499],[36.94401,47.5752],[36.96599,47.55323],[36.97972,47.56147],[37.00169,47.53949],[37.02092,47.55323],[37.0731,47.49555],[37.08409,47.49555],[37.15825,47.45435],[37.18022,47.48456],[37.1967,47.47907],[37.18846,47.46808],[37.24614,47.46808],[37.24888,47.4571],[37.19395,47.3747],[37.20494,47.35547],[37.16099,47.34174],[37.14726,47.38019],[37.10606,47.37744],[37.12254,47.34174],[37.09233,47.33075],[37.08409,47.31427],[37.0374,47.30054],[37.02641,47.31427],[36.94676,47.31153],[36.94401,47.31977],[36.92479,47.31977],[36.96324,47.20166],[36.93028,47.20166],[36.93028,47.20716],[36.85338,47.19892],[36.88908,47.17145],[36.90007,47.1742],[36.90831,47.16596],[36.91929,47.17145],[36.92204,47.16046],[36.93577,47.16596],[36.94951,47.15772],[36.98246,47.12476],[37.00169,47.12751],[37.01268,47.08905],[36.98521,47.08081],[37.02366,47.06708],[37.08134,47.04786],[37.09782,47.05884],[37.12529,47.03962],[37.08958,47.00666],[37.14177,46.98194],[37.10331,46.95996],[37.09233,46.9682],[37.02092,46.92701],[37.06212,46.88306],[37.03465,46.87207],[36.99345,46.86658],[36.89732,46.81165],[36.81767,46.67707],[36.76549,46.63037],[36.74901,46.63312],[36.75175,46.64411],[36.77647,46.6496],[36.79295,46.67157],[36.80119,46.66883],[36.80668,46.70728],[36.80394,46.67981],[36.82591,46.69629],[36.81767,46.72376],[36.7902,46.74848],[36.77372,46.74848],[36.77098,46.75672],[36.72154,46.77869],[36.62266,46.77869],[36.41392,46.7265],[36.35899,46.69904],[36.17222,46.49854],[36.14201,46.50129],[36.153,46.53974],[36.16673,46.52326],[36.21068,46.54248],[36.26011,46.60291],[36.26011,46.62213],[36.23265,46.65235],[36.1887,46.67157],[36.10631,46.65784],[36.04313,46.66883],[35.93602,46.66059],[35.86461,46.64411],[35.73002,46.58918],[35.69157,46.6139],[35.72728,46.58918],[35.65037,46.526],[35.57896,46.48206],[35.44438,46.43537]]}},{"type":"Feature","properties":{"ADMIN_1":"Черкаська область","COD_1":"UA71000000000010357"},"geometry":{"type":"LineString","coordinates":[[30.57469,48.72052],[30.61039,48.69855],[30.59941,48.66285],[30.55272,48.65461],[30.53074,48.62714],[30.57194,48.60517],[30.55821,48.59418],[30.5692,48.59143],[30.56645,48.56671],[30.4868,48.56397],[30.45384,48.58319],[30.40165,48.57495],[30.38517,48.52826],[30.25334,48.50629],[30.25609,48.48981],[30.22038,48.47882],[30.1627,48.50354],[30.14348,48.47333],[30.11326,48.45136],[30.05009,48.48157],[29.96769,48.47058],[29.96769,48.49256],[30.00065,48.49256],[30.00615,48.51453],[29.98967,48.51728],[30.01988,48.52002],[30.00615,48.57221],[29.95671,48.58319],[29.94847,48.59693],[29.95121,48.60791],[29.98967,48.61341],[29.98967,48.63538],[29.97868,48.63538],[29.95671,48.65735],[29.94572,48.65735],[29.94572,48.67109],[29.91826,48.67109],[29.87156,48.7013],[29.86058,48.69855],[29.86882,48.73426],[29.8853,48.737],[29.86058,48.75898],[29.86607,48.76447],[29.76445,48.78644],[29.7617,48.84687],[29.73149,48.85511],[29.726,48.88807],[29.70952,48.8963],[29.73698,48.90729],[29.70128,48.91828],[29.68754,48.91278],[29.65184,48.9375],[29.66008,48.94849],[29.65184,48.95948],[29.69578,49.00067],[29.6848,49.00617],[29.6848,49.02814],[29.6381,49.01166],[29.60515,49.05561],[29.62986,49.04737],[29.65184,49.09955],[29.6848,49.09131],[29.6793,49.11328],[29.73424,49.12152],[29.71226,49.1435],[29.726,49.20392],[29.70952,49.20667],[29.70402,49.22589],[29.726,49.2204],[29.73698,49.22864],[29.75346,49.22589],[29.726,49.20942],[29.75895,49.1792],[29.81389,49.18744],[29.82213,49.1792],[29.88255,49.1847],[29.87706,49.20118],[29.89903,49.20392],[29.93199,49.24787],[29.95671,49.25336],[29.94847,49.31104],[29.95945,49.30555],[30.00615,49.31379],[30.02537,49.33301],[30.07756,49.32203],[30.08854,49.28632],[30.11326,49.26984],[30.12425,49.28907],[30.10777,49.3028],[30.13249,49.31379],[30.13798,49.33026],[30.20115,49.32752],[30.19017,49.27533],[30.36595,49.25611],[30.37694,49.23688],[30.39891,49.3028],[30.42088,49.3028],[30.41264,49.33026],[30.44011,49.33301],[30.43736,49.35224],[30.47307,49.36597],[30.51701,49.32752],[30.54722,49.32752],[30.56645,49.35224],[30.58293,49.34949],[30.60765,49.37146],[30.63786,49.35498],[30.67631,49.35498],[30.7285,49.33301],[30.75047,49.344],[30.77794,49.344],[30.79991,49.35498],[30.86583,49.34949],[30.88505,49.36322],[30.90977,49.35773],[30.93724,49.39344],[30.93724,49.40717],[30.92076,49.41541],[30.99492,49.42365],[31.03062,49.47034],[31.04435,49.45661],[31.03886,49.47309],[31.09379,49.49506],[31.09929,49.54724],[31.11851,49.56098],[31.15422,49.55548],[31.14049,49.57196],[31.15147,49.5802],[31.1295,49.58295],[31.13499,49.60492],[31.20091,49.67633],[31.20091,49.69007],[31.2119,49.68732],[31.21739,49.69556],[31.19542,49.70105],[31.22288,49.73401],[31.20366,49.75598],[31.21739,49.77796],[31.18992,49.78894],[31.22014,49.83289],[31.20915,49.85212],[31.2476,49.86859],[31.26133,49.85761],[31.31077,49.89057],[31.3657,49.89606],[31.37944,49.90705],[31.33549,49.93451],[31.34648,49.94825],[31.33824,49.95374],[31.31352,49.96473],[31.2888,49.95374],[31.30528,49.97296],[31.2888,49.97022],[31.29155,49.97846],[31.38218,49.99219],[31.43712,49.98395],[31.44536,49.97296],[31.42613,49.91529],[31.4481,49.87683],[31.46733,49.87409],[31.47831,49.86036],[31.49754,49.86036],[31.50578,49.84113],[31.51677,49.84662],[31.51951,49.86859],[31.54973,49.87409],[31.57994,49.90705],[31.6129,49.90705],[31.61564,49.85486],[31.71727,49.85212],[31.75297,49.89331],[31.77495,49.89331],[31.7722,49.92078],[31.79417,49.93451],[31.8134,49.96747],[31.8903,49.96198],[31.90129,49.94275],[31.91777,49.96198],[31.91777,49.99219],[31.90129,50.01966],[31.96721,50.04438],[31.98094,50.03888],[31.98643,50.05262],[31.90403,50.05536],[31.91227,50.10205],[31.97545,50.12403],[31.95897,50.14051],[31.94523,50.13776],[31.93425,50.15699],[31.96446,50.15149],[32.00017,50.19544],[31.99467,50.20093],[32.01664,50.20642],[32.0551,50.1872],[32.08531,50.22016],[32.10728,50.22016],[32.11827,50.2284],[32.12651,50.22565],[32.11278,50.21192],[32.16221,50.1872],[32.17595,50.16523],[32.29954,50.14051],[32.30504,50.12128],[32.2501,50.11304],[32.27757,50.09656],[32.26109,50.08283],[32.31328,50.03888],[32.3325,50.05811],[32.34349,50.05262],[32.34349,50.03614],[32.36546,50.03339],[32.37919,49.9812],[32.42863,49.95923],[32.41765,49.93451],[32.42863,49.93177],[32.4149,49.9043],[32.43413,49.88782],[32.40391,49.87409],[32.39293,49.88507],[32.3737,49.87409],[32.43687,49.8219],[32.4506,49.79718],[32.50279,49.80542],[32.51378,49.77521],[32.55497,49.77246],[32.57145,49.75324],[32.5742,49.7038],[32.66484,49.68183],[32.70878,49.65436],[32.70054,49.64887],[32.71428,49.61316],[32.70329,49.60218],[32.75273,49.5802],[32.74998,49.52253],[32.71153,49.50055],[32.67857,49.49781],[32.66758,49.46759],[32.67308,49.44837],[32.65111,49.43463],[32.67857,49.4264],[32.67857,49.40168],[32.6923,49.3852],[32.71153,49.3852],[32.73625,49.37146],[32.73625,49.35224],[32.67582,49.35224],[32.59343,49.37696],[32.54124,49.38245],[32.51103,49.40717],[32.45884,49.34674],[32.47807,49.3385],[32.46708,49.32752],[32.59617,49.27533],[32.60716,49.25336],[32.63463,49.25885],[32.65934,49.24787],[32.71428,49.25611],[32.76371,49.23139],[32.81315,49.24787],[32.85985,49.24512],[32.75822,49.16822],[32.77745,49.14075],[32.89006,49.12702],[32.89555,49.09406],[32.8159,49.07483],[32.82963,49.07483],[32.84337,49.02539],[32.82963,49.00891],[32.87083,49.00067],[32.87358,48.99244],[32.84337,48.98969],[32.84611,48.98145],[32.7335,48.96497],[32.73076,48.9787],[32.6978,48.97321],[32.69505,48.9842],[32.67582,48.98694],[32.67857,48.95673],[32.61265,48.95398],[32.60716,48.96497],[32.58244,48.95124],[32.57695,48.95948],[32.5385,48.96772],[32.55223,48.943],[32.52202,48.94025],[32.4973,49.01166],[32.47532,49.00617],[32.47258,49.03363],[32.4506,49.03913],[32.44236,49.05286],[32.41765,49.02814],[32.39567,49.02539],[32.37095,49.03913],[32.36546,49.07209],[32.31602,49.08033],[32.2968,49.07209],[32.28306,49.08582],[32.28306,49.08033],[32.26109,49.07758],[32.26384,49.0611],[32.23362,49.05835],[32.21715,48.98694],[32.18693,48.99518],[32.17869,48.97321],[32.13475,48.96497],[32.132,48.95124],[32.15397,48.94574],[32.14573,48.91278],[32.10454,48.91004],[32.09904,48.9018],[32.08806,48.90454],[32.09355,48.91828],[32.0496,48.91553],[32.02763,48.93201],[32.00291,48.91278],[31.94523,48.90729],[31.92051,48.87983],[31.91777,48.90729],[31.82164,48.9375],[31.80516,48.94849],[31.75023,48.92652],[31.69804,48.93201],[31.6898,48.8963],[31.64036,48.9018],[31.64036,48.90729],[31.60191,48.9018],[31.57994,48.88807],[31.59367,48.90729],[31.58268,48.91278],[31.56621,48.89905],[31.58268,48.87433],[31.55797,48.86335],[31.55797,48.83039],[31.52775,48.81665],[31.52775,48.80292],[31.46733,48.78919],[31.42338,48.76447],[31.43712,48.75348],[31.42338,48.7425],[31.4124,48.75623],[31.39317,48.73426],[31.39317,48.74799],[31.38493,48.72876],[31.35746,48.7425],[31.35472,48.72876],[31.33,48.72602],[31.31077,48.75898],[31.26133,48.74799],[31.25035,48.76722],[31.21739,48.76722],[31.21464,48.75623],[31.17619,48.76172],[31.15696,48.7425],[31.12126,48.73975],[31.11302,48.72876],[31.10203,48.73975],[31.08555,48.73151],[31.06633,48.737],[31.05809,48.75348],[31.03611,48.76172],[30.96745,48.76172],[30.94273,48.77271],[30.94548,48.75898],[30.90153,48.76172],[30.89604,48.74524],[30.88231,48.74524],[30.83287,48.75074],[30.8109,48.76996],[30.80266,48.75623],[30.75322,48.76996],[30.75047,48.76172],[30.69829,48.76722],[30.63786,48.75074],[30.61039,48.71778],[30.57469,48.72052]]}},{"type":"Feature","properties":{"ADMIN_1":"Житомирська область","COD_1":"UA18000000000041385"},"geometry":{"type":"LineString","coordinates":[[28.98442,49.60218],[29.00914,49.63239],[28.98167,49.64338],[28.96245,49.67359],[28.94597,49.67908],[29.00364,49.73127],[28.96519,49.75598],[28.96519,49.77521],[28.94322,49.78345],[28.97069,49.80268],[28.9597,49.8219],[28.94597,49.81916],[28.95421,49.84113],[28.90202,49.8631],[28.89927,49.88233],[28.88005,49.88782],[28.85808,49.88782],[28.84434,49.86036],[28.78392,49.85212],[28.78392,49.84388],[28.75096,49.84388],[28.7592,49.81916],[28.74547,49.81641],[28.73448,49.79718],[28.70701,49.80817],[28.69053,49.79993],[28.6356,49.81641],[28.63835,49.80817],[28.62736,49.81641],[28.60264,49.81092],[28.60264,49.78345],[28.56968,49.77521],[28.52849,49.81916],[28.48179,49.80817],[28.46806,49.8219],[28.42137,49.82465],[28.40764,49.79169],[28.38017,49.7807],[28.29777,49.79993],[28.26207,49.79993],[28.25108,49.81366],[28.22636,49.7862],[28.21263,49.79169],[28.15495,49.78894],[28.09178,49.77246],[27.96269,49.77796],[27.89952,49.76697],[27.89128,49.75598],[27.83635,49.75598],[27.81712,49.73401],[27.78142,49.72852],[27.74846,49.75598],[27.70451,49.76972],[27.72648,49.79993],[27.7155,49.80542],[27.66881,49.80817],[27.65782,49.79718],[27.62211,49.84113],[27.62761,49.84937],[27.61113,49.87683],[27.62486,49.89331],[27.59465,49.89057],[27.56718,49.90979],[27.56169,49.90155],[27.54796,49.9043],[27.54796,49.93451],[27.57542,49.94825],[27.54521,50.01142],[27.56993,50.01966],[27.61113,50.00592],[27.64134,50.03614],[27.65782,50.02515],[27.68254,50.03339],[27.66881,50.07734],[27.61662,50.08557],[27.63035,50.10205],[27.62486,50.11304],[27.63859,50.11579],[27.62486,50.12128],[27.6331,50.146],[27.67705,50.15699],[27.66057,50.17072],[27.66331,50.19269],[27.63585,50.1872],[27.64134,50.17347],[27.62211,50.17072],[27.62211,50.19818],[27.61113,50.19544],[27.60838,50.21466],[27.5919,50.21466],[27.59739,50.25861],[27.54246,50.24488],[27.52049,50.22565],[27.49028,50.23938],[27.48204,50.25586],[27.44359,50.26136],[27.44359,50.27509],[27.42161,50.27234],[27.39415,50.28882],[27.41887,50.29706],[27.41612,50.30805],[27.36393,50.33277],[27.3145,50.33277],[27.31999,50.36847],[27.24858,50.39319],[27.30076,50.49207],[27.2678,50.49207],[27.25956,50.51404],[27.20738,50.53052],[27.19639,50.56073],[27.2321,50.56623],[27.21562,50.5882],[27.22386,50.60468],[27.18815,50.62116],[27.21287,50.64038],[27.20463,50.6651],[27.24583,50.67334],[27.2733,50.72553],[27.26231,50.74475],[27.27055,50.76398],[27.24309,50.76947],[27.24309,50.79145],[27.2321,50.79694],[27.24309,50.8299],[27.2321,50.83539],[27.25682,50.89582],[27.21562,50.92054],[27.23759,50.94525],[27.22386,50.95349],[27.19914,51.00019],[27.22661,51.00843],[27.22111,51.0304],[27.32548,51.04139],[27.32274,51.07984],[27.36668,51.09632],[27.36393,51.14301],[27.39689,51.17047],[27.39964,51.20069],[27.4738,51.23639],[27.44633,51.25562],[27.46007,51.26386],[27.44084,51.31055],[27.49028,51.31604],[27.52873,51.3545],[27.52598,51.36548],[27.49577,51.37372],[27.50401,51.45337],[27.53422,51.45337],[27.52598,51.44239],[27.53697,51.42865],[27.58366,51.40119],[27.61387,51.40393],[27.60014,51.4314],[27.58366,51.42865],[27.57817,51.47809],[27.62486,51.48359],[27.64958,51.50281],[27.66881,51.49732],[27.66331,51.51654],[27.73747,51.47535],[27.76219,51.4726],[27.80064,51.53302],[27.85008,51.54401],[27.82536,51.57422],[27.83909,51.60718],[27.81987,51.61817],[27.8336,51.62366],[27.86107,51.6319],[27.9105,51.61542],[27.92149,51.60443],[27.91874,51.57697],[27.97368,51.59345],[27.93797,51.55774],[28.04783,51.56598],[28.07255,51.57972],[28.08079,51.57422],[28.1165,51.58521],[28.11924,51.59894],[28.16319,51.62091],[28.17143,51.64289],[28.25657,51.67859],[28.27031,51.67035],[28.25383,51.62091],[28.28129,51.62366],[28.34172,51.57697],[28.34996,51.54401],[28.39116,51.5495],[28.46531,51.58796],[28.49278,51.5907],[28.5532,51.58246],[28.5532,51.57148],[28.65757,51.56873],[28.62736,51.56324],[28.65208,51.56324],[28.6411,51.555],[28.68229,51.44513],[28.69877,51.44239],[28.73448,51.46436],[28.73173,51.43415],[28.75371,51.41492],[28.78117,51.45612],[28.76194,51.48633],[28.81962,51.55774],[28.8361,51.55774],[28.90477,51.58796],[28.96794,51.5907],[28.97343,51.57422],[28.99815,51.57422],[29.119,51.65662],[29.17393,51.64838],[29.15745,51.62641],[29.18492,51.62091],[29.17668,51.60718],[29.20414,51.59619],[29.21513,51.56598],[29.25358,51.56598],[29.25358,51.48084],[29.26732,51.47535],[29.27281,51.45612],[29.30302,51.45063],[29.3195,51.37921],[29.3607,51.38745],[29.3607,51.37647],[29.39366,51.37921],[29.39641,51.32703],[29.34697,51.32428],[29.36619,51.30506],[29.35521,51.27484],[29.33598,51.26935],[29.33049,51.27759],[29.26732,51.26386],[29.30302,51.16773],[29.32225,51.12653],[29.33049,51.15674],[29.34971,51.15949],[29.42662,51.12378],[29.45958,51.09082],[29.51176,51.06061],[29.46507,51.01941],[29.46782,50.98645],[29.41288,50.98371],[29.41014,50.948],[29.43486,50.94525],[29.46782,50.92603],[29.47056,50.90406],[29.52,50.86835],[29.49803,50.83814],[29.52824,50.82441],[29.54197,50.82715],[29.54747,50.81342],[29.50078,50.81891],[29.48704,50.81342],[29.52275,50.79145],[29.50627,50.77497],[29.47606,50.77222],[29.50902,50.76673],[29.53373,50.77771],[29.56944,50.77222],[29.57768,50.74201],[29.59691,50.72828],[29.57768,50.69806],[29.54197,50.68708],[29.52275,50.66236],[29.48704,50.66236],[29.47606,50.65137],[29.4843,50.64588],[29.46232,50.63214],[29.47331,50.6294],[29.44584,50.62116],[29.49803,50.59095],[29.50352,50.547],[29.48704,50.53601],[29.45683,50.53876],[29.45958,50.51679],[29.50627,50.50031],[29.51176,50.4701],[29.4843,50.45911],[29.45683,50.4701],[29.44584,50.45362],[29.49803,50.45087],[29.49803,50.43988],[29.48155,50.41791],[29.4431,50.41516],[29.45408,50.40143],[29.48155,50.40418],[29.48155,50.41242],[29.5612,50.4234],[29.59141,50.40143],[29.58867,50.37397],[29.61613,50.36573],[29.6381,50.37122],[29.64085,50.35749],[29.61064,50.34101],[29.62712,50.33002],[29.69304,50.32453],[29.67656,50.29706],[29.68754,50.27784],[29.66557,50.27509],[29.66557,50.2641],[29.70128,50.23114],[29.6848,50.22565],[29.6436,50.17896],[29.69304,50.15149],[29.66008,50.12677],[29.65458,50.11853],[29.67106,50.11304],[29.64634,50.10755],[29.69578,50.0691],[29.69578,50.04438],[29.67106,50.03339],[29.69853,50.00592],[29.69029,49.99768],[29.71776,49.97846],[29.71501,49.96747],[29.72874,49.96747],[29.7205,49.95923],[29.73424,49.9455],[29.72874,49.93177],[29.66557,49.91254],[29.62712,49.88507],[29.63261,49.87683],[29.66557,49.87409],[29.65458,49.86585],[29.64085,49.86859],[29.62163,49.85212],[29.60515,49.85486],[29.59416,49.84113],[29.54747,49.83564],[29.54197,49.81916],[29.50902,49.83564],[29.48155,49.80268],[29.47056,49.81366],[29.4376,49.80542],[29.46232,49.76148],[29.43486,49.72852],[29.44584,49.71479],[29.49528,49.71479],[29.48979,49.66809],[29.51451,49.6626],[29.50627,49.64887],[29.43211,49.6626],[29.42662,49.65161],[29.41014,49.65985],[29.37993,49.61866],[29.35521,49.6269],[29.34147,49.61591],[29.32774,49.6269],[29.27556,49.6269],[29.27556,49.59119],[29.25358,49.59119],[29.2426,49.60218],[29.21238,49.58844],[29.15196,49.59394],[29.11625,49.58295],[29.10527,49.59394],[29.02836,49.59119],[28.98442,49.60218]]}},{"type":"Feature","properties":{"ADMIN_1":"Чернівецька область","COD_1":"UA73000000000044923"},"geometry":{"type":"LineString","coordinates":[[24.92222,47.72626],[24.94694,47.79493],[24.98539,47.82788],[24.99638,47.8581],[24.95518,47.88007],[24.9442,47.8993],[24.96068,47.90204],[24.95793,47.91852],[24.91948,47.94873],[24.92772,47.95423],[24.91398,47.96796],[24.91124,48.02838],[24.99363,48.08606],[24.9799,48.11078],[24.99913,48.11902],[25.03483,48.11078],[25.04033,48.12726],[25.06779,48.13275],[25.06505,48.15747],[25.09251,48.16022],[25.08153,48.17121],[25.08976,48.18219],[25.13646,48.18219],[25.13646,48.19593],[25.10624,48.22614],[25.14744,48.24811],[25.17491,48.24536],[25.19139,48.2536],[25.24357,48.31403],[25.27653,48.32776],[25.31498,48.36621],[25.38365,48.39368],[25.43583,48.39368],[25.44407,48.40467],[25.51274,48.39917],[25.57316,48.3772],[25.61986,48.37995],[25.61986,48.41291],[25.60338,48.41016],[25.61162,48.4184],[25.59788,48.47333],[25.60887,48.52552],[25.58415,48.63538],[25.64183,48.67109],[25.70775,48.66285],[25.73521,48.63263],[25.76542,48.67109],[25.79838,48.67109],[25.85606,48.6189],[25.85057,48.59693],[25.87254,48.59967],[25.90825,48.58594],[25.93297,48.59143],[25.97142,48.6189],[26.02086,48.61066],[26.03459,48.64637],[26.05107,48.64911],[26.0648,48.60791],[26.04558,48.58594],[26.09501,48.53925],[26.12797,48.55573],[26.09501,48.59967],[26.10051,48.61341],[26.11699,48.6189],[26.14445,48.59693],[26.1472,48.54474],[26.16917,48.52826],[26.19938,48.52552],[26.26805,48.53925],[26.29826,48.50904],[26.32573,48.51728],[26.35594,48.50629],[26.39164,48.53376],[26.44383,48.53925],[26.48778,48.54474],[26.56193,48.45685],[26.61686,48.45411],[26.6251,48.46784],[26.61137,48.50629],[26.63334,48.50629],[26.66905,48.48432],[26.69652,48.48706],[26.71299,48.49805],[26.67454,48.53925],[26.62236,48.5365],[26.62236,48.55573],[26.66081,48.56122],[26.70201,48.5365],[26.72947,48.53376],[26.74321,48.55848],[26.72123,48.57495],[26.72673,48.58869],[26.7487,48.58045],[26.76243,48.55024],[26.77891,48.54749],[26.79539,48.56397],[26.77891,48.59143],[26.80089,48.60791],[26.82286,48.60517],[26.82011,48.58045],[26.84208,48.55848],[26.88054,48.542],[26.90251,48.55024],[26.92448,48.5777],[26.96568,48.5777],[26.98216,48.59143],[26.99589,48.57221],[27.08928,48.55848],[27.17167,48.58319],[27.25132,48.56946],[27.25956,48.58319],[27.24309,48.61066],[27.25682,48.62165],[27.28154,48.62165],[27.32274,48.60242],[27.35295,48.62989],[27.37217,48.62989],[27.45183,48.59693],[27.48204,48.5365],[27.47929,48.50629],[27.49852,48.48157],[27.53422,48.47058],[27.46556,48.44861],[27.44633,48.41016],[27.38316,48.41016],[27.37217,48.44037],[27.35295,48.44861],[27.35295,48.44037],[27.33922,48.44861],[27.33647,48.44037],[27.31999,48.44312],[27.28703,48.37171],[27.26506,48.37995],[27.23485,48.37171],[27.1909,48.39368],[27.16069,48.37995],[27.12498,48.37995],[27.08653,48.41291],[27.08378,48.43488],[27.06181,48.42115],[27.01512,48.42389],[27.03984,48.41016],[27.04533,48.37445],[27.02885,48.38269],[27.00413,48.37995],[26.99589,48.36072],[26.92997,48.37171],[26.93272,48.36347],[26.89427,48.38269],[26.90251,48.39643],[26.86955,48.42115],[26.85032,48.41291],[26.77617,48.4184],[26.75419,48.39917],[26.72398,48.41291],[26.71025,48.40467],[26.76518,48.35248],[26.79539,48.34424],[26.80638,48.35248],[26.8256,48.34424],[26.8311,48.31403],[26.81736,48.2948],[26.79539,48.29206],[26.76793,48.30304],[26.75694,48.32502],[26.73771,48.31403],[26.69377,48.36072],[26.68278,48.35523],[26.69652,48.32776],[26.67454,48.32502],[26.61686,48.27283],[26.6306,48.2591],[26.6306,48.24811],[26.61412,48.25086],[26.62236,48.24262],[26.60313,48.23713],[26.58665,48.24811],[26.57017,48.23713],[26.57292,48.22065],[26.5482,48.22614],[26.53447,48.20966],[26.47404,48.2179],[26.43834,48.20417],[26.43834,48.19318],[26.41911,48.19867],[26.38615,48.18769],[26.37517,48.19867],[26.36143,48.18494],[26.35045,48.19318],[26.35045,48.18494],[26.33397,48.18494],[26.33397,48.16022],[26.29826,48.13275],[26.2653,48.07782],[26.21037,48.05036],[26.18565,47.99543],[26.10051,47.97895],[26.0648,47.98719],[25.95219,47.97071],[25.91374,47.97895],[25.89177,47.96247],[25.85057,47.96796],[25.77366,47.94049],[25.64457,47.95148],[25.59239,47.93775],[25.31498,47.91578],[25.26829,47.89106],[25.22984,47.8938],[25.2216,47.8581],[25.20512,47.8526],[25.17766,47.82514],[25.17216,47.79767],[25.13096,47.77845],[25.11174,47.75647],[25.06505,47.73999],[25.05406,47.74549],[25.04033,47.72626],[25.00737,47.73175],[24.99638,47.72626],[24.92222,47.72626]]}},{"type":"Feature","properties":{"ADMIN_1":"Тернопільська область","COD_1":"UA61000000000060328"},"geometry":{"type":"LineString","coordinates":[[25.32597,48.83863],[25.32048,48.84687],[25.29027,48.84687],[25.28203,48.86335],[25.26555,48.86609],[25.23808,48.86609],[25.22709,48.84687],[25.20787,48.84687],[25.22984,48.88257],[25.23533,48.93201],[25.21061,48.92102],[25.19139,48.92652],[25.19688,48.91553],[25.16667,48.89356],[25.16942,48.86884],[25.1392,48.86884],[25.11723,48.92377],[25.14744,48.943],[25.10899,48.96497],[25.11998,48.99518],[25.08702,48.99244],[25.08702,48.9842],[25.07603,48.9842],[25.01835,49.01166],[24.96617,48.99244],[24.96892,49.01166],[24.90574,49.05011],[24.91673,49.08307],[24.99089,49.07209],[24.99089,49.08582],[24.97166,49.09681],[24.98539,49.11603],[24.95518,49.12702],[24.90025,49.12976],[24.85631,49.16272],[24.85631,49.17646],[24.93321,49.23688],[24.84257,49.2616],[24.83983,49.28357],[24.82884,49.28632],[24.82884,49.32203],[24.83708,49.34125],[24.85905,49.34674],[24.83433,49.36322],[24.82884,49.3852],[24.77665,49.37696],[24.77116,49.43189],[24.72172,49.49781],[24.72172,49.56922],[24.79039,49.57196],[24.80137,49.58844],[24.82884,49.59394],[24.83433,49.5857],[24.83433,49.59943],[24.86455,49.59943],[24.87004,49.61042],[24.90574,49.59668],[24.903,49.61316],[24.94145,49.61042],[24.93321,49.61591],[24.95518,49.61591],[24.96068,49.64338],[24.98265,49.63788],[24.98814,49.64338],[24.99638,49.69556],[25.0211,49.73401],[25.06779,49.71204],[25.11174,49.74225],[25.1035,49.75598],[25.07329,49.76972],[25.08976,49.78345],[25.08427,49.8274],[25.13646,49.81366],[25.15019,49.83289],[25.17491,49.83838],[25.23808,49.82465],[25.25731,49.83838],[25.28752,49.8274],[25.29851,49.85486],[25.37541,49.86859],[25.38914,49.89606],[25.37541,49.91254],[25.3864,49.93177],[25.42759,49.93726],[25.42759,49.94275],[25.40288,49.94825],[25.41111,49.97022],[25.40288,49.9867],[25.34794,50.00318],[25.36442,50.04712],[25.43034,50.05262],[25.43858,50.07184],[25.45781,50.08283],[25.45506,50.09381],[25.48802,50.10205],[25.48527,50.11304],[25.45506,50.11579],[25.44957,50.12952],[25.44957,50.15149],[25.47703,50.16523],[25.55394,50.15149],[25.57591,50.17621],[25.62535,50.15149],[25.68577,50.17621],[25.72148,50.17347],[25.72972,50.1872],[25.76268,50.17896],[25.8231,50.18171],[25.85881,50.19269],[25.87803,50.22016],[25.93571,50.25586],[25.96318,50.25586],[26.00987,50.2284],[26.0648,50.25861],[26.16368,50.23114],[26.19114,50.2641],[26.22136,50.26685],[26.21312,50.23114],[26.18565,50.2284],[26.18016,50.19818],[26.22136,50.17896],[26.20762,50.15424],[26.2241,50.14325],[26.24333,50.14325],[26.23509,50.13227],[26.27354,50.11304],[26.27354,50.10205],[26.19938,50.09656],[26.20213,50.06635],[26.22136,50.06086],[26.22685,50.04712],[26.17466,50.02515],[26.21037,50.01691],[26.20213,49.99219],[26.17192,49.99494],[26.14171,49.97296],[26.16642,49.92353],[26.13896,49.91254],[26.13347,49.89881],[26.20213,49.86585],[26.17741,49.84662],[26.21586,49.81092],[26.22685,49.7807],[26.24058,49.77521],[26.24333,49.745],[26.21312,49.73401],[26.19114,49.71479],[26.24333,49.69281],[26.27354,49.65711],[26.25981,49.65436],[26.26256,49.63788],[26.23234,49.63788],[26.19938,49.61042],[26.21861,49.54999],[26.20213,49.54724],[26.19114,49.55548],[26.17466,49.54999],[26.14171,49.50879],[26.19114,49.47858],[26.19389,49.42914],[26.23509,49.40168],[26.21861,49.37696],[26.24608,49.36872],[26.23234,49.35773],[26.24333,49.34674],[26.2296,49.34949],[26.22685,49.33026],[26.25981,49.28907],[26.24882,49.28632],[26.25706,49.27808],[26.24333,49.27808],[26.25706,49.26435],[26.24333,49.25611],[26.24333,49.24237],[26.20213,49.24512],[26.20762,49.23139],[26.1829,49.19568],[26.19664,49.1847],[26.1884,49.17371],[26.21037,49.16272],[26.19114,49.15723],[26.20488,49.13251],[26.19114,49.07758],[26.21586,49.07209],[26.1829,49.05835],[26.20762,49.03638],[26.19664,49.02539],[26.21586,49.00617],[26.17741,48.99518],[26.21312,48.98145],[26.17741,48.97321],[26.20762,48.95673],[26.19664,48.91828],[26.1829,48.91553],[26.19664,48.90454],[26.21312,48.91278],[26.2241,48.91004],[26.20488,48.8963],[26.21312,48.86609],[26.19938,48.85785],[26.22136,48.84687],[26.23509,48.8194],[26.24882,48.82215],[26.25706,48.81665],[26.25157,48.80841],[26.22685,48.81391],[26.23234,48.78919],[26.21586,48.80017],[26.20762,48.79743],[26.21586,48.78095],[26.23784,48.77546],[26.2296,48.76172],[26.24608,48.75348],[26.2241,48.75074],[26.24333,48.737],[26.2296,48.70679],[26.23784,48.69855],[26.22136,48.68482],[26.24608,48.68482],[26.24882,48.66834],[26.27629,48.67383],[26.27354,48.64637],[26.3065,48.65735],[26.28727,48.64087],[26.32023,48.63538],[26.32298,48.62714],[26.29277,48.62165],[26.32573,48.61066],[26.34221,48.58594],[26.36143,48.58594],[26.33671,48.56946],[26.36418,48.55848],[26.35869,48.542],[26.37517,48.54474],[26.3834,48.56397],[26.40812,48.542],[26.43284,48.54749],[26.44383,48.53925],[26.39164,48.53376],[26.35594,48.50629],[26.32573,48.51728],[26.29826,48.50904],[26.26805,48.53925],[26.19938,48.52552],[26.16917,48.52826],[26.1472,48.54474],[26.14445,48.59693],[26.11699,48.6189],[26.10051,48.61341],[26.09501,48.59967],[26.12797,48.55573],[26.09501,48.53925],[26.04558,48.58594],[26.0648,48.60791],[26.05107,48.64911],[26.03459,48.64637],[26.02086,48.61066],[25.97142,48.6189],[25.93297,48.59143],[25.90825,48.58594],[25.87254,48.59967],[25.85057,48.59693],[25.85606,48.6189],[25.79838,48.67109],[25.76542,48.67109],[25.73521,48.63263],[25.70775,48.66285],[25.64183,48.67109],[25.61986,48.67932],[25.65281,48.70404],[25.60887,48.72327],[25.64183,48.74799],[25.54844,48.80017],[25.50175,48.80841],[25.45506,48.83039],[25.4633,48.8606],[25.43034,48.87159],[25.43858,48.84961],[25.42759,48.84412],[25.35069,48.8606],[25.33696,48.85511],[25.3397,48.83863],[25.32597,48.83863]]}},{"type":"Feature","properties":{"ADMIN_1":"Чернігівська область","COD_1":"UA74000000000025378"},"geometry":{"type":"MultiLineString","coordinates":[[[32.25285,50.37397],[32.26384,50.36298],[32.2556,50.35199],[32.26933,50.35199],[32.2556,50.3465],[32.21989,50.35749],[32.14299,50.34925],[32.16221,50.36847],[32.15397,50.37671],[32.11552,50.37946],[32.08806,50.36847],[32.07432,50.37397],[32.08531,50.3877],[32.07707,50.39319],[32.10179,50.41242],[32.0551,50.39869],[32.04411,50.40143],[32.02488,50.45911],[31.9727,50.46735],[31.97819,50.48108],[31.96171,50.48383],[31.98369,50.48383],[31.98643,50.49482],[32.00291,50.49482],[32.0084,50.48658],[32.04686,50.49482],[32.06334,50.5113],[32.05235,50.52228],[32.06334,50.54151],[31.95073,50.54425],[31.91227,50.59644],[31.88481,50.60743],[31.85734,50.63214],[31.81065,50.6239],[31.81065,50.60468],[31.78319,50.60468],[31.78319,50.56073],[31.68431,50.56348],[31.66783,50.55249],[31.64586,50.55249],[31.64586,50.53052],[31.62938,50.51953],[31.5717,50.52777],[31.56346,50.51953],[31.52226,50.53601],[31.52226,50.52228],[31.49205,50.52228],[31.44536,50.50031],[31.36296,50.53052],[31.33,50.50031],[31.31901,50.52777],[31.26133,50.53876],[31.2476,50.56623],[31.18718,50.57447],[31.18718,50.5882],[31.1652,50.5882],[31.1652,50.60743],[31.22288,50.60743],[31.22838,50.61292],[31.21739,50.62116],[31.22838,50.62665],[31.19816,50.64588],[31.22288,50.66785],[31.21739,50.69806],[31.2064,50.69806],[31.2064,50.7063],[31.18992,50.70356],[31.18992,50.72553],[31.1652,50.72553],[31.16795,50.73377],[31.12126,50.75025],[31.12675,50.77497],[31.07457,50.78046],[31.06907,50.76398],[30.95372,50.76398],[30.95097,50.75849],[30.89329,50.76673],[30.89055,50.77497],[30.87681,50.76947],[30.87407,50.7475],[30.83836,50.74475],[30.83012,50.75299],[30.84385,50.75299],[30.8466,50.77771],[30.87132,50.78595],[30.84935,50.78321],[30.83561,50.76398],[30.76695,50.77771],[30.73948,50.77222],[30.75047,50.79969],[30.73124,50.81067],[30.74223,50.81891],[30.7642,50.81067],[30.77794,50.83265],[30.7697,50.87659],[30.73399,50.89856],[30.67357,50.9068],[30.64061,51.00293],[30.60215,51.00843],[30.60215,51.02765],[30.50053,51.01941],[30.49229,51.04413],[30.51152,51.07434],[30.48131,51.09082],[30.51701,51.1128],[30.48955,51.13752],[30.49229,51.16773],[30.50053,51.17597],[30.528,51.17047],[30.54173,51.17871],[30.51701,51.18695],[30.53349,51.20069],[30.50602,51.22815],[30.528,51.23639],[30.55821,51.2309],[30.56645,51.25837],[30.58018,51.27484],[30.61863,51.28858],[30.62138,51.30506],[30.6049,51.29956],[30.61314,51.3078],[30.59392,51.31055],[30.62138,51.33252],[30.65159,51.33527],[30.65709,51.34351],[30.63511,51.36274],[30.65709,51.37647],[30.62138,51.42865],[30.59392,51.42316],[30.58568,51.4314],[30.58018,51.45063],[30.62413,51.46436],[30.59117,51.47809],[30.56645,51.5138],[30.58568,51.54401],[30.57469,51.55225],[30.54722,51.54401],[30.528,51.56873],[30.55272,51.57697],[30.50602,51.60169],[30.53349,51.60443],[30.53349,51.62091],[30.55821,51.62366],[30.54722,51.64289],[30.58018,51.64563],[30.57744,51.67585],[30.56096,51.70606],[30.62687,51.7143],[30.62413,51.73078],[30.65159,51.75824],[30.64335,51.76648],[30.61589,51.76099],[30.61314,51.76648],[30.63511,51.78296],[30.66807,51.7912],[30.65983,51.81592],[30.69005,51.82691],[30.70653,51.86536],[30.75322,51.90381],[30.80266,51.89832],[30.82463,51.92304],[30.80815,51.94776],[30.81913,51.956],[30.83561,51.95325],[30.86033,51.97248],[30.8878,51.96973],[30.88505,51.98346],[30.90977,51.98896],[30.89604,52.00269],[30.92351,52.01642],[30.93998,52.01368],[30.94548,52.02466],[30.93449,52.03839],[30.94822,52.05213],[30.93174,52.07135],[30.95097,52.0741],[30.94822,52.09058],[30.99492,52.07685],[31.09929,52.09058],[31.13774,52.10431],[31.15971,52.07959],[31.21464,52.07135],[31.21739,52.05213],[31.25309,52.04114],[31.29704,52.05213],[31.32451,52.10706],[31.38768,52.12079],[31.37669,52.13453],[31.43162,52.14276],[31.4893,52.1153],[31.51677,52.12629],[31.6074,52.11255],[31.65959,52.11805],[31.71452,52.10706],[31.72276,52.09607],[31.7722,52.11255],[31.81614,52.09882],[31.87108,52.10981],[31.95897,52.0741],[31.94249,52.05762],[31.92051,52.05762],[31.92875,52.04663],[31.91502,52.04114],[31.98918,52.05213],[32.0963,52.0329],[32.10179,52.04663],[32.132,52.04389],[32.14848,52.06861],[32.20067,52.06586],[32.22538,52.08783],[32.2913,52.10431],[32.29405,52.12079],[32.31877,52.12354],[32.31877,52.13727],[32.36821,52.14826],[32.34623,52.15924],[32.32426,52.151],[32.34623,52.18396],[32.32426,52.22242],[32.34623,52.24439],[32.36271,52.2389],[32.40117,52.24713],[32.38194,52.26911],[32.39293,52.28009],[32.36821,52.27735],[32.35173,52.3158],[32.37645,52.33777],[32.40666,52.33777],[32.43413,52.32129],[32.45884,52.32679],[32.48906,52.31305],[32.50279,52.32679],[32.54948,52.32679],[32.57695,52.30207],[32.60716,52.30481],[32.68406,52.26636],[32.70054,52.24713],[32.75548,52.26636],[32.76371,52.25537],[32.79942,52.26636],[32.8159,52.25812],[32.83238,52.28009],[32.88456,52.2746],[32.88731,52.24439],[32.90104,52.24439],[32.96147,52.2746],[32.99443,52.26911],[32.99717,52.28833],[33.04387,52.30756],[33.06035,52.32953],[33.07133,52.32679],[33.07133,52.3158],[33.06035,52.31031],[33.06584,52.30207],[33.1345,52.34601],[33.17021,52.34052],[33.17021,52.37348],[33.18944,52.37897],[33.30479,52.3515],[33.35148,52.35425],[33.38719,52.37073],[33.40916,52.36798],[33.40367,52.35974],[33.4174,52.35974],[33.41465,52.34876],[33.42839,52.34601],[33.40092,52.31305],[33.38719,52.3158],[33.40092,52.30481],[33.38719,52.29657],[33.39268,52.29108],[33.3762,52.27735],[33.38444,52.26636],[33.36522,52.25263],[33.35972,52.25812],[33.36796,52.2334],[33.35148,52.21967],[33.33226,52.21418],[33.32402,52.22242],[33.31578,52.21418],[33.33226,52.20319],[33.31028,52.18946],[33.33775,52.1565],[33.32402,52.13727],[33.3405,52.13453],[33.32951,52.14002],[33.3405,52.14826],[33.4174,52.12354],[33.40916,52.1153],[33.44487,52.09607],[33.43937,52.08783],[33.49156,52.08234],[33.4998,52.09058],[33.4998,52.03839],[33.46409,52.03839],[33.43113,52.02466],[33.41191,52.0329],[33.40367,52.05213],[33.35698,52.03015],[33.31852,52.0329],[33.31852,52.01642],[33.30479,52.01368],[33.33775,52.00818],[33.35148,51.98621],[33.37346,51.97797],[33.37346,51.97248],[33.3817,51.97522],[33.39543,51.95325],[33.37071,51.95325],[33.35423,51.93128],[33.30479,51.93402],[33.26909,51.91755],[33.25261,51.92578],[33.22239,51.90381],[33.21415,51.91205],[33.18669,51.91205],[33.17296,51.90107],[33.1812,51.88459],[33.14549,51.87909],[33.1345,51.85987],[33.12352,51.86261],[33.14549,51.81592],[33.12077,51.81043],[33.10154,51.78296],[33.07957,51.77472],[33.08507,51.76923],[33.0933,51.77472],[33.10429,51.74726],[33.14,51.72528],[33.15648,51.70331],[33.17296,51.70057],[33.15922,51.68958],[33.14549,51.68958],[33.16472,51.68134],[33.14,51.67585],[33.14549,51.66486],[33.12626,51.64563],[33.15373,51.64289],[33.15373,51.60993],[33.19218,51.58246],[33.22239,51.57972],[33.20591,51.56873],[33.15922,51.56873],[33.15648,51.555],[33.18669,51.53852],[33.19218,51.5138],[33.19218,51.50556],[33.13725,51.49457],[33.13725,51.46711],[33.11253,51.42865],[33.1345,51.41767],[33.12077,51.40393],[33.1345,51.39844],[33.13176,51.38471],[33.09056,51.3902],[33.10978,51.38196],[33.10978,51.36823],[33.06035,51.37098],[33.06035,51.38196],[33.03837,51.3902],[33.0576,51.40393],[33.04661,51.40943],[33.0164,51.39569],[33.04112,51.36823],[33.03563,51.349],[33.07683,51.34076],[33.06859,51.33252],[33.07683,51.3133],[33.04112,51.29132],[33.07683,51.29132],[33.0576,51.26661],[33.06859,51.25562],[33.03013,51.22815],[33.04112,51.20618],[32.97795,51.18695],[32.98619,51.18421],[32.96147,51.16223],[32.99168,51.14301],[32.94224,51.09082],[33.04112,51.08258],[33.03837,51.0716],[33.06859,51.06885],[33.06035,51.04963],[33.08507,51.03864],[33.0576,51.02216],[33.04112,50.99195],[33.07957,50.98096],[33.07683,50.99195],[33.11802,51.00568],[33.13725,50.96173],[33.20042,50.96173],[33.19767,50.92054],[33.21141,50.90131],[33.20042,50.89032],[33.17021,50.88758],[33.18394,50.86835],[33.17021,50.85187],[33.18394,50.84912],[33.15648,50.82715],[33.17021,50.79969],[33.15648,50.79145],[33.18944,50.7475],[33.20866,50.7475],[33.21141,50.73651],[33.24162,50.73102],[33.13725,50.7118],[33.15098,50.69257],[33.14549,50.65412],[33.11802,50.64862],[33.10429,50.60193],[33.12352,50.59644],[33.10154,50.59095],[33.04936,50.54151],[33.06584,50.51953],[33.04387,50.50306],[33.02189,50.50031],[33.0164,50.4701],[32.97246,50.47559],[32.96971,50.44812],[32.934,50.43714],[32.9395,50.4289],[32.91203,50.4234],[32.91203,50.40418],[32.83787,50.37397],[32.78843,50.37122],[32.78569,50.36298],[32.80217,50.35749],[32.79393,50.3465],[32.76097,50.34925],[32.74998,50.36023],[32.74174,50.35199],[32.67033,50.35749],[32.67033,50.36847],[32.63188,50.36573],[32.63463,50.35749],[32.56047,50.35749],[32.52476,50.3465],[32.48356,50.37122],[32.4918,50.39869],[32.44511,50.39869],[32.40117,50.41242],[32.39842,50.40692],[32.36821,50.41516],[32.36271,50.42615],[32.33799,50.4289],[32.32152,50.4234],[32.32426,50.40418],[32.29954,50.39869],[32.2913,50.37946],[32.25285,50.37397]],[[30.77519,51.51105],[30.77244,51.5083],[30.77794,51.5083],[30.77519,51.51105]],[[30.75322,51.5138],[30.75596,51.5138],[30.75322,51.5138]],[[30.66258,51.5138],[30.66807,51.5138],[30.67357,51.52204],[30.69829,51.52204],[30.78343,51.51105],[30.78618,51.53852],[30.73674,51.54126],[30.73674,51.5495],[30.70927,51.55225],[30.70927,51.53028],[30.67357,51.53028],[30.62413,51.51654],[30.60215,51.52478],[30.58568,51.52204],[30.59941,51.51105],[30.67082,51.52204],[30.66258,51.5138]]]}},{"type":"Feature","properties":{"ADMIN_1":"Харківська область","COD_1":"UA63000000000041885"},"geometry":{"type":"MultiLineString","coordinates":[[[36.18321,48.66834],[36.18321,48.66834],[36.18321,48.66834]],[[36.29582,48.53101],[36.2711,48.54474],[36.31779,48.58594],[36.25187,48.62439],[36.28209,48.6601],[36.14201,48.72327],[36.16124,48.74799],[36.13926,48.76447],[36.15849,48.76722],[36.15849,48.78369],[36.13102,48.80567],[36.06511,48.80841],[36.07609,48.83313],[36.01841,48.85511],[36.04039,48.87433],[36.01292,48.88807],[36.04313,48.91553],[35.99644,48.94025],[36.00468,48.94574],[35.97722,48.95948],[35.99095,48.96772],[35.93876,48.99793],[35.93052,48.9787],[35.94426,48.9787],[35.93876,48.97046],[35.88383,48.97596],[35.87834,48.96222],[35.85637,48.95673],[35.85362,48.94574],[35.8289,48.94849],[35.80967,48.943],[35.80967,48.92652],[35.79319,48.93476],[35.80143,48.943],[35.79045,48.95398],[35.77397,48.94849],[35.75749,48.95398],[35.752,48.94574],[35.73826,48.95124],[35.73826,48.96497],[35.72453,48.96497],[35.71354,48.94849],[35.69706,48.943],[35.69432,48.96772],[35.64763,48.97321],[35.63115,48.96222],[35.62565,48.9842],[35.5872,48.98694],[35.57347,48.97321],[35.5103,48.9842],[35.48558,48.97321],[35.48832,48.9787],[35.45537,48.98969],[35.46086,48.99793],[35.43614,49.00342],[35.43889,49.01166],[35.40593,49.01441],[35.40593,49.02814],[35.38395,49.02814],[35.34276,49.04462],[35.33452,49.0611],[35.30156,49.06934],[35.31254,49.07758],[35.30705,49.09131],[35.27958,49.09681],[35.27684,49.09131],[35.25761,49.11328],[35.23839,49.11328],[35.2274,49.09955],[35.18895,49.11054],[35.2274,49.12702],[35.18895,49.14075],[35.21092,49.15174],[35.19444,49.15998],[35.15873,49.15998],[35.145,49.14899],[35.12028,49.16272],[35.09556,49.15448],[35.08732,49.14075],[35.07634,49.17096],[35.05711,49.17646],[35.04338,49.15448],[35.01866,49.15174],[34.98021,49.25061],[35.02415,49.32477],[35.03788,49.33301],[35.07634,49.31653],[35.09282,49.30005],[35.24113,49.29731],[35.27134,49.27808],[35.28782,49.29731],[35.27958,49.31928],[35.37846,49.39893],[35.34825,49.40442],[35.36473,49.44837],[35.31529,49.45661],[35.33177,49.5033],[35.48008,49.48407],[35.49107,49.50879],[35.48558,49.51703],[35.4279,49.52527],[35.4279,49.54999],[35.40318,49.55548],[35.48558,49.57196],[35.42515,49.65711],[35.43339,49.67359],[35.3455,49.66535],[35.33177,49.68183],[35.24388,49.69281],[35.25486,49.70929],[35.24113,49.71204],[35.2631,49.71753],[35.26036,49.73401],[35.22465,49.73676],[35.20543,49.75873],[35.21092,49.78894],[35.19993,49.79993],[35.22191,49.80817],[35.21916,49.83014],[35.13951,49.86036],[35.12028,49.85212],[35.0681,49.85761],[35.04612,49.87134],[35.06535,49.88507],[35.03514,49.88782],[35.01591,49.87683],[34.98021,49.89057],[34.97197,49.88507],[34.91154,49.93451],[34.89232,49.93177],[34.85661,49.94825],[34.87584,49.96198],[34.86485,49.96473],[34.85661,49.9867],[34.93901,50.06086],[34.96373,50.07459],[34.95549,50.09381],[34.93626,50.09656],[34.93901,50.15149],[34.97197,50.15699],[34.96098,50.18445],[35.03239,50.17896],[35.02965,50.16523],[35.04338,50.16523],[35.07634,50.20093],[35.07084,50.20642],[35.1038,50.21466],[35.14775,50.24213],[35.19169,50.2284],[35.19719,50.23938],[35.23564,50.2284],[35.23839,50.23664],[35.26036,50.23389],[35.26585,50.2641],[35.29881,50.26136],[35.32902,50.27509],[35.29606,50.28882],[35.32902,50.31903],[35.38121,50.29432],[35.37846,50.32178],[35.40867,50.32178],[35.42241,50.33551],[35.43889,50.31629],[35.45811,50.31629],[35.49656,50.29157],[35.5048,50.29981],[35.52403,50.28882],[35.53502,50.30255],[35.51579,50.31629],[35.57347,50.31903],[35.59269,50.33002],[35.6284,50.32453],[35.62291,50.31903],[35.65037,50.31079],[35.66136,50.32727],[35.68882,50.33551],[35.69157,50.3465],[35.68333,50.3465],[35.65861,50.35199],[35.73826,50.35474],[35.80143,50.39869],[35.80693,50.41242],[35.79319,50.41516],[35.83165,50.43439],[35.83439,50.42615],[35.85362,50.4289],[35.87285,50.4234],[35.88933,50.43988],[35.93602,50.43164],[36.06785,50.45087],[36.16124,50.43164],[36.17772,50.40143],[36.19145,50.40418],[36.23265,50.36298],[36.28483,50.33551],[36.27385,50.32453],[36.29582,50.29157],[36.36723,50.28882],[36.43315,50.33002],[36.44139,50.31079],[36.48808,50.31079],[36.53477,50.28333],[36.58696,50.28608],[36.59245,50.27509],[36.57322,50.27509],[36.58146,50.26136],[36.55949,50.25037],[36.59794,50.2284],[36.64738,50.21741],[36.68034,50.23664],[36.68858,50.26685],[36.74901,50.28058],[36.76823,50.30255],[36.83415,50.31354],[36.8726,50.33551],[36.93852,50.34925],[37.04564,50.34375],[37.12254,50.36023],[37.15275,50.35749],[37.29283,50.40143],[37.32853,50.43714],[37.3972,50.43164],[37.49058,50.45636],[37.48509,50.43439],[37.46312,50.4234],[37.46586,50.38221],[37.48234,50.36023],[37.5208,50.33551],[37.5565,50.33002],[37.57573,50.3053],[37.59495,50.31629],[37.63615,50.31079],[37.61693,50.21741],[37.64439,50.18994],[37.64164,50.17621],[37.71031,50.13227],[37.757,50.07734],[37.7982,50.08283],[37.92454,50.03614],[37.96299,49.9812],[38.00419,49.96747],[38.04265,49.93177],[38.02067,49.92627],[38.03166,49.89881],[38.09208,49.84662],[38.07286,49.83564],[38.01793,49.83838],[38.00969,49.81366],[38.05363,49.79169],[38.05363,49.78345],[38.03715,49.78345],[37.9987,49.75324],[37.98222,49.75598],[37.97673,49.76697],[37.95201,49.73127],[37.97398,49.70929],[38.01793,49.71204],[37.9987,49.70105],[38.01243,49.69556],[38.01243,49.67633],[38.02617,49.6626],[38.04539,49.65711],[37.99595,49.64887],[37.98771,49.64063],[37.99595,49.62964],[37.97947,49.6269],[37.97398,49.61042],[37.94377,49.61042],[37.93278,49.59119],[37.95201,49.56922],[37.89982,49.57471],[37.88609,49.54999],[37.92729,49.54724],[37.92729,49.54175],[37.88609,49.51978],[37.84764,49.51978],[37.83665,49.49231],[37.85038,49.48682],[37.84489,49.44562],[37.8751,49.44562],[37.87785,49.41816],[37.89708,49.40442],[37.87785,49.32752],[37.88334,49.31379],[37.94926,49.3028],[37.9575,49.28632],[37.89982,49.26984],[37.91081,49.25885],[37.86686,49.24512],[37.8751,49.23413],[37.85313,49.22589],[37.84215,49.20118],[37.61418,49.23413],[37.56199,49.22864],[37.50157,49.18744],[37.55375,49.16822],[37.56474,49.14075],[37.54277,49.14624],[37.58397,49.12702],[37.48784,49.1023],[37.50706,49.06934],[37.4796,49.05835],[37.45213,49.05286],[37.44938,49.0611],[37.41642,49.0611],[37.38621,49.04737],[37.39171,49.02539],[37.37523,49.02539],[37.36699,48.99244],[37.34501,49.00342],[37.31205,48.98969],[37.32579,48.9842],[37.29558,48.97046],[37.32029,48.95673],[37.30656,48.94849],[37.33128,48.93476],[37.32853,48.92102],[37.26811,48.92377],[37.26536,48.90729],[37.22416,48.91004],[37.21592,48.89081],[37.19395,48.87983],[37.19121,48.81391],[37.14177,48.83313],[37.14451,48.84137],[37.09782,48.84961],[37.0786,48.81665],[37.02366,48.81665],[37.01817,48.80292],[37.00718,48.80292],[36.9962,48.78644],[37.02366,48.76722],[37.04289,48.76722],[37.03465,48.74524],[36.96599,48.79468],[36.85338,48.80017],[36.83964,48.77271],[36.82042,48.77271],[36.78746,48.78095],[36.7902,48.80292],[36.76823,48.79743],[36.72154,48.80567],[36.68858,48.77546],[36.70781,48.76722],[36.73527,48.70404],[36.72703,48.69306],[36.71055,48.69306],[36.73802,48.62714],[36.67485,48.62439],[36.65562,48.61066],[36.59245,48.60242],[36.48259,48.66285],[36.44688,48.63263],[36.42216,48.63538],[36.44139,48.62714],[36.42766,48.61615],[36.44139,48.61341],[36.41942,48.60791],[36.35624,48.53101],[36.32329,48.55573],[36.29582,48.53101]]]}},{"type":"Feature","properties":{"ADMIN_1":"Одеська область","COD_1":"UA51000000000030770"},"geometry":{"type":"LineString","coordinates":[[28.89653,45.30103],[28.8773,45.31751],[28.8004,45.33948],[28.78117,45.32575],[28.80589,45.31202],[28.80314,45.30103],[28.75096,45.28455],[28.76469,45.26258],[28.78941,45.25708],[28.78941,45.2406],[28.71251,45.22412],[28.64384,45.24335],[28.57243,45.24884],[28.34721,45.323],[28.28679,45.39716],[28.2758,45.4466],[28.21263,45.46857],[28.25657,45.51526],[28.30601,45.54822],[28.42686,45.50977],[28.42686,45.48505],[28.51475,45.49878],[28.49003,45.57019],[28.54496,45.57843],[28.5175,45.66632],[28.48729,45.66083],[28.47905,45.67731],[28.50651,45.70203],[28.52025,45.73774],[28.55595,45.73774],[28.56419,45.72675],[28.58891,45.7295],[28.5944,45.74048],[28.57792,45.77069],[28.62462,45.7652],[28.70976,45.77893],[28.69603,45.81739],[28.78666,45.83112],[28.75371,45.92725],[28.76469,45.93549],[28.75645,45.95746],[28.77842,45.96021],[28.77568,45.97119],[28.97892,46.00415],[29.00639,46.0481],[28.95146,46.09479],[29.06682,46.19641],[28.95146,46.25959],[28.98442,46.31726],[29.00364,46.31726],[28.92949,46.45734],[29.02562,46.46283],[29.02287,46.47931],[28.97618,46.47931],[28.98167,46.4903],[29.03386,46.4903],[29.03935,46.50678],[29.06407,46.51227],[29.16295,46.51502],[29.16295,46.54523],[29.2371,46.55896],[29.23985,46.49854],[29.25633,46.48481],[29.22062,46.46283],[29.22886,46.43262],[29.24534,46.41614],[29.20689,46.38593],[29.23985,46.37494],[29.26732,46.39417],[29.26732,46.4079],[29.29753,46.41614],[29.30302,46.4079],[29.32499,46.41339],[29.30577,46.44361],[29.3195,46.44635],[29.30851,46.46558],[29.33598,46.47382],[29.33049,46.49579],[29.35246,46.50403],[29.39641,46.42438],[29.38542,46.44635],[29.44859,46.49854],[29.50078,46.46283],[29.4843,46.4491],[29.49528,46.42713],[29.56669,46.41614],[29.58043,46.36121],[29.59965,46.36396],[29.6024,46.35297],[29.6793,46.36121],[29.66008,46.43537],[29.6793,46.44086],[29.6848,46.42713],[29.73424,46.43537],[29.74247,46.44361],[29.726,46.46558],[29.74247,46.47382],[29.77543,46.45459],[29.78642,46.41889],[29.82213,46.39692],[29.80565,46.38593],[29.89079,46.35297],[29.88804,46.3722],[29.94023,46.39966],[29.98692,46.38318],[29.99791,46.38868],[30.01988,46.38318],[30.06932,46.39692],[30.09678,46.37494],[30.10777,46.39142],[30.1627,46.41339],[30.15721,46.42987],[30.13524,46.41065],[30.09678,46.44086],[30.09678,46.42713],[30.08305,46.43537],[30.07756,46.42438],[30.05559,46.42713],[30.06382,46.44086],[30.02263,46.44086],[30.02537,46.45459],[29.99516,46.46009],[30.02263,46.46833],[29.99516,46.47382],[30.00065,46.49579],[29.98967,46.49305],[29.98692,46.50953],[29.9622,46.4903],[29.95396,46.4903],[29.9622,46.50953],[29.93748,46.49305],[29.94298,46.50129],[29.92375,46.50129],[29.92924,46.51227],[29.90727,46.51502],[29.91276,46.52051],[29.89628,46.52875],[29.90178,46.53424],[29.88804,46.54798],[29.87706,46.54798],[29.94572,46.55622],[29.93474,46.58094],[29.9622,46.60291],[29.94572,46.64685],[29.97044,46.68531],[29.97319,46.75122],[29.93474,46.80616],[29.97868,46.81714],[29.96769,46.83088],[29.94847,46.84186],[29.90452,46.81989],[29.8853,46.8501],[29.8853,46.88581],[29.74797,46.86109],[29.71776,46.9325],[29.70952,46.92426],[29.64909,46.91877],[29.64085,46.95447],[29.57219,46.94074],[29.55571,46.95722],[29.59691,46.96271],[29.6024,47.04236],[29.62986,47.04511],[29.61339,47.10004],[29.54747,47.09455],[29.55021,47.07532],[29.53099,47.07532],[29.51451,47.11377],[29.49803,47.10828],[29.49528,47.12476],[29.49528,47.133],[29.58043,47.13575],[29.55296,47.2511],[29.59965,47.2566],[29.57493,47.36921],[29.48704,47.35547],[29.48704,47.30603],[29.42662,47.2923],[29.42387,47.30603],[29.39915,47.30054],[29.38267,47.34449],[29.39641,47.35273],[29.39091,47.38019],[29.33598,47.36921],[29.31675,47.44886],[29.2426,47.4159],[29.2426,47.46259],[29.19316,47.42414],[29.18217,47.44886],[29.19041,47.46808],[29.16295,47.4516],[29.15745,47.45984],[29.18767,47.47632],[29.19041,47.51477],[29.15196,47.50653],[29.11625,47.55323],[29.18492,47.57245],[29.18492,47.58619],[29.21788,47.6109],[29.20964,47.62738],[29.23436,47.64386],[29.20964,47.64112],[29.22062,47.68232],[29.23161,47.68506],[29.20414,47.71802],[29.21513,47.73725],[29.24809,47.75098],[29.27556,47.80317],[29.24809,47.8114],[29.23436,47.79767],[29.21788,47.79767],[29.19865,47.8169],[29.22612,47.85535],[29.28105,47.88831],[29.21513,47.88556],[29.21513,47.89655],[29.2014,47.88556],[29.17668,47.99268],[29.08879,47.98444],[29.09703,47.95972],[29.08055,47.97071],[29.08604,47.94599],[29.07231,47.94324],[29.03386,47.94324],[28.96245,47.97895],[28.92674,47.95972],[28.8773,48.00092],[28.90202,48.01191],[28.85533,48.02015],[28.83885,48.03388],[28.85258,48.06134],[28.8416,48.07508],[28.83336,48.07233],[28.84709,48.07782],[28.86906,48.06958],[28.86906,48.08057],[28.92949,48.0943],[28.94597,48.15747],[28.98442,48.14374],[29.00914,48.15198],[29.03111,48.12452],[29.05034,48.14923],[29.04484,48.17395],[29.06407,48.19593],[29.13548,48.15198],[29.15745,48.14923],[29.14097,48.14099],[29.20964,48.1355],[29.21238,48.14374],[29.23985,48.14099],[29.25084,48.14923],[29.26182,48.13001],[29.20414,48.11628],[29.22886,48.10254],[29.25908,48.11353],[29.26457,48.0943],[29.31126,48.08606],[29.35246,48.09705],[29.35246,48.08881],[29.37169,48.09156],[29.38817,48.0943],[29.39366,48.11353],[29.4431,48.12177],[29.47331,48.12177],[29.4788,48.10804],[29.49528,48.10254],[29.56944,48.0998],[29.58867,48.10254],[29.58043,48.11078],[29.6024,48.13275],[29.66282,48.10804],[29.66832,48.11628],[29.65733,48.11902],[29.67381,48.12726],[29.67656,48.16297],[29.65458,48.19593],[29.68205,48.18769],[29.71501,48.20142],[29.76445,48.20142],[29.78093,48.20966],[29.79466,48.20142],[29.8441,48.21241],[29.89079,48.18494],[29.92924,48.23438],[29.97593,48.2179],[29.98967,48.22889],[30.00889,48.20691],[30.0034,48.18494],[30.02537,48.18494],[30.04735,48.15198],[30.06657,48.14649],[30.15172,48.14374],[30.18742,48.15473],[30.23961,48.14099],[30.26158,48.14923],[30.30827,48.14374],[30.31376,48.11628],[30.35771,48.11353],[30.35771,48.10254],[30.3275,48.09705],[30.31376,48.10529],[30.32475,48.0943],[30.28904,48.09705],[30.28355,48.08606],[30.24785,48.08881],[30.23411,48.07233],[30.20665,48.06684],[30.22587,48.05585],[30.23411,48.06134],[30.25609,48.02838],[30.25883,48.02015],[30.22587,48.01191],[30.25059,47.98169],[30.2451,47.96796],[30.30827,47.92951],[30.29728,47.92401],[30.33024,47.80866],[30.42363,47.82239],[30.43736,47.80042],[30.44011,47.78943],[30.41539,47.78669],[30.42363,47.76197],[30.38792,47.75373],[30.42088,47.63288],[30.46483,47.64112],[30.47032,47.61914],[30.61314,47.63562],[30.61863,47.62464],[30.66533,47.63288],[30.65983,47.59992],[30.72026,47.60816],[30.70927,47.63837],[30.78892,47.64936],[30.79167,47.63562],[30.77244,47.62189],[30.77794,47.58344],[30.74498,47.57795],[30.75596,47.55048],[30.7697,47.55323],[30.77244,47.54499],[30.82737,47.55048],[30.83287,47.53675],[30.87681,47.54499],[30.88231,47.50653],[30.85209,47.50379],[30.86583,47.44336],[30.84935,47.44336],[30.85209,47.42139],[30.8878,47.42688],[30.89329,47.40216],[30.87407,47.39942],[30.88505,47.35822],[30.89879,47.36097],[30.90977,47.34449],[30.86583,47.3335],[30.87407,47.31702],[30.89329,47.31977],[30.90703,47.27582],[30.99217,47.28955],[30.98668,47.26758],[31.00865,47.27033],[31.01964,47.24012],[31.1707,47.26484],[31.17894,47.22364],[31.14598,47.21814],[31.15696,47.17969],[31.12401,47.17694],[31.11851,47.18793],[31.11027,47.18793],[31.11027,47.15497],[31.19816,47.15497],[31.20091,47.17145],[31.2476,47.17694],[31.25035,47.1687],[31.26957,47.17145],[31.30253,47.08356],[31.29429,47.08081],[31.30528,47.04786],[31.29429,47.04511],[31.29155,47.02314],[31.22838,47.02039],[31.24486,46.99018],[31.14049,46.97919],[31.13774,46.99018],[31.0883,46.98194],[31.09105,46.9737],[31.01689,46.96546],[31.03886,46.89954],[31.0883,46.88581],[31.10478,46.84735],[31.15696,46.83088],[31.15147,46.79792],[31.1652,46.7732],[31.15147,46.74024],[31.15971,46.71827],[31.17894,46.70728],[31.18718,46.65784],[31.1707,46.65509],[31.17619,46.62763],[31.01964,46.60016],[30.83012,46.55072],[30.79167,46.55896],[30.75047,46.54523],[30.7285,46.50953],[30.73399,46.49305],[30.75596,46.48481],[30.7642,46.49305],[30.77244,46.4491],[30.75322,46.37494],[30.72026,46.36121],[30.68181,46.3255],[30.55821,46.15522],[30.51152,46.12226],[30.48131,46.08106],[30.3632,45.99317],[30.22313,45.86682],[29.70677,45.57569],[29.63261,45.51252],[29.62986,45.4823],[29.65184,45.47132],[29.66832,45.47406],[29.6793,45.45758],[29.68754,45.46857],[29.70677,45.46308],[29.74522,45.49054],[29.74247,45.46308],[29.76719,45.47132],[29.78642,45.46308],[29.76445,45.36695],[29.78367,45.31751],[29.75621,45.27082],[29.75621,45.22138],[29.72874,45.21863],[29.72325,45.21039],[29.69853,45.21314],[29.68754,45.2049],[29.66282,45.23786],[29.66282,45.25708],[29.6793,45.26807],[29.65458,45.33673],[29.58867,45.39167],[29.42662,45.44385],[29.35795,45.43836],[29.32499,45.44934],[29.29204,45.42737],[29.23985,45.43286],[29.18767,45.41364],[29.17119,45.39716],[29.0421,45.36145],[28.95695,45.32575],[28.94871,45.2818],[28.92399,45.28455],[28.89653,45.30103]]}},{"type":"Feature","properties":{"ADMIN_1":"Місто Київ","COD_1":"UA80000000000093317"},"geometry":{"type":"MultiLineString","coordinates":[[[30.2451,50.44263],[30.25059,50.48383],[30.26982,50.49756],[30.26982,50.50031],[30.25883,50.50855],[30.28904,50.53052],[30.29179,50.53327],[30.30278,50.53327],[30.29728,50.55524],[30.3275,50.547],[30.33299,50.55249],[30.33024,50.55524],[30.34123,50.55799],[30.3275,50.56348],[30.30827,50.57172],[30.37144,50.57447],[30.37144,50.58545],[30.46208,50.58545],[30.46483,50.57172],[30.49504,50.56623],[30.49778,50.55249],[30.54173,50.53327],[30.54173,50.52228],[30.56645,50.51679],[30.5637,50.52503],[30.55272,50.53327],[30.55546,50.53876],[30.57194,50.53876],[30.61589,50.53601],[30.65434,50.53327],[30.66533,50.55249],[30.69829,50.56073],[30.69829,50.55524],[30.71476,50.55524],[30.71751,50.59095],[30.73399,50.5882],[30.75322,50.58271],[30.81639,50.56348],[30.82463,50.53601],[30.75322,50.51953],[30.76146,50.50855],[30.73948,50.49756],[30.73948,50.49482],[30.75871,50.48383],[30.74772,50.48383],[30.74223,50.4701],[30.75596,50.46186],[30.74223,50.45911],[30.80266,50.42615],[30.80266,50.4234],[30.79716,50.41516],[30.82737,50.40418],[30.82188,50.40143],[30.81364,50.39319],[30.77519,50.39594],[30.78068,50.38495],[30.76146,50.37397],[30.74223,50.37122],[30.71751,50.38221],[30.71476,50.38221],[30.71476,50.35474],[30.69554,50.3465],[30.67357,50.35474],[30.67357,50.36573],[30.67631,50.36847],[30.63786,50.36023],[30.64061,50.33826],[30.62687,50.34925],[30.61039,50.3465],[30.67082,50.27509],[30.65709,50.2696],[30.64885,50.28058],[30.63511,50.28058],[30.61039,50.28058],[30.62687,50.26136],[30.62413,50.25586],[30.6461,50.23938],[30.63786,50.23664],[30.64335,50.22565],[30.62138,50.22016],[30.59941,50.21466],[30.59117,50.22016],[30.59117,50.2284],[30.58568,50.24762],[30.57744,50.25586],[30.5637,50.27784],[30.55272,50.2696],[30.54173,50.27509],[30.54722,50.29157],[30.53349,50.29157],[30.528,50.29157],[30.53349,50.31629],[30.51701,50.32178],[30.50877,50.32727],[30.49504,50.32178],[30.48955,50.32727],[30.49778,50.33277],[30.47581,50.33277],[30.46757,50.36023],[30.43736,50.35749],[30.42912,50.37122],[30.44285,50.38221],[30.41539,50.39869],[30.39341,50.40692],[30.35222,50.44812],[30.322,50.44263],[30.2808,50.44812],[30.27531,50.4289],[30.2451,50.4234],[30.23686,50.4289],[30.2451,50.44263]],[[30.33574,50.49482],[30.31926,50.49756],[30.322,50.48658],[30.3275,50.48383],[30.33848,50.48383],[30.34947,50.49482],[30.34672,50.49482],[30.34672,50.49207],[30.33848,50.49207],[30.33574,50.49482]],[[30.73124,50.5113],[30.75047,50.52503],[30.72026,50.52228],[30.73124,50.5113]]]}},{"type":"Feature","properties":{"ADMIN_1":"Вінницька область","COD_1":"UA05000000000010236"},"geometry":{"type":"LineString","coordinates":[[28.57792,48.18219],[28.52849,48.15198],[28.50377,48.15198],[28.52025,48.13825],[28.49278,48.11902],[28.49278,48.07508],[28.50102,48.06684],[28.49003,48.06684],[28.45158,48.08057],[28.42137,48.12177],[28.43785,48.14374],[28.42686,48.17395],[28.38292,48.17395],[28.34721,48.1355],[28.31975,48.13275],[28.30327,48.14099],[28.30876,48.16297],[28.34996,48.17945],[28.36644,48.20417],[28.3527,48.24811],[28.32524,48.23438],[28.30327,48.24262],[28.20714,48.20417],[28.18516,48.21515],[28.18791,48.25086],[28.17692,48.25635],[28.14671,48.26184],[28.13298,48.24262],[28.10277,48.23163],[28.08903,48.23438],[28.07805,48.25086],[28.09453,48.29755],[28.0753,48.31678],[28.04234,48.32776],[27.9572,48.32776],[27.88304,48.37171],[27.87205,48.40467],[27.81987,48.4184],[27.78416,48.44861],[27.74296,48.45685],[27.67979,48.44037],[27.64134,48.44037],[27.5919,48.46234],[27.60563,48.48706],[27.59465,48.49256],[27.53422,48.47058],[27.49852,48.48157],[27.47929,48.50629],[27.48204,48.5365],[27.45183,48.59693],[27.37217,48.62989],[27.38865,48.68207],[27.41337,48.69855],[27.39964,48.72876],[27.41612,48.73975],[27.38865,48.76447],[27.41063,48.76722],[27.40239,48.77271],[27.42711,48.79743],[27.41063,48.81116],[27.41612,48.88257],[27.39415,48.9018],[27.3914,48.9375],[27.40239,48.95124],[27.41612,48.95398],[27.41887,48.97046],[27.38041,49.00617],[27.41612,49.05561],[27.42711,49.05286],[27.44359,49.07209],[27.50401,49.06934],[27.47929,49.08857],[27.50676,49.11054],[27.49302,49.12152],[27.50676,49.13251],[27.53148,49.12427],[27.53422,49.138],[27.57817,49.12152],[27.59739,49.13526],[27.60289,49.16272],[27.64134,49.16822],[27.68528,49.14075],[27.72099,49.14624],[27.74022,49.138],[27.7567,49.15448],[27.7512,49.15998],[27.78142,49.17371],[27.77592,49.19019],[27.7924,49.1847],[27.7924,49.17646],[27.81437,49.19019],[27.85283,49.17096],[27.89952,49.18744],[27.89403,49.20942],[27.86656,49.21216],[27.85557,49.23688],[27.87205,49.24512],[27.85008,49.26435],[27.86107,49.28083],[27.85832,49.32752],[27.81163,49.36597],[27.82811,49.36872],[27.81163,49.38794],[27.8336,49.39069],[27.85283,49.4264],[27.82811,49.4209],[27.80613,49.44013],[27.7512,49.44013],[27.74571,49.45111],[27.76494,49.47858],[27.77592,49.47583],[27.7924,49.48682],[27.73472,49.49506],[27.74296,49.53077],[27.77318,49.51978],[27.79515,49.53077],[27.78416,49.5445],[27.7924,49.55274],[27.75944,49.57746],[27.80064,49.6214],[27.81163,49.61866],[27.81163,49.64338],[27.76494,49.66535],[27.76219,49.69831],[27.81163,49.70105],[27.80613,49.70929],[27.83635,49.72852],[27.81712,49.73401],[27.83635,49.75598],[27.89128,49.75598],[27.89952,49.76697],[27.96269,49.77796],[28.09178,49.77246],[28.15495,49.78894],[28.21263,49.79169],[28.22636,49.7862],[28.25108,49.81366],[28.26207,49.79993],[28.29777,49.79993],[28.38017,49.7807],[28.40764,49.79169],[28.42137,49.82465],[28.46806,49.8219],[28.48179,49.80817],[28.52849,49.81916],[28.56968,49.77521],[28.60264,49.78345],[28.60264,49.81092],[28.62736,49.81641],[28.63835,49.80817],[28.6356,49.81641],[28.69053,49.79993],[28.70701,49.80817],[28.73448,49.79718],[28.74547,49.81641],[28.7592,49.81916],[28.75096,49.84388],[28.78392,49.84388],[28.78392,49.85212],[28.84434,49.86036],[28.85808,49.88782],[28.88005,49.88782],[28.89927,49.88233],[28.90202,49.8631],[28.95421,49.84113],[28.94597,49.81916],[28.9597,49.8219],[28.97069,49.80268],[28.94322,49.78345],[28.96519,49.77521],[28.96519,49.75598],[29.00364,49.73127],[28.94597,49.67908],[28.96245,49.67359],[28.98167,49.64338],[29.00914,49.63239],[28.98442,49.60218],[29.02836,49.59119],[29.10527,49.59394],[29.11625,49.58295],[29.15196,49.59394],[29.21238,49.58844],[29.2426,49.60218],[29.25358,49.59119],[29.27556,49.59119],[29.27556,49.6269],[29.32774,49.6269],[29.34147,49.61591],[29.35521,49.6269],[29.37993,49.61866],[29.41014,49.65985],[29.42662,49.65161],[29.43211,49.6626],[29.50627,49.64887],[29.53648,49.63788],[29.49528,49.59943],[29.53099,49.56098],[29.54747,49.53077],[29.53923,49.51978],[29.56944,49.5033],[29.58592,49.50605],[29.58592,49.49506],[29.55845,49.49781],[29.54197,49.48407],[29.59416,49.44287],[29.54197,49.40168],[29.50627,49.39618],[29.50352,49.36872],[29.52,49.36048],[29.53648,49.32477],[29.57219,49.32477],[29.61888,49.30555],[29.60789,49.30005],[29.62163,49.27533],[29.61339,49.26435],[29.6381,49.24787],[29.66282,49.25061],[29.69029,49.23688],[29.70128,49.2616],[29.7205,49.24512],[29.71501,49.23688],[29.73698,49.22864],[29.726,49.2204],[29.70402,49.22589],[29.70952,49.20667],[29.726,49.20392],[29.71226,49.1435],[29.73424,49.12152],[29.6793,49.11328],[29.6848,49.09131],[29.65184,49.09955],[29.62986,49.04737],[29.60515,49.05561],[29.6381,49.01166],[29.6848,49.02814],[29.6848,49.00617],[29.69578,49.00067],[29.65184,48.95948],[29.66008,48.94849],[29.65184,48.9375],[29.68754,48.91278],[29.70128,48.91828],[29.73698,48.90729],[29.70952,48.8963],[29.726,48.88807],[29.73149,48.85511],[29.7617,48.84687],[29.76445,48.78644],[29.86607,48.76447],[29.86058,48.75898],[29.8853,48.737],[29.86882,48.73426],[29.86058,48.69855],[29.87156,48.7013],[29.91826,48.67109],[29.94572,48.67109],[29.94572,48.65735],[29.95671,48.65735],[29.97868,48.63538],[29.98967,48.63538],[29.98967,48.61341],[29.95121,48.60791],[29.94847,48.59693],[29.95671,48.58319],[30.00615,48.57221],[30.01988,48.52002],[29.98967,48.51728],[30.00615,48.51453],[30.00065,48.49256],[29.96769,48.49256],[29.96769,48.47058],[29.96495,48.4596],[29.95396,48.46234],[29.95671,48.45136],[29.86332,48.42664],[29.87156,48.41565],[29.78642,48.36896],[29.81114,48.34973],[29.80015,48.34973],[29.8029,48.33326],[29.78367,48.33051],[29.78093,48.31403],[29.76445,48.29755],[29.75071,48.3003],[29.75071,48.28931],[29.77269,48.27283],[29.78093,48.20966],[29.76445,48.20142],[29.71501,48.20142],[29.68205,48.18769],[29.65458,48.19593],[29.67656,48.16297],[29.67381,48.12726],[29.65733,48.11902],[29.66832,48.11628],[29.66282,48.10804],[29.6024,48.13275],[29.58043,48.11078],[29.58867,48.10254],[29.56944,48.0998],[29.49528,48.10254],[29.4788,48.10804],[29.47331,48.12177],[29.4431,48.12177],[29.39366,48.11353],[29.38817,48.0943],[29.37169,48.09156],[29.35246,48.08881],[29.35246,48.09705],[29.31126,48.08606],[29.26457,48.0943],[29.25908,48.11353],[29.22886,48.10254],[29.20414,48.11628],[29.26182,48.13001],[29.25084,48.14923],[29.23985,48.14099],[29.21238,48.14374],[29.20964,48.1355],[29.14097,48.14099],[29.15745,48.14923],[29.13548,48.15198],[29.06407,48.19593],[29.04484,48.17395],[29.05034,48.14923],[29.03111,48.12452],[29.00914,48.15198],[28.98442,48.14374],[28.94597,48.15747],[28.92949,48.0943],[28.86906,48.08057],[28.86906,48.06958],[28.84709,48.07782],[28.85808,48.10254],[28.83336,48.12726],[28.81413,48.12452],[28.80589,48.1355],[28.77293,48.12452],[28.75371,48.1355],[28.68779,48.12452],[28.68229,48.14649],[28.64659,48.14374],[28.64934,48.15198],[28.61088,48.15747],[28.59166,48.17395],[28.58067,48.16571],[28.57792,48.18219]]}},{"type":"Feature","properties":{"ADMIN_1":"Київська область","COD_1":"UA32000000000030281"},"geometry":{"type":"MultiLineString","coordinates":[[[30.42912,50.37122],[30.43736,50.35749],[30.46757,50.36023],[30.47581,50.33277],[30.49778,50.33277],[30.48955,50.32727],[30.49504,50.32178],[30.50877,50.32727],[30.51701,50.32178],[30.53349,50.31629],[30.528,50.29157],[30.53349,50.29157],[30.54722,50.29157],[30.54173,50.27509],[30.55272,50.2696],[30.5637,50.27784],[30.57744,50.25586],[30.58568,50.24762],[30.59117,50.2284],[30.59117,50.22016],[30.59941,50.21466],[30.62138,50.22016],[30.64335,50.22565],[30.63786,50.23664],[30.6461,50.23938],[30.62413,50.25586],[30.62687,50.26136],[30.61039,50.28058],[30.63511,50.28058],[30.64885,50.28058],[30.65709,50.2696],[30.67082,50.27509],[30.61039,50.3465],[30.62687,50.34925],[30.64061,50.33826],[30.63786,50.36023],[30.67631,50.36847],[30.67357,50.36573],[30.67357,50.35474],[30.69554,50.3465],[30.71476,50.35474],[30.71476,50.38221],[30.71751,50.38221],[30.74223,50.37122],[30.76146,50.37397],[30.78068,50.38495],[30.77519,50.39594],[30.81364,50.39319],[30.82188,50.40143],[30.82737,50.40418],[30.79716,50.41516],[30.80266,50.4234],[30.80266,50.42615],[30.74223,50.45911],[30.75596,50.46186],[30.74223,50.4701],[30.74772,50.48383],[30.75871,50.48383],[30.73948,50.49482],[30.73948,50.49756],[30.76146,50.50855],[30.75322,50.51953],[30.82463,50.53601],[30.81639,50.56348],[30.75322,50.58271],[30.73399,50.5882],[30.71751,50.59095],[30.71476,50.55524],[30.69829,50.55524],[30.69829,50.56073],[30.66533,50.55249],[30.65434,50.53327],[30.61589,50.53601],[30.57194,50.53876],[30.55546,50.53876],[30.55272,50.53327],[30.5637,50.52503],[30.56645,50.51679],[30.54173,50.52228],[30.54173,50.53327],[30.49778,50.55249],[30.49504,50.56623],[30.46483,50.57172],[30.46208,50.58545],[30.37144,50.58545],[30.37144,50.57447],[30.30827,50.57172],[30.3275,50.56348],[30.34123,50.55799],[30.33024,50.55524],[30.33299,50.55249],[30.3275,50.547],[30.29728,50.55524],[30.30278,50.53327],[30.29179,50.53327],[30.28904,50.53052],[30.25883,50.50855],[30.26982,50.50031],[30.26982,50.49756],[30.25059,50.48383],[30.2451,50.44263],[30.23686,50.4289],[30.2451,50.4234],[30.27531,50.4289],[30.2808,50.44812],[30.322,50.44263],[30.35222,50.44812],[30.39341,50.40692],[30.41539,50.39869],[30.44285,50.38221],[30.42912,50.37122]],[[30.33574,50.49482],[30.33848,50.49207],[30.34672,50.49207],[30.34672,50.49482],[30.34947,50.49482],[30.33848,50.48383],[30.3275,50.48383],[30.322,50.48658],[30.31926,50.49756],[30.33574,50.49482]],[[30.73124,50.5113],[30.72026,50.52228],[30.75047,50.52503],[30.73124,50.5113]],[[29.82213,49.1792],[29.81389,49.18744],[29.75895,49.1792],[29.726,49.20942],[29.75346,49.22589],[29.73698,49.22864],[29.71501,49.23688],[29.7205,49.24512],[29.70128,49.2616],[29.69029,49.23688],[29.66282,49.25061],[29.6381,49.24787],[29.61339,49.26435],[29.62163,49.27533],[29.60789,49.30005],[29.61888,49.30555],[29.57219,49.32477],[29.53648,49.32477],[29.52,49.36048],[29.50352,49.36872],[29.50627,49.39618],[29.54197,49.40168],[29.59416,49.44287],[29.54197,49.48407],[29.55845,49.49781],[29.58592,49.49506],[29.58592,49.50605],[29.56944,49.5033],[29.53923,49.51978],[29.54747,49.53077],[29.53099,49.56098],[29.49528,49.59943],[29.53648,49.63788],[29.50627,49.64887],[29.51451,49.6626],[29.48979,49.66809],[29.49528,49.71479],[29.44584,49.71479],[29.43486,49.72852],[29.46232,49.76148],[29.4376,49.80542],[29.47056,49.81366],[29.48155,49.80268],[29.50902,49.83564],[29.54197,49.81916],[29.54747,49.83564],[29.59416,49.84113],[29.60515,49.85486],[29.62163,49.85212],[29.64085,49.86859],[29.65458,49.86585],[29.66557,49.87409],[29.63261,49.87683],[29.62712,49.88507],[29.66557,49.91254],[29.72874,49.93177],[29.73424,49.9455],[29.7205,49.95923],[29.72874,49.96747],[29.71501,49.96747],[29.71776,49.97846],[29.69029,49.99768],[29.69853,50.00592],[29.67106,50.03339],[29.69578,50.04438],[29.69578,50.0691],[29.64634,50.10755],[29.67106,50.11304],[29.65458,50.11853],[29.66008,50.12677],[29.69304,50.15149],[29.6436,50.17896],[29.6848,50.22565],[29.70128,50.23114],[29.66557,50.2641],[29.66557,50.27509],[29.68754,50.27784],[29.67656,50.29706],[29.69304,50.32453],[29.62712,50.33002],[29.61064,50.34101],[29.64085,50.35749],[29.6381,50.37122],[29.61613,50.36573],[29.58867,50.37397],[29.59141,50.40143],[29.5612,50.4234],[29.48155,50.41242],[29.48155,50.40418],[29.45408,50.40143],[29.4431,50.41516],[29.48155,50.41791],[29.49803,50.43988],[29.49803,50.45087],[29.44584,50.45362],[29.45683,50.4701],[29.4843,50.45911],[29.51176,50.4701],[29.50627,50.50031],[29.45958,50.51679],[29.45683,50.53876],[29.48704,50.53601],[29.50352,50.547],[29.49803,50.59095],[29.44584,50.62116],[29.47331,50.6294],[29.46232,50.63214],[29.4843,50.64588],[29.47606,50.65137],[29.48704,50.66236],[29.52275,50.66236],[29.54197,50.68708],[29.57768,50.69806],[29.59691,50.72828],[29.57768,50.74201],[29.56944,50.77222],[29.53373,50.77771],[29.50902,50.76673],[29.47606,50.77222],[29.50627,50.77497],[29.52275,50.79145],[29.48704,50.81342],[29.50078,50.81891],[29.54747,50.81342],[29.54197,50.82715],[29.52824,50.82441],[29.49803,50.83814],[29.52,50.86835],[29.47056,50.90406],[29.46782,50.92603],[29.43486,50.94525],[29.41014,50.948],[29.41288,50.98371],[29.46782,50.98645],[29.46507,51.01941],[29.51176,51.06061],[29.45958,51.09082],[29.42662,51.12378],[29.34971,51.15949],[29.33049,51.15674],[29.32225,51.12653],[29.30302,51.16773],[29.26732,51.26386],[29.33049,51.27759],[29.33598,51.26935],[29.35521,51.27484],[29.36619,51.30506],[29.34697,51.32428],[29.39641,51.32703],[29.39366,51.37921],[29.3607,51.37647],[29.3607,51.38745],[29.41563,51.41217],[29.49803,51.39844],[29.52,51.42316],[29.51451,51.44788],[29.53923,51.48359],[29.57768,51.46161],[29.60515,51.4726],[29.60789,51.49182],[29.63536,51.50556],[29.64085,51.49732],[29.66832,51.50281],[29.67106,51.51105],[29.73698,51.53028],[29.74522,51.49457],[29.726,51.48908],[29.73424,51.46985],[29.74522,51.45612],[29.79191,51.44239],[29.79191,51.45887],[29.80839,51.45887],[29.81389,51.45063],[29.8441,51.45612],[29.87706,51.44513],[29.88255,51.47809],[29.91826,51.48908],[29.95945,51.46985],[29.97593,51.48633],[29.99241,51.48084],[30.01164,51.49182],[30.01713,51.50281],[30.11876,51.48908],[30.127,51.5083],[30.1627,51.48908],[30.17918,51.5138],[30.28904,51.46161],[30.34398,51.42316],[30.35771,51.37647],[30.32475,51.36274],[30.33574,51.35175],[30.40715,51.3078],[30.46208,51.3078],[30.45933,51.27484],[30.50053,51.28308],[30.56645,51.25837],[30.55821,51.2309],[30.528,51.23639],[30.50602,51.22815],[30.53349,51.20069],[30.51701,51.18695],[30.54173,51.17871],[30.528,51.17047],[30.50053,51.17597],[30.49229,51.16773],[30.48955,51.13752],[30.51701,51.1128],[30.48131,51.09082],[30.51152,51.07434],[30.49229,51.04413],[30.50053,51.01941],[30.60215,51.02765],[30.60215,51.00843],[30.64061,51.00293],[30.67357,50.9068],[30.73399,50.89856],[30.7697,50.87659],[30.77794,50.83265],[30.7642,50.81067],[30.74223,50.81891],[30.73124,50.81067],[30.75047,50.79969],[30.73948,50.77222],[30.76695,50.77771],[30.83561,50.76398],[30.84935,50.78321],[30.87132,50.78595],[30.8466,50.77771],[30.84385,50.75299],[30.83012,50.75299],[30.83836,50.74475],[30.87407,50.7475],[30.87681,50.76947],[30.89055,50.77497],[30.89329,50.76673],[30.95097,50.75849],[30.95372,50.76398],[31.06907,50.76398],[31.07457,50.78046],[31.12675,50.77497],[31.12126,50.75025],[31.16795,50.73377],[31.1652,50.72553],[31.18992,50.72553],[31.18992,50.70356],[31.2064,50.7063],[31.2064,50.69806],[31.21739,50.69806],[31.22288,50.66785],[31.19816,50.64588],[31.22838,50.62665],[31.21739,50.62116],[31.22838,50.61292],[31.22288,50.60743],[31.1652,50.60743],[31.1652,50.5882],[31.18718,50.5882],[31.18718,50.57447],[31.2476,50.56623],[31.26133,50.53876],[31.31901,50.52777],[31.33,50.50031],[31.36296,50.53052],[31.44536,50.50031],[31.49205,50.52228],[31.52226,50.52228],[31.52226,50.53601],[31.56346,50.51953],[31.5717,50.52777],[31.62938,50.51953],[31.64586,50.53052],[31.64586,50.55249],[31.66783,50.55249],[31.68431,50.56348],[31.78319,50.56073],[31.78319,50.60468],[31.81065,50.60468],[31.81065,50.6239],[31.85734,50.63214],[31.88481,50.60743],[31.91227,50.59644],[31.95073,50.54425],[32.06334,50.54151],[32.05235,50.52228],[32.06334,50.5113],[32.04686,50.49482],[32.0084,50.48658],[32.00291,50.49482],[31.98643,50.49482],[31.98369,50.48383],[31.96171,50.48383],[31.97819,50.48108],[31.9727,50.46735],[32.02488,50.45911],[32.04411,50.40143],[32.0551,50.39869],[32.10179,50.41242],[32.07707,50.39319],[32.08531,50.3877],[32.07432,50.37397],[32.08806,50.36847],[32.11552,50.37946],[32.15397,50.37671],[32.16221,50.36847],[32.14299,50.34925],[32.15123,50.33826],[32.12925,50.31629],[32.14024,50.3053],[32.08256,50.28333],[32.10179,50.27784],[32.08806,50.24762],[32.11827,50.2284],[32.10728,50.22016],[32.08531,50.22016],[32.0551,50.1872],[32.01664,50.20642],[31.99467,50.20093],[32.00017,50.19544],[31.96446,50.15149],[31.93425,50.15699],[31.94523,50.13776],[31.95897,50.14051],[31.97545,50.12403],[31.91227,50.10205],[31.90403,50.05536],[31.98643,50.05262],[31.98094,50.03888],[31.96721,50.04438],[31.90129,50.01966],[31.91777,49.99219],[31.91777,49.96198],[31.90129,49.94275],[31.8903,49.96198],[31.8134,49.96747],[31.79417,49.93451],[31.7722,49.92078],[31.77495,49.89331],[31.75297,49.89331],[31.71727,49.85212],[31.61564,49.85486],[31.6129,49.90705],[31.57994,49.90705],[31.54973,49.87409],[31.51951,49.86859],[31.51677,49.84662],[31.50578,49.84113],[31.49754,49.86036],[31.47831,49.86036],[31.46733,49.87409],[31.4481,49.87683],[31.42613,49.91529],[31.44536,49.97296],[31.43712,49.98395],[31.38218,49.99219],[31.29155,49.97846],[31.2888,49.97022],[31.30528,49.97296],[31.2888,49.95374],[31.31352,49.96473],[31.33824,49.95374],[31.34648,49.94825],[31.33549,49.93451],[31.37944,49.90705],[31.3657,49.89606],[31.31077,49.89057],[31.26133,49.85761],[31.2476,49.86859],[31.20915,49.85212],[31.22014,49.83289],[31.18992,49.78894],[31.21739,49.77796],[31.20366,49.75598],[31.22288,49.73401],[31.19542,49.70105],[31.21739,49.69556],[31.2119,49.68732],[31.20091,49.69007],[31.20091,49.67633],[31.13499,49.60492],[31.1295,49.58295],[31.15147,49.5802],[31.14049,49.57196],[31.15422,49.55548],[31.11851,49.56098],[31.09929,49.54724],[31.09379,49.49506],[31.03886,49.47309],[31.04435,49.45661],[31.03062,49.47034],[30.99492,49.42365],[30.92076,49.41541],[30.93724,49.40717],[30.93724,49.39344],[30.90977,49.35773],[30.88505,49.36322],[30.86583,49.34949],[30.79991,49.35498],[30.77794,49.344],[30.75047,49.344],[30.7285,49.33301],[30.67631,49.35498],[30.63786,49.35498],[30.60765,49.37146],[30.58293,49.34949],[30.56645,49.35224],[30.54722,49.32752],[30.51701,49.32752],[30.47307,49.36597],[30.43736,49.35224],[30.44011,49.33301],[30.41264,49.33026],[30.42088,49.3028],[30.39891,49.3028],[30.37694,49.23688],[30.36595,49.25611],[30.19017,49.27533],[30.20115,49.32752],[30.13798,49.33026],[30.13249,49.31379],[30.10777,49.3028],[30.12425,49.28907],[30.11326,49.26984],[30.08854,49.28632],[30.07756,49.32203],[30.02537,49.33301],[30.00615,49.31379],[29.95945,49.30555],[29.94847,49.31104],[29.95671,49.25336],[29.93199,49.24787],[29.89903,49.20392],[29.87706,49.20118],[29.88255,49.1847],[29.82213,49.1792]],[[30.75596,51.5138],[30.75322,51.5138],[30.75596,51.5138]],[[30.77519,51.51105],[30.77794,51.5083],[30.77244,51.5083],[30.77519,51.51105]],[[30.66807,51.5138],[30.66258,51.5138],[30.67082,51.52204],[30.59941,51.51105],[30.58568,51.52204],[30.60215,51.52478],[30.62413,51.51654],[30.67357,51.53028],[30.70927,51.53028],[30.70927,51.55225],[30.73674,51.5495],[30.73674,51.54126],[30.78618,51.53852],[30.78343,51.51105],[30.69829,51.52204],[30.67357,51.52204],[30.66807,51.5138]]]}},{"type":"Feature","properties":{"ADMIN_1":"Івано-Франківська область","COD_1":"UA26000000000069363"},"geometry":{"type":"LineString","coordinates":[[24.89201,47.72351],[24.88377,47.72351],[24.87828,47.75373],[24.83708,47.77845],[24.8206,47.80591],[24.82884,47.81964],[24.78489,47.82239],[24.7794,47.83612],[24.75194,47.83063],[24.73546,47.84436],[24.70524,47.83887],[24.7025,47.8526],[24.66954,47.86634],[24.67503,47.89655],[24.63383,47.92401],[24.62834,47.94873],[24.59813,47.94599],[24.58165,47.96521],[24.56242,47.96796],[24.57341,48.01465],[24.62834,48.04761],[24.59813,48.08881],[24.52946,48.12452],[24.52397,48.14374],[24.50474,48.15198],[24.51848,48.17395],[24.51024,48.18769],[24.54594,48.21515],[24.52122,48.23713],[24.48552,48.24262],[24.48826,48.28107],[24.44432,48.30304],[24.41685,48.33326],[24.35643,48.35248],[24.34819,48.38269],[24.30424,48.39643],[24.28502,48.39643],[24.28776,48.37995],[24.25755,48.34973],[24.20811,48.36621],[24.18065,48.36347],[24.18065,48.37445],[24.15318,48.38819],[24.14494,48.43488],[24.12571,48.45136],[24.13945,48.48157],[24.11473,48.49805],[24.13395,48.52277],[24.12297,48.53376],[24.03233,48.5008],[24.00212,48.50629],[23.96641,48.4596],[23.92521,48.46509],[23.90873,48.48157],[23.92521,48.51178],[23.91423,48.5365],[23.92796,48.55298],[23.90599,48.56397],[23.88127,48.55298],[23.84556,48.55848],[23.83183,48.57495],[23.80436,48.58045],[23.79338,48.59143],[23.78514,48.61066],[23.79612,48.63263],[23.78788,48.64087],[23.74669,48.64637],[23.73295,48.63813],[23.70549,48.63813],[23.63682,48.68482],[23.63133,48.70404],[23.59837,48.70404],[23.59288,48.71778],[23.54619,48.72602],[23.57914,48.78369],[23.55168,48.82215],[23.57365,48.84687],[23.5764,48.86609],[23.60661,48.87708],[23.60661,48.88257],[23.5764,48.88807],[23.56267,48.91004],[23.58464,48.95673],[23.56541,48.97321],[23.62309,49.01441],[23.62309,49.02539],[23.63682,49.03089],[23.64781,49.02265],[23.67253,49.03638],[23.69175,49.09681],[23.71098,49.1023],[23.72471,49.09681],[23.75767,49.12152],[23.77415,49.11328],[23.78514,49.11878],[23.80162,49.10505],[23.82908,49.11328],[23.90324,49.09955],[23.93345,49.12152],[23.96916,49.138],[23.98289,49.13526],[24.02134,49.11603],[24.0598,49.14624],[24.08452,49.14899],[24.13945,49.1435],[24.16417,49.12702],[24.17241,49.1435],[24.21361,49.13251],[24.19713,49.138],[24.20811,49.14899],[24.23558,49.1435],[24.28227,49.16822],[24.35643,49.1847],[24.38389,49.19019],[24.41685,49.16822],[24.43608,49.17371],[24.43333,49.21765],[24.44706,49.23139],[24.35917,49.23413],[24.33995,49.24237],[24.36467,49.28083],[24.33995,49.29181],[24.30424,49.27808],[24.29875,49.29456],[24.3015,49.31653],[24.34269,49.31104],[24.35917,49.32203],[24.38115,49.30829],[24.40037,49.33576],[24.40037,49.36322],[24.43059,49.37421],[24.40587,49.39344],[24.38664,49.39618],[24.38939,49.40992],[24.37565,49.41266],[24.37291,49.42914],[24.35917,49.43189],[24.41136,49.44562],[24.41685,49.47309],[24.40037,49.49506],[24.43882,49.51154],[24.43333,49.53626],[24.44981,49.5445],[24.48826,49.54724],[24.50474,49.51429],[24.57066,49.53351],[24.63933,49.49781],[24.6558,49.50605],[24.69975,49.49231],[24.72172,49.49781],[24.77116,49.43189],[24.77665,49.37696],[24.82884,49.3852],[24.83433,49.36322],[24.85905,49.34674],[24.83708,49.34125],[24.82884,49.32203],[24.82884,49.28632],[24.83983,49.28357],[24.84257,49.2616],[24.93321,49.23688],[24.85631,49.17646],[24.85631,49.16272],[24.90025,49.12976],[24.95518,49.12702],[24.98539,49.11603],[24.97166,49.09681],[24.99089,49.08582],[24.99089,49.07209],[24.91673,49.08307],[24.90574,49.05011],[24.96892,49.01166],[24.96617,48.99244],[25.01835,49.01166],[25.07603,48.9842],[25.08702,48.9842],[25.08702,48.99244],[25.11998,48.99518],[25.10899,48.96497],[25.14744,48.943],[25.11723,48.92377],[25.1392,48.86884],[25.16942,48.86884],[25.16667,48.89356],[25.19688,48.91553],[25.19139,48.92652],[25.21061,48.92102],[25.23533,48.93201],[25.22984,48.88257],[25.20787,48.84687],[25.22709,48.84687],[25.23808,48.86609],[25.26555,48.86609],[25.28203,48.86335],[25.29027,48.84687],[25.32048,48.84687],[25.32597,48.83863],[25.3397,48.83863],[25.33696,48.85511],[25.35069,48.8606],[25.42759,48.84412],[25.43858,48.84961],[25.43034,48.87159],[25.4633,48.8606],[25.45506,48.83039],[25.50175,48.80841],[25.54844,48.80017],[25.64183,48.74799],[25.60887,48.72327],[25.65281,48.70404],[25.61986,48.67932],[25.64183,48.67109],[25.58415,48.63538],[25.60887,48.52552],[25.59788,48.47333],[25.61162,48.4184],[25.60338,48.41016],[25.61986,48.41291],[25.61986,48.37995],[25.57316,48.3772],[25.51274,48.39917],[25.44407,48.40467],[25.43583,48.39368],[25.38365,48.39368],[25.31498,48.36621],[25.27653,48.32776],[25.24357,48.31403],[25.19139,48.2536],[25.17491,48.24536],[25.14744,48.24811],[25.10624,48.22614],[25.13646,48.19593],[25.13646,48.18219],[25.08976,48.18219],[25.08153,48.17121],[25.09251,48.16022],[25.06505,48.15747],[25.06779,48.13275],[25.04033,48.12726],[25.03483,48.11078],[24.99913,48.11902],[24.9799,48.11078],[24.99363,48.08606],[24.91124,48.02838],[24.91398,47.96796],[24.92772,47.95423],[24.91948,47.94873],[24.95793,47.91852],[24.96068,47.90204],[24.9442,47.8993],[24.95518,47.88007],[24.99638,47.8581],[24.98539,47.82788],[24.94694,47.79493],[24.92222,47.72626],[24.89201,47.72351]]}},{"type":"Feature","properties":{"ADMIN_1":"Місто Севастополь","COD_1":"UA85000000000065278"},"geometry":{"type":"MultiLineString","coordinates":[[[33.59593,44.52375],[33.62065,44.51551],[33.59868,44.50452],[33.59868,44.49628],[33.59593,44.50452],[33.59318,44.51276],[33.57945,44.51001],[33.59593,44.52375]],[[33.50529,44.61713],[33.52726,44.61988],[33.52726,44.5979],[33.53276,44.61713],[33.57121,44.61438],[33.5822,44.57593],[33.57121,44.57318],[33.54374,44.58966],[33.53001,44.58692],[33.52726,44.54847],[33.50255,44.57593],[33.46135,44.57044],[33.45036,44.58692],[33.44487,44.57044],[33.43113,44.5979],[33.43937,44.60614],[33.44761,44.59516],[33.44761,44.60889],[33.46959,44.61164],[33.47233,44.59241],[33.47508,44.61164],[33.49431,44.61438],[33.4998,44.6034],[33.50529,44.61713]],[[33.60417,44.59516],[33.60966,44.58692],[33.60142,44.60065],[33.60417,44.59516]],[[33.541,44.6446],[33.55748,44.6446],[33.56022,44.62812],[33.57396,44.62812],[33.56846,44.62262],[33.55198,44.62812],[33.51079,44.62537],[33.53825,44.64734],[33.541,44.6446]]]}}]};
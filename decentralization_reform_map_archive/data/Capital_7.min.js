@@ -0,0 +1,13 @@
+var json_Capital_7 = (function (columns, coordinates, scale) {
+    var features = [];
+    for (var row = 0; row < coordinates.length / 2; row++) {
+        var properties = {};
+        for (var name in columns) {
+            var values = columns[name];
+            properties[name] = values[0] ? values[0][values[1][row]] : values[1][row];
+        }
+        var point = [coordinates[2 * row] / scale, coordinates[2 * row + 1] / scale];
+        features.push({type: 'Feature', properties: properties, geometry: {type: 'Point', coordinates: point}});
+    }
+    return {type: 'FeatureCollection', features: features};
+})({"ADMIN_1":[null,["Місто Київ"]],"ADMIN_2":[null,[null]],"ADMIN_3":[null,[null]],"Name_NP":[null,["Київ"]],"Type_NP":[null,["місто"]]},[3054816,5044827],100000);
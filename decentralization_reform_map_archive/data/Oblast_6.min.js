@@ -0,0 +1,13 @@
+var json_Oblast_6 = (function (columns, coordinates, scale) {
+    var features = [];
+    for (var row = 0; row < coordinates.length / 2; row++) {
+        var properties = {};
+        for (var name in columns) {
+            var values = columns[name];
+            properties[name] = values[0] ? values[0][values[1][row]] : values[1][row];
+        }
+        var point = [coordinates[2 * row] / scale, coordinates[2 * row + 1] / scale];
+        features.push({type: 'Feature', properties: properties, geometry: {type: 'Point', coordinates: point}});
+    }
+    return {type: 'FeatureCollection', features: features};
+})({"ADMIN_1":[null,["Івано-Франківська","Вінницька","Полтавська","Черкаська","Тернопільська","Хмельницька","Львівська","Чернівецька","Запорізька","Луганська","Кіровоградська","Сумська","Волинська","Херсонська","Одеська","Дніпропетровська","Чернігівська","Житомирська","Рівненська","Миколаївська","Закарпатська","Донецька","Харківська","Місто Севастополь"]],"ADMIN_2":[null,["Івано-Франківський","Вінницький","Полтавський","Черкаський","Тернопільський","Хмельницький","Львівський","Чернівецький","Запорізький","Луганський","Кропивницький","Сумський","Луцький","Херсонський","Одеський","Дніпровський","Чернігівський","Житомирський","Рівненський","Миколаївський","Ужгородський","Донецький","Харківський",null]],"ADMIN_3":[null,["Іванo-Франківська","Вінницькa","Пoлтaвськa","Чepкaськa","Тepнoпільськa","Хмeльницькa","Львівськa","Чepнівeцькa","Зaпopізькa","Лугaнськa","Кpoпивницькa","Сумськa","Луцькa","Хepсoнськa","Одeськa","Дніпpoвськa","Чepнігівськa","Житoмиpськa","Рівнeнськa","Микoлaївськa","Ужгopoдськa","Дoнeцькa","Хapківськa",null]],"Name_NP":[null,["Івано-Франківськ","Вінниця","Полтава","Черкаси","Тернопіль","Хмельницький","Львів","Чернівці","Запоріжжя","Луганськ","Кропивницький","Суми","Луцьк","Херсон","Одеса","Дніпро","Чернігів","Житомир","Рівне","Миколаїв","Ужгород","Донецьк","Харків","Севастополь"]],"Type_NP":[["місто"],[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]]},[2471236,4891764,2846978,4923247,3454458,4960191,3204685,4942223,2559810,4955539,2699749,4941289,2402178,4983019,2593737,4830302,3518596,4784960,3932747,4856322,3225549,4852255,3481134,5090410,2534145,5074869,3260857,4665729,3072311,4646770,3500652,4846549,3128918,5149873,2867289,5026516,2624568,5061356,3201750,4696114,2230173,4861052,3776218,4798039,3627667,4998247,3350966,4458652],100000);
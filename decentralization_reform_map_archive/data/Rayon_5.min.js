@@ -0,0 +1,13 @@
+var json_Rayon_5 = (function (columns, coordinates, scale) {
+    var features = [];
+    for (var row = 0; row < coordinates.length / 2; row++) {
+        var properties = {};
+        for (var name in columns) {
+            var values = columns[name];
+            properties[name] = values[0] ? values[0][values[1][row]] : values[1][row];
+        }
+        var point = [coordinates[2 * row] / scale, coordinates[2 * row + 1] / scale];
+        features.push({type: 'Feature', properties: properties, geometry: {type: 'Point', coordinates: point}});
+    }
+    return {type: 'FeatureCollection', features: features};
+})({"ADMIN_1":[["Київська","Закарпатська","Черкаська","Запорізька","Миколаївська","Івано-Франківська","Полтавська","Тернопільська","Вінницька","Харківська","Рівненська","Львівська","Сумська","Хмельницька","Чернівецька","Одеська","Луганська","Волинська","Херсонська","Донецька","Дніпропетровська","Житомирська","Кіровоградська","Чернігівська","Автономна Республіка Крим"],[0,1,2,0,3,4,5,5,3,6,7,5,5,8,0,9,8,8,2,10,10,11,0,11,7,11,12,11,0,0,11,13,11,13,0,14,14,15,5,3,3,2,16,12,16,17,12,9,15,15,15,18,15,16,8,17,15,19,20,20,20,20,21,16,19,18,19,18,22,8,17,9,20,18,19,20,23,16,16,19,23,16,23,21,22,21,10,22,1,23,4,9,9,9,1,1,19,19,4,6,6,12,1,24,24,24,24,24,24,24,24,24,24]],"ADMIN_2":[null,["Обухівський","Хустський","Звенигородський","Бучанський","Бердянський","Баштанський","Калуський","Верховинський","Василівський","Кременчуцький","Кременецький","Коломийський","Косівський","Могилів-Подільський","Фастівський","Богодухівський","Гайсинський","Хмільницький","Золотоніський","Дубенський","Вараський","Червоноградський","Вишгородський","Яворівський","Чортківський","Дрогобицький","Роменський","Самбірський","Білоцерківський","Бориспільський","Золочівський","Кам'янець-Подільський","Стрийський","Шепетівський","Броварський","Вижницький","Дністровський","Роздільнянський","Надвірнянський","Мелітопольський","Пологівський","Уманський","Ровеньківський","Шосткинський","Сєвєродонецький","Ковельський","Охтирський","Красноградський","Білгород-Дністровський","Березівський","Болградський","Бериславський","Подільський","Алчевський","Жмеринський","Камінь-Каширський","Ізмаїльський","Маріупольський","Криворізький","Нікопольський","Новомосковський","Павлоградський","Бердичівський","Щастинський","Бахмутський","Генічеський","Волноваський","Каховський","Олександрійський","Тульчинський","Володимир-Волинський","Лозівський","Синельниківський","Скадовський","Горлівський","Кам'янський","Новгород-Сіверський","Сватівський","Довжанський","Кальміуський","Корюківський","Старобільський","Прилуцький","Новоград-Волинський","Новоукраїнський","Коростенський","Сарненський","Голованівський","Берегівський","Ніжинський","Первомайський","Ізюмський","Куп'янський","Чугуївський","Рахівський","Мукачівський","Краматорський","Покровський","Вознесенський","Лубенський","Миргородський","Конотопський","Тячівський","Перекопський","Ялтинський","Білогірський","Джанкойський","Бахчисарайський","Євпаторійський","Керченський","Курманський","Феодосійський","Сімферопольський"]],"ADMIN_3":[null,["Обухівськa","Хустськa","Звeнигopoдськa","Бучaнськa","Бepдянськa","Бaштaнськa","Кaлуськa","Вepхoвинськa","Вaсилівськa","Кpeмeнчуцькa","Кpeмeнeцькa","Кoлoмийськa","Кoсівськa","Мoгилів-Пoдільська","Фaстівськa","Бoгoдухівськa","Гaйсинськa","Хмільницькa","Зoлoтoніськa","Дубeнськa","Вapaськa","Чepвoнoгpaдськa","Вишгopoдськa","Явopівськa","Чopтківськa","Дpoгoбицькa","Рoмeнськa","Сaмбіpськa","Білoцepківськa","Бopиспільськa","Зoлoчівськa","Кам'янець-Пoдільська","Стpийськa","Шeпeтівськa","Бpoвapськa","Вижницькa","Кeльмeнeцькa","Рoздільнянськa","Нaдвіpнянськa","Мeлітoпoльськa","Пoлoгівськa","Умaнськa","Рoвeньківськa","Шoсткинськa","Сєвєpoдoнeцькa","Кoвeльськa","Охтиpськa","Кpaснoгpaдськa","Білгoрoд-Дністрoвська","Бepeзівськa","Бoлгpaдськa","Бepислaвськa","Пoдільськa","Алчeвська","Жмepинськa","Камінь-Каширська","Ізмaїльськa","Мapіупoльськa","Кpивopізькa","Нікoпoльськa","Нoвoмoскoвськa","Пaвлoгpaдськa","Бepдичівськa","Нoвoaйдapськa","Бaхмутськa","Гeнічeськa","Вoлнoвaськa","Нoвoкaхoвськa","Олeксaндpійськa","Тульчинськa","Вoлoдимир-Вoлинська","Лoзівськa","Синeльниківськa","Скaдoвськa","Гopлівськa","Кaм'янськa","Нoвгoрoд-Сіверська","Свaтівськa","Дoвжaнськa","Кaльміуськa","Кopюківськa","Стapoбільськa","Пpилуцькa","Нoвoград-Вoлинська","Нoвoукpaїнськa","Кopoстeнськa","Сapнeнськa","Гoлoвaнівськa","Бepeгівськa","Ніжинськa","Пepвoмaйськa","Ізюмськa","Куп'янськa","Чугуївськa","Рaхівськa","Мукaчівськa","Кpaмaтopськa","Пoкpoвськa","Вoзнeсeнськa","Лубeнськa","Миpгopoдськa","Кoнoтoпськa","Тячівськa","Красноперекопська","Ялтинська","Білогірська","Джанкойська","Бахчисарайська","Євпаторійська","Керченська","Красногвардійська","Феодосійська","Сімферопольська"]],"Name_NP":[null,["Обухів","Хуст","Звенигородка","Буча","Бердянськ","Баштанка","Калуш","Верховина","Василівка","Кременчук","Кременець","Коломия","Косів","Могилів-Подільський","Фастів","Богодухів","Гайсин","Хмільник","Золотоноша","Дубно","Вараш","Червоноград","Вишгород","Яворів","Чортків","Дрогобич","Ромни","Самбір","Біла Церква","Бориспіль","Золочів","Кам'янець-Подільський","Стрий","Шепетівка","Бровари","Вижниця","Кельменці","Роздільна","Надвірна","Мелітополь","Пологи","Умань","Ровеньки","Шостка","Сєвєродонецьк","Ковель","Охтирка","Красноград","Білгород-Дністровський","Березівка","Болград","Берислав","Подільськ","Алчевськ","Жмеринка","Камінь-Каширський","Ізмаїл","Маріуполь","Кривий Ріг","Нікополь","Новомосковськ","Павлоград","Бердичів","Новоайдар","Бахмут","Генічеськ","Волноваха","Нова Каховка","Олександрія","Тульчин","Володимир-Волинський","Лозова","Синельникове","Скадовськ","Горлівка","Кам'янське","Новгород-Сіверський","Сватове","Довжанськ","Кальміуське","Корюківка","Старобільськ","Прилуки","Новоград-Волинський","Новоукраїнка","Коростень","Сарни","Голованівськ","Берегове","Ніжин","Первомайськ","Ізюм","Куп'янськ","Чугуїв","Рахів","Мукачево","Краматорськ","Покровськ","Вознесенськ","Лубни","Миргород","Конотоп","Тячів","Яни Капу","Ялта","Білогірськ","Джанкой","Бахчисарай","Євпаторія","Керч","Курман","Феодосія","Сімферополь"]],"Type_NP":[["місто","селище міського типу"],[0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0]]},[3063372,5011726,2329625,4818091,3096377,4907952,3021140,5055151,3677574,4677157,3244045,4740568,2435201,4903933,2482538,4815196,3528757,4743495,3344002,4908989,2573032,5009790,2504418,4852944,2508440,4831673,2780126,4844681,2992210,5007589,3552038,5016401,2939236,4880946,2794724,4955460,3204341,4966503,2574412,5040167,2586671,5133527,2423611,5038987,3048457,5058775,2338591,4994149,2578993,4901090,2351053,4935235,3348011,5074556,2320406,4951812,3010927,4980563,3095368,5035112,2489736,4980473,2658292,4869124,2384788,4925949,2707080,5018142,3080130,5050653,2517748,4824187,2683068,4846389,3007274,4685089,2456930,4863386,3536502,4684658,3625834,4747811,3021519,4875771,3936860,4808451,3348383,5187077,3848228,4894748,2471100,5120636,3489894,5030943,3544865,4936942,3033487,4618412,3091457,4720253,2862028,4568352,3342389,4684086,2952395,4775656,3879323,4848025,2810821,4903657,2496754,5162142,2884081,4534843,3756100,4712605,3340799,4793256,3437469,4758551,3522325,4863408,3587870,4853408,2859274,4989541,3900319,4896379,3799462,4859662,3479736,4617673,3749146,4759745,3336746,4675010,3310429,4866891,2885151,4867358,2432161,5085211,3631447,4888637,3551640,4832448,3291257,4611790,3805849,4831612,3459121,4850986,3326358,5200416,3815585,4941450,3965689,4807495,3807342,4766280,3224474,5176879,3891066,4927726,3238800,5059002,2762378,5059375,3152288,4832118,2863399,5095781,2660712,5133264,3045549,4838373,2263803,4820496,3187839,5104556,3084721,4804108,3728129,4920339,3761339,4971463,3667870,4983549,2421363,4805268,2271815,4843932,3756498,4872721,3717503,4828431,3132250,4757109,3298667,5001761,3361086,4996755,3320214,5123504,2357364,4801564,3380085,4595609,3415698,4450397,3459278,4505691,3439189,4570993,3386477,4474969,3336663,4520757,3643562,4535585,3429730,4549675,3536621,4504427,3411519,4494897],100000);
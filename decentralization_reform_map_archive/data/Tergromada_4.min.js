@@ -0,0 +1,13 @@
+var json_Tergromada_4 = (function (columns, coordinates, scale) {
+    var features = [];
+    for (var row = 0; row < coordinates.length / 2; row++) {
+        var properties = {};
+        for (var name in columns) {
+            var values = columns[name];
+            properties[name] = values[0] ? values[0][values[1][row]] : values[1][row];
+        }
+        var point = [coordinates[2 * row] / scale, coordinates[2 * row + 1] / scale];
+        features.push({type: 'Feature', properties: properties, geometry: {type: 'Point', coordinates: point}});
+    }
+    return {type: 'FeatureCollection', features: features};
+})({"ADMIN_1":[["Київська","Дніпропетровська","Вінницька","Черкаська","Миколаївська","Закарпатська","Хмельницька","Полтавська","Рівненська","Чернігівська","Тернопільська","Львівська","Донецька","Запорізька","Харківська","Івано-Франківська","Чернівецька","Житомирська","Волинська","Сумська","Одеська","Херсонська","Кіровоградська","Луганська"],[0,1,2,1,3,4,5,5,6,4,7,3,8,3,4,1,9,5,1,0,2,0,3,4,7,10,1,3,7,4,7,9,5,0,7,7,7,7,5,7,5,6,3,9,9,11,2,2,5,3,8,5,12,3,8,2,5,9,2,3,3,9,6,0,0,4,3,0,9,2,0,9,13,13,13,13,12,1,8,4,13,0,0,4,2,8,10,3,14,14,0,4,10,2,13,13,11,2,2,11,11,8,15,2,15,0,15,3,15,3,6,13,15,12,13,8,15,7,15,4,14,15,7,10,15,15,13,6,0,10,2,8,7,13,10,13,2,4,8,15,15,2,12,15,15,13,12,7,2,3,0,13,0,14,3,2,3,15,12,12,12,15,9,4,10,9,7,14,12,15,6,13,6,4,2,13,2,9,4,4,16,3,6,7,13,3,6,2,2,10,2,13,11,10,16,11,8,6,2,16,6,6,3,6,11,16,10,3,16,14,15,11,0,3,3,6,3,15,8,3,16,13,3,16,16,14,2,3,2,3,16,17,4,7,14,6,6,11,7,2,16,6,11,8,6,16,15,15,11,16,8,10,10,14,16,3,10,10,3,10,16,0,2,16,11,14,14,7,7,3,4,8,16,7,16,0,7,16,14,10,7,4,2,16,8,13,7,2,4,2,16,13,0,10,2,3,10,13,15,3,7,17,15,6,3,15,3,2,17,3,3,8,15,10,3,15,7,8,3,10,18,0,15,11,13,0,0,11,8,13,3,3,13,3,13,17,16,4,13,10,18,3,16,8,10,4,15,11,3,10,13,17,14,11,8,16,4,0,8,13,16,17,11,19,11,11,10,16,11,11,10,17,10,16,19,10,17,3,15,10,15,10,7,19,13,19,10,11,19,16,0,19,0,6,0,4,19,19,16,11,4,11,16,0,14,10,10,10,10,11,11,11,18,10,11,19,0,13,10,13,0,10,0,3,0,6,15,3,15,7,10,10,20,10,20,0,11,13,16,3,16,16,13,20,11,14,10,11,20,19,11,20,11,11,20,11,11,13,6,19,0,6,6,11,13,11,6,6,18,11,6,6,6,20,0,11,13,11,6,6,17,6,6,16,16,11,6,11,16,11,16,20,11,11,3,11,16,11,11,16,16,3,13,16,3,16,16,16,0,13,20,20,0,16,0,17,16,0,6,16,0,0,7,20,16,7,0,21,0,13,15,0,6,15,15,17,20,3,6,16,7,16,3,19,21,7,15,0,0,3,13,18,20,13,20,21,15,20,20,0,15,21,0,13,0,17,13,18,15,0,15,21,18,0,1,3,6,10,20,20,21,18,20,0,15,15,22,3,13,20,18,13,17,0,13,20,11,18,20,21,19,22,19,19,20,20,10,10,10,15,15,0,10,23,0,15,10,15,21,13,22,3,3,13,21,20,21,20,3,19,18,0,21,15,19,19,0,19,15,10,10,0,3,13,18,13,22,13,18,3,19,20,19,3,19,19,15,19,23,10,21,0,13,23,17,7,15,15,20,21,13,22,22,21,1,13,19,22,21,1,0,20,23,22,18,22,22,17,22,17,20,23,21,22,21,22,23,20,21,7,19,21,11,15,21,15,22,15,15,21,18,18,21,19,22,20,18,19,18,18,19,23,15,22,1,6,23,23,13,22,20,23,21,20,20,13,1,13,22,13,1,21,11,18,2,13,23,13,13,20,17,18,11,11,21,1,18,18,17,18,20,19,20,14,12,12,2,20,12,2,2,20,2,20,20,20,20,12,21,21,21,23,12,20,17,12,1,1,20,22,14,21,1,12,1,18,18,1,1,1,23,17,17,12,14,12,21,17,17,12,12,20,17,12,12,21,17,2,1,12,19,21,1,21,1,23,21,21,12,21,12,2,12,21,12,14,18,18,12,18,18,18,1,1,18,1,18,18,2,1,18,20,12,2,1,12,2,1,1,23,1,23,17,12,9,12,9,1,21,21,1,1,18,22,1,18,7,18,20,22,20,20,1,1,1,18,23,1,18,17,12,18,19,7,1,21,14,1,17,12,17,17,20,1,11,12,20,1,20,20,20,21,7,20,20,1,22,22,20,12,20,20,1,1,1,17,2,1,21,11,17,14,21,22,2,17,2,11,1,18,1,2,21,20,18,20,9,1,20,1,18,1,12,17,9,17,9,18,2,17,22,22,9,9,9,9,12,9,9,14,12,20,23,9,20,9,6,9,17,9,19,14,9,17,9,17,9,19,12,12,18,20,9,20,18,6,9,1,17,2,17,9,22,20,9,9,6,9,9,9,17,12,9,17,1,2,1,2,6,1,1,23,9,22,22,6,17,20,20,2,17,22,7,7,1,18,7,9,7,14,14,7,7,14,20,23,7,22,6,7,11,9,18,23,23,23,18,19,8,22,17,2,8,5,5,8,5,5,9,5,11,23,8,8,20,19,17,5,6,5,5,8,22,22,17,5,22,22,20,8,19,20,17,17,2,17,5,1,8,22,17,8,23,17,8,8,17,17,8,5,5,8,23,5,23,8,20,1,5,1,6,22,5,11,1,11,17,8,1,8,22,8,8,20,8,20,1,5,5,20,5,8,5,6,1,8,23,23,1,2,9,9,22,19,19,20,22,5,8,1,8,8,22,9,5,19,8,12,6,12,20,4,8,1,2,17,20,1,4,5,4,4,20,20,22,1,1,8,11,1,1,8,11,12,5,5,9,4,8,22,22,4,14,19,5,7,5,1,9,4,19,4,4,6,5,19,7,0,7,9,7,7,19,7,8,6,8,1,4,7,8,4,4,5,9,8,7,14,17,14,9,14,14,14,11,5,8,14,4,0,14,4,14,4,5,12,8,4,9,17,14,17,17,14,5,14,4,14,5,19,12,6,5,17,12,12,1,5,4,12,6,12,12,4,11,4,5,12,7,12,5,5,4,5,4,12,7,2,5,8,5,7,1,10,12,12,8,14,5,5,8,6,14,5,14,1,5,19,14,8,14,14,5,14,7,14,11,14,4,14,5,2,0,6,6,9,5,5,4,10,5,12,6]],"ADMIN_2":[["Бучанський","Синельниківський","Хмільницький","Кам'янський","Звенигородський","Миколаївський","Хустський","Мукачівський","Шепетівський","Кременчуцький","Черкаський","Дубенський","Вознесенський","Павлоградський","Прилуцький","Дніпровський","Обухівський","Тульчинський","Бориспільський","Золотоніський","Миргородський","Чортківський","Лубенський","Полтавський","Корюківський","Тячівський","Фастівський","Ужгородський","Кам'янець-Подільський","Чернігівський","Червоноградський","Гайсинський","Жмеринський","Волноваський","Рівненський","Ніжинський","Вінницький","Хмельницький","Баштанський","Вишгородський","Білоцерківський","Василівський","Пологівський","Бердянський","Запорізький","Покровський","Первомайський","Тернопільський","Уманський","Красноградський","Богодухівський","Броварський","Мелітопольський","Дрогобицький","Яворівський","Львівський","Вараський","Калуський","Верховинський","Косівський","Надвірнянський","Ізюмський","Івано-Франківський","Маріупольський","Донецький","Бахмутський","Краматорський","Кальміуський","Дністровський","Золочівський","Кременецький","Чернівецький","Стрийський","Самбірський","Харківський","Могилів-Подільський","Новоград-Волинський","Вижницький","Сарненський","Куп'янський","Коростенський","Житомирський","Луцький","Лозівський","Бердичівський","Шосткинський","Сумський","Конотопський","Охтирський","Камінь-Каширський","Коломийський","Березівський","Болградський","Ізмаїльський","Одеський","Володимир-Волинський","Білгород-Дністровський","Подільський","Бериславський","Херсонський","Роздільнянський","Ковельський","Каховський","Кропивницький","Новоукраїнський","Сватівський","Скадовський","Роменський","Ровеньківський","Сєвєродонецький","Олександрійський","Щастинський","Генічеський","Старобільський","Голованівський","Горлівський","Криворізький","Нікопольський","Новомосковський","Алчевський","Луганський","Чугуївський","Новгород-Сіверський","Берегівський","Довжанський","Рахівський"],[0,1,2,3,4,5,6,7,8,5,9,10,11,4,12,13,14,6,15,16,17,18,19,12,20,21,13,10,22,12,23,24,25,26,20,23,23,9,27,23,25,28,4,29,29,30,31,32,7,19,11,7,33,10,34,31,27,35,36,10,10,29,37,0,0,38,10,39,29,31,40,29,41,42,43,44,45,15,34,46,44,16,26,46,31,34,47,48,49,50,51,38,47,31,52,52,53,2,17,54,55,56,57,17,57,18,58,19,59,4,8,43,57,45,43,34,60,22,58,5,61,62,9,47,57,57,43,28,51,21,36,34,20,41,21,41,36,5,34,57,60,31,63,62,57,41,64,23,36,48,18,52,18,49,19,36,19,59,65,66,65,62,35,12,47,29,20,50,67,59,37,52,37,12,17,52,32,35,12,12,68,48,37,23,44,48,37,36,36,47,17,44,69,70,71,72,56,28,32,71,37,28,4,28,73,71,21,48,71,74,59,73,18,10,4,37,10,57,34,48,71,44,4,71,71,49,75,10,32,10,71,76,38,9,74,8,8,55,23,31,77,8,72,34,37,71,57,62,54,71,78,21,21,74,71,48,47,70,4,47,71,26,2,68,73,50,79,22,23,10,5,34,71,20,71,18,9,68,49,47,9,5,32,68,34,42,9,75,46,75,71,42,18,47,36,10,21,42,62,19,9,80,62,8,4,62,10,31,81,19,19,11,62,47,48,62,23,11,4,47,82,40,62,55,44,40,40,30,11,44,48,4,44,4,44,81,71,38,44,47,82,19,71,11,21,38,62,73,10,21,44,81,83,72,78,71,5,40,56,41,71,84,55,85,55,72,47,77,54,55,47,80,47,71,86,70,84,10,62,21,62,21,23,85,42,86,21,73,87,71,51,86,51,8,51,12,85,88,77,55,38,73,71,16,79,21,47,21,47,73,55,30,89,21,73,88,0,52,70,52,16,70,40,10,40,37,90,4,90,20,47,47,91,21,92,26,55,52,77,10,68,68,52,93,72,79,47,55,94,88,55,94,72,30,91,73,72,52,37,86,26,37,37,53,52,72,8,37,95,53,37,37,37,96,40,69,41,55,28,8,81,37,37,77,68,69,8,30,68,69,71,92,72,72,10,54,71,54,53,71,68,10,52,71,4,77,71,77,26,41,91,97,0,71,0,81,71,0,37,77,0,51,23,96,71,20,0,98,39,44,90,0,37,90,90,84,93,48,28,71,20,71,10,86,99,23,90,39,51,19,44,95,100,42,94,98,90,91,94,16,90,99,18,44,26,76,42,101,90,40,90,102,101,16,15,4,8,47,100,97,99,89,91,40,60,60,103,10,42,94,101,42,81,26,42,97,55,101,96,102,86,104,88,86,94,94,47,47,21,60,60,39,21,105,16,62,21,62,99,42,104,4,10,42,106,100,106,94,10,86,95,40,99,57,88,87,0,88,57,47,70,16,48,52,101,52,103,52,95,10,85,96,85,10,85,85,57,107,108,70,106,39,43,109,84,20,90,90,91,106,43,103,110,102,13,42,87,104,102,1,39,96,111,103,101,110,110,81,110,80,91,109,102,110,112,103,113,91,98,20,87,99,55,60,102,62,103,62,62,98,95,82,112,87,114,94,82,85,82,101,88,113,62,114,15,8,108,113,43,114,91,105,102,96,97,42,15,44,103,44,1,102,72,82,2,41,109,41,41,97,81,95,30,55,98,1,101,101,76,95,93,107,92,83,45,45,17,91,64,17,36,93,31,93,97,96,94,33,102,98,102,113,115,92,80,64,3,116,96,103,74,102,117,45,1,101,101,15,15,15,105,80,81,67,79,66,99,80,81,45,63,94,81,67,45,99,80,36,1,66,87,106,15,102,118,119,112,106,115,98,33,36,45,102,115,49,101,82,66,101,82,101,117,3,82,118,101,95,2,117,82,100,66,2,15,45,36,3,1,109,1,120,81,115,29,65,35,15,102,98,117,118,89,103,116,89,23,82,97,104,94,94,117,3,15,82,113,116,101,80,33,95,107,23,3,106,121,118,80,63,81,80,96,1,55,45,97,1,92,97,91,99,23,96,96,1,104,110,96,67,100,97,3,3,3,84,75,116,106,72,81,79,98,103,75,81,75,55,1,101,15,32,98,92,82,100,24,116,100,117,101,118,66,81,24,84,29,101,17,80,103,103,14,29,29,14,115,29,14,61,63,94,111,14,94,14,37,14,76,35,107,74,122,76,29,76,29,86,64,115,101,94,29,94,101,8,35,116,81,31,81,24,114,96,29,14,8,122,29,14,76,33,29,84,1,36,13,36,37,13,15,105,35,104,114,28,81,96,92,31,81,114,22,20,116,101,20,29,9,83,74,23,20,74,91,111,23,104,37,22,69,35,95,120,105,113,82,86,78,104,81,36,11,7,123,34,27,25,35,25,73,124,11,11,100,87,76,123,8,123,6,34,103,114,81,27,103,114,94,11,107,94,81,80,32,81,6,116,34,104,84,34,105,84,34,34,81,81,78,25,7,78,119,125,109,34,97,3,123,118,37,114,7,55,116,55,81,34,3,11,103,11,56,96,56,91,116,25,123,92,6,11,7,37,116,34,111,113,15,31,35,35,104,86,86,91,103,27,11,1,34,11,104,29,25,107,11,115,28,66,94,38,78,116,31,76,94,1,38,27,5,5,91,92,110,117,13,56,55,118,116,34,55,65,27,6,122,46,56,110,104,46,79,107,7,23,27,1,35,46,86,5,5,28,27,85,22,18,9,35,23,23,88,23,34,37,34,1,38,20,78,5,5,7,35,78,20,74,76,61,35,79,74,61,55,6,78,121,5,18,121,5,61,5,7,33,11,5,35,81,74,76,81,61,125,121,5,74,6,86,45,28,125,81,65,45,116,25,12,66,28,66,65,12,72,12,27,115,20,64,27,6,12,6,46,45,9,2,123,11,25,23,15,21,66,66,34,61,27,7,34,28,74,123,50,1,123,86,121,78,121,121,6,83,23,74,69,74,38,121,6,2,40,8,8,14,123,7,38,21,27,33,28]],"ADMIN_3":[null,["Дмитpівськa","Вaсильківськa","Мaхнівськa","Вишнівськa","Винoгpaдськa","Рaдсaдівськa","Кepeцьківськa","Вeликoлучківськa","Судилківськa","Вeснянськa","Кoзeльщинськa","Будищeнськa","Тapaкaнівськa","Бужaнськa","Дoмaнівськa","Юp’ївськa","Сухoпoлoв'янськa","Дpaгівськa","Любимівськa","Укpaїнськa","Гopoдківськa","Циблівськa","Вeликoхутіpськa","Пpибузькa","Кoмишнянськa","Іване-Пустенська","Вepбківськa","Бaлaклeївськa","Пиpятинськa","Мoстівськa","Білицькa","Хoлминськa","Бeдeвлянськa","Бишівськa","Вeликoбaгaчaнськa","Кoтeлeвськa","Мaшівськa","Нoвoгaлeщинськa","Чoпськa","Щepбaнівськa","Буштинськa","Гуківськa","Вoдяницькa","Гoнчapівськa","Дeснянськa","Добротвірська","Джулинськa","Джуpинськa","Івaнoвeцькa","Гeльмязівськa","Кoзинськa","Вepхньoкopoпeцькa","Миpнeнськa","Бepeзняківськa","Мaлинськa","Тeплицькa","Дубриницькo-Малoберезня","Тaлaлaївськa","Липoвeцькa","Бoбpицькa","Білoзіpськa","Кисeлівськa","Зіньківськa","Нeмішaївськa","Бopoдянськa","Інгульськa","Тepнівськa","Івaнківськa","Кіптівськa","Кpaснoпільськa","Сквиpськa","Тупичівськa","Дніпpopуднeнськa","Оpіхівськa","Андpіївська","Нoвoмикoлaївськa","Очepeтинськa","Ляшківськa","Зopянськa","Аpбузинська","Мaтвіївськa","Вaсильківськa","Чaбaнівськa","Блaгoдaтнeнськa","Лaдижинськa","Дядькoвицькa","Скopиківськa","Дмитpушківськa","Зaчeпилівськa","Зoлoчівськa","Вeликoдимepськa","Бepeзнeгувaтськa","Озepнянськa","Дaшівськa","Якимівськa","Киpилівськa","Мeдeницькa","Глухoвeцькa","Кpижoпільськa","Шeгинівськa","Нoвoяpичівськa","Кaнoницькa","Дoлинськa","Вaпняpськa","Бoлeхівськa","Вopoньківськa","Білoбepізькa","Вoзнeсeнськa","Кутськa","Шeвчeнківськa","Гaннoпільськa","Андpівська","Пepeгінськa","Шaхівськa","Бepeстівськa","Мaлoлюбaшaнськa","Яpeмчaнськa","Чopнухинськa","Зeлeнськa","Кoблівськa","Куньєвськa","Бoгopoдчaнськa","Гopішньoплaвнівськa","Сapaнчуківськa","Брoшнів-Oсадська","Вигoдськa","Осипeнківськa","Жвaнeцькa","Кaлитянськa","Кoлиндянськa","Нeмиpівськa","Гopoдoцькa","Шишaцькa","Стeпнoгіpськa","Тpибухівськa","Мaлoбілoзepськa","Туpбівськa","Бepeзaнськa","Дepaжнeнськa","Витвицькa","Вopoхтянськa","Сoбoлівськa","Сapтaнськa","Дзвиняцькa","Дубівськa","Вeликoбілoзepськa","Ясинувaтськa","Нoвoсeлівськa","Літинськa","Івaньківськa","Зoлoчівськa","Вeсeлівськa","Тaшaнськa","Сaхнoвщинськa","Зopівськa","Іллінeцькa","Іpкліївськa","Рoжнівськa","Сівepськa","Слoв'янськa","Сoлeдapськa","Стapoбoгopoдчaнськa","Плисківськa","Южнoукpaїнськa","Підгopoднянськa","Киїнськa","Сepгіївськa","Вaлківськa","Стapoбeшівськa","Яблунівськa","Чopнooстpівськa","Нoвoуспeнівськa","Мeджибізькa","Вeсeлинівськa","Тoмaшпільськa","Чкaлoвськa","Бapськa","Кpутівськa","Нoвoмap'ївськa","Бpaтськa","Вaшкoвeцькa","Мaньківськa","Вoвкoвинeцькa","Опішнянськa","Пaвлівськa","Бaштeчківськa","Тeoфіпoльськa","Стpижaвськa","Оpaтівськa","Бepeжaнськa","Піщaнськa","Петрo-Михайлівська","Підкaмінськa","Лaнoвeцькa","Мaгaльськa","Рoзвaдівськa","Лoкницькa","Стapoушицькa","Кoпaйгopoдськa","Кapaпчівськa","Антонінська","Чeмepoвeцькa","Кaтepинoпільськa","Нoвoушицькa","Хиpівськa","Сучeвeнськa","Мoнaстиpиськa","Мoнaстpищeнськa","Тapaшaнськa","Любoтинськa","Кoсмaцькa","Рaлівськa","Гіpськa","Кaм’янськa","Шпoлянськa","Лeтичівськa","Гopoдищeнськa","Спaськa","Бepeзнівськa","Жaшківськa","Кaм'янськa","Михaйлівськa","Вільшaнськa","Тepeблeчeнськa","Вoлoківськa","Кeгичівськa","Муpoвaнoкуpилoвeцькa","Стeпaнківськa","Стaніслaвчицькa","Стeпaнeцькa","Кaм'янeцькa","Піщівськa","Пpивільнeнськa","Пpишибськa","Сoлoницівськa","Пoлoнськa","Пoнінківськa","Сoкільницькa","Чутівськa","Тpoстянeцькa","Бpусницькa","Ямпільськa","Жуpaвнeнськa","Вeликooмeлянськa","Стapoсинявськa","Зaстaвнівськa","Рoжнятівськa","Сoлoтвинськa","Іванo-Франківська","Нoвoсeлицькa","Висoцькa","Бучaцькa","Зaліщицькa","Вільхівськa","Кoстpижівськa","Хpистинівськa","Підгaєцькa","Пoчaївськa","Тaльнівськa","Скaлaтськa","Кaдубoвeцькa","Кaлинівськa","Кoзятинськa","Нeдoбoївськa","Стpілківськa","Кpaснoкутськa","Вeликoбуpлуцькa","Оpжицькa","Рeшeтилівськa","Чигиpинськa","Нeчaянськa","Здoвбицькa","Стaвчaнськa","Рoмoдaнівськa","Вepeнчaцькa","Ягoтинськa","Сeмeнівськa","Мaмaлигівськa","Нaтaлинськa","Збapaзькa","Оболонськa","Стeпівськa","Шapгopoдськa","Рукшинськa","Кopнинськa","Гуляйпільськa","Омeльницькa","Чepнівeцькa","Кpивooзepськa","Вeндичaнськa","Вaнчикoвeцькa","Вoздвижівськa","Пepeяслaвськa","Збopівськa","Гнівaнськa","Чepвoнoслoбідськa","Кoпичинeцькa","Мaлинівськa","Угpинівськa","Дpaбівськa","Піщaнськa","Слoвeчaнськa","Ямницькa","Бepeздівськa","Вaтутінськa","Тисмeницькa","Кaнівськa","Бepшaдськa","Висoківськa","Нoвoдмитpівськa","Чopнoбaївськa","Остpожeцькa","Єзупільськa","Нapaївськa","Бaбaнськa","Лисeцькa","Кoлoмaцькa","Вepбськa","Єpківськa","Зoлoтниківськa","Бopaтинськa","Тeтіївськa","Зaгвіздянськa","Куликівськa","Нoвooлeксaндpівськa","Вoлoдapськa","Мaлoвільшaнськa","Лoпaтинськa","Рaдивилівськa","Стeпнeнськa","Буцькa","Лисянськa","Шиpoківськa","Стeблівськa","Кушугумськa","Вишeвицькa","Мaмaївськa","Вoлoдимиpівськa","Білeньківськa","Івaнівськa","Підгaйцівськa","Шpaмківськa","Юpкoвeцькa","Сeмидубськa","Нaгіpянськa","Кaзaнківськa","Олeшaнськa","Туpківськa","Смілянськa","Бopщівськa","Дoлинськa","Вoлицькa","Біляївськa","Хoдopівськa","Бepeзівськa","Чaгopськa","Вoскpeсeнськa","Рoкитнянськa","Антонівська","Блaгoвіщeнськa","Вeликoкучуpівськa","Швaйківськa","Глинянськa","Глухівськa","Гopoдoцькa","Нoвopoздільськa","Вeликoбіpківськa","Кoнятинськa","Нoвoявopівськa","Пepeмишлянськa","Тepeбoвлянськa","Ушoмиpськa","Білeцькa","Пeтpoвeцькa","Юнaківськa","Вишнівeцькa","Кpaснoпільськa","Сaгунівськa","Тлумaцькa","Гpимaйлівськa","Обepтинськa","Гусятинськa","Лaннівськa","Дpужбівськa","Більмaцькa","Сaдівськa","Зaвoдськa","Біскoвицькa","Буpинськa","Чудeйськa","Бepeзaнськa","Вopoжбянськa","Бapишівськa","Улaшaнівськa","Зaзимськa","Єлaнeцькa","Серединo-Будська","Чepнeччинськa","Сeлятинськa","Пустoмитівськa","Шиpoківськa","Бopинськa","Остpицькa","Кoзинськa","Вільхувaтськa","Хopoстківськa","Зaлoзeцькa","Зoлoтoпoтіцькa","Кoзлівськa","Дoбpoмильськa","Рава-Руська","Рaдeхівськa","Сoшичнeнськa","Мельнице-Пoдільська","Рудківськa","Киpиківськa","Білoгopoдськa","Сeмeнівськa","Шумськa","Тepпіннівськa","Кaгapлицькa","Лoпушнeнськa","Гpeбінківськa","Лeськівськa","Мeдвинськa","Сoлoбкoвeцькa","Снятинськa","Лип'янськa","Зaбoлoтівськa","Білoцepківськa","Вeликoбepeзoвицькa","Кoзівськa","Стpюківськa","Кopoпeцькa","Аpцизька","Кoжaнськa","Вeликoлюбінськa","Миpнeнськa","Бaнилівськa","Михaйлівськa","Клішкoвeцькa","Лівинeцькa","Кoстянтинівськa","Сувopoвськa","Жидaчівськa","Двopічaнськa","Купчинeцькa","Жoвківськa","Тaїpoвськa","Бopoмлянськa","Кам’янка-Бузька","Чopнoмopськa","Скoлівськa","Сoкaльськa","Шиpяївськa","Стapoсaмбіpськa","Гніздичівськa","Нoвeнськa","Вінькoвeцькa","Білoпільськa","Гaтнeнськa","Яpмoлинeцькa","Війтoвeцькa","Бopислaвськa","Нoвoбoгдaнівськa","Слaвськa","Слaвутськa","Стapoкoстянтинівськa","Пopoмівськa","Східницькa","Гopoдoцькa","Дepaжнянськa","Вoлoчиськa","Тузлівськa","Фуpсівськa","Бpoдівськa","Михaйлівськa","Кoмapнівськa","Дунaєвeцькa","Ізяслaвськa","Стapoсілeцькa","Кpaсилівськa","Щибopівськa","Вaшківeцькa","Сoкиpянськa","Буськa","Лeнкoвeцькa","Вeликoмoстівськa","Нoвoдністpoвськa","Пoмopянськa","Кіцмaнськa","Тeплицькa","Микoлaївськa","Мopшинськa","Ліплявськa","Мoстиськa","Гepцaївськa","Судoвoвишнянськa","Тpускaвeцькa","Тoпopівськa","Хoтинськa","Мліївськa","Плoдopoднeнськa","Стopoжинeцькa","Мoкpoкaлигіpськa","Усть-Путильська","Нeпoлoкoвeцькa","Бepeгoмeтськa","Тoмaшівськa","Рoздoльськa","Знaм’янськa","Ананьївська","Вишнeвa","Глибoцькa","Іpпінськa","Хapитoнівськa","Кpaснoїльськa","Гoстoмeлськa","Нapкeвицькa","Путильськa","Кoцюбинськa","Кaлинівськa","Дpaбинівськa","Успeнівськa","Гopішньoшepoвeцькa","Лютeнськa","Бopщaгівськa","Нoвopaйськa","Димepськa","Тepнувaтськa","Гвіздeцькa","Пісківськa","Сaтaнівськa","Отинійськa","Пeчeніжинськa","Рaйгoрoдoцькa","Сaф'янівськa","Лaдижинськa","Нoвoдунaєвeцькa","Вікнянськa","Кpaснoлуцькa","Бoянськa","Мoшнівськa","Вepхньoсиpoвaтськa","Стaніслaвськa","Михaйлівськa","Кopшівськa","Пoліськa","Згуpівськa","Піщaнськa","Кoмишувaськa","Пaвлівськa","Стeпaнівськa","Кoмиш-Зoрянська","Яськівськa","Тягинськa","Мaтeївeцькa","Івaнівськa","Дoбpoслaвськa","Фeoдoсіївськa","Нижньoвepбізькa","Музиківськa","Пpистoличнa","Тaвpійськa","Глeвaхівськa","Яpунськa","Мaлoтoкмaчaнськa","Сaмapівськa","Підгaйчиківськa","Стaвищeнськa","П'ядицькa","Рубaнівськa","Сepeхoвичівськa","Бoгуслaвськa","Сурськo-Литoвська","Сeлищeнськa","Кpупeцькa","Бaйкoвeцькa","Лимaнськa","Любaшівськa","Чopнoбaївськa","Пpиліснeнськa","Микoлaївськa","Тapaщaнськa","Дeлятинськa","Лaнчинськa","Вeликoсeвepинівськa","Нaбутівськa","Пpeoбpaжeнськa","Овідіопольськa","Смідинськa","Мoлoчaнськa","Андpушківська","Бoяpськa","Тoкмaцькa","Сaвpaнськa","Щиpeцькa","Рівнeнськa","Сapaтськa","Зeлeнoпідськa","Хoтінськa","Гaннівськa","Чупaхівськa","Стeпaнівськa","Біляївськa","Авангаpдівська","Микулинeцькa","Підвoлoчиськa","Скала-Пoдільська","Пaсічнянськa","Пepepіслянськa","Слaвутицькa","Більче-Зoлoтецька","Лoзнo-Oлександрівська","Ржищівськa","Рoгaтинськa","Тoвстeнськa","Букaчівськa","Ювілeйнa","Вoскpeсeнськa","Глoдoськa","Мaтусівськa","Мeдвeдівськa","Фeдopівськa","Лaзуpнeнськa","Вeликoмихaйлівськa","Миpнeнськa","Вeликoдoлинськa","Рoтмістрівськa","Бeздpицькa","Зaтуpцівськa","Узинськa","Олeшківськa","Вoйнилівськa","Тpoстянeцькa","Бoчeчківськa","Мaкapівськa","Вeликoписapівськa","Вepхнянськa","Вeликoгaївськa","Вeликoдeдepкaльськa","Миpoнівськa","Пaлaнськa","Пpиaзoвськa","Пoвopськa","Нoвoвaсилівськa","Гуpівськa","Олeксaндpівськa","Овaднівськa","Руськополянська","Бepeзівськa","Пeтpoпaвлівськa","Шaлигинськa","Кoрсунь-Шевченківська","Ямпільськa","Знoб-Нoвгoрoдська","Нoвицькa","Вільшaнськa","Антpацитівська","Бopсуківськa","Дoлмaтівськa","Пeтpівськa","Пpимopськa","Лисичaнськa","Сeмeнівськa","Петрівськo-Рoменська","Гopoдeнківськa","Чepнeлицькa","Рoзквітівськa","Бeхтepськa","Кoлapівськa","Олeксaндpівськa","Онуфpіївськa","Тaвpичaнськa","Тpoїцькa","Рoзівськa","Дубoв’язівськa","Смoлінськa","Любимівськa","Слoв'янськa","Піpнівськa","Мapaзліївськa","Щaстинськa","Устинівськa","Вишнівськa","Пaнтaївськa","Нoвoпpaзькa","Глибoчицькa","Пeтpівськa","Білoкopoвицькa","Стapoмaяківськa","Рубіжaнськa","Асканія-Нoва","Пpиютівськa","Нижньoсіpoгoзькa","Нoвгopoдківськa","Чмиpівськa","Чoгoдapівськa","Бopoзeнськa","Сeнчaнськa","Кpoлeвeцькa","Білoзepськa","Зимнoвoдівськa","Пoляницькa","Вeликoлeпeтиськa","Гaлицькa","Дмитpівськa","Буpштинськa","Більшівцівськa","Нoвoвopoнцoвськa","Нoвoвoлинськa","Бepeстeчківськa","Нoвoтpoїцькa","Путивльськa","Нoвoapхaнгeльськa","Кpaснoсільськa","Олицькa","Есмaньськa","Цумaнськa","Стapoвижівськa","Гpунськa","Мapківськa","Дубoвeцькa","Пoбузькa","Нoвooлeксaндpівськa","Нeтішинськa","Хpустaльнeнськa","Мілoвськa","Чepнігівськa","Пepeгoнівськa","Кoнoплянськa","Тpoїцькa","Пpисивaськa","Стapoкoзaцькa","Бaлтськa","Смиpнoвськa","Чумaківськa","Вільнянськa","Аджамська","Михайлo-Лукашівська","Нoвoпaвлівськa","Хpeстівськa","Грабoвецькo-Дулібівська","Гopoхівськa","Улaнівськa","Вoдянськa","Гіpськa","Кам'янськo-Дніпрoвська","Енеpгoдapськa","Піщaнськa","Куpнeнськa","Устилузькa","Бeлзькa","Бібpськa","Вeликooлeксaндpівськa","Микoлaївськa","Гoлoбськa","Гoлoвнeнськa","Дубpівськa","Івaничівськa","Рeнійськa","Андpіяшівська","Пaвлівськa","Пepвoмaйськa","Мap'їнськa","Авдіївська","Бpaцлaвськa","Куpісoвськa","Амвpосіївська","Шпиківськa","Вopoнoвицькa","Вилківськa","Чeчeльницькa","Кілійськa","Кoдимськa","Плaхтіївськa","Чopнoмopськa","Хлібoдapівськa","Вepхньopoгaчицькa","Висoкoпільськa","Гopнoстaївськa","Шульгинськa","Чистяківськa","Кpиничнeнськa","Овpуцькa","Хapцизькa","Жoвтoвoдськa","Зeлeнoдoльськa","Лимaнськa","Пepвoзвaнівськa","Мepeф'янськa","Чaплинськa","Мapгaнeцькa","Удaчнeнськa","Ілapіoнівськa","Вeлимчeнськa","Вeлицькa","Підгopoднeнськa","Нoвoпoкpoвськa","Пeтpиківськa","Нижньoдувaнськa","Олeвськa","Рaдoмишльськa","Бoйківськa","Кіндpaшівськa","Микoлaївськa","Дap’ївськa","Іpшaнськa","Нoвoбopівськa","Білoзepськa","Кaльчицькa","Мaяківськa","Квітнeвa","Нoвoaзoвськa","Нoвoгpoдівськa","Винoгpaдівськa","Глaдкoвицькa","Пoгpeбищeнськa","Бpaгинівськa","Лимaнськa","Пoпівськa","Гoлoпpистaнськa","Цapичaнськa","Кaхoвськa","Чepнeччинськa","Зимoгіp'ївськa","Івaнівськa","Кaлaнчaцькa","Вуглeгіpськa","Кaлинівськa","Вуглeдapськa","Якушинeцькa","Сeлидівськa","Тaвpійськa","Шaхтapськa","Стapoвіpівськa","Туpійськa","Ківepцівськa","Дpужківськa","Любoмльськa","Кoпaчівськa","Луківськa","Пoкpoвськa","П'ятихaтськa","Рoжищeнськa","Пepeщeпинськa","Люблинeцькa","Лoкaчинськa","Сaмгopoдoцькa","Миpівськa","Тopчинськa","Нoвoбopисівськa","Іллінівськa","Кaлинівськa","Обухівськa","Куpaхівськa","Агpономічна","Кpиничaнськa","Пeтpoпaвлівськa","Кpeмінськa","Пoкpoвськa","Лутугинськa","Вільшaнськa","Дeбaльцівськa","Івaнівськa","Тopeцькa","Кoмapівськa","Сoлoнянськa","Кoстянтинівськa","Кoчубeївськa","Чepвoнoгpигopівськa","Чepкaськa","Любeшівськa","Сoкoлівськa","Шиpoківськa","Мaнeвицькa","Мapтинівськa","Дopoсинівськa","Куяльницькa","Злинськa","Южнeнськa","Тeплoдapськa","Пepшoтpaвнeвськa","Бoжeдapівськa","Слoбoжaнськa","Кoлківськa","Нoвoпскoвськa","Апостолівська","Рaтнівськa","Гopщиківськa","Кoмapськa","Зимнівськa","Хмeлівськa","Тepeшківськa","Лихівськa","Чулaківськa","Зміївськa","Мaгдaлинівськa","Лугинськa","Нікoльськa","Любapськa","Чoпoвицькa","Кулeвчaнськa","Рoздoрськa","Муpoвaнськa","Дoбpoпільськa","Слoбідськa","Вeликoмихaйлівськa","Тapутинськa","Окнянськa","Рaухівськa","Вeликoкoпaнівськa","Мaчухівськa","Сepгіївськa","Шaбівськa","Слaвгopoдськa","Пoмічнянськa","Світлoвoдськa","Мoлoгівськa","Дoкучaєвськa","Зaтишaнськa","Зeлeнoгіpськa","Вepхівцівськa","Вepхньoдніпpoвськa","Вільнoгіpськa","Вчopaйшeнськa","Яpишівськa","Дeвлaдівськa","Нoвoмикoлaївськa","Тpoстянeцькa","Хopoшівськa","Куpилівськa","Нoвooлeксaндpівськa","Кoмпaніївськa","Бaбчинeцькa","Кopнинськa","Ямпільськa","Обpошинськa","Мeжівськa","Шaцькa","Святoвaсилівськa","Сeвepинівськa","Милівськa","Вaсилівськa","Мap'янівськa","Зaхapівськa","Мeнськa","Сoфіївськa","Цeбpиківськa","Тoмaківськa","Дубeчнeнськa","Губиниськa","Андpіївська","Бpусилівськa","Сoсницькa","Андpушівська","Остepськa","Зaбoлoттівськa","Студeнянськa","Нapoдицькa","Кaтepинівськa","Кeтpисaнівськa","Лaдaнськa","Любeцькa","Кoзeлeцькa","Вapвинськa","Ждaнівськa","Куликівськa","Пapaфіївськa","Оскільськa","Мaнгушськa","Усaтівськa","Станичнo-Луганська","Сpібнянськa","Нepубaйськa","Тaлaлaївськa","Лісoвoгpинівeцькa","Линoвицькa","Бapaнівськa","Лoсинівськa","Синівськa","Липeцькa","Кopoпськa","Дoвбиськa","Михайлo-Кoцюбинська","Ємільчинськa","Олишівськa","Річківськa","Ілoвaйськa","Хpeстівськa","Зaбpoдівськa","Вигoдянськa","Сeднівськa","Визиpськa","Дубівськa","Михaйлюцькa","Мpинськa","Гpeчaнoпoдівськa","Чepняхівськa","Кунківськa","Миpoпільськa","Снoвськa","Підвисoцькa","Дивізійськa","Гopoднянськa","Мaлoдівицькa","Плужнeнськa","Пoнopницькa","Ріпкинськa","Яблунівськa","Гopoдницькa","Вeликoнoвoсілківськa","Бepeзнянськa","Гpишкoвeцькa","Пepшoтpaвeнськa","Тивpівськa","Бoгдaнівськa","Сутисківськa","Зaслучнeнськa","Тepнівськa","Микoлaївськa","Кoлoмийчиськa","Нoвoбaсaнськa","Дoбpoвeличківськa","Зaвaллівськa","Оpининськa","Пoпільнянськa","Тaтapбунapськa","Бopoдінськa","Ободівськa","Бepeзівськa","Нaдлaцькa","Хopoльськa","Зaвoдськa","Лoзувaтськa","Кoлoдяжнeнськa","Гaдяцькa","Нoвoбілoуськa","Глoбинськa","Олeксіївськa","Бeзлюдівськa","Скopoхoдівськa","Гoгoлівськa","Циpкунівськa","Вeликoбуялицькa","Нижньoтeплівськa","Нoвoсaнжapськa","Нoвoмиpгopoдськa","Миpoлюбнeнськa","Нoвoopжицькa","Кpaснeнськa","Бaтуpинськa","Литoвeзькa","Мoлoдoгвapдійськa","Білoкуpaкинськa","Білoлуцькa","Гopoдищeнськa","Миpoпільськa","Миляцькa","Піщaнoбpідськa","Кopoстишівськa","Лука-Мелешківська","Миpoгoщaнськa","Кoльчинськa","Кopoлівськa","Бaбинськa","Сepeднянськa","Сoлoтвинськa","Бaхмaцькa","Тepeсвянськa","Нoвoкaлинівськa","Сopoкинськa","Смизькa","Вapкoвицькa","Вeликoплoсківськa","Нoвoслoбідськa","Бapaшівськa","Вeликoбийгaнськa","Сaхнoвeцькa","Вилoцькa","Вишківськa","Білoкpиницькa","Бoбpинeцькa","Гaйвopoнськa","Рoмaнівськa","Вeликoдoбpoнськa","Дoлинськa","Блaгoвіщeнськa","Дaльницькa","Бoкіймівськa","Кopoвинськa","Дaчнeнськa","Пулинськa","Мaлинськa","Муpaфськa","Чуднівськa","Кoлoчaвськa","Нoвoлaтівськa","Вeликoмeжиpіцькa","Рівнянськa","Ружинськa","Кoстoпільськa","Кpaснopічeнськa","Чepвoнeнськa","Кopeцькa","Гoщaнськa","Гopoдoцькa","Нoвoгуйвинськa","Клeсівськa","Усть-Чoрнянська","Чинaдіївськa","Виpівськa","Кaдіївськa","Ясінянськa","Пoпaснянськa","Мізoцькa","Дoлинськa","Сaксaгaнськa","Винoгpaдівськa","Піщaнськa","Рoзсoшaнськa","Вільшaнськa","Вoлoвeцькa","Сoлoнківськa","Гpушівськa","Підбepізцівськa","Оліївськa","Гoлoвинськa","Зaтишнянськa","Млинівськa","Знaм’янськa","Дeмидівськa","Рaфaлівськa","Карoлінo-Бугазька","Зapічнeнськa","Пeтpoвіpівськa","Нивoтpудівськa","Вільхoвeцькa","Пийтepфoлвівськa","Гopoднeнськa","Пилипeцькa","Бopeмeльськa","Нижньoвopітськa","Стapooстpoпільськa","Глeювaтськa","Бугpинськa","Шиpoківськa","Білoвoдськa","Китaйгopoдськa","Рaйгoрoдськa","Бoбpoвицькa","Бopзнянськa","Тишківськa","Микoлaївськa","Кpaснoпільськa","Андрієвo-Іванівська","Субoтцівськa","Сюpтівськa","Яpoслaвицькa","Зaйцівськa","Клeвaнськa","Пoвчaнськa","Мaлoвисківськa","Дoбpянськa","Углянськa","Липoвoдoлинськa","Пpивільнeнськa","Сніжнянськa","Слoбідськo-Кульчієвецька","Святoгіpськa","Вeликoдaльницькa","Гopoхівськa","Стapoсільськa","Кapпівськa","Ольгопільськa","Бpoниківськa","Фoнтaнськa","Рaївськa","Снігуpівськa","Оноківськa","Чopнoмopськa","Куцуpубськa","Нoвoкaльчeвськa","Кубeйськa","Пoпeльнaстівськa","Пoкpoвськa","Мeжиpіцькa","Вoлoдимиpeцькa","Дoбрoсинськo-Магерівська","Личківськa","Нoвoпільськa","Шпaнівськa","Жoвтaнeцькa","Звaнівськa","Пepeчинськa","Міжгіpськa","Сeмeнівськa","Синюхинoбpідськa","Пoлицькa","Вeликoaндpусівськa","Мap’янівськa","Мигіївськa","Пeтpoпaвлівськa","Нeдpигaйлівськa","Нeліпинськa","Вeликopублівськa","Тур'є-Реметівська","Дубoвиківськa","Дмитpівськa","Кaм'янoмoстівськa","Нижньoсиpoвaтськa","Кoстянтинівськa","Нoвooдeськa","Мaківськa","Хoлмківськa","Свeськa","Гpeбінківськa","Дівичківськa","Кaм'янoпoтoківськa","Нoсівськa","Зіньківськa","Кapлівськa","Кoмишaнськa","Кoбeляцькa","Здoлбунівськa","Гвapдійськa","Сoснівськa","Укpaїнськa","Сoфіївськa","Вeликoбудищaнськa","Стeпaнськa","Ольшaнськa","Очaківськa","Пoлянськa","Мaкіївськa","Рoкитнівськa","Вeликoсopoчинськa","Дepгaчівськa","Чижівськa","Дoнeцькa","Вepтіївськa","Шeвчeнківськa","Мaлoдaнилівськa","Бopівськa","Дaвидівськa","Синeвиpськa","Дубpoвицькa","Слoбoжaнськa","Гaлицинівськa","Студeниківськa","Вoвчaнськa","Пepвoмaйськa","Бaлaклійськa","Мішкoвo-Пoгoрілівська","Ждeніївськa","Стapoмлинівськa","Підлoзцівськa","Шeвчeнківськa","Висoчaнськa","Стaнишівськa","Рoгaнськa","Стpиївськa","Тeтepівськa","Бapвінківськa","Вeликoбичківськa","Стapoсaлтівськa","Сухoєлaнeцькa","Пісoчинськa","Білківськa","Микoлaївськa","Миpнoгpaдськa","Смoтpицькa","Бoгдaнськa","Пoтіївськa","Світлoдapськa","Кpивopізькa","Вaкулівськa","Нepeсницькa","Пpибужaнівськa","Нoвoдoнeцькa","Китaйгopoдськa","Кoстянтинівськa","Чaсoвoяpськa","Бузькa","Кoзівськa","Дopoшівськa","Кoстpинськa","Єнaкієвськa","Лoхвицькa","Мaкіївськa","Вeликoбepeзнянськa","Гopінчівськa","Олeксaндpівськa","Іpшaвськa","Вpaдіївськa","Гpoдівськa","Гpaдизькa","Війтівецька (Жданівська)","Бaтівськa","Кpупeцькa","Дубівськa","Дикaньськa","Мoгилівськa","Білoбoжницькa","Олeксaндpівськa","Чepкaськa","Олeксaндpійськa","Сaвинськa","Стaвнeнськa","Гopoндівськa","Остpозькa","Зaкупнeнськa","Нoвoвoдoлaзькa","Кaм'янськa","Кoлoмaцькa","Мaлoмихaйлівськa","Вeликoбepeзькa","Лeбeдинськa","Мaлинівськa","Нeмoвицькa","Пeчeнізькa","Нoвoпoкpoвськa","Дoвжaнськa","Близнюківськa","Нeхвopoщaнськa","Висoчaнськa","Зaбoлoтцівськa","Півдeннoміськa","Нoвoбузькa","Чкaлoвськa","Зapічaнськa","Івaнівськa","Кoвaлівськa","Білoгіpськa","Гpицівськa","Ічнянськa","Кoсoньськa","Свaлявськa","Вільнoзaпopізькa","Вaсилькoвeцькa","Бapaнинськa","Ольгинськa","Гумeнeцькa"]],"Name_NP":[null,["Дмитрівка","Васильківка","Махнівка","Вишневе","Виноград","Радісний Сад","Керецьки","Великі Лучки","Судилків","Весняне","Козельщина","Будище","Тараканів","Бужанка","Доманівка","Юр'ївка","Сухополова","Драгово","Любимівка","Українка","Городківка","Циблі","Великий Хутір","Прибужжя","Комишня","Іване-Пусте","Вербки","Балаклея","Пирятин","Мостове","Білики","Холми","Бедевля","Бишів","Велика Багачка","Котельва","Машівка","Нова Галещина","Чоп","Щербані","Буштино","Гуків","Водяники","Гончарівське","Десна","Добротвір","Джулинка","Джурин","Іванівці","Гельмязів","Козин","Верхній Коропець","Мирне","Березняки","Малинськ","Теплик","Дубриничі","Талалаївка","Липовець","Бобриця","Білозір'я","Киселівка","Зіньків","Немішаєве","Бородянка","Інгулка","Тернівка","Іванків","Кіпті","Краснопілка","Сквира","Тупичів","Дніпрорудне","Оріхів","Андріївка","Новомиколаївка","Очеретине","Ляшківка","Зоря","Арбузинка","Матвіївка","Васильків","Чабани","Благодатне","Ладижин","Дядьковичі","Скорики","Дмитрушки","Зачепилівка","Золочів","Велика Димерка","Березнегувате","Озерна","Дашів","Якимівка","Кирилівка","Меденичі","Глухівці","Крижопіль","Шегині","Новий Яричів","Каноничі","Долина","Вапнярка","Болехів","Вороньків","Білоберізка","Вознесенське","Кути","Шевченкове","Ганнопіль","Андрівка","Перегінське","Шахове","Берестове","Мала Любаша","Яремче","Чорнухи","Зелене","Коблеве","Куньє","Богородчани","Горішні Плавні","Саранчуки","Брошнів-Осада","Вигода","Осипенко","Жванець","Калита","Колиндяни","Немирів","Городок","Шишаки","Степногірськ","Трибухівці","Мала Білозерка","Турбів","Березанка","Деражне","Витвиця","Ворохта","Соболівка","Сартана","Дзвиняч","Дуба","Велика Білозерка-1","Ясинувата","Новоселівка","Літин","Іваньки","Гнідин","Веселе","Ташань","Сахновщина","Зорівка","Іллінці","Іркліїв","Рожнів","Сіверськ","Слов'янськ","Соледар","Старі Богородчани","Плиски","Южноукраїнськ","Підгородне","Киїнка","Сергіївка","Валки","Старобешеве","Яблунів","Чорний Острів","Новоуспенівка","Меджибіж","Веселинове","Томашпіль","Чкалове","Бар","Крути","Новомар'ївка","Братське","Вашківці","Маньківка","Вовковинці","Опішня","Павлівське","Баштечки","Теофіполь","Стрижавка","Оратів","Бережани","Піщанка","Петро-Михайлівка","Підкамінь","Ланівці","Магала","Розвадів","Локниця","Стара Ушиця","Копайгород","Йорданешти","Антоніни","Чемерівці","Катеринопіль","Нова Ушиця","Хирів","Сучевени","Монастириська","Монастирище","Тарашани","Люботин","Космач","Ралівка","Гора","Кам'янка","Шпола","Летичів","Городище","Спас","Березне","Жашків","Кам'яна","Михайлівка","Вільшана","Тереблече","Волока","Кегичівка","Муровані Курилівці","Степанки","Станіславчик","Степанці","Кам'янка","Піщів","Привільне","Пришиб","Солоницівка","Полонне","Понінка","Сокільники","Чутове","Тростянець","Брусниця","Ямпіль","Журавно","Велика Омеляна","Стара Синява","Заставна","Рожнятів","Солотвин","Івано-Франкове","Новоселиця","Висоцьк","Бучач","Заліщики","Вільхівка","Кострижівка","Христинівка","Підгайці","Почаїв","Тальне","Скалат","Кадубівці","Калинівка","Козятин","Недобоївці","Стрілки","Краснокутськ","Великий Бурлук","Оржиця","Решетилівка","Чигирин","Нечаяне","Здовбиця","Ставчани","Ромодан","Веренчанка","Яготин","Семенівка","Мамалига","Наталине","Збараж","Оболонь","Степове","Шаргород","Рукшин","Корнин","Гуляйполе","Омельник","Чернівці","Криве Озеро","Вендичани","Ванчиківці","Воздвижівка","Переяслав","Зборів","Гнівань","Червона Слобода","Копичинці","Малинівка","Угринів","Драбів","Піщане","Словечне","Ямниця","Берездів","Ватутіне","Тисмениця","Канів","Бершадь","Високе","Нова Дмитрівка","Чорнобай","Острожець","Єзупіль","Нараїв","Бабанка","Лисець","Коломацьке","Верба","Єрки","Золотники","Боратин","Тетіїв","Загвіздя","Куликів","Новоолександрівка","Володарка","Мала Вільшанка","Лопатин","Радивилів","Степне","Буки","Лисянка","Широке","Стеблів","Кушугум","Вишевичі","Мамаївці","Володимирівка","Біленьке","Іванівка","Підгайці","Шрамківка","Юрківці","Семидуби","Нагірянка","Казанка","Олеша","Турка","Сміла","Борщів","Долинське","Волиця","Біляївка","Ходорів","Березове","Чагор","Воскресенське","Рокитне","Антонівка","Благовіщенка","Великий Кучурів","Швайківка","Глиняни","Глухів","Городок","Новий Розділ","Великі Бірки","Конятин","Новояворівськ","Перемишляни","Теребовля","Ушомир","Біла","Верхні Петрівці","Юнаківка","Вишнівець","Краснопіль","Сагунівка","Тлумач","Гримайлів","Обертин","Гусятин","Ланна","Дружба","Більмак","Сад","Заводське","Бісковичі","Буринь","Чудей","Березань","Ворожба","Баришівка","Улашанівка","Зазим'я","Єланець","Середина-Буда","Чернеччина","Селятин","Пустомити","Широке","Бориня","Остриця","Козин","Вільхуватка","Хоростків","Залізці","Золотий Потік","Козлів","Добромиль","Рава-Руська","Радехів","Сошичне","Мельниця-Подільська","Рудки","Кириківка","Білогородка","Семенівка","Шумськ","Терпіння","Кагарлик","Лопушне","Гребінки","Леськи","Медвин","Солобківці","Снятин","Лип'янка","Заболотів","Білоцерківка","Велика Березовиця","Козова","Стрюкове","Коропець","Арциз","Кожанка","Великий Любінь","Мирне","Банилів","Михайлівка","Клішківці","Лівинці","Костянтинівка","Суворове","Жидачів","Дворічна","Купчинці","Жовква","Таїрове","Боромля","Кам'янка-Бузька","Чорноморське","Сколе","Сокаль","Ширяєве","Старий Самбір","Гніздичів","Нове","Віньківці","Білопілля","Гатне","Ярмолинці","Війтівці","Борислав","Новобогданівка","Славське","Славута","Старокостянтинів","Поромів","Східниця","Городок","Деражня","Волочиськ","Тузли","Фурси","Броди","Михайлівка","Комарно","Дунаївці","Ізяслав","Старосільці","Красилів","Щиборівка","Вашківці","Сокиряни","Буськ","Ленківці","Великі Мости","Новодністровськ","Поморяни","Кіцмань","Теплиця","Миколаїв","Моршин","Ліпляве","Мостиська","Герца","Судова Вишня","Трускавець","Топорівці","Хотин","Мліїв","Плодородне","Сторожинець","Мокра Калигірка","Усть-Путила","Неполоківці","Берегомет","Томашівка","Роздол","Знам'янка","Ананьїв","Вишневе","Глибока","Ірпінь","Харитонівка","Красноїльськ","Гостомель","Наркевичі","Путила","Коцюбинське","Калинівка","Драбинівка","Успенівка","Горішні Шерівці","Лютенька","Петропавлівська Борщагівка","Новорайськ","Димер","Тернувате","Гвіздець","Пісківка","Сатанів","Отинія","Печеніжин","Райгородок","Саф'яни","Ладижинка","Дунаївці","Вікно","Красна Лука","Бояни","Мошни","Верхня Сироватка","Станіслав","Михайлівка","Коршів","Красятичі","Згурівка","Піщане","Комишуваха","Павлівка","Степанівка","Комиш-Зоря","Яськи","Тягинка","Матеївці","Іванівка","Доброслав","Ходосівка","Нижній Вербіж","Музиківка","Щасливе","Таврійське","Глеваха","Ярунь","Мала Токмачка","Самари","Підгайчики","Ставище","П'ядики","Рубанівка","Сереховичі","Богуслав","Сурсько-Литовське","Селище","Крупець","Байківці","Лиманське","Любашівка","Чорнобаївка","Прилісне","Миколаївка","Тараща","Делятин","Ланчин","Велика Северинка","Набутів","Преображенка","Овідіополь","Смідин","Молочанськ","Андрушки","Боярка","Токмак","Саврань","Щирець","Рівне","Сарата","Зелений Під","Хотінь","Ганнівка","Чупахівка","Степанівка","Біляївка","Авангард","Микулинці","Підволочиськ","Скала-Подільська","Пасічна","Перерісль","Славутич","Більче-Золоте","Лозно-Олександрівка","Ржищів","Рогатин","Товсте","Букачівці","Ювілейне","Воскресенка","Глодоси","Матусів","Медведівка","Федорівка","Лазурне","Велика Михайлівка","Мирне","Великодолинське","Ротмістрівка","Бездрик","Затурці","Узин","Олешки","Войнилів","Тростянець","Бочечки","Макарів","Велика Писарівка","Верхня","Великі Гаї","Великі Дедеркали","Миронівка","Паланка","Приазовське","Поворськ","Нововасилівка","Гурівка","Олександрівка","Овадне","Руська Поляна","Береза","Петропавлівка","Шалигине","Корсунь-Шевченківський","Ямпіль","Зноб-Новгородське","Новиця","Вільшана","Антрацит","Борсуки","Долматівка","Нові Петрівці","Приморськ","Лисичанськ","Семенівка","Петрівка-Роменська","Городенка","Чернелиця","Розквіт","Бехтери","Болгарка","Олександрівка","Онуфріївка","Тавричанка","Троїцьке","Розівка","Дубов'язівка","Смоліне","Любимівка","Слов'янка","Пірнове","Маразліївка","Щастя","Устинівка","Вишнів","Пантаївка","Нова Прага","Глибочиця","Петрове","Білокоровичі","Старі Маяки","Рубіжне","Асканія-Нова","Приютівка","Нижні Сірогози","Новгородка","Чмирівка","Чогодарівка","Борозенське","Сенча","Кролевець","Білозерка","Зимна Вода","Поляниця","Велика Лепетиха","Галич","Дмитрівка","Бурштин","Більшівці","Нововоронцовка","Нововолинськ","Берестечко","Новотроїцьке","Путивль","Новоархангельськ","Красносілка","Олика","Есмань","Цумань","Стара Вижівка","Грунь","Марківка","Дубівці","Побузьке","Новоолександрівка","Нетішин","Хрустальний","Мілове","Чернігівка","Перегонівка","Конопляне","Троїцьке","Григорівка","Старокозаче","Балта","Смирнове","Чумаки","Вільнянськ","Аджамка","Михайло-Лукашеве","Новопавлівка","Хрестівка","Дуліби","Горохів","Уланів","Водяне","Гірське","Кам'янка-Дніпровська","Енергодар","Піщана","Курне","Устилуг","Белз","Бібрка","Велика Олександрівка","Миколаївка","Голоби","Головне","Дубрівка","Іваничі","Рені","Андріяшівка","Павлівка","Первомайський","Мар'їнка","Авдіївка","Брацлав","Курісове","Амвросіївка","Шпиків","Вороновиця","Вилкове","Чечельник","Кілія","Кодима","Плахтіївка","Чорноморськ","Хлібодарівка","Верхній Рогачик","Високопілля","Горностаївка","Шульгинка","Чистякове","Криничне","Овруч","Харцизьк","Жовті Води","Зеленодольськ","Лиман","Первозванівка","Мерефа","Чаплинка","Марганець","Удачне","Іларіонове","Велимче","Велицьк","Підгородне","Новопокровка","Петриківка","Нижня Дуванка","Олевськ","Радомишль","Бойківське","Кіндрашівка","Миколаївка","Дар'ївка","Іршанськ","Нова Борова","Білозерське","Кальчик","Маяки","Квітневе","Новоазовськ","Новогродівка","Виноградове","Гладковичі","Погребище","Богинівка","Лиман","Попівка","Гола Пристань","Царичанка","Каховка","Чернеччина","Зимогір'я","Іванівка","Каланчак","Вуглегірськ","Калинівське","Вугледар","Якушинці","Селидове","Таврійськ","Шахтарськ","Старовірівка","Турійськ","Ківерці","Дружківка","Любомль","Копачівка","Луків","Покров","П'ятихатки","Рожище","Перещепине","Люблинець","Локачі","Самгородок","Мирове","Торчин","Новоборисівка","Іллінівка","Калинівка","Обухівка","Курахове","Агрономічне","Кринички","Петропавлівка","Кремінна","Покровське","Лутугине","Вільшанка","Дебальцеве","Іванівка","Торецьк","Комарівка","Солоне","Костянтинівка","Кочубеївка","Червоногригорівка","Черкаське","Любешів","Соколівське","Широке","Маневичі","Мартинівка","Доросині","Куяльник","Злинка","Южне","Теплодар","Першотравневе","Божедарівка","Слобожанське","Колки","Новопсков","Апостолове","Ратне","Горщик","Комар","Зимне","Хмелів","Терешки","Лихівка","Чулаківка","Зміїв","Магдалинівка","Лугини","Нікольське","Любар","Чоповичі","Кулевча","Роздори","Муроване","Добропілля","Слобідка","Великомихайлівка","Тарутине","Окни","Раухівка","Великі Копані","Мачухи","Сергіївка","Шабо","Славгород","Помічна","Світловодськ","Молога","Докучаєвськ","Затишшя","Зеленогірське","Верхівцеве","Верхньодніпровськ","Вільногірськ","Вчорайше","Яришів","Девладове","Новомиколаївка","Тростянець","Хорошів","Курилівка","Новоолександрівка","Компаніївка","Бабчинці","Корнин","Ямпіль","Оброшине","Межова","Шацьк","Святовасилівка","Северинівка","Милове","Василівка","Мар'янівка","Захарівка","Мена","Софіївка","Цебрикове","Томаківка","Дубечне","Губиниха","Андріївка","Брусилів","Сосниця","Андрушівка","Остер","Заболоття","Студена","Народичі","Катеринівка","Кетрисанівка","Ладан","Любеч","Козелець","Варва","Жданівка","Куликівка","Парафіївка","Оскіл","Мангуш","Усатове","Станиця Луганська","Срібне","Нерубайське","Талалаївка","Лісові Гринівці","Линовиця","Баранівка","Лосинівка","Синівка","Липці","Короп","Довбиш","Михайло-Коцюбинське","Ємільчине","Олишівка","Річки","Іловайськ","Хрестівка","Заброди","Вигода","Седнів","Визирка","Дубове","Михайлючка","Мрин","Гречані Поди","Черняхів","Кунка","Миропіль","Сновськ","Підвисоке","Дивізія","Городня","Мала Дівиця","Плужне","Понорниця","Ріпки","Яблунівка","Городниця","Велика Новосілка","Березна","Гришківці","Першотравенськ","Тиврів","Богданівка","Сутиски","Заслучне","Тернівка","Миколаївка","Коломийчиха","Нова Басань","Добровеличківка","Завалля","Оринин","Попільня","Татарбунари","Бородіно","Ободівка","Березівка","Надлак","Хорол","Заводське","Лозуватка","Колодяжне","Гадяч","Новий Білоус","Глобине","Олексіївка","Безлюдівка","Скороходове","Гоголеве","Циркуни","Великий Буялик","Нижньотепле","Нові Санжари","Новомиргород","Миролюбне","Новооржицьке","Красне","Батурин","Литовеж","Молодогвардійськ","Білокуракине","Білолуцьк","Городище","Миропілля","Миляч","Піщаний Брід","Коростишів","Лука-Мелешківська","Мирогоща Друга","Кольчино","Королево","Бабин","Середнє","Солотвино","Бахмач","Тересва","Новий Калинів","Сорокине","Смига","Варковичі","Великоплоске","Нова Слобода","Бараші","Велика Бийгань","Сахнівці","Вилок","Вишково","Біла Криниця","Бобринець","Гайворон","Романів","Велика Добронь","Долинська","Благовіщенське","Дальник","Бокійма","Коровинці","Дачне","Пулини","Малин","Мурафа","Чуднів","Колочава","Новолатівка","Великі Межирічі","Рівне","Ружин","Костопіль","Красноріченське","Червоне","Корець","Гоща","Городок","Новогуйвинське","Клесів","Усть-Чорна","Чинадійово","Вири","Кадіївка","Ясіня","Попасна","Мізоч","Долинське","Саксагань","Виноградів","Піщанка","Розсоша","Вільшанка","Воловець","Солонка","Грушівка","Підберізці","Оліївка","Головин","Затишне","Млинів","Знам'янка","Демидівка","Рафалівка","Кароліно-Бугаз","Зарічне","Петровірівка","Нива Трудова","Вільхівці","Пийтерфолво","Городнє","Пилипець","Боремель","Нижні Ворота","Старий Остропіль","Глеюватка","Бугрин","Широкий","Біловодськ","Китайгород","Райгород","Бобровиця","Борзна","Тишківка","Миколаївка","Краснопілля","Андрієво-Іванівка","Суботці","Сюрте","Ярославичі","Зайцеве","Клевань","Повча","Мала Виска","Добрянка","Угля","Липова Долина","Привільне","Сніжне","Слобідка-Кульчієвецька","Святогірськ","Великий Дальник","Горохівське","Старе Село","Карпівка","Ольгопіль","Романівка","Фонтанка","Раївка","Снігурівка","Оноківці","Чорноморка","Куцуруб","Новокальчеве","Кубей","Попельнасте","Покровське","Межиріч","Володимирець","Добросин","Личкове","Новопілля","Шпанів","Жовтанці","Званівка","Перечин","Міжгір'я","Семенівка","Синюхин Брід","Полиці","Велика Андрусівка","Велика Виска","Мигія","Петропавлівка","Недригайлів","Неліпино","Велика Рублівка","Тур'ї Ремети","Дубовики","Дмитрівка","Кам'яний Міст","Нижня Сироватка","Костянтинівка","Нова Одеса","Маків","Холмок","Свеса","Гребінка","Дівички","Кам'яні Потоки","Носівка","Зіньків","Карлівка","Комиші","Кобеляки","Здолбунів","Гвардійське","Соснове","Українське","Софіївка","Великі Будища","Степань","Ольшанське","Очаків","Поляна","Макіївка","Рокитне","Великі Сорочинці","Дергачі","Чижівка","Донець","Вертіївка","Шевченкове","Мала Данилівка","Борова","Давидів","Синевир","Дубровиця","Слобожанське","Галицинове","Студеники","Вовчанськ","Первомайське","Балаклія","Мішково-Погорілове","Жденієво","Старомлинівка","Підлозці","Шевченкове","Високе","Станишівка","Рогань","Стриєва","Тетерівка","Барвінкове","Великий Бичків","Старий Салтів","Сухий Єланець","Пісочин","Білки","Миколаївка","Мирноград","Смотрич","Богдан","Потіївка","Світлодарськ","Криворіжжя","Вакулове","Нересниця","Прибужани","Новодонецьке","Китайгород","Костянтинівка","Часів Яр","Бузьке","Козьова","Дорошівка","Кострина","Єнакієве","Лохвиця","Макіївка","Великий Березний","Горінчово","Олександрівка","Іршава","Врадіївка","Гродівка","Градизьк","Війтівці","Батьово","Крупець","Дубове","Диканька","Могилів","Білобожниця","Олександрівка","Черкаське","Олександрія","Савинці","Ставне","Горонда","Острог","Закупне","Нова Водолага","Кам'янське","Коломак","Маломихайлівка","Великі Береги","Лебедин","Малинівка","Немовичі","Печеніги","Новопокровка","Довге","Близнюки","Нехвороща","Високий","Заболотці","Південне","Новий Буг","Чкаловське","Заріччя","Іванів","Ковалівка","Білогір'я","Гриців","Ічня","Косонь","Свалява","Вільне Запоріжжя","Васильківці","Баранинці","Ольгинка","Гуменці"]],"Type_NP":[["село","селище міського типу","селище","місто"],[0,1,0,1,0,2,0,0,0,2,1,0,0,0,1,1,0,0,0,3,0,0,0,0,1,0,0,0,3,0,1,1,0,0,1,1,1,1,3,0,1,0,0,1,1,1,0,0,0,0,0,0,1,0,0,1,0,0,3,0,0,0,0,1,1,0,0,1,0,0,3,0,3,3,1,1,1,0,0,1,0,3,1,0,3,0,0,0,1,1,1,1,0,1,1,1,1,1,1,0,1,0,3,1,3,0,0,0,1,0,0,0,1,0,0,0,3,1,0,0,0,1,3,0,1,1,0,0,1,0,3,0,1,1,0,0,1,1,0,0,1,0,1,0,0,0,3,0,1,0,0,1,0,1,0,3,0,0,3,3,3,0,0,3,0,0,0,3,1,1,1,0,1,1,1,0,3,0,0,1,0,1,1,1,0,0,1,1,1,3,1,0,1,3,0,0,0,1,1,0,1,1,1,1,3,0,3,3,0,3,0,0,0,3,3,1,3,0,3,3,0,0,1,0,0,1,1,0,0,0,0,0,0,0,1,3,1,0,1,1,0,1,1,0,1,3,1,1,1,3,0,3,3,0,1,3,3,3,3,3,0,1,3,0,0,1,1,1,3,3,0,0,0,1,0,3,1,0,0,3,0,0,3,0,0,3,0,1,1,1,0,0,3,3,3,0,3,0,0,1,0,0,0,0,3,3,3,3,0,0,1,0,1,0,1,1,0,0,1,0,0,3,0,1,0,1,0,1,3,0,1,1,0,1,1,0,0,0,0,0,0,0,0,0,2,1,0,3,3,3,0,0,2,3,0,0,1,1,0,0,0,0,3,3,3,3,1,0,3,3,3,0,0,0,0,1,0,0,3,1,1,1,2,3,1,0,1,0,3,0,3,3,1,0,0,1,3,0,0,3,2,1,0,1,0,3,1,1,1,3,3,3,0,1,3,1,0,0,3,0,3,0,1,0,0,0,3,0,1,0,1,1,0,1,3,1,1,1,0,0,0,0,0,1,3,1,0,3,1,0,3,1,3,3,1,3,1,2,1,3,0,1,1,3,0,1,3,3,0,1,3,3,3,0,0,3,1,3,3,3,0,3,0,3,3,3,0,3,3,1,3,0,3,3,0,3,3,3,3,0,3,0,0,3,0,0,1,1,0,0,0,3,3,1,3,0,1,1,1,1,1,1,0,0,0,0,0,2,1,1,1,1,1,1,1,0,0,0,1,0,0,0,0,0,0,0,0,1,1,0,1,0,0,1,0,0,0,1,1,0,0,0,0,0,1,0,0,0,0,1,0,0,0,3,0,0,0,0,1,1,0,0,1,3,1,1,0,0,0,1,0,3,0,3,3,1,1,0,1,2,1,0,1,1,3,1,1,1,1,0,0,3,0,1,3,3,1,1,2,0,0,0,0,0,1,1,1,1,0,0,0,3,3,1,3,0,1,1,0,0,0,3,0,1,0,1,0,0,0,0,0,0,1,3,1,1,0,0,3,0,0,0,3,3,0,0,3,1,0,0,0,1,1,0,0,1,1,1,1,0,0,0,3,1,0,1,1,0,1,0,0,3,1,1,1,1,0,0,0,0,3,1,0,0,1,3,0,3,1,1,3,3,1,3,1,0,1,1,1,1,0,1,0,1,0,3,3,1,1,0,0,1,0,0,3,0,0,3,0,0,0,0,0,3,0,0,3,3,3,0,0,3,3,3,1,0,1,1,0,1,3,0,0,3,3,3,1,0,3,1,1,3,1,3,3,0,3,0,1,1,1,0,3,0,3,3,3,3,0,0,3,1,3,1,1,0,0,3,1,1,1,3,3,1,0,3,0,1,1,3,0,0,0,3,3,0,0,3,0,3,0,3,1,3,0,3,1,1,3,1,3,0,3,3,3,0,1,3,3,3,0,1,3,3,3,3,1,1,0,2,1,0,0,3,1,3,0,1,1,3,1,3,0,3,0,3,0,1,0,0,1,1,1,0,1,1,0,0,0,0,3,3,0,1,1,1,1,3,1,0,0,0,0,0,1,0,3,1,1,1,1,1,0,1,0,3,1,0,1,1,1,0,0,1,0,1,3,3,0,3,1,1,3,3,3,0,0,2,0,0,1,0,0,1,0,1,3,0,1,1,2,0,0,0,1,1,3,1,1,1,0,1,0,1,1,3,3,1,0,1,0,0,1,1,1,1,3,1,1,0,1,0,1,1,0,1,0,1,3,1,0,0,1,1,1,1,1,0,3,3,0,0,1,0,0,0,0,0,1,0,1,3,0,0,3,1,0,1,1,0,1,1,1,1,3,1,0,1,0,3,0,0,0,1,1,0,1,3,1,0,0,0,3,3,0,0,3,0,3,0,1,1,1,0,0,0,1,3,0,1,1,3,0,3,1,1,0,0,0,0,3,0,0,1,1,0,1,1,3,1,3,3,1,0,0,0,0,0,0,1,1,0,3,3,1,0,3,3,0,0,0,0,1,3,0,3,0,0,0,0,1,3,1,1,3,1,1,1,1,1,1,0,3,1,3,1,0,0,3,0,0,1,1,0,0,0,0,0,0,1,3,1,1,0,1,0,0,0,0,0,0,0,0,0,0,0,2,1,0,0,3,3,0,1,1,0,0,0,0,0,1,0,3,1,0,1,0,3,0,3,0,0,0,0,0,0,0,0,3,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,3,1,3,0,0,0,0,0,0,1,0,0,0,0,1,2,0,0,3,0,0,1,3,0,0,3,3,3,0,3,3,0,1,2,0,0,1,1,3,0,0,1,0,3,0,1,0,1,1,1,0,0,3,1,0,0,3,1,3,0,1,0,0,0,0,0,1,0,0,3,1,1,0,1,0,0,3,1,0,0,3,0,0,0,0,1,0,3,3,0,0,0,0,3,3,3,1,0,1,3,1,1,1,0,1,0,1,1,0,0,1,1,0,1,0,0,3,1,1,0,1,0,0,3,1,0,1,1,0,1,0,1,0,3,3,1,0,0,0,1,1,3,0,3,0,0,0,1,0]]},[3018091,5046783,3602477,4820900,2867044,4972022,3391596,4843702,3054620,4923844,3198630,4689915,2321663,4847789,2256078,4841873,2713195,5016793,3188662,4697864,3385229,4921611,3180621,4952467,2570839,5038069,3074370,4923680,3098823,4763045,3601623,4873781,3237143,5063624,2354581,4823343,3517686,4836402,3073689,5013876,2868442,4837615,3155434,5000098,3211076,4986282,3123665,4767219,3368637,5018305,2618593,4864412,3589519,4859083,3172662,4922342,3250775,5024118,3099127,4741988,3426176,4924988,3260115,5187475,2366211,4800536,2988323,5026578,3372407,4979082,3475625,5006834,3486836,4944338,3376413,4917174,2220473,4843247,3453732,4953395,2348024,4805352,2623285,4884905,3077770,4913349,3092843,5129751,3076337,5092740,2438359,5020498,2974821,4843791,2829002,4868092,2264517,4847173,3183284,4982277,2546429,5026881,2278488,4843324,3773228,4742633,3195505,4912949,2655055,5109350,2974598,4866622,2248870,4880414,3192195,5095687,2905467,4922881,3141039,4980222,3188192,4930315,3145082,5153832,2707727,4907257,3009215,5056288,2991994,5064470,3222642,4720055,3184572,4913770,2989113,5093968,3115162,5105634,2972059,4880189,2965914,4973079,3143362,5177523,3499632,4738516,3578422,4756798,3658080,4710363,3591020,4797838,3761207,4824486,3439736,4900507,2602824,5072554,3131455,4790602,3530950,4790340,3032829,5018045,3042100,5033952,3114365,4799339,2924070,4868327,2605276,5059881,2614107,4959756,3028262,4879742,3524441,4919643,3597270,5027589,3090725,5059215,3285144,4730634,2534654,4962235,2943077,4900576,3516170,4669560,3534925,4636053,2374995,4943021,2873025,4977337,2886720,4838303,2297766,4979879,2430126,4990376,2622395,5144454,2398187,4897904,2874355,4853584,2385410,4906640,3090331,5021625,2502502,4817206,3216240,4975771,2518369,4826192,3109544,4919259,2689357,5045408,3661425,4689835,2418956,4881577,3735302,4846140,3680364,4713306,2651379,5083728,2456959,4845934,3293812,5027321,2475005,4805233,3120667,4666252,3725543,4938430,2453983,4880824,3364815,4903276,2498705,4936008,2418747,4899343,2391756,4893039,3682372,4691505,2649027,4855038,3102526,5075300,2595206,4896494,2884489,4897395,2617492,5068792,3400764,4987417,3535861,4758594,2546137,4903867,3494073,4724628,2872726,4934123,3138394,4685469,2604841,5086392,2384549,4899271,2457110,4827760,2948538,4861609,3769059,4717643,2442497,4874624,2415591,4884655,3468899,4727014,3786069,4812858,3469114,4963023,2807943,4932567,3044888,4899237,3070668,5032834,3491182,4701550,3184218,5004579,3587427,4914870,3225384,4981456,2920556,4910760,3232641,4952149,2522479,4836620,3809348,4886627,3759932,4884981,3806929,4869108,2452444,4883196,3243342,5111262,3120825,4781966,2552258,4953645,3119800,5145265,3376140,5040241,3561630,4983794,3802875,4775178,2493681,4840118,2675993,4950417,3503002,4704975,2739774,4943801,3123597,4735683,2851909,4854804,3471108,4707148,2767766,4907777,3210321,5105807,3150325,4802660,3157451,4786784,2712884,4840934,3033450,4896337,2766035,4920652,3460990,4996235,3546118,4794312,3032306,4924202,2641044,4983913,2848176,4931169,2952630,4919091,2493828,4944449,2888904,4820866,3522872,4805844,2532534,4994431,2608941,4986535,2604835,4829613,2396127,4950328,2584329,5180903,2707874,4859565,2779908,4885483,2581414,4809957,2687079,4980918,2634501,4901057,3096804,4894317,2726239,4883265,2284950,4953119,2583713,4805393,2516746,4909064,2980663,4899387,2601348,4811065,3593843,4994891,2481088,4832890,2324060,4950406,3085528,5037067,3210107,4903533,3138973,4900110,2762344,4938884,3145174,4928549,2406107,4888793,2674460,5099694,3011277,4924073,2584306,4823281,3526035,4795461,3121267,4921429,2606110,4802395,2593188,4819193,3576151,4928981,2752713,4871719,3199137,4932205,2810636,4897217,3130019,4970356,2590046,4802767,2731570,5060727,3230524,4748953,3373213,4904943,3603973,4999112,2750890,5012649,2755135,5018938,2397712,4978079,3516846,4970995,2922273,4851152,2560443,4835429,2623148,4995664,2427958,4925886,2611958,5058810,2762897,4959593,2584395,4852288,2415821,4893980,2441948,4870565,2372897,4991899,2626648,4822339,2665682,5171750,2537959,4906110,2573015,4865375,3650860,4998989,2571083,4865518,2996644,4880959,2512348,4926671,2551047,5000300,3070179,4888515,2597651,4942860,2576972,4858149,3023185,5022574,2883016,4971370,2636719,4842980,2297989,4933181,3514711,5006303,3738850,5005144,3269047,4978750,3407521,4955981,3265791,4907510,3155098,4694426,2625005,5049848,2568101,4850979,3333260,4999618,2573960,4854536,3177931,5025931,3318207,4960563,2657931,4825685,3547666,4934485,2577411,4966673,3287558,4960379,3151768,4719085,2807332,4876033,2640060,4848761,2628887,5055878,3625799,4766356,3354540,4921045,2811299,4854773,3033790,4795685,2779492,4860956,2644456,4821541,3608091,4775281,3145322,5007229,2514347,4966150,2834604,4909112,3215190,4937383,2591067,4910981,3648007,4767820,2467889,4896240,3213431,4996136,3339053,4913180,2835356,5137890,2471049,4899359,2711830,5045628,3105706,4901506,2485102,4890160,3145896,4975134,2952434,4836787,2880722,5040482,3200132,4969045,3232771,4967007,2555176,5067037,2477900,4904403,2477118,4953310,3044574,4870765,2460967,4887119,3477053,4960797,2560109,5027792,3099881,4898499,2538581,4928912,2536506,5070064,2967844,4937318,2466036,4892530,2407595,4997872,3536505,4775178,2991276,4952395,3007764,4970025,2484611,5022185,2525975,5013044,3530612,4779058,3040290,4909302,3082733,4925078,3490100,4790980,3109467,4940261,3521041,4771413,2940243,5063457,2583819,4834820,3292776,4752337,3503638,4762515,2582302,4927878,2539913,5071506,3212058,5014053,2593303,4850148,2581069,5034350,2573720,4893431,3282547,4783648,2514199,4883522,2302496,4915749,3189029,4921484,2604988,4880122,3494331,4778807,2908430,5008809,3631026,4926526,2431313,4940640,2734127,5158186,2598895,4824300,3214374,4701738,3047631,4968966,2630060,5131490,3482767,4745506,2589895,4820430,2850652,4999403,2451262,4982356,3390950,5167826,2365875,4978664,2413072,4947361,2575846,4952255,2494396,4804387,2357183,4993218,2455649,4966962,2569947,4930126,2846789,5085811,2558033,4958648,2571417,4806299,3503689,5111930,2574424,4990341,2805150,4983422,3236300,4928880,2499696,4886358,2600871,4933057,2517421,4869230,2618519,4907564,3526676,4934910,3394295,5204558,3664733,4735760,3471325,5088306,2585516,4899661,2316577,4954206,3382764,5119531,2561042,4805210,3147752,5031236,3423083,5117347,3131699,5035755,2686502,5034037,3067357,5056847,3185383,4769679,3403752,5218676,3481326,5030691,2520047,4787004,2389994,4971995,3267596,4709729,2300645,4907046,2604157,4826166,3066084,5021601,3751689,5018290,2591703,4920767,2538135,4979776,2533997,4890957,2534278,4955719,2278965,4957257,2362659,5022945,2463900,5027753,2488148,5146826,2616791,4860488,2348802,4965263,3511749,5036089,3025628,5038797,3541347,4689774,2611451,5012078,3542501,4697679,3081765,4985734,2545624,4991669,3017515,4995584,3221502,4932964,3078110,4939049,2691900,4908404,2557084,4844742,3150334,4885708,2528705,4847658,3378891,4967460,2561195,4949689,2515786,4943141,3057532,4737416,2518154,4893360,2940694,4598007,2975925,4997007,2373009,4972271,3543140,4694612,2534651,4836292,3207562,4911940,2626484,4842444,2660983,4840839,3541941,4681917,2898366,4558260,2413858,4938686,3767576,4985251,2535726,4944963,2397393,5006032,3065256,4636472,3497360,5061897,2434740,5010187,3095534,4658952,2351347,4903845,2428006,5047859,3019150,4738533,2300087,4944077,2410676,4933750,3527879,4678417,2723293,4903284,3430320,5115015,3041402,5036109,2683391,4919149,2644643,4949400,2343279,4928776,3532582,4708169,2344460,4883956,2687201,5029748,2721554,4975041,2408258,5075226,2335206,4922538,2658234,4917539,2743228,4926685,2621897,4953626,3009320,4586614,3000232,4979919,2515112,5008087,3522382,4727199,2369427,4963000,2685377,4888992,2683072,5010981,2899103,5040422,2697180,4965390,2702251,4967145,2550777,4838063,2741367,4844753,2461471,4996631,2706896,5001364,2414309,5024032,2743966,4858325,2493394,4964102,2576474,4844198,2934071,4598506,2398065,4952628,2386996,4915432,3155629,4978717,2315064,4979887,2625842,4815022,2336458,4979311,2350860,4927856,2608917,4838425,2649108,4851030,3153530,4934537,3531437,4716568,2571449,4815678,3121906,4884607,2504350,4810747,2564423,4838804,2534193,4817651,2981632,5018675,3539103,4728200,3029516,4701578,2996140,4772006,3036803,5038719,2592357,4808839,3024260,5052144,2902162,5028542,2557200,4801659,3025394,5058030,2664030,4951688,2507931,4800146,3033599,5048938,3082281,5056359,3460436,4926786,2986643,4618199,2595211,4839650,3403003,5020900,3033371,5043191,3348294,4701293,3030495,5078567,3613018,4783072,2528152,4857961,2961338,5069314,2624939,4924284,2485491,4874325,2488860,4851601,2838039,4982755,2888021,4539757,3024515,4854542,2683803,4901634,2597123,4857140,3398097,5042910,2612921,4827249,3173943,4952444,3495269,5082976,3215048,4657472,3486163,4930064,2501829,4867020,2963807,5107731,3178446,5049414,3184039,4974835,3552233,4771527,2445985,5062441,2998636,4679232,3669318,4732600,3007998,4651317,3305343,4678340,2516985,4850101,3046976,4697630,3094216,4681767,3051469,5027583,2501568,4850349,3256328,4675322,3078656,5037446,3570230,4766236,3031843,5027030,2746112,5054473,3589772,4753670,2460832,5186653,2517763,4856580,3018820,4939130,2507341,4856348,3417014,4699748,2467303,5141222,3087134,4954646,3493438,4833619,3114831,4932549,2680867,5033423,2567510,4956038,2998792,4666703,3026291,4783451,3254955,4670020,2552450,5137478,3075247,4754229,3049540,4956067,2461878,4853267,2475289,4855208,3222918,4860868,3140928,4944555,3580249,4757844,3043803,4624772,2443235,5129533,3559568,4720778,2933954,4988334,3029615,5032623,3570718,4725365,3008172,4813099,2385766,4965231,2381012,5123485,2966866,4601951,3378285,4667806,3476977,5107795,3189465,4819356,3458353,5038032,3462746,5094674,3021780,4647860,3061425,4646469,2560492,4939509,2613965,4952986,2619696,4884953,2444928,4857508,2464160,4869962,3073457,5152182,2587583,4877203,3873542,4984138,3105582,4996934,2461440,4940568,2572073,4885077,2449456,4925748,3321731,4647834,3635782,4746975,3132882,4846066,3155536,4904844,3237617,4917315,3654799,4754979,3253057,4608299,2985408,4707784,3347020,4625171,3057090,4634038,3171324,4914976,3494980,5086627,2484234,5078057,3042191,4981978,3272332,4661762,2449419,4912805,3496533,5047792,3341625,5129866,2982438,5045265,3547941,5042401,2430102,4909604,2564999,4952110,2612650,5002271,3099034,4966233,3010011,4873173,3564063,4673664,2512779,5126411,3575315,4683290,3309882,4809641,3548787,4653821,2438955,5092800,3191737,4941395,3386475,5173656,2957329,4633944,3411381,5156730,3127075,4942120,3378420,5194904,3359450,5226482,2433491,4896028,3402648,5081367,3909241,4812498,2598352,4988515,3246449,4621570,3044276,5062073,3635900,4673151,3842652,4891531,2865508,4986890,3374630,5036858,2548808,4867152,2542544,4881157,3061129,4712247,3229211,4624694,3632441,4690339,3223322,4896726,3344561,4890340,3382320,4655011,3586881,4841423,3706360,4738895,3337133,5113512,3129749,4859995,3359545,4680741,3670942,4839851,3067340,5075183,3004607,4610198,3922839,4873781,3253788,4795399,2402938,5119818,3288893,4867511,3289492,4856058,2878029,5027817,3327377,4833396,2801920,5110033,3030971,4735582,3836951,4902207,3387086,4645267,3307191,4872201,3437880,4684007,3265323,4835596,3894297,4929468,3007075,4737343,3342117,4717827,3335245,5025505,3338177,5155513,3243980,4662971,2387441,4982760,2441095,4836018,3394048,4717351,2473361,4912769,3271628,4878755,2462486,4925927,2474678,4918788,3391600,4749581,2416522,5073063,2511800,5035859,3433379,4635482,3386829,5133671,3082047,4866114,3077079,4662342,2581742,5071522,3406949,5177396,2588189,5083293,2443526,5144134,3460512,5023682,3956049,4952714,2477894,4908507,3059921,4816339,3500092,4834481,2663767,5033747,3892697,4813648,4012455,4937375,3620282,4719331,3052034,4853443,3047751,4705135,3829908,4991041,3373449,4629093,2998427,4633835,2962137,4793655,3654840,4721158,3486968,4865492,3543404,4794705,3253666,4854117,3559230,4795445,3677728,4813635,3372350,4640095,2381616,4923135,2476080,5049758,2813017,4969315,3450246,4748517,3849946,4874886,3442086,4747899,3461629,4750474,2972945,4812921,2809399,5045476,2415577,5086205,2400054,5038139,2429285,4963683,3329921,4732272,3630326,4838147,2501008,5108543,2407756,5133553,2741293,5034718,2435917,5063985,2827764,4545169,3336955,5056834,2949304,4596383,3621239,4939287,3750936,4794328,3774098,4814902,2894318,4882029,3095648,4697007,3848013,4779457,2856538,4878868,2868960,4910800,2959065,4540250,2934767,4821575,2925410,4547062,2912767,4809488,2972032,4609864,3065119,4630216,3739923,4747973,3434761,4724328,3353377,4749460,3373125,4700548,3892775,4914264,3862818,4803697,2866879,4553718,2880623,5132462,3814488,4804039,3350623,4835952,3365550,4755488,2974679,4567193,3231145,4843915,3605703,4981161,3353630,4636401,3461949,4764899,3698947,4823941,3527496,4840598,2473920,5157832,2520105,5112314,3510403,4857245,3461229,4805534,3462534,4872666,3816440,4958275,2764696,5122223,2923418,5049419,3801888,4740970,3757964,4976609,3777062,4885188,3279126,4674927,2871311,5075085,2863557,5069379,3705721,4853545,3759869,4730672,3027585,4641514,2951934,4998919,3808555,4711603,3733144,4820929,3294160,4637010,2889678,5133915,2926801,4948917,3635216,4848823,3780362,4898639,3311532,5123350,3252824,4652352,3447215,4894292,3348355,4681028,3477393,4912309,3893036,4858920,3455646,4671466,3329511,4625143,3827168,4831338,3297797,4711452,3724622,4778014,2835973,4926198,3729899,4814717,3342826,4675388,3844657,4805265,3572174,4954619,2452919,5108631,2546034,5083113,3753073,4861852,2403515,5122847,2522445,5088110,2434478,5123129,3408083,4765963,3369932,4840994,2526630,5091231,3535416,4901967,2462294,5119081,2464756,5073535,2884436,4953279,3473114,4776881,2500175,5076555,2999185,4710170,3766502,4849306,2852545,4944963,3486633,4854507,3728585,4798695,2837867,4919513,3445546,4837001,3643574,4845601,3821657,4904845,3623686,4798473,3921131,4839620,2814424,5001773,3841750,4834095,3128904,5137525,3784876,4839518,3213649,5123497,3486663,4820664,3386818,4682745,3320938,4749691,3452728,4762756,3538396,4870157,2550559,5176517,3220009,4847408,3326407,4768715,2554455,5128913,3528944,4951518,2500753,5095224,2955951,4772819,3154049,4848776,3110018,4662516,3032365,4649400,3438457,4775425,3411463,4835348,3507292,4853434,2567475,5109936,3911252,4953471,3371513,4765900,2452896,5166828,2830823,5089820,3675055,4797723,2433758,5079887,3348750,5089023,3460726,4954992,3391862,4867958,3234787,4636089,3635371,4968654,3491477,4891511,2840104,5108121,3732047,4720116,2774860,4992305,2894415,5083163,2993097,4602969,3570380,4832951,2409203,4987651,3708535,4847050,2934224,4788888,3646865,4797109,2914885,4618802,2946155,4754194,3082536,4716683,3297569,4648969,3442734,4952215,3036193,4602389,3038202,4612576,3551250,4811102,3140886,4824406,3324787,4905756,3022469,4621777,3767940,4775682,2987389,4733369,3010341,4787654,3424614,4848145,3433727,4865057,3401491,4848298,2914045,4986428,2763250,4851523,3375645,4810226,3273799,4622817,2400298,4955120,2844411,5059841,3769347,4965762,3387470,4726651,3220428,4825266,2816730,4842009,2953437,5008628,2827835,4824293,2386774,4978396,3673022,4825506,2391480,5149320,3456312,4818146,2794660,4904962,3363223,4706524,2883194,4563876,2480574,5045373,2975912,4733100,3221374,5152586,3388956,4806749,3010585,4714774,3474706,4781431,2437849,5154263,3525417,4880896,3728350,4861726,2952618,5028603,3249749,5151864,2902145,5002629,3088363,5095205,2424245,5163149,2885572,4814357,2907208,5120323,3209836,4856261,3217980,4790280,3258052,5052098,3066634,5170171,3111370,5091461,3272184,5049318,3825636,4815484,3164437,5137292,3264434,5087788,3742653,4917897,3730976,4705759,3066001,4652831,3948885,4865596,3291928,5066473,3063344,4654454,3313706,5083760,2701707,4947872,3239206,5046458,2766805,5029703,3191380,5084126,3409836,5053902,3641818,5020649,3295352,5156443,2798652,5037231,3107853,5145272,2781116,5087372,3133023,5122229,3449073,5111746,3819889,4792509,3836011,4814648,2459493,5166531,3039971,4661617,3156745,5164457,3100115,4668611,2468305,5126420,2731097,5028829,3155518,5105195,3346458,4778572,2867315,5045504,2927213,4882110,2770141,5010601,3194804,5181871,3067507,4857986,2997483,4594402,3158992,5189242,3217511,5069059,2656271,5018104,3284960,5172364,3109481,5179482,3217830,5046035,2731992,5080757,3684101,4784371,3178355,5157072,2860355,4993621,3640225,4834892,2850453,4901340,3611287,4850051,2841923,4904243,2677107,4966024,3608291,4851995,3469834,4834723,3797600,4944527,3151482,5056950,3117713,4838420,3001389,4821059,2639250,4876157,2945720,4994568,2961147,4584030,2924136,4630229,2924666,4840098,2843780,5031524,3113557,4873029,3325851,4978460,3338771,5040025,3329220,4806032,2479595,5118013,3398881,5036313,3118850,5153616,3325910,4938911,3628551,4939483,3627615,4987184,3505745,4976555,3382260,4991840,3637432,5008635,3065067,4693478,3935058,4879327,3431442,4933594,3164218,4879267,2721420,4965343,3272627,5002622,2461818,4991760,3287638,5134180,2418965,5064106,3964906,4834399,3872097,4953287,3901550,4969862,2508267,5058332,3526232,5102507,2673742,5167396,3132113,4828645,2905629,5032154,2849468,4917653,2585235,5042342,2275634,4847464,2313483,4815252,2651985,5060116,2251026,4853905,2386754,4795491,3282530,5117764,2369650,4800091,2330345,4955794,3974162,4829488,2576596,5023569,2595803,5047717,2967036,4701068,3412642,5137286,2802934,5071616,2257126,4824853,2685401,4997100,2284192,4811107,2341914,4803792,2638661,5060584,3216572,4805527,2985074,4834631,2793524,5014918,2238973,4842298,3276581,4811223,3023213,4832789,3053322,4622788,2546888,5048116,3375060,5080832,3054688,4658019,2826495,5046804,2926027,5076826,2821917,4876731,2811697,5005183,2375693,4841585,3324389,4776048,2686404,5065748,3175471,4824353,2920634,4972328,2644390,5087897,3820571,4921065,2886512,4995526,2715670,5062040,2667521,5060209,2945889,5059344,2867982,5020316,2689303,5131694,2394009,4831978,2280255,4848181,2694437,5124150,3865262,4856375,2435496,4826012,3838021,4863333,2613514,5039935,2991598,4753521,3383880,4834522,2303086,4814748,3530999,4860335,2688190,4934302,3087612,4823424,2318554,4871301,2401748,4975426,3401351,4758389,2422018,4980635,2868670,5033387,2629438,5089552,3424744,4820486,2560897,5051403,3267379,4871438,2533000,5042776,2599594,5130972,3053528,4615622,2612529,5181675,3033348,4723513,3363565,4773127,2373673,4809793,2292879,4806553,2884820,4588857,2333608,4866387,2518970,5047134,2309695,4876911,2755499,4980748,3342576,4804564,2653288,5054092,3963888,4882968,3957694,4920197,3444391,4889910,2908022,4888054,3138506,5075005,3242788,5125212,3094153,4849558,3437864,5094338,3526677,5077307,3045179,4750594,3251291,4865399,2222794,4850231,2545358,5061436,3567299,4842904,2600590,5074643,2550730,5037449,3163313,4864684,3117664,5205985,2363157,4815287,3379227,5056428,2580876,5045982,3876450,4801701,2665353,4866224,3756915,4904028,3055878,4647623,3270249,4695919,2712988,5161233,3311717,4766371,2948806,4818716,2776045,5057658,3085712,4656823,3545102,4835458,3280312,4707269,2233944,4865001,3150489,4664463,3162092,4665251,3103205,4719761,2874489,4579076,3368568,4866199,3415210,4755278,3577058,4856190,2614353,5142187,2385275,5013458,3520136,4909238,3352262,4794803,2626198,5066677,2423512,4999197,3807577,4881424,2246954,4873728,2350445,4852038,3258919,5217490,3082061,4814441,2606292,5126352,3295167,4906018,3185213,4856057,3095065,4803803,3771244,4972052,3387926,5083404,2303161,4856067,3481766,4989587,2259140,4871523,3621779,4823953,3294870,5093508,3078532,4791056,3483444,5077795,3191921,4709547,3178006,4729671,2668454,4879506,2226753,4856369,3393651,5194850,3244265,5011963,3127228,5007449,3352811,4898475,3158262,5093072,3436102,5020751,3512067,4945198,3447866,5031054,3420023,4914706,2624786,5052827,2670447,4933698,2700190,5082338,3657638,4850270,3235815,4768860,3414436,5046316,2630198,5113233,3177321,4717351,3154173,4662037,2296122,4862249,3183217,5066482,2721825,5126790,3394455,5002426,3611149,5011087,2763193,5067168,3656108,4950498,3185406,5116477,3717269,4969472,3616573,5006944,3762445,4937864,2413966,4974884,2362556,4849155,2656227,5157331,3652543,4958956,3196802,4680450,3161268,5020664,3694498,5028675,3243981,4704265,3684004,4946059,3210435,4699549,2298055,4877548,3682766,4769538,2536908,5058216,3219797,4686268,3255288,5133146,2871065,5022204,3648338,4990405,2762173,5052521,2856447,5023514,3702223,4890679,2401254,4797288,3678046,5007693,3199067,4736968,3610493,4995387,2313826,4832013,3466325,5105612,3726841,4829555,2656074,4894793,2434791,4804715,2896764,5061893,3822098,4843366,3691731,4844055,3393135,4789726,2377187,4812235,3132294,4752875,3698117,4863553,2679753,4864470,3770108,4852266,3783792,4858511,3121704,4760315,2334556,4895006,3146454,4747688,2259477,4894114,3821441,4822836,3326162,5036011,3796522,4805746,2246059,4889294,2343364,4827073,3127269,4769375,2303823,4831719,3059475,4786001,3738054,4825949,3313299,4923381,2789339,4962186,2239650,4836322,2530740,5015273,2388641,4818180,3453101,4982317,3449147,4885718,2567148,4904961,3691442,4871044,3737990,4883598,2634959,5073537,3705907,4940084,2270095,4899199,2256766,4837608,2651925,5032774,2633315,4911749,3586371,4971664,2294257,4827925,3531004,4984340,3640406,4808474,2274732,4823226,3448157,5058395,3671283,4979698,2663321,5126011,3693160,4987002,3654740,4983560,2328593,4836543,3655379,4885592,3471298,4915213,3612281,4988759,2497320,5003145,3606942,4987811,3250951,4769262,3693435,4971529,2299320,4827963,2834516,4948640,3001504,4998468,2641768,5000569,2722212,4997291,3238675,5085462,2245690,4825466,2298969,4854696,3261965,4757407,2607322,4909405,2232717,4856931,3750699,4769621,2662824,4876267],100000);
@@ -0,0 +1,155 @@
+import os
+import time
+import logging
+import numpy as np
+from geometry import distance_to_edges_km, haversine_km
+from rollup import save_table
+from spatial_validation import load_polygon_layers
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+OUTPUT_DIR = os.path.join("assets", "data", "adjacency")
+ADJACENCY_LAYERS = ("districts", "communities")
+
+# Coordinates are hashed on a grid of 1e-7 degrees (about 1 cm), so float noise does not split shared vertices.
+HASH_PRECISION = 1e7
+# Features whose boundaries come this close without sharing vertices are still neighbours.
+DEFAULT_TOLERANCE_KM = 0.05
+
+
+def _vertex_keys(xs, ys):
+    return np.round(np.asarray(xs) * HASH_PRECISION).astype(np.int64) * (1 << 31) + np.round(np.asarray(ys) * HASH_PRECISION).astype(np.int64)
+
+def _shared_pairs(keys, features):
+    """
+    Groups features by hash keys, returns (feature_a, feature_b, key) for every pair of
+    different features with a common key, feature_a < feature_b.
+    """
+    rows = np.unique(np.stack([keys, features], axis=1), axis=0)
+    keys, features = rows[:, 0], rows[:, 1]
+    starts = np.nonzero(np.concatenate([[True], keys[1:] != keys[:-1]]))[0]
+    sizes = np.diff(np.append(starts, len(keys)))
+
+    # Most keys are shared by exactly two features, larger groups expand to all their pairs.
+    pairs = [np.stack([features[starts[sizes == 2]], features[starts[sizes == 2] + 1], keys[starts[sizes == 2]]], axis=1)]
+    for start, size in zip(starts[sizes > 2], sizes[sizes > 2]):
+        group = features[start:start + size]
+        first, second = np.triu_indices(size, 1)
+        pairs.append(np.stack([group[first], group[second], np.full(len(first), keys[start])], axis=1))
+    pairs = np.concatenate(pairs) if pairs else np.empty((0, 3), dtype=np.int64)
+    return pairs[:, 0], pairs[:, 1], pairs[:, 2]
+
+def _edges_in_bbox(edges, bbox, margin):
+    min_x, min_y, max_x, max_y = bbox
+    inside = (
+        (np.maximum(edges[:, 0], edges[:, 2]) >= min_x - margin) & (np.minimum(edges[:, 0], edges[:, 2]) <= max_x + margin)
+        & (np.maximum(edges[:, 1], edges[:, 3]) >= min_y - margin) & (np.minimum(edges[:, 1], edges[:, 3]) <= max_y + margin)
+    )
+    return edges[inside]
+
+def _edge_lengths_km(edges):
+    return haversine_km(edges[:, 0], edges[:, 1], edges[:, 2], edges[:, 3])
+
+
+def build_adjacency(polygon_layer, tolerance_km=DEFAULT_TOLERANCE_KM):
+    """
+    Derives the neighbours of every feature of a PolygonLayer.
+
+    Features sharing boundary edges are neighbours along the summed length of those
+    edges, features sharing only vertices touch at a point. Pairs with overlapping
+    bounding boxes and nothing shared exactly are checked against the tolerance, the
+    border of such pairs is the length of the edges lying within it.
+
+    Returns a list of dicts with katotth_a, katotth_b, border_km and relation
+    (edge, vertex or near), katotth_a < katotth_b.
+    """
+    if len(polygon_layer) == 0:
+        return []
+    edges = np.vstack(polygon_layer.edges)
+    edge_features = np.repeat(np.arange(len(polygon_layer)), [len(feature_edges) for feature_edges in polygon_layer.edges])
+    start_keys = _vertex_keys(edges[:, 0], edges[:, 1])
+    end_keys = _vertex_keys(edges[:, 2], edges[:, 3])
+    valid = start_keys != end_keys
+    edges, edge_features, start_keys, end_keys = edges[valid], edge_features[valid], start_keys[valid], end_keys[valid]
+
+    # Undirected edge hash: the ordered pair of vertex keys, numbered by np.unique.
+    low, high = np.minimum(start_keys, end_keys), np.maximum(start_keys, end_keys)
+    edge_keys = np.unique(np.stack([low, high], axis=1), axis=0, return_inverse=True)[1].ravel()
+    edge_lengths = np.zeros(edge_keys.max() + 1)
+    edge_lengths[edge_keys] = _edge_lengths_km(edges)
+
+    borders = dict()
+    feature_a, feature_b, shared_edges = _shared_pairs(edge_keys, edge_features)
+    unique_pairs, pair_index = np.unique(feature_a * len(polygon_layer) + feature_b, return_inverse=True)
+    lengths = np.bincount(pair_index.ravel(), weights=edge_lengths[shared_edges], minlength=len(unique_pairs))
+    for pair, length in zip(unique_pairs.tolist(), lengths.tolist()):
+        borders[divmod(pair, len(polygon_layer))] = (length, "edge")
+
+    vertex_features = np.concatenate([edge_features, edge_features])
+    feature_a, feature_b, _ = _shared_pairs(np.concatenate([start_keys, end_keys]), vertex_features)
+    for pair in np.unique(feature_a * len(polygon_layer) + feature_b).tolist():
+        borders.setdefault(divmod(pair, len(polygon_layer)), (0.0, "vertex"))
+
+    borders.update(_near_pairs(polygon_layer, borders, tolerance_km))
+
+    ids = polygon_layer.ids
+    result = []
+    for (a, b), (length, relation) in borders.items():
+        katotth_a, katotth_b = sorted((ids[a], ids[b]))
+        result.append({"katotth_a": katotth_a, "katotth_b": katotth_b, "border_km": round(length, 3), "relation": relation})
+    result.sort(key=lambda row: (row["katotth_a"], row["katotth_b"]))
+    return result
+
+def _near_pairs(polygon_layer, known_pairs, tolerance_km):
+    """Fallback for pairs with overlapping bounding boxes that share no vertex."""
+    if tolerance_km <= 0:
+        return dict()
+    margin = tolerance_km / 111.0
+    bboxes = polygon_layer.bboxes
+    overlap = (
+        (bboxes[:, None, 0] - margin <= bboxes[None, :, 2]) & (bboxes[None, :, 0] - margin <= bboxes[:, None, 2])
+        & (bboxes[:, None, 1] - margin <= bboxes[None, :, 3]) & (bboxes[None, :, 1] - margin <= bboxes[:, None, 3])
+    )
+    near = dict()
+    for a, b in zip(*np.nonzero(np.triu(overlap, 1))):
+        a, b = int(a), int(b)
+        if (a, b) in known_pairs:
+            continue
+        # Only the edges inside the other feature's (expanded) bounding box can be close to it.
+        edges_a = _edges_in_bbox(polygon_layer.edges[a], bboxes[b], margin)
+        edges_b = _edges_in_bbox(polygon_layer.edges[b], bboxes[a], margin)
+        if len(edges_a) == 0 or len(edges_b) == 0:
+            continue
+        start_distance = distance_to_edges_km(edges_a[:, 0], edges_a[:, 1], edges_b)
+        if start_distance.min() > tolerance_km:
+            continue
+        end_distance = distance_to_edges_km(edges_a[:, 2], edges_a[:, 3], edges_b)
+        close = (start_distance <= tolerance_km) & (end_distance <= tolerance_km)
+        near[(a, b)] = (float(_edge_lengths_km(edges_a[close]).sum()), "near")
+    return near
+
+
+def build_adjacency_graphs(layers=ADJACENCY_LAYERS, output_dir=OUTPUT_DIR, polygon_layers=None):
+    """Builds and saves the adjacency edge list of every layer as adjacency/<layer>.csv."""
+    if polygon_layers is None:
+        polygon_layers = load_polygon_layers()
+    os.makedirs(output_dir, exist_ok=True)
+    graphs = dict()
+    for layer in layers:
+        polygon_layer = polygon_layers.get(layer)
+        if polygon_layer is None or len(polygon_layer) == 0:
+            logger.warning(f"No polygons in the {layer} layer, skipping adjacency.")
+            continue
+        start_time = time.time()
+        graphs[layer] = build_adjacency(polygon_layer)
+        relations = [row["relation"] for row in graphs[layer]]
+        save_table(graphs[layer], os.path.join(output_dir, f"{layer}.csv"))
+        logger.info(
+            f"{layer}: {len(polygon_layer)} features, {relations.count('edge')} shared borders, "
+            f"{relations.count('vertex')} point contacts, {relations.count('near')} near borders, in {time.time() - start_time:.2f} seconds."
+        )
+    return graphs
+
+if __name__ == '__main__':
+    build_adjacency_graphs()
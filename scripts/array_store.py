@@ -0,0 +1,12 @@
+import numpy as np
+
+
+def save_arrays(path, arrays):
+    """Saves a dict of named arrays as an uncompressed .npz file, loading it needs no decompression pass."""
+    with open(path, "wb") as f:
+        np.savez(f, **arrays)
+
+def load_arrays(path, names=None):
+    """Named arrays of an .npz file: the given names (KeyError if one is missing) or all of them."""
+    with np.load(path) as data:
+        return {name: data[name] for name in (data.files if names is None else names)}
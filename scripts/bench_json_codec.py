@@ -0,0 +1,63 @@
+import os
+import time
+import logging
+from json_codec import CODECS, load_json
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BENCHMARK_FILES = [
+    os.path.join("assets", "data", "settlements.json"),
+    os.path.join("assets", "maps", "ukraine_oblasti.geojson"),
+    os.path.join("assets", "maps", "districts.geojson"),
+    os.path.join("assets", "maps", "communities.geojson"),
+    os.path.join("assets", "maps", "old_maps", "ua-koatuu", "raions.geojson"),
+    os.path.join("assets", "maps", "old_maps", "ua-2021", "ADMIN_1.geojson"),
+    os.path.join("assets", "maps", "old_maps", "ri", "volyn1906.geojson"),
+]
+
+def best_time(func, repeats):
+    """Returns the best wall time of several runs of func, in milliseconds."""
+    best = None
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        func()
+        elapsed = (time.perf_counter() - start_time) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def benchmark_file(path, repeats=3):
+    """Measures load, pretty dump and compact dump of a file with every available codec."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    data = load_json(path)
+
+    results = []
+    for name, (loads, dumps) in CODECS.items():
+        results.append({
+            "codec": name,
+            "load_ms": best_time(lambda: loads(raw), repeats),
+            "pretty_ms": best_time(lambda: dumps(data, True), repeats),
+            "compact_ms": best_time(lambda: dumps(data, False), repeats),
+            "pretty_size": len(dumps(data, True)),
+            "compact_size": len(dumps(data, False)),
+        })
+    return results
+
+def run_benchmark(files=BENCHMARK_FILES, repeats=3):
+    """Prints a comparison table of the JSON codecs on the project assets."""
+    logger.info(f"Available codecs: {', '.join(CODECS)}")
+    for path in files:
+        if not os.path.exists(path):
+            logger.info(f"Skipping {path}: file not found.")
+            continue
+        logger.info(f"{path} ({os.path.getsize(path) / 1024 / 1024:.1f} MB)")
+        for result in benchmark_file(path, repeats):
+            logger.info(
+                f"  {result['codec']:>8}: load {result['load_ms']:8.1f} ms, "
+                f"pretty dump {result['pretty_ms']:8.1f} ms ({result['pretty_size'] / 1024:.0f} KB), "
+                f"compact dump {result['compact_ms']:8.1f} ms ({result['compact_size'] / 1024:.0f} KB)"
+            )
+
+if __name__ == '__main__':
+    run_benchmark()
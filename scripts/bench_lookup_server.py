@@ -0,0 +1,148 @@
+import time
+import random
+import asyncio
+import logging
+import multiprocessing
+from urllib.parse import quote
+from json_codec import dumps_json
+from settlement_lookup import SettlementLookup
+from lookup_server import run_server
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+HOST = "127.0.0.1"
+PORT = 8765
+CONNECTIONS = 32
+DURATION = 10.0
+BULK_SIZE = 1000
+# Connections sending only the largest bulk requests while single requests are measured.
+BULK_CONNECTIONS = 4
+LARGE_BULK_SIZE = 10000
+
+
+def request_mix(lookup, seed=1):
+    """(name, method, path, body) requests over sample records: single and bulk lookups, reverse geocoding, search, subtrees."""
+    rng = random.Random(seed)
+    records = [lookup.record(row) for row in rng.sample(range(len(lookup)), min(2000, len(lookup)))]
+    located = [record["location"] for record in records if record.get("location")]
+    katotth_ids = [record["katotth_id"] for record in records]
+    requests = []
+    for record in records:
+        requests.append(("settlement", "GET", f"/settlements/{record['katotth_id']}", b""))
+        if record.get("koatuu_id"):
+            requests.append(("lookup", "GET", f"/lookup/koatuu_id/{record['koatuu_id']}", b""))
+        if record.get("name"):
+            requests.append(("search", "GET", f"/search?q={quote(record['name'][:4])}", b""))
+        if record.get("category") == "H":
+            requests.append(("subtree", "GET", f"/subtree/{record['katotth_id']}", b""))
+    for lon, lat in located[:200]:
+        requests.append(("reverse", "GET", f"/reverse?lon={lon}&lat={lat}", b""))
+    for _ in range(20):
+        requests.append(("bulk lookup", "POST", "/lookup/katotth_id", dumps_json({"ids": rng.sample(katotth_ids, min(BULK_SIZE, len(katotth_ids)))}, pretty=False)))
+        requests.append(("bulk reverse", "POST", "/reverse", dumps_json({"points": rng.sample(located, min(BULK_SIZE, len(located)))}, pretty=False)))
+    rng.shuffle(requests)
+    return requests
+
+def large_bulk_requests(lookup, seed=2):
+    """(name, method, path, body) bulk requests of LARGE_BULK_SIZE IDs or points."""
+    rng = random.Random(seed)
+    records = [lookup.record(row) for row in rng.sample(range(len(lookup)), min(2000, len(lookup)))]
+    located = [record["location"] for record in records if record.get("location")]
+    katotth_ids = [record["katotth_id"] for record in records]
+    return [
+        ("large bulk lookup", "POST", "/lookup/katotth_id", dumps_json({"ids": rng.choices(katotth_ids, k=LARGE_BULK_SIZE)}, pretty=False)),
+        ("large bulk reverse", "POST", "/reverse", dumps_json({"points": rng.choices(located, k=LARGE_BULK_SIZE)}, pretty=False)),
+    ]
+
+async def send(reader, writer, method, path, body):
+    """Sends one keep-alive request, returns the status and the response body size."""
+    head = f"{method} {path} HTTP/1.1\r\nHost: {HOST}\r\nAccept-Encoding: gzip\r\nContent-Length: {len(body)}\r\n\r\n"
+    writer.write(head.encode("utf-8") + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status, length
+
+async def client(requests, offset, deadline, latencies, errors):
+    reader, writer = await asyncio.open_connection(HOST, PORT)
+    position = offset
+    while time.perf_counter() < deadline:
+        name, method, path, body = requests[position % len(requests)]
+        position += 1
+        start_time = time.perf_counter()
+        status, _ = await send(reader, writer, method, path, body)
+        latencies.setdefault(name, []).append(time.perf_counter() - start_time)
+        if status != 200:
+            errors[status] = errors.get(status, 0) + 1
+    writer.close()
+
+async def wait_for_server(timeout=60.0):
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(HOST, PORT)
+            writer.close()
+            return
+        except OSError:
+            if time.perf_counter() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+def percentile(values, share):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(share * len(values)))]
+
+async def load_test(requests, connections, duration, background=(), background_connections=0):
+    """Runs connections over requests, and background_connections over background requests at the same time."""
+    await wait_for_server()
+    latencies, errors = dict(), dict()
+    start_time = time.perf_counter()
+    deadline = start_time + duration
+    await asyncio.gather(
+        *(client(requests, connection * len(requests) // connections, deadline, latencies, errors) for connection in range(connections)),
+        *(client(background, connection, deadline, latencies, errors) for connection in range(background_connections)),
+    )
+    return latencies, errors, time.perf_counter() - start_time
+
+def log_latencies(title, connections, latencies, errors, elapsed):
+    total = sum(len(values) for values in latencies.values())
+    logger.info(f"{title}: {total} requests over {connections} connections in {elapsed:.1f} s: {total / elapsed:.0f} requests/s, errors: {errors or 'none'}")
+    for name, values in sorted(latencies.items()) + [("all", [value for values in latencies.values() for value in values])]:
+        logger.info(
+            f"{name:>18}: {len(values):6d} requests, latency p50 {percentile(values, 0.5) * 1000:6.2f} ms, "
+            f"p90 {percentile(values, 0.9) * 1000:6.2f} ms, p99 {percentile(values, 0.99) * 1000:6.2f} ms"
+        )
+
+def run_benchmark(connections=CONNECTIONS, duration=DURATION):
+    """
+    Starts the lookup server in a separate process and reports requests per second and
+    latency percentiles of the request mix, then of single requests while other
+    connections keep sending LARGE_BULK_SIZE bulk requests.
+    """
+    with SettlementLookup() as lookup:
+        requests = request_mix(lookup)
+        background = large_bulk_requests(lookup)
+    singles = [request for request in requests if request[1] == "GET"]
+    server = multiprocessing.Process(target=run_server, args=(HOST, PORT), daemon=True)
+    server.start()
+    try:
+        mix = asyncio.run(load_test(requests, connections, duration))
+        under_bulk = asyncio.run(load_test(singles, connections, duration, background, BULK_CONNECTIONS))
+    finally:
+        server.terminate()
+        server.join()
+
+    log_latencies("Request mix", connections, *mix)
+    log_latencies(f"Single requests with {BULK_CONNECTIONS} connections of {LARGE_BULK_SIZE}-item bulk requests", connections + BULK_CONNECTIONS, *under_bulk)
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,63 @@
+import os
+import time
+import logging
+import numpy as np
+from reverse_geocoder import ReverseGeocoder, INDEX_FILE, build_reverse_geocoder
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def random_points(geocoder, count, seed=1):
+    """Random points inside the coarsest rasterized layer, i.e. inside Ukraine."""
+    layer = geocoder.layers[list(geocoder.layers)[-1]]
+    rows, columns = layer.raster.shape
+    min_x, min_y = layer.origin
+    rng = np.random.default_rng(seed)
+    points = []
+    while sum(len(part) for part in points) < count:
+        xs = rng.uniform(min_x, min_x + columns * layer.cell_size, count)
+        ys = rng.uniform(min_y, min_y + rows * layer.cell_size, count)
+        inside = layer.locate(xs, ys) >= 0
+        points.append(np.column_stack([xs[inside], ys[inside]]))
+    return np.vstack(points)[:count]
+
+def outside_points(geocoder, count, margin=5.0, seed=1):
+    """Random points within margin degrees around the coarsest rasterized layer but outside of Ukraine."""
+    layer = geocoder.layers[list(geocoder.layers)[-1]]
+    rows, columns = layer.raster.shape
+    min_x, min_y = layer.origin
+    rng = np.random.default_rng(seed)
+    xs = rng.uniform(min_x - margin, min_x + columns * layer.cell_size + margin, count)
+    ys = rng.uniform(min_y - margin, min_y + rows * layer.cell_size + margin, count)
+    outside = layer.locate(xs, ys) < 0
+    return np.column_stack([xs[outside], ys[outside]])
+
+def run_benchmark(count=100000, single_count=2000):
+    """Measures index load time and single and batch reverse geocoding throughput."""
+    if not os.path.exists(INDEX_FILE):
+        build_reverse_geocoder()
+
+    start_time = time.perf_counter()
+    geocoder = ReverseGeocoder.load(INDEX_FILE)
+    logger.info(f"Index loaded in {(time.perf_counter() - start_time) * 1000:.1f} ms")
+
+    points = random_points(geocoder, count)
+    start_time = time.perf_counter()
+    geocoder.lookup_many(points)
+    elapsed = time.perf_counter() - start_time
+    logger.info(f"Batch: {count} points in {elapsed:.3f} s ({count / elapsed:.0f} lookups/s)")
+
+    outside = outside_points(geocoder, count)
+    start_time = time.perf_counter()
+    geocoder.lookup_many(outside)
+    elapsed = time.perf_counter() - start_time
+    logger.info(f"Batch outside of Ukraine: {len(outside)} points in {elapsed:.3f} s ({len(outside) / elapsed:.0f} lookups/s)")
+
+    start_time = time.perf_counter()
+    for lon, lat in points[:single_count]:
+        geocoder.lookup(lon, lat)
+    elapsed = time.perf_counter() - start_time
+    logger.info(f"Single: {elapsed / single_count * 1e6:.0f} us per lookup")
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,44 @@
+import os
+import time
+import logging
+from json_codec import load_json
+from settlement_lookup import SettlementLookup, INDEX_FILE, ID_FIELDS, build_settlement_lookup
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DATA_FILE = os.path.join("assets", "data", "settlements.json")
+
+def load_dicts():
+    """What services do without the index: load the file and build a dict per ID field."""
+    settlements = load_json(DATA_FILE)
+    return {field: {settlement[field]: settlement for settlement in settlements if settlement.get(field)} for field in ID_FIELDS}
+
+def run_benchmark(lookup_count=20000):
+    """Compares the startup of json loading with opening the index, and measures lookups."""
+    if not os.path.exists(INDEX_FILE):
+        build_settlement_lookup()
+
+    start_time = time.perf_counter()
+    indexes = load_dicts()
+    logger.info(f"JSON load and ID dicts: {(time.perf_counter() - start_time) * 1000:.1f} ms")
+
+    start_time = time.perf_counter()
+    lookup = SettlementLookup(INDEX_FILE)
+    logger.info(f"Index opened in {(time.perf_counter() - start_time) * 1000:.2f} ms")
+
+    for field in ID_FIELDS:
+        values = list(indexes[field])[:lookup_count]
+        start_time = time.perf_counter()
+        for value in values:
+            lookup.rows(field, value)
+        row_time = (time.perf_counter() - start_time) / len(values)
+        start_time = time.perf_counter()
+        for value in values:
+            lookup.find_one(field, value)
+        record_time = (time.perf_counter() - start_time) / len(values)
+        logger.info(f"{field}: {row_time * 1e6:.1f} us per row lookup, {record_time * 1e6:.1f} us with the decoded record")
+    lookup.close()
+
+if __name__ == '__main__':
+    run_benchmark()
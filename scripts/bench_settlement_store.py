@@ -0,0 +1,57 @@
+import gc
+import os
+import time
+import logging
+import tracemalloc
+from hierarchy import Hierarchy
+from json_codec import dumps_json, loads_json
+from settlement_store import SettlementStore
+from step_1_generate_settlements import read_kodifikator, update_settlement, update_ancestor_names
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+KODIFIKATOR_FILE = os.path.join("assets", "kodifikator", "kodifikator-02-07-2025.csv")
+
+def read_kodifikator_settlements(kodifikator_file=KODIFIKATOR_FILE):
+    """Builds settlement dicts from the kodifikator the way step 1 does, without its output file."""
+    rows = read_kodifikator(kodifikator_file)
+    hierarchy = Hierarchy(rows)
+    settlements = dict()
+    for row in rows:
+        settlement = settlements.setdefault(row["katotth_id"], {"katotth_id": row["katotth_id"]})
+        update_settlement(settlement, row, hierarchy)
+    for settlement in settlements.values():
+        update_ancestor_names(settlement, hierarchy)
+    return list(settlements.values())
+
+def measure(build):
+    """Returns the result of build() with the memory it retains and the time it took."""
+    gc.collect()
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start_time
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, retained, elapsed
+
+def run_benchmark():
+    """Compares the memory held by plain settlement dicts and by SettlementStore."""
+    # Parse the CSV into JSON text once, so both variants build fresh, unshared objects.
+    source = dumps_json(read_kodifikator_settlements(), pretty=False)
+
+    dicts, dicts_memory, dicts_time = measure(lambda: loads_json(source))
+    count = len(dicts)
+    del dicts
+    store, store_memory, store_time = measure(lambda: SettlementStore(loads_json(source)))
+
+    logger.info(f"Settlements: {count}")
+    logger.info(f"Plain dicts:     {dicts_memory / 1024 / 1024:7.1f} MB ({dicts_memory / count:.0f} B/record), built in {dicts_time:.2f} s")
+    logger.info(f"SettlementStore: {store_memory / 1024 / 1024:7.1f} MB ({store_memory / count:.0f} B/record), built in {store_time:.2f} s")
+    logger.info(f"Reduction: {100 * (1 - store_memory / dicts_memory):.0f}%")
+    return store
+
+if __name__ == '__main__':
+    run_benchmark()
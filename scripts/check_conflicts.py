@@ -0,0 +1,90 @@
+import logging
+import numpy as np
+from duplicates import ConflictFinder
+from data_validation import find_duplicates
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Two hromadas side by side: H1 west of longitude 31, H2 east of it.
+HROMADA_BOXES = {
+    "UA00000000000000001": (30.0, 50.0, 31.0, 51.0),
+    "UA00000000000000002": (31.0, 50.0, 32.0, 51.0),
+}
+
+# Records of the fixture, keyed by their role:
+# - "owner" and "misplaced" share a name and a Wikidata ID, both are located in H1,
+#   the misplaced record belongs to H2, so the owner is the record of H1,
+# - "west" and "east" share a name, "east" is located in the hromada of "west": its
+#   location was taken from the wrong record, their Wikidata IDs differ,
+# - "first" and "second" have different names and share an osm_id, both are in their hromada.
+FIXTURE = {
+    "owner": {"katotth_id": "UA00000000000000011", "name": "Вільне", "category": "C", "hromada_id": "UA00000000000000001",
+              "location": [30.5, 50.5], "wikidata": "Q1"},
+    "misplaced": {"katotth_id": "UA00000000000000012", "name": "Вільне", "category": "C", "hromada_id": "UA00000000000000002",
+                  "location": [30.52, 50.5], "wikidata": "Q1"},
+    "west": {"katotth_id": "UA00000000000000013", "name": "Іванівка", "category": "C", "hromada_id": "UA00000000000000001",
+             "location": [30.2, 50.2], "wikidata": "Q2"},
+    "east": {"katotth_id": "UA00000000000000014", "name": "Іванівка", "category": "C", "hromada_id": "UA00000000000000002",
+             "location": [30.8, 50.8], "wikidata": "Q3"},
+    "first": {"katotth_id": "UA00000000000000015", "name": "Петрівка", "category": "C", "hromada_id": "UA00000000000000001",
+              "location": [30.1, 50.9], "osm_id": 7},
+    "second": {"katotth_id": "UA00000000000000016", "name": "Степове", "category": "C", "hromada_id": "UA00000000000000002",
+               "location": [31.9, 50.9], "osm_id": 7},
+}
+
+
+class BoxGeocoder:
+    """Stand-in for ReverseGeocoder.locate_chains: hromadas are lon/lat boxes, oblasts and districts unknown."""
+
+    def __init__(self, boxes=HROMADA_BOXES):
+        self.boxes = boxes
+
+    def locate_chains(self, xs, ys):
+        chains = np.full((len(xs), 3), "", dtype=object)
+        for hromada_id, (min_x, min_y, max_x, max_y) in self.boxes.items():
+            inside = (xs >= min_x) & (xs < max_x) & (ys >= min_y) & (ys < max_y)
+            chains[inside, 2] = hromada_id
+        return chains
+
+
+def expect(condition, message):
+    if not condition:
+        raise AssertionError(message)
+
+def check_conflict_owners():
+    """Checks owners, suspects and misplaced locations of ConflictFinder on the fixture."""
+    ids = {role: record["katotth_id"] for role, record in FIXTURE.items()}
+    conflicts = ConflictFinder(list(FIXTURE.values()), BoxGeocoder()).find()
+    by_ids = {frozenset(conflict["katotth_ids"]): conflict for conflict in conflicts}
+    for conflict in conflicts:
+        logger.info(f"{conflict['kind']} {conflict['field']} {conflict['value']}: {conflict['katotth_ids']}, owner {conflict['owner']}, suspects {conflict['suspects']}")
+
+    shared_wikidata = [conflict for conflict in conflicts if conflict["field"] == "wikidata"]
+    expect(len(shared_wikidata) == 1, f"one shared Wikidata ID expected, found {len(shared_wikidata)}")
+    expect(shared_wikidata[0]["kind"] == "cross_assignment", "same-named records sharing a Wikidata ID are a cross assignment")
+    expect(shared_wikidata[0]["owner"] == ids["owner"], "the record located in its own hromada owns the Wikidata ID")
+    expect(shared_wikidata[0]["suspects"] == [ids["misplaced"]], "the record located outside its hromada is the suspect")
+
+    misplaced = by_ids.get(frozenset((ids["west"], ids["east"])))
+    expect(misplaced is not None and misplaced["field"] == "location", "a location in the hromada of a same-named record is misplaced")
+    expect(misplaced["owner"] == ids["west"] and misplaced["suspects"] == [ids["east"]], "the record of the hromada owns the location")
+
+    location = by_ids.get(frozenset((ids["owner"], ids["misplaced"])))
+    expect(location is not None and location["kind"] == "cross_assignment" and location["field"] == "location",
+           "near-identical locations of a misplaced pair are reported once, as a misplacement")
+
+    shared_osm = [conflict for conflict in conflicts if conflict["field"] == "osm_id"]
+    expect(len(shared_osm) == 1 and shared_osm[0]["kind"] == "shared_id", "differently named records sharing an osm_id share an ID")
+    expect(shared_osm[0]["owner"] is None, "no owner when every claimant is located in its own hromada")
+
+    without_geocoder = ConflictFinder(list(FIXTURE.values())).find()
+    expect(all(conflict["owner"] is None for conflict in without_geocoder), "no owners without a geocoder")
+
+    # Only the suspect of the shared Wikidata ID loses it, the misplaced pair keeps its own IDs.
+    dropped = find_duplicates(list(FIXTURE.values()), BoxGeocoder())
+    expect(dropped == {ids["misplaced"]}, f"only the suspect of the shared Wikidata ID is dropped, got {sorted(dropped)}")
+    logger.info(f"Conflict owners checked on {len(FIXTURE)} records: {len(conflicts)} conflicts as expected.")
+
+if __name__ == '__main__':
+    check_conflict_owners()
@@ -0,0 +1,61 @@
+import os
+import json
+import logging
+import tempfile
+from json_codec import iter_json_array
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Arrays iter_json_array must read like json.loads, valid ones and the malformed ones it used to accept.
+CASES = (
+    '[]',
+    ' [ ] \n',
+    '[{"a":1},{"b":2}]',
+    '[1, 2.5, "x", null, [3], {"c": [4]}]\n\n',
+    '[{"a":1},{"b":2},]',
+    '[ 1 , 2 ,  ]',
+    '[,]',
+    '[1]x',
+    '[1] [2]',
+    '[1]\n,',
+    '[1,2',
+    '{"a": 1}',
+)
+# Small chunks cut elements, separators and the text after the array at every position.
+CHUNK_SIZES = (1, 2, 3, 7, 1 << 16)
+
+
+def expect(condition, message):
+    if not condition:
+        raise AssertionError(message)
+
+def read_with_stdlib(text):
+    try:
+        return json.loads(text)
+    except ValueError:
+        return ValueError
+
+def read_with_iterator(path, chunk_size):
+    try:
+        return list(iter_json_array(path, chunk_size))
+    except ValueError:
+        return ValueError
+
+def check_iter_json_array():
+    """Checks that iter_json_array accepts and rejects the same arrays as json.loads."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "array.json")
+        for text in CASES:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+            expected = read_with_stdlib(text)
+            if expected is not ValueError and not isinstance(expected, list):
+                expected = ValueError
+            for chunk_size in CHUNK_SIZES:
+                result = read_with_iterator(path, chunk_size)
+                expect(result == expected, f"{text!r} with {chunk_size}-character chunks: {result!r} instead of {expected!r}")
+    logger.info(f"iter_json_array checked on {len(CASES)} arrays with {len(CHUNK_SIZES)} chunk sizes.")
+
+if __name__ == '__main__':
+    check_iter_json_array()
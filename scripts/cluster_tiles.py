@@ -0,0 +1,142 @@
+import os
+import time
+import shutil
+import logging
+import numpy as np
+from categories import SETTLEMENT_TYPES
+from json_codec import load_json, save_json
+from rollup import parse_number
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+OUTPUT_DIR = os.path.join("assets", "data", "clusters")
+
+MIN_ZOOM = 4
+# The last zoom level is not clustered, its tiles hold every settlement and are overzoomed by clients.
+MAX_ZOOM = 10
+TILE_SIZE = 256
+# Cluster cell size in pixels, divides the tile size so clusters never cross tiles.
+CLUSTER_SIZE = 64
+# Representatives are chosen by category first (cities of special status, cities, towns, villages).
+CATEGORY_RANK = {"K": 0, "M": 1, "X": 2, "C": 3}
+
+
+def web_mercator(lons, lats):
+    """Projects lon/lat to web mercator coordinates in [0, 1) with y growing southwards."""
+    lats = np.clip(np.asarray(lats, dtype=np.float64), -85.05112878, 85.05112878)
+    x = (np.asarray(lons, dtype=np.float64) + 180) / 360
+    sin_lat = np.sin(np.radians(lats))
+    y = 0.5 - np.log((1 + sin_lat) / (1 - sin_lat)) / (4 * np.pi)
+    return np.clip(x, 0, 1 - 1e-12), np.clip(y, 0, 1 - 1e-12)
+
+
+class ClusterPyramid:
+    """
+    Grid clusters of settlement points for every zoom level.
+
+    At each zoom the world is cut into cells of CLUSTER_SIZE pixels, every cell with
+    points becomes a cluster with its count, centroid and the most important settlement
+    as representative (by category, then population). At max_zoom every settlement is
+    a cluster of its own.
+    """
+
+    def __init__(self, settlements, min_zoom=MIN_ZOOM, max_zoom=MAX_ZOOM):
+        located = [
+            s for s in settlements
+            if s.get("category") in SETTLEMENT_TYPES and s.get("location") and len(s["location"]) >= 2
+        ]
+        self.min_zoom = min_zoom
+        self.max_zoom = max_zoom
+        self.locations = np.array([s["location"][:2] for s in located], dtype=np.float64).reshape(-1, 2)
+        self.ids = [s.get("katotth_id") for s in located]
+        self.names = [s.get("name") for s in located]
+        self.categories = [s.get("category") for s in located]
+        self.x, self.y = web_mercator(self.locations[:, 0], self.locations[:, 1])
+
+        population = np.array([parse_number(s.get("population")) or 0.0 for s in located])
+        rank = np.array([CATEGORY_RANK.get(category, len(CATEGORY_RANK)) for category in self.categories])
+        # Position of every point in the representative priority order.
+        self.priority = np.empty(len(located), dtype=np.int64)
+        self.priority[np.lexsort((-population, rank))] = np.arange(len(located))
+
+    @classmethod
+    def from_file(cls, path, min_zoom=MIN_ZOOM, max_zoom=MAX_ZOOM):
+        return cls(load_json(path), min_zoom, max_zoom)
+
+    def clusters(self, zoom):
+        """
+        Returns the clusters of a zoom level as a dict of arrays: tile_x, tile_y,
+        lon, lat, count and representative (row of the representative settlement).
+        """
+        if zoom >= self.max_zoom:
+            keys = np.arange(len(self.ids))
+        else:
+            cells = TILE_SIZE // CLUSTER_SIZE * 2 ** zoom
+            keys = (self.y * cells).astype(np.int64) * cells + (self.x * cells).astype(np.int64)
+
+        order = np.lexsort((self.priority, keys))
+        sorted_keys = keys[order]
+        first = np.concatenate([[True], sorted_keys[1:] != sorted_keys[:-1]]) if len(order) else np.zeros(0, dtype=bool)
+        cluster_index = np.cumsum(first) - 1
+        representatives = order[first]
+        counts = np.bincount(cluster_index, minlength=len(representatives))
+        lons = np.bincount(cluster_index, weights=self.locations[order, 0], minlength=len(representatives)) / np.maximum(counts, 1)
+        lats = np.bincount(cluster_index, weights=self.locations[order, 1], minlength=len(representatives)) / np.maximum(counts, 1)
+        # Cells never cross tiles, so the tile of the representative is the tile of the cluster.
+        return {
+            "tile_x": (self.x[representatives] * 2 ** zoom).astype(np.int64),
+            "tile_y": (self.y[representatives] * 2 ** zoom).astype(np.int64),
+            "lon": lons,
+            "lat": lats,
+            "count": counts,
+            "representative": representatives,
+        }
+
+    def tiles(self, zoom):
+        """Yields (tile_x, tile_y, FeatureCollection) for every tile of a zoom level that has clusters."""
+        clusters = self.clusters(zoom)
+        tile_keys = clusters["tile_y"] * 2 ** zoom + clusters["tile_x"]
+        order = np.argsort(tile_keys, kind="stable")
+        unique_keys, starts = np.unique(tile_keys[order], return_index=True)
+        ends = np.append(starts[1:], len(order))
+        for tile_key, start, end in zip(unique_keys, starts, ends):
+            features = []
+            for cluster in order[start:end]:
+                row = clusters["representative"][cluster]
+                count = int(clusters["count"][cluster])
+                location = [round(float(clusters["lon"][cluster]), 6), round(float(clusters["lat"][cluster]), 6)] if count > 1 else self.locations[row].tolist()
+                features.append({
+                    "type": "Feature",
+                    "properties": {"count": count, "katotth_id": self.ids[row], "name": self.names[row], "category": self.categories[row]},
+                    "geometry": {"type": "Point", "coordinates": location},
+                })
+            yield int(tile_key % 2 ** zoom), int(tile_key // 2 ** zoom), {"type": "FeatureCollection", "features": features}
+
+    def save(self, output_dir=OUTPUT_DIR):
+        """Writes every tile to output_dir/{z}/{x}/{y}.geojson and an index.json with the tile lists."""
+        if os.path.exists(output_dir):
+            shutil.rmtree(output_dir)
+        index = {"min_zoom": self.min_zoom, "max_zoom": self.max_zoom, "tile_size": TILE_SIZE, "cluster_size": CLUSTER_SIZE, "tiles": {}}
+        for zoom in range(self.min_zoom, self.max_zoom + 1):
+            tiles = []
+            for tile_x, tile_y, collection in self.tiles(zoom):
+                tile_dir = os.path.join(output_dir, str(zoom), str(tile_x))
+                os.makedirs(tile_dir, exist_ok=True)
+                save_json(collection, os.path.join(tile_dir, f"{tile_y}.geojson"), pretty=False)
+                tiles.append([tile_x, tile_y, len(collection["features"])])
+            index["tiles"][str(zoom)] = tiles
+            logger.info(f"Zoom {zoom}: {sum(tile[2] for tile in tiles)} clusters in {len(tiles)} tiles.")
+        save_json(index, os.path.join(output_dir, "index.json"), pretty=False)
+
+
+def build_cluster_tiles():
+    """Builds the cluster pyramid of settlements.json and saves its tiles."""
+    start_time = time.time()
+    data_file = os.path.join("assets", "data", "settlements.json")
+    pyramid = ClusterPyramid.from_file(data_file)
+    pyramid.save(OUTPUT_DIR)
+    logger.info(f"Cluster tiles of {len(pyramid.ids)} settlements saved to {OUTPUT_DIR} in {time.time() - start_time:.2f} seconds.")
+
+if __name__ == '__main__':
+    build_cluster_tiles()
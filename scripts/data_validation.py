@@ -1,170 +1,203 @@
-import json
 import os
 import logging
-from categories import  is_area_type, is_point_type, get_category_name, get_admin_level, ALL_TYPES
+from collections import Counter
+from categories import SETTLEMENT_TYPES
+from json_codec import iter_json_array, JsonArrayWriter
+from hierarchy import DEPTH_OBLAST, DEPTH_DISTRICT, DEPTH_HROMADA
+from map_index import MAP_LAYERS, load_map_indexes
+from spatial_validation import validate_locations, load_polygon_layers
+from duplicates import ConflictFinder, ID_FIELDS, suspect_fields, load_geocoder
+from reverse_geocoder import INDEX_FILE as REVERSE_GEOCODER_FILE
+from validation import RuleRegistry, run_validation, log_report
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def find_duplicates(settlements):
+def find_duplicates(settlements, geocoder=None):
     """
-    Find duplicate settlements based on their administrative IDs.
+    Find duplicate katotth IDs and the records that conflict over a Wikidata or OSM ID
+    or a location (see duplicates.ConflictFinder).
+
+    Every conflict is reported, only shared Wikidata IDs are resolved. Returns the katotth
+    IDs of the settlements whose Wikidata ID should be dropped: the suspects of a shared
+    Wikidata ID when its owner is known, every claimant of it otherwise.
     """
+    finder = ConflictFinder(settlements, geocoder)
     katotth = dict()
-    koatuu = dict()
-    wikidata = dict()
-
-    for settlement in settlements:
-        name = settlement.get("name")
-        katotth_id = settlement.get("katotth_id")
-        koatuu_id = settlement.get("koatuu_id")
-        wikidata_id = settlement.get("wikidata")
-
-        el = {"name":name, "katotth_id": katotth_id}
-        if katotth_id in katotth:
-            katotth[katotth_id].append(el)
-        else:
-            katotth[katotth_id] = [el]
-
-        if koatuu_id:
-            if koatuu_id in koatuu:
-                koatuu[koatuu_id].append(el)
-            else:
-                koatuu[koatuu_id] = [el] 
-        if wikidata_id:    
-            if wikidata_id in wikidata:
-                wikidata[wikidata_id].append(el)
-            else:
-                wikidata[wikidata_id] = [el]
+    for record in finder.records:
+        katotth.setdefault(record.get("katotth_id"), []).append(record.get("name") or "Unknown")
+    for id, names in katotth.items():
+        if len(names) > 1:
+            logger.warning(f"Duplicate katotth_id {id} found for settlements: {', '.join(names)}")
 
     drop_wikidata_for = set()
-    for id, elements in katotth.items():
-        if len(elements) > 1:
-            logger.warning(f"Duplicate katotth_id {id} found for settlements: {', '.join(el.get('name', 'Unknown') for el in elements)}")
-    # for id, elements in koatuu.items():
-    #     if len(elements) > 1:
-    #         logger.warning(f"Duplicate koatuu_id {id} found for settlements: {', '.join(el.get('name', 'Unknown') for el in elements)}")
-    for id, elements in wikidata.items():
-        if len(elements) > 1:
-            drop_wikidata_for.add(id)
-            logger.warning(f"Duplicate wikidata_id {id} found for settlements: {', '.join(el.get('name', 'Unknown') for el in elements)}")
-
-    need_to_drop_duplicates = False
-    for settlement in settlements:
-        # if settlement.get("koatuu_id") in drop_koatuu_for:
-        #     need_to_drop_duplicates = True
-        #     settlement.pop("koatuu_id", None)
-        #     logger.info(f"Removed koatuu_id for settlement {settlement.get('name')}")
-        if settlement.get("wikidata") in drop_wikidata_for:
-            need_to_drop_duplicates = True
-            settlement.pop("wikidata", None)
-            logger.info(f"Removed wikidata_id for settlement {settlement.get('name')}")
-    if need_to_drop_duplicates:
-        logger.info("Duplicates found and removed. Saving updated settlements data.")
-        data_file = os.path.join("assets", "data", "settlements.json")
-        with open(data_file, 'w', encoding='utf-8') as f:
-            json.dump(settlements, f, ensure_ascii=False, indent=2)
-
-def validate_maps(settlements):
-    oblasti_map_file = os.path.join("assets", "maps", "ukraine_oblasti.geojson")
-    with open(oblasti_map_file, 'r', encoding='utf-8') as f:
-        oblasti_map = json.load(f)
-    
-    districts_map_file = os.path.join("assets", "maps", "districts.geojson")
-    with open(districts_map_file, 'r', encoding='utf-8') as f:
-        districts_map = json.load(f)
-
-    communities_map_file = os.path.join("assets", "maps", "communities.geojson")
-    with open(communities_map_file, 'r', encoding='utf-8') as f:
-        communities_map = json.load(f)
-
-    for settlement in settlements:
-        category = settlement.get("category")
-        if get_admin_level(settlement) == 1:
-            map_item_found = False
-            for oblast in oblasti_map["features"]:
-                if settlement.get("katotth_id") == oblast.get("properties", {}).get("katotth"):
-                    map_item_found = True
-                    break
-            if not map_item_found:
-                logger.warning(f"Oblast {settlement.get('katotth_id')} {settlement.get('name')} not found in oblasts map.")
-        if category == "P":
-            map_item_found = False
-            for disctrict in districts_map["features"]:
-                if settlement.get("katotth_id") == disctrict.get("properties", {}).get("katotth"):
-                    map_item_found = True
-                    break
-            if not map_item_found:
-                logger.warning(f"District {settlement.get('katotth_id')} {settlement.get('name')} not found in districts map.")
-        if category == "H":
-            map_item_found = False
-            for community in communities_map["features"]:
-                if settlement.get("katotth_id") == community.get("properties", {}).get("katotth"):
-                    map_item_found = True
-                    break
-            if not map_item_found:
-                logger.warning(f"Community {settlement.get('katotth_id')} {settlement.get('name')} not found in communities map.")
-
-def check_generated_data():
-    data_file = os.path.join("assets", "data", "settlements.json")
-    with open(data_file, 'r', encoding='utf-8') as f:
-        settlements = json.load(f)
+    for conflict in finder.find():
+        records = ", ".join(f"{name} ({katotth_id})" for name, katotth_id in zip(conflict["names"], conflict["katotth_ids"]))
+        owner = f", likely owner {conflict['owner']}" if conflict["owner"] else ""
+        shared = f" of {conflict['field']} {conflict['value']}" if conflict["value"] else ""
+        logger.warning(f"{conflict['kind'].replace('_', ' ').capitalize()}{shared}: {records}{owner}")
+        if conflict["field"] != "wikidata":
+            continue
+        if conflict["owner"]:
+            drop_wikidata_for.update(suspect_fields(conflict))
+        else:
+            drop_wikidata_for.update(conflict["katotth_ids"])
+    return drop_wikidata_for
 
-    settlements_count = len(settlements)
-    logger.info(f"Total settlements and regions loaded: {settlements_count}")
+def drop_wikidata_ids(data_file, katotth_ids):
+    """
+    Removes the Wikidata IDs of the given settlements, rewriting the data file record by record.
+    """
+    if not katotth_ids:
+        return
+
+    logger.info("Duplicates found and removed. Saving updated settlements data.")
+    with JsonArrayWriter(data_file) as writer:
+        for settlement in iter_json_array(data_file):
+            if settlement.get("katotth_id") in katotth_ids and settlement.get("wikidata"):
+                settlement.pop("wikidata", None)
+                logger.info(f"Removed wikidata_id for settlement {settlement.get('name')}")
+            writer.write(settlement)
+
+def validate_hierarchy(settlement, hierarchy):
+    """
+    Checks that the parent and the oblast, district and hromada IDs of a settlement agree with the KATOTTH tree.
 
+    Returns the list of problems found.
+    """
+    problems = []
+    katotth_id = settlement.get("katotth_id")
+    parent_katotth = settlement.get("parent_katotth")
+    if parent_katotth and parent_katotth not in hierarchy:
+        problems.append(f"unknown parent {parent_katotth}")
+
+    for key, depth in (("oblast_id", DEPTH_OBLAST), ("district_id", DEPTH_DISTRICT), ("hromada_id", DEPTH_HROMADA)):
+        level_id = settlement.get(key)
+        if level_id and level_id != hierarchy.ancestor(katotth_id, depth):
+            problems.append(f"{key} {level_id} is not its ancestor")
+    return problems
+
+def validate_maps(settlements, verbose=True):
+    """
+    Checks map coverage in both directions: every oblast, district and community must have a
+    feature in its map layer, and every feature must belong to a settlement of that level.
 
-    
-    missing_data = {
-        "osm_id": {type_: 0 for type_ in ALL_TYPES},
-        "postal_code": {type_: 0 for type_ in ALL_TYPES},
-        "location": {type_: 0 for type_ in ALL_TYPES},
-        "koatuu_id": {type_: 0 for type_ in ALL_TYPES},
-        "wikidata": {type_: 0 for type_ in ALL_TYPES},
-    }
+    Returns a report with missing and orphaned katotth IDs per layer, logged one by one when verbose.
+    """
+    indexes = load_map_indexes()
 
-    regions_settlements = 0
-    settlements_count = 0
+    expected = {layer: dict() for layer in indexes}
     for settlement in settlements:
-        is_region = is_area_type(settlement)
-        is_settlement = is_point_type(settlement)
-
-        if not settlement.get("name"):
-            logger.warning(f"Settlement {settlement.get('katotth_id')} has no name.")
-        if not settlement.get("category"):
-            logger.warning(f"Settlement {settlement.get('katotth_id')} has no category.")
-        if not settlement.get("osm_id"):
-            missing_data["osm_id"][settlement.get("category")] += 1
-        if not settlement.get("postal_code"):
-            missing_data["postal_code"][settlement.get("category")] += 1
-        if not settlement.get("wikidata"):
-            missing_data["wikidata"][settlement.get("category")] += 1
-            if is_settlement:
-                logger.warning(f"Settlement {settlement.get('katotth_id')} - {settlement.get('name')} has no Wikidata ID.")
-        if not settlement.get("location"):
-            missing_data["location"][settlement.get("category")] += 1
-        if not settlement.get("koatuu_id"):
-            missing_data["koatuu_id"][settlement.get("category")] += 1
-            if not is_region:
-                logger.warning(f"Settlement {settlement.get('katotth_id')} - {settlement.get('name')} has no KOATUU ID.")
-        if is_region:
-            regions_settlements += 1
-        if is_settlement:
-            settlements_count += 1
-
-    
-    validate_maps(settlements)
-
-    find_duplicates(settlements)
-    
-    for type_ in ALL_TYPES:
-        cat_name =get_category_name(type_)
-        for missing_type, missing_records in missing_data.items():
-            if missing_records[type_] > 0:
-                logger.warning(f"'{cat_name}' has no {missing_type.replace('_', ' ')}: {missing_records[type_]}")
-  
-    logger.info(f"Regions Settlements Count: {regions_settlements}")
-    logger.info(f"Regions Settlements: {regions_settlements}")
-    logger.info(f"Settlements: {settlements_count}")
+        category = settlement.get("category")
+        for layer in indexes:
+            if category in MAP_LAYERS[layer]["categories"]:
+                expected[layer][settlement.get("katotth_id")] = settlement.get("name")
+
+    report = dict()
+    for layer, (index, duplicates, features_without_katotth) in indexes.items():
+        title = MAP_LAYERS[layer]["title"]
+        missing = [katotth_id for katotth_id in expected[layer] if katotth_id not in index]
+        orphaned = [katotth_id for katotth_id in index if katotth_id not in expected[layer]]
+
+        for katotth_id in missing if verbose else ():
+            logger.warning(f"{title} {katotth_id} {expected[layer][katotth_id]} not found in {layer} map.")
+        for katotth_id in orphaned if verbose else ():
+            logger.warning(f"{title} feature {katotth_id} {index[katotth_id].get('name', '')} in {layer} map has no matching settlement.")
+        for katotth_id in sorted(duplicates) if verbose else ():
+            logger.warning(f"{title} {katotth_id} has several features in {layer} map.")
+        if features_without_katotth:
+            logger.warning(f"{features_without_katotth} features in {layer} map have no katotth.")
+
+        report[layer] = {
+            "features": len(index),
+            "missing": missing,
+            "orphaned": orphaned,
+            "duplicates": sorted(duplicates),
+            "without_katotth": features_without_katotth,
+        }
+        logger.info(f"{layer} map: {len(index)} features, {len(missing)} missing, {len(orphaned)} orphaned.")
+    return report
+
+# Rules of check_generated_data. Each rule names the fields it depends on, so a
+# validation after a refresh only checks the records whose fields changed.
+RULES = RuleRegistry()
+
+# Fields counted as missing: (field, categories or None for all, severity).
+MISSING_FIELD_RULES = (
+    ("osm_id", None, "info"),
+    ("postal_code", None, "info"),
+    ("location", None, "info"),
+    ("koatuu_id", SETTLEMENT_TYPES, "warning"),
+    ("wikidata", SETTLEMENT_TYPES, "warning"),
+)
+
+@RULES.register("missing_name", ("name",), severity="error")
+def check_name(settlement, context):
+    return None if settlement.get("name") else "has no name"
+
+@RULES.register("missing_category", ("category",), severity="error")
+def check_category(settlement, context):
+    return None if settlement.get("category") else "has no category"
+
+def _missing_field_rule(field, categories, severity):
+    @RULES.register(f"missing_{field}", (field,), severity=severity, categories=categories)
+    def check_field(settlement, context):
+        return None if settlement.get(field) else f"has no {field.replace('_', ' ')}"
+
+for missing_field, missing_categories, missing_severity in MISSING_FIELD_RULES:
+    _missing_field_rule(missing_field, missing_categories, missing_severity)
+
+@RULES.register("hierarchy", ("parent_katotth", "oblast_id", "district_id", "hromada_id"), ancestors=True)
+def check_hierarchy(settlement, context):
+    return "; ".join(validate_hierarchy(settlement, context.hierarchy)) or None
+
+MAP_FILES = tuple(config["file"] for config in MAP_LAYERS.values())
+
+@RULES.register("location_outside_admin_polygons", ("location", "category", "oblast_id", "district_id", "hromada_id"), scope="batch", resources=MAP_FILES)
+def check_locations(settlements, context):
+    for mismatch in validate_locations(settlements, context.resource("polygon_layers", load_polygon_layers), verbose=False):
+        yield mismatch["katotth_id"], (
+            f"location {mismatch['location']} is {mismatch['distance_km']} km outside of its {mismatch['field']} "
+            f"{mismatch['expected']} (found in {mismatch['found'] or 'no feature'})"
+        )
+
+@RULES.register("map_coverage", ("katotth_id", "category"), scope="dataset", resources=MAP_FILES)
+def check_maps(settlements, context):
+    for layer, layer_report in validate_maps(settlements, verbose=False).items():
+        for katotth_id in layer_report["missing"]:
+            yield katotth_id, f"not found in {layer} map"
+        for katotth_id in layer_report["orphaned"]:
+            yield katotth_id, f"feature in {layer} map has no matching settlement"
+        for katotth_id in layer_report["duplicates"]:
+            yield katotth_id, f"has several features in {layer} map"
+
+@RULES.register("duplicate_katotth_id", ("katotth_id",), severity="error", scope="dataset")
+def check_duplicate_ids(settlements, context):
+    counts = Counter(settlement.get("katotth_id") for settlement in settlements)
+    for katotth_id, count in counts.items():
+        if katotth_id and count > 1:
+            yield katotth_id, f"katotth_id is used by {count} records"
+
+@RULES.register("conflicts", ("name", "category", "hromada_id", "location") + ID_FIELDS, scope="dataset", resources=(REVERSE_GEOCODER_FILE,))
+def check_conflicts(settlements, context):
+    for conflict in ConflictFinder(settlements, context.resource("geocoder", load_geocoder)).find():
+        shared = f" {conflict['field']} {conflict['value']}" if conflict["value"] else f" {conflict['field']}"
+        for katotth_id in conflict["katotth_ids"]:
+            others = ", ".join(other for other in conflict["katotth_ids"] if other != katotth_id)
+            owner = f", likely owner {conflict['owner']}" if conflict["owner"] else ""
+            yield katotth_id, f"{conflict['kind'].replace('_', ' ')} of{shared} with {others}{owner}"
+
+def check_generated_data(full=False):
+    """
+    Validates settlements.json with RULES, only checking again what changed since the
+    last report unless full, logs the issue counts and drops conflicting Wikidata IDs.
+    """
+    data_file = os.path.join("assets", "data", "settlements.json")
 
+    report = run_validation(RULES, data_file, full=full)
+    logger.info(f"Total settlements and regions loaded: {report['records']}")
+    log_report(report)
 
+    # Conflicting Wikidata IDs were already dropped after the last run if the conflicts were not checked again.
+    if report["checked"].get("conflicts"):
+        drop_wikidata_ids(data_file, find_duplicates(iter_json_array(data_file), load_geocoder()))
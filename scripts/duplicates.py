@@ -0,0 +1,198 @@
+import os
+import math
+import time
+import logging
+import numpy as np
+from categories import is_area_type
+from geometry import haversine_km
+from json_codec import load_json
+from name_search import normalize
+from rollup import save_table
+from reverse_geocoder import ReverseGeocoder, INDEX_FILE as REVERSE_GEOCODER_FILE
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+REPORT_FILE = os.path.join("assets", "data", "conflicts.csv")
+
+# IDs that must belong to a single record.
+ID_FIELDS = ("osm_id", "wikidata")
+# Fields set together from one OSM object or Wikidata entity, suspect as a whole on a wrong record.
+LINKED_FIELDS = ("osm_id", "wikidata", "wikipedia", "location")
+# Geo blocks in degrees, records are compared with their own and the neighbouring cells.
+CELL_SIZE = 0.25
+# Same-named records closer than this share a location.
+NEAR_KM = 1.0
+# Neighbour cells visited from every cell, so each pair of adjacent cells is compared once.
+_FORWARD_CELLS = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+
+SLIM_FIELDS = ("katotth_id", "name", "category", "hromada_id", "hromada_name", "district_name", "oblast_name", "location") + ID_FIELDS
+
+
+def name_key(settlement):
+    """Blocking key of a name: the normalized name, areas and settlements never match each other."""
+    return normalize(settlement.get("name") or ""), is_area_type(settlement)
+
+def geo_cell(location):
+    return math.floor(location[0] / CELL_SIZE), math.floor(location[1] / CELL_SIZE)
+
+def _has_location(settlement):
+    location = settlement.get("location")
+    return bool(location) and len(location) >= 2
+
+
+class ConflictFinder:
+    """
+    Finds records that claim the same place or the same external ID.
+
+    Work stays linear: shared IDs are grouped by hashing, and location comparisons only
+    run inside blocks of the same normalized name and neighbouring geo cells. With a
+    reverse geocoder, locations are also placed in hromadas, which tells which of two
+    same-named records a location (and the IDs that came with it) belongs to.
+    """
+
+    def __init__(self, settlements, geocoder=None):
+        self.records = [{field: settlement.get(field) for field in SLIM_FIELDS} for settlement in settlements]
+        self.name_keys = [name_key(record) for record in self.records]
+        self.located_hromadas = [None] * len(self.records)
+        if geocoder is not None:
+            rows = [row for row, record in enumerate(self.records) if _has_location(record)]
+            if rows:
+                coordinates = np.array([self.records[row]["location"][:2] for row in rows], dtype=np.float64)
+                chains = geocoder.locate_chains(coordinates[:, 0], coordinates[:, 1])
+                for row, hromada_id in zip(rows, chains[:, 2].tolist()):
+                    self.located_hromadas[row] = hromada_id or None
+
+    def _in_own_hromada(self, row):
+        """True/False if the location of a row is inside/outside its hromada, None if unknown."""
+        record = self.records[row]
+        if self.located_hromadas[row] is None or not record.get("hromada_id"):
+            return None
+        return self.located_hromadas[row] == record["hromada_id"]
+
+    def _conflict(self, kind, rows, field=None, value=None, owner=None):
+        records = [self.records[row] for row in rows]
+        locations = [record["location"] for record in records if _has_location(record)]
+        distance = None
+        if len(locations) > 1:
+            lons, lats = np.array([location[0] for location in locations]), np.array([location[1] for location in locations])
+            distance = round(float(haversine_km(lons[:, None], lats[:, None], lons[None, :], lats[None, :]).max()), 3)
+        return {
+            "kind": kind,
+            "field": field,
+            "value": value,
+            "katotth_ids": [record["katotth_id"] for record in records],
+            "names": [record["name"] for record in records],
+            "hromadas": [record["hromada_name"] for record in records],
+            "distance_km": distance,
+            "owner": self.records[owner]["katotth_id"] if owner is not None else None,
+            "suspects": [record["katotth_id"] for row, record in zip(rows, records) if owner is not None and row != owner],
+        }
+
+    def shared_ids(self):
+        """
+        Records sharing an osm_id or Wikidata ID. Among same-named records this is a cross
+        assignment, the owner is the only claimant located inside its own hromada.
+        """
+        conflicts = []
+        for field in ID_FIELDS:
+            groups = dict()
+            for row, record in enumerate(self.records):
+                if record.get(field):
+                    groups.setdefault(record[field], []).append(row)
+            for value, rows in groups.items():
+                if len(rows) < 2:
+                    continue
+                same_name = len({self.name_keys[row] for row in rows}) == 1
+                consistent = [row for row in rows if self._in_own_hromada(row)]
+                owner = consistent[0] if len(consistent) == 1 else None
+                conflicts.append(self._conflict("cross_assignment" if same_name else "shared_id", rows, field, value, owner))
+        return conflicts
+
+    def misplaced(self):
+        """
+        Records located in another hromada that has a record of the same name: the
+        location and its linked IDs likely belong to that record.
+        """
+        by_hromada = dict()
+        for row, record in enumerate(self.records):
+            if record.get("hromada_id"):
+                by_hromada.setdefault((self.name_keys[row], record["hromada_id"]), []).append(row)
+        conflicts = []
+        for row, hromada_id in enumerate(self.located_hromadas):
+            if hromada_id is None or self._in_own_hromada(row) is not False:
+                continue
+            others = by_hromada.get((self.name_keys[row], hromada_id), [])
+            if len(others) == 1:
+                conflicts.append(self._conflict("cross_assignment", [row, others[0]], "location", None, others[0]))
+        return conflicts
+
+    def same_locations(self):
+        """Same-named records with near-identical locations, compared within name and geo cell blocks."""
+        blocks = dict()
+        for row, record in enumerate(self.records):
+            if _has_location(record):
+                blocks.setdefault((self.name_keys[row], geo_cell(record["location"])), []).append(row)
+        conflicts = []
+        for (key, (cell_x, cell_y)), rows in blocks.items():
+            for step_x, step_y in _FORWARD_CELLS:
+                others = rows if (step_x, step_y) == (0, 0) else blocks.get((key, (cell_x + step_x, cell_y + step_y)), [])
+                for position, row in enumerate(rows):
+                    for other in (others[position + 1:] if others is rows else others):
+                        a, b = self.records[row]["location"], self.records[other]["location"]
+                        if float(haversine_km(a[0], a[1], b[0], b[1])) >= NEAR_KM:
+                            continue
+                        consistent = [candidate for candidate in (row, other) if self._in_own_hromada(candidate)]
+                        owner = consistent[0] if len(consistent) == 1 else None
+                        conflicts.append(self._conflict("same_location", [row, other], "location", None, owner))
+        return conflicts
+
+    def find(self):
+        """All conflicts: shared IDs, misplaced locations and shared locations."""
+        conflicts = self.shared_ids() + self.misplaced()
+        # A misplaced pair with near-identical locations is reported once, as a misplacement.
+        reported = {frozenset(conflict["katotth_ids"]) for conflict in conflicts if conflict["field"] == "location"}
+        conflicts += [conflict for conflict in self.same_locations() if frozenset(conflict["katotth_ids"]) not in reported]
+        return conflicts
+
+
+def find_conflicts(settlements, geocoder=None):
+    return ConflictFinder(settlements, geocoder).find()
+
+def suspect_fields(conflict):
+    """{katotth_id: fields} that should be dropped to resolve a conflict, {} when no owner is known."""
+    if conflict["owner"] is None:
+        return dict()
+    fields = (conflict["field"],) if conflict["kind"] == "shared_id" else LINKED_FIELDS
+    return {katotth_id: fields for katotth_id in conflict["suspects"]}
+
+def conflict_table(conflicts):
+    """Conflicts as CSV rows, lists joined with ';'."""
+    return [
+        {key: ";".join(str(item) for item in value) if isinstance(value, list) else value for key, value in conflict.items()}
+        for conflict in conflicts
+    ]
+
+def load_geocoder(path=REVERSE_GEOCODER_FILE):
+    """The prebuilt reverse geocoder, None if it has not been built."""
+    if not os.path.exists(path):
+        logger.info(f"{path} not found, conflicts are reported without owners.")
+        return None
+    return ReverseGeocoder.load(path)
+
+def report_conflicts():
+    """Finds the conflicts of settlements.json and saves them to conflicts.csv."""
+    start_time = time.time()
+    data_file = os.path.join("assets", "data", "settlements.json")
+    conflicts = find_conflicts(load_json(data_file), load_geocoder())
+    counts = dict()
+    for conflict in conflicts:
+        counts[conflict["kind"]] = counts.get(conflict["kind"], 0) + 1
+    logger.info(f"{len(conflicts)} conflicts found in {time.time() - start_time:.2f} seconds: {counts}")
+    if conflicts:
+        save_table(conflict_table(conflicts), REPORT_FILE)
+        logger.info(f"Conflicts report saved to {REPORT_FILE}")
+    return conflicts
+
+if __name__ == '__main__':
+    report_conflicts()
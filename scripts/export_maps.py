@@ -0,0 +1,201 @@
+import os
+import re
+import json
+import time
+import logging
+from json_codec import load_json, dumps_json
+from map_index import MAP_LAYERS
+from rollup import save_table
+from topology import Topology, topojson_to_geojson
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+OUTPUT_DIR = os.path.join("assets", "maps", "topo")
+ARCHIVE_DIR = os.path.join("decentralization_reform_map_archive", "data")
+
+# Admin polygon layers to export with the property used as the feature id.
+EXPORT_LAYERS = {
+    **{layer: {"file": config["file"], "key": "katotth"} for layer, config in MAP_LAYERS.items()},
+    "volyn1906": {"file": os.path.join("assets", "maps", "old_maps", "ri", "volyn1906.geojson"), "key": None},
+    "ua2021_oblasti": {"file": os.path.join("assets", "maps", "old_maps", "ua-2021", "ADMIN_1.geojson"), "key": None},
+    "koatuu_raions": {"file": os.path.join("assets", "maps", "old_maps", "ua-koatuu", "raions.geojson"), "key": "KOATUU"},
+    "ADMIN_1_3": {"file": os.path.join(ARCHIVE_DIR, "ADMIN_1_3.js"), "key": "COD_1"},
+}
+
+# Zoom levels of the exported pyramid, the simplification tolerance of a level is one pixel.
+ZOOM_LEVELS = (4, 6, 8, 10)
+# Zoom level of the geometries loaded by the archive map (its minimal zoom is 6).
+ARCHIVE_ZOOM = 8
+ARCHIVE_LAYERS = ("ADMIN_1_3",)
+# Point layers of the archive map and the properties its popups read.
+ARCHIVE_POINT_LAYERS = ("Tergromada_4", "Rayon_5", "Oblast_6", "Capital_7")
+ARCHIVE_POINT_PROPERTIES = ("ADMIN_1", "ADMIN_2", "ADMIN_3", "Name_NP", "Type_NP")
+# Decimal places of archive coordinates, about 1 m.
+ARCHIVE_PRECISION = 5
+# Decimal places of the points exported next to the polygons of a mixed layer.
+POINT_PRECISION = ARCHIVE_PRECISION
+
+_JS_VARIABLE = re.compile(r"var\s+(json_\w+)\s*=\s*")
+
+def zoom_tolerance(zoom):
+    """Size of one 256px tile pixel in degrees at a zoom level."""
+    return 360 / (256 * 2 ** zoom)
+
+def read_layer(path):
+    """Reads a GeoJSON file or a qgis2web data script (var json_X = {...}), returns the FeatureCollection."""
+    if not path.endswith(".js"):
+        return load_json(path) or {}
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    match = _JS_VARIABLE.search(text)
+    if not match:
+        raise ValueError(f"No json_ variable found in {path}")
+    data, _ = json.JSONDecoder().raw_decode(text, match.end())
+    return data
+
+def write_js_layer(data, variable, path):
+    """Writes a FeatureCollection as a data script for the archive map."""
+    with open(path, 'wb') as f:
+        f.write(f"var {variable} = ".encode("utf-8"))
+        f.write(dumps_json(data, pretty=False))
+        f.write(b";\n")
+
+# Rebuilds the FeatureCollection of a point layer from its columns when the data script loads.
+_POINTS_DECODER = (
+    "(function (columns, coordinates, scale) {\n"
+    "    var features = [];\n"
+    "    for (var row = 0; row < coordinates.length / 2; row++) {\n"
+    "        var properties = {};\n"
+    "        for (var name in columns) {\n"
+    "            var values = columns[name];\n"
+    "            properties[name] = values[0] ? values[0][values[1][row]] : values[1][row];\n"
+    "        }\n"
+    "        var point = [coordinates[2 * row] / scale, coordinates[2 * row + 1] / scale];\n"
+    "        features.push({type: 'Feature', properties: properties, geometry: {type: 'Point', coordinates: point}});\n"
+    "    }\n"
+    "    return {type: 'FeatureCollection', features: features};\n"
+    "})"
+)
+
+def write_js_points(features, properties, variable, path, precision):
+    """
+    Writes Point features as a compact data script: property columns (repeated values as
+    a dictionary and indexes) and integer coordinates, decoded into a FeatureCollection.
+    """
+    columns = dict()
+    for key in properties:
+        values = [feature.get("properties", {}).get(key) for feature in features]
+        dictionary = list(dict.fromkeys(values))
+        if 2 * len(dictionary) < len(values):
+            positions = {value: position for position, value in enumerate(dictionary)}
+            columns[key] = [dictionary, [positions[value] for value in values]]
+        else:
+            columns[key] = [None, values]
+    scale = 10 ** precision
+    coordinates = [round(value * scale) for feature in features for value in feature["geometry"]["coordinates"][:2]]
+    with open(path, 'wb') as f:
+        f.write(f"var {variable} = {_POINTS_DECODER}(".encode("utf-8"))
+        f.write(dumps_json(columns, pretty=False))
+        f.write(b",")
+        f.write(dumps_json(coordinates, pretty=False))
+        f.write(f",{scale});\n".encode("utf-8"))
+
+def export_layer(layer, config, output_dir=OUTPUT_DIR, zoom_levels=ZOOM_LEVELS):
+    """
+    Builds the topology of a layer and writes one TopoJSON file per zoom level. Point
+    features, which the topology leaves out, are written to points.js of the layer.
+
+    Returns the topology, the importance of its vertices and the report rows.
+    """
+    start_time = time.time()
+    source_size = os.path.getsize(config["file"])
+    features = read_layer(config["file"]).get("features", [])
+    topology = Topology(features, config["key"])
+    points = [feature for feature in features if (feature.get("geometry") or {}).get("type") == "Point"]
+    skipped = len(features) - len(topology.ids)
+    if skipped:
+        logger.warning(f"{layer}: {skipped} of {len(features)} features are not polygons or lines, {len(points)} of them points.")
+
+    layer_dir = os.path.join(output_dir, layer)
+    points_size = 0
+    if points:
+        os.makedirs(layer_dir, exist_ok=True)
+        properties = list(dict.fromkeys(key for feature in points for key in feature.get("properties") or {}))
+        path = os.path.join(layer_dir, "points.js")
+        write_js_points(points, properties, f"json_{layer}_points", path, POINT_PRECISION)
+        points_size = os.path.getsize(path)
+        logger.info(f"{layer}: {len(points)} points saved to {path} ({points_size / 1024:.0f} KB)")
+    if not topology.arcs:
+        logger.warning(f"{layer}: no polygons in {config['file']}, skipping.")
+        return topology, [], []
+    importance = topology.importance()
+    source_vertices = topology.vertex_count()
+    logger.info(f"{layer}: {len(topology.ids)} features, {len(topology.arcs)} arcs, {source_vertices} vertices, topology built in {time.time() - start_time:.2f} seconds.")
+
+    os.makedirs(layer_dir, exist_ok=True)
+    report = []
+    for zoom in zoom_levels:
+        topojson = topology.to_topojson(layer, zoom_tolerance(zoom), importance)
+        path = os.path.join(layer_dir, f"z{zoom}.topojson")
+        with open(path, 'wb') as f:
+            f.write(dumps_json(topojson, pretty=False))
+        vertices = sum(len(arc) for arc in topojson["arcs"])
+        # The source size includes the points, so they count towards the exported size too.
+        size = os.path.getsize(path) + points_size
+        report.append({
+            "layer": layer,
+            "zoom": zoom,
+            "features": len(topology.ids),
+            "points": len(points),
+            "arcs": len(topojson["arcs"]),
+            "vertices": vertices,
+            "source_vertices": source_vertices,
+            "size_kb": round(size / 1024, 1),
+            "source_size_kb": round(source_size / 1024, 1),
+            "size_ratio": round(size / source_size, 3),
+        })
+        logger.info(f"{layer} z{zoom}: {vertices} vertices ({100 * vertices / source_vertices:.1f}%), {size / 1024:.0f} KB ({100 * size / source_size:.1f}% of source)")
+    return topology, importance, report
+
+def export_archive_layer(layer, topology, importance, zoom=ARCHIVE_ZOOM, archive_dir=ARCHIVE_DIR):
+    """Writes the simplified geometries of an archive map layer to data/<layer>.min.js."""
+    tolerance = zoom_tolerance(zoom)
+    geojson = topojson_to_geojson(topology.to_topojson(layer, tolerance, importance), layer, precision=ARCHIVE_PRECISION)
+    path = os.path.join(archive_dir, f"{layer}.min.js")
+    write_js_layer(geojson, f"json_{layer}", path)
+    logger.info(f"Archive layer {layer} saved to {path} ({os.path.getsize(path) / 1024:.0f} KB)")
+
+def export_archive_points(layer, archive_dir=ARCHIVE_DIR, properties=ARCHIVE_POINT_PROPERTIES, precision=ARCHIVE_PRECISION):
+    """
+    Writes a point layer of the archive map to data/<layer>.min.js with only the properties
+    of the popups, quantized coordinates and none of the web archive wrapper code.
+    """
+    source = os.path.join(archive_dir, f"{layer}.js")
+    features = [feature for feature in read_layer(source).get("features", []) if (feature.get("geometry") or {}).get("type") == "Point"]
+    path = os.path.join(archive_dir, f"{layer}.min.js")
+    write_js_points(features, properties, f"json_{layer}", path, precision)
+    logger.info(f"Archive layer {layer} saved to {path} ({os.path.getsize(path) / 1024:.0f} KB, {os.path.getsize(source) / 1024:.0f} KB before)")
+
+def export_maps(layers=EXPORT_LAYERS, output_dir=OUTPUT_DIR):
+    """Exports the multi-resolution TopoJSON pyramid of every admin layer and the report."""
+    start_time = time.time()
+    report = []
+    for layer, config in layers.items():
+        if not os.path.exists(config["file"]):
+            logger.warning(f"Map file {config['file']} not found, skipping {layer} layer.")
+            continue
+        topology, importance, layer_report = export_layer(layer, config, output_dir)
+        report.extend(layer_report)
+        if layer in ARCHIVE_LAYERS and topology.arcs:
+            export_archive_layer(layer, topology, importance)
+    for layer in ARCHIVE_POINT_LAYERS:
+        if os.path.exists(os.path.join(ARCHIVE_DIR, f"{layer}.js")):
+            export_archive_points(layer)
+
+    save_table(report, os.path.join(output_dir, "report.csv"))
+    logger.info(f"Maps exported to {output_dir} in {time.time() - start_time:.2f} seconds.")
+    return report
+
+if __name__ == '__main__':
+    export_maps()
@@ -0,0 +1,100 @@
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = np.pi * EARTH_RADIUS_KM / 180
+
+# Upper bound of point x edge pairs tested at once, keeps temporary arrays small.
+MAX_PAIRS = 1 << 22
+
+def geometry_rings(geometry):
+    """
+    Returns the polygons of a GeoJSON Polygon or MultiPolygon as lists of rings,
+    each ring an (n, 2) float array of lon/lat with the first point repeated at the end.
+    """
+    if not geometry:
+        return []
+    geometry_type = geometry.get("type")
+    coordinates = geometry.get("coordinates") or []
+    if geometry_type == "Polygon":
+        polygons = [coordinates]
+    elif geometry_type == "MultiPolygon":
+        polygons = coordinates
+    else:
+        return []
+
+    result = []
+    for polygon in polygons:
+        rings = []
+        for ring in polygon:
+            if len(ring) < 3:
+                continue
+            ring = np.asarray(ring, dtype=np.float64)[:, :2]
+            if not np.array_equal(ring[0], ring[-1]):
+                ring = np.vstack([ring, ring[:1]])
+            rings.append(ring)
+        if rings:
+            result.append(rings)
+    return result
+
+def rings_edges(rings):
+    """Stacks the edges of rings into an (n, 4) array of x1, y1, x2, y2."""
+    if not rings:
+        return np.empty((0, 4))
+    return np.vstack([np.hstack([ring[:-1], ring[1:]]) for ring in rings])
+
+def points_in_edges(xs, ys, edges):
+    """
+    Even-odd point in polygon test of many points against the edges of all rings of a
+    (multi)polygon, so holes and separate parts are handled in one go.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    inside = np.zeros(len(xs), dtype=bool)
+    if len(xs) == 0 or len(edges) == 0:
+        return inside
+
+    x1, y1, x2, y2 = edges[:, 0], edges[:, 1], edges[:, 2], edges[:, 3]
+    step = max(1, MAX_PAIRS // len(edges))
+    for start in range(0, len(xs), step):
+        px = xs[start:start + step, None]
+        py = ys[start:start + step, None]
+        crosses = (y1 > py) != (y2 > py)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_cross = x1 + (py - y1) * (x2 - x1) / (y2 - y1)
+        crosses &= px < x_cross
+        inside[start:start + step] = np.count_nonzero(crosses, axis=1) % 2 == 1
+    return inside
+
+def distance_to_edges_km(xs, ys, edges):
+    """
+    Distance in kilometers from each point to the nearest edge, on a local
+    equirectangular projection which is accurate enough at the scale of Ukraine.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    distances = np.full(len(xs), np.inf)
+    if len(xs) == 0 or len(edges) == 0:
+        return distances
+
+    step = max(1, MAX_PAIRS // len(edges))
+    for start in range(0, len(xs), step):
+        py = ys[start:start + step, None]
+        scale = np.cos(np.radians(py))
+        px = xs[start:start + step, None] * scale
+        x1, x2 = edges[:, 0] * scale, edges[:, 2] * scale
+        y1, y2 = edges[:, 1], edges[:, 3]
+        dx, dy = x2 - x1, y2 - y1
+        length = dx * dx + dy * dy
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.clip(((px - x1) * dx + (py - y1) * dy) / length, 0, 1)
+        t = np.where(length > 0, t, 0)
+        nearest_x = x1 + t * dx - px
+        nearest_y = y1 + t * dy - py
+        distances[start:start + step] = np.sqrt((nearest_x ** 2 + nearest_y ** 2).min(axis=1)) * KM_PER_DEGREE
+    return distances
+
+def haversine_km(lon1, lat1, lon2, lat2):
+    """Great-circle distance in kilometers, works on scalars and arrays."""
+    lon1, lat1, lon2, lat2 = (np.radians(np.asarray(value, dtype=np.float64)) for value in (lon1, lat1, lon2, lat2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
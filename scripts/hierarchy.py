@@ -0,0 +1,167 @@
+import logging
+from array import array
+from json_codec import iter_json_array
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Depths of the KATOTTH levels, they match the kodifikator column positions.
+DEPTH_OBLAST = 0
+DEPTH_DISTRICT = 1
+DEPTH_HROMADA = 2
+DEPTH_SETTLEMENT = 3
+DEPTH_CITY_DISTRICT = 4
+
+# Fields kept by Hierarchy.from_file, enough for names and levels of the ancestors.
+HIERARCHY_FIELDS = ("katotth_id", "parent_katotth", "name", "category")
+
+
+class Hierarchy:
+    """
+    KATOTTH tree built from katotth_id/parent_katotth.
+
+    Nodes are numbered in DFS preorder, so the subtree of a node is the row range
+    [row, exit_row) (an Euler tour interval). Together with the stored root paths
+    this gives constant time parent, ancestor-at-depth, ancestor test and subtree
+    range queries.
+    """
+
+    def __init__(self, settlements):
+        nodes = []
+        rows_by_id = {}
+        for settlement in settlements:
+            katotth_id = settlement.get("katotth_id")
+            if not katotth_id:
+                continue
+            if katotth_id in rows_by_id:
+                logger.warning(f"Duplicate katotth_id {katotth_id} ignored in hierarchy.")
+                continue
+            rows_by_id[katotth_id] = len(nodes)
+            nodes.append(settlement)
+
+        node_children = [[] for _ in nodes]
+        roots = []
+        for node_row, settlement in enumerate(nodes):
+            parent_row = rows_by_id.get(settlement.get("parent_katotth"))
+            if parent_row is None or parent_row == node_row:
+                if settlement.get("parent_katotth"):
+                    logger.warning(f"Parent {settlement.get('parent_katotth')} of {settlement.get('katotth_id')} not found.")
+                roots.append(node_row)
+            else:
+                node_children[parent_row].append(node_row)
+
+        self.ids = []
+        self.records = []
+        self.index = {}
+        self.parents = array("i")
+        self.exits = array("i")
+        self.paths = []
+        self._children = []
+
+        # Iterative DFS, children keep their input order.
+        stack = [(node_row, -1) for node_row in reversed(roots)]
+        while stack:
+            node_row, parent_row = stack.pop()
+            if node_row < 0:
+                self.exits[~node_row] = len(self.ids)
+                continue
+            row = len(self.ids)
+            settlement = nodes[node_row]
+            self.ids.append(settlement["katotth_id"])
+            self.records.append(settlement)
+            self.index[settlement["katotth_id"]] = row
+            self.parents.append(parent_row)
+            self.exits.append(row + 1)
+            self.paths.append((self.paths[parent_row] if parent_row >= 0 else ()) + (row,))
+            self._children.append([])
+            if parent_row >= 0:
+                self._children[parent_row].append(row)
+            stack.append((~row, parent_row))
+            for child_row in reversed(node_children[node_row]):
+                stack.append((child_row, row))
+
+        if len(self.ids) < len(nodes):
+            logger.warning(f"{len(nodes) - len(self.ids)} settlements are in parent cycles and left out of the hierarchy.")
+
+    @classmethod
+    def from_file(cls, path, fields=HIERARCHY_FIELDS):
+        """Builds the hierarchy from settlements.json, keeping only the given fields of each record."""
+        return cls({key: settlement[key] for key in fields if key in settlement} for settlement in iter_json_array(path))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, katotth_id):
+        return katotth_id in self.index
+
+    def get(self, katotth_id):
+        """Returns the record of a node or None."""
+        row = self.index.get(katotth_id)
+        return None if row is None else self.records[row]
+
+    def name(self, katotth_id):
+        """Returns the name of a node or None."""
+        record = self.get(katotth_id)
+        return record.get("name") if record else None
+
+    def depth(self, katotth_id):
+        """Returns the depth of a node, DEPTH_OBLAST for the roots, or None."""
+        row = self.index.get(katotth_id)
+        return None if row is None else len(self.paths[row]) - 1
+
+    def parent(self, katotth_id):
+        """Returns the katotth_id of the parent or None."""
+        row = self.index.get(katotth_id)
+        if row is None or self.parents[row] < 0:
+            return None
+        return self.ids[self.parents[row]]
+
+    def ancestor(self, katotth_id, depth):
+        """Returns the ancestor at the given depth (the node itself at its own depth) or None."""
+        row = self.index.get(katotth_id)
+        if row is None:
+            return None
+        path = self.paths[row]
+        return self.ids[path[depth]] if 0 <= depth < len(path) else None
+
+    def ancestors(self, katotth_id):
+        """Returns ancestor katotth_ids from the root down to the parent."""
+        row = self.index.get(katotth_id)
+        if row is None:
+            return []
+        return [self.ids[ancestor_row] for ancestor_row in self.paths[row][:-1]]
+
+    def is_ancestor(self, ancestor_id, katotth_id):
+        """True if ancestor_id is a proper ancestor of katotth_id."""
+        ancestor_row = self.index.get(ancestor_id)
+        row = self.index.get(katotth_id)
+        if ancestor_row is None or row is None:
+            return False
+        return ancestor_row < row < self.exits[ancestor_row]
+
+    def children(self, katotth_id):
+        """Returns katotth_ids of the direct children."""
+        row = self.index.get(katotth_id)
+        if row is None:
+            return []
+        return [self.ids[child_row] for child_row in self._children[row]]
+
+    def subtree_range(self, katotth_id):
+        """Returns the (start, end) row range of a node and all its descendants."""
+        row = self.index.get(katotth_id)
+        if row is None:
+            return (0, 0)
+        return (row, self.exits[row])
+
+    def subtree(self, katotth_id):
+        """Returns katotth_ids of the node and all its descendants in preorder."""
+        start, end = self.subtree_range(katotth_id)
+        return self.ids[start:end]
+
+    def descendants(self, katotth_id, category=None):
+        """Returns records of all descendants, optionally of one category."""
+        start, end = self.subtree_range(katotth_id)
+        records = self.records[start + 1:end]
+        if category:
+            records = [record for record in records if record.get("category") == category]
+        return records
@@ -0,0 +1,121 @@
+import os
+import time
+import logging
+import numpy as np
+from geometry import KM_PER_DEGREE
+from map_index import MAP_LAYERS
+from polygon_metrics import geodesic_areas_km2
+from rollup import save_table
+from spatial_index import PolygonLayer
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+OUTPUT_DIR = os.path.join("assets", "data", "crosswalk")
+
+# Historic polygon layers with the properties used as id and name of their units.
+HISTORIC_LAYERS = {
+    "volyn1906": {"file": os.path.join("assets", "maps", "old_maps", "ri", "volyn1906.geojson"), "key": "Distr_ID", "name": "Name_RU"},
+}
+MODERN_LAYER = "communities"
+
+# Spacing of the sample grid in degrees, about 0.2 km² per sample in Volhynia.
+SAMPLE_SIZE = 0.005
+# Sample rows located at once, keeps memory flat for large governorates.
+ROWS_PER_CHUNK = 64
+
+
+def overlay_areas(historic_layer, modern_layer, sample_size=SAMPLE_SIZE):
+    """
+    Overlap areas between the features of two polygon layers.
+
+    A regular grid of sample points over the historic layer's bounding box is located
+    in both layers through their grid indexes, each sample standing for the area of its
+    cell. The cost grows with the area of the historic layer, not with the number of
+    polygon pairs.
+
+    Returns (historic_rows, modern_rows, areas_km2, historic_areas_km2) where the last
+    one holds the sampled area of every historic feature.
+    """
+    historic_areas = np.zeros(len(historic_layer))
+    pair_areas = dict()
+    if len(historic_layer) == 0 or len(modern_layer) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0), historic_areas
+
+    min_x, min_y = historic_layer.bboxes[:, 0].min(), historic_layer.bboxes[:, 1].min()
+    max_x, max_y = historic_layer.bboxes[:, 2].max(), historic_layer.bboxes[:, 3].max()
+    xs = np.arange(min_x + sample_size / 2, max_x, sample_size)
+    ys = np.arange(min_y + sample_size / 2, max_y, sample_size)
+    for start in range(0, len(ys), ROWS_PER_CHUNK):
+        grid_x, grid_y = np.meshgrid(xs, ys[start:start + ROWS_PER_CHUNK])
+        grid_x, grid_y = grid_x.ravel(), grid_y.ravel()
+        historic_rows = historic_layer.locate(grid_x, grid_y)
+        inside = historic_rows >= 0
+        grid_x, grid_y, historic_rows = grid_x[inside], grid_y[inside], historic_rows[inside]
+        cell_areas = (sample_size * KM_PER_DEGREE) ** 2 * np.cos(np.radians(grid_y))
+        historic_areas += np.bincount(historic_rows, weights=cell_areas, minlength=len(historic_layer))
+
+        modern_rows = modern_layer.locate(grid_x, grid_y)
+        matched = modern_rows >= 0
+        pair_keys = historic_rows[matched] * len(modern_layer) + modern_rows[matched]
+        unique_keys, pair_index = np.unique(pair_keys, return_inverse=True)
+        for key, area in zip(unique_keys.tolist(), np.bincount(pair_index.ravel(), weights=cell_areas[matched]).tolist()):
+            pair_areas[key] = pair_areas.get(key, 0.0) + area
+
+    keys = np.array(list(pair_areas), dtype=np.int64)
+    return keys // len(modern_layer), keys % len(modern_layer), np.array(list(pair_areas.values())), historic_areas
+
+def build_crosswalk(historic_layer, modern_layer, name_key, sample_size=SAMPLE_SIZE):
+    """
+    Many-to-many crosswalk between historic units and modern features.
+
+    Every row holds the overlap area and the shares of the overlap in the historic unit
+    (historic_share) and in the modern feature (modern_share, against its geodesic area).
+    """
+    historic_rows, modern_rows, areas, historic_areas = overlay_areas(historic_layer, modern_layer, sample_size)
+    modern_areas = geodesic_areas_km2(modern_layer)
+    crosswalk = []
+    for historic_row, modern_row, area in zip(historic_rows.tolist(), modern_rows.tolist(), areas.tolist()):
+        crosswalk.append({
+            "historic_id": historic_layer.ids[historic_row],
+            "historic_name": historic_layer.properties[historic_row].get(name_key),
+            "katotth": modern_layer.ids[modern_row],
+            "modern_name": modern_layer.properties[modern_row].get("name"),
+            "overlap_km2": round(area, 2),
+            "historic_share": round(area / float(historic_areas[historic_row]), 4),
+            "modern_share": round(min(area / float(modern_areas[modern_row]), 1.0), 4),
+        })
+    crosswalk.sort(key=lambda row: (str(row["historic_id"]), -row["overlap_km2"]))
+
+    uncovered = historic_areas.sum() - areas.sum()
+    if historic_areas.sum() > 0 and uncovered / historic_areas.sum() > 0.01:
+        logger.warning(f"{100 * uncovered / historic_areas.sum():.1f}% of the historic area is not covered by the modern layer.")
+    return crosswalk
+
+
+def build_historic_crosswalks(historic_layers=HISTORIC_LAYERS, modern_layer=MODERN_LAYER, output_dir=OUTPUT_DIR):
+    """Builds the crosswalk of every historic layer to the modern layer, saves crosswalk/<layer>.csv."""
+    modern_file = MAP_LAYERS[modern_layer]["file"]
+    if not os.path.exists(modern_file):
+        logger.warning(f"Map file {modern_file} not found, no crosswalk built.")
+        return dict()
+    modern = PolygonLayer.from_file(modern_file)
+    if len(modern) == 0:
+        logger.warning(f"No polygons in {modern_file}, no crosswalk built.")
+        return dict()
+
+    os.makedirs(output_dir, exist_ok=True)
+    crosswalks = dict()
+    for layer, config in historic_layers.items():
+        if not os.path.exists(config["file"]):
+            logger.warning(f"Historic map {config['file']} not found, skipping {layer}.")
+            continue
+        start_time = time.time()
+        historic = PolygonLayer.from_file(config["file"], key=config["key"])
+        crosswalks[layer] = build_crosswalk(historic, modern, config["name"])
+        save_table(crosswalks[layer], os.path.join(output_dir, f"{layer}.csv"))
+        logger.info(f"{layer}: {len(historic)} historic units, {len(crosswalks[layer])} links to {modern_layer} in {time.time() - start_time:.2f} seconds.")
+    return crosswalks
+
+if __name__ == '__main__':
+    build_historic_crosswalks()
@@ -0,0 +1,220 @@
+import json
+import os
+import re
+import logging
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Set UA_SETTLEMENTS_JSON_BACKEND=json to force the standard library codec.
+BACKEND_ENV = "UA_SETTLEMENTS_JSON_BACKEND"
+
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+_INCOMPLETE = object()
+
+
+def _stdlib_loads(data):
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8-sig")
+    return json.loads(data)
+
+def _stdlib_dumps(data, pretty=True):
+    if pretty:
+        text = json.dumps(data, ensure_ascii=False, indent=2)
+    else:
+        text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8")
+
+def _orjson_loads(data):
+    if isinstance(data, (bytes, bytearray)) and data.startswith(b"\xef\xbb\xbf"):
+        data = data[3:]
+    return orjson.loads(data)
+
+def _orjson_dumps(data, pretty=True):
+    # OPT_INDENT_2 produces the same bytes as json.dump(..., ensure_ascii=False, indent=2)
+    # for our data; only floats in exponent notation are spelled differently.
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+
+CODECS = {"json": (_stdlib_loads, _stdlib_dumps)}
+if orjson is not None:
+    CODECS["orjson"] = (_orjson_loads, _orjson_dumps)
+
+
+def get_backend():
+    """Returns the name of the codec used by load_json and save_json."""
+    backend = os.environ.get(BACKEND_ENV)
+    if backend:
+        if backend in CODECS:
+            return backend
+        logger.warning(f"JSON backend '{backend}' is not available, using the default one.")
+    return "orjson" if "orjson" in CODECS else "json"
+
+def loads_json(data, backend=None):
+    """Parses JSON from str or bytes."""
+    loads, _ = CODECS[backend or get_backend()]
+    return loads(data)
+
+def dumps_json(data, pretty=True, backend=None):
+    """
+    Serializes data to UTF-8 encoded JSON bytes.
+
+    Pretty mode matches json.dump(..., ensure_ascii=False, indent=2), compact mode drops all whitespace.
+    """
+    _, dumps = CODECS[backend or get_backend()]
+    return dumps(data, pretty)
+
+def load_json(path, backend=None):
+    """Loads a JSON file."""
+    with open(path, "rb") as f:
+        return loads_json(f.read(), backend)
+
+def save_json(data, path, pretty=True, backend=None):
+    """Saves data to a JSON file, pretty printed by default."""
+    with open(path, "wb") as f:
+        f.write(dumps_json(data, pretty, backend))
+
+def _expect_end(f, buffer, pos, chunk_size, path):
+    """Raises ValueError unless only whitespace follows pos up to the end of the file."""
+    while True:
+        pos = _skip_whitespace(buffer, pos)
+        if pos < len(buffer):
+            raise ValueError(f"Extra data after the JSON array at character {pos} of the buffer in {path}.")
+        buffer, pos = f.read(chunk_size), 0
+        if not buffer:
+            return
+
+def iter_json_array(path, chunk_size=1 << 16):
+    """
+    Yields the elements of a top-level JSON array one at a time.
+
+    Only the element being decoded and one read chunk are held in memory,
+    so settlements.json can be processed without loading it as a whole.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8-sig") as f:
+        buffer = f.read(chunk_size)
+        pos = _skip_whitespace(buffer, 0)
+        while pos == len(buffer) and buffer:
+            buffer = f.read(chunk_size)
+            pos = _skip_whitespace(buffer, 0)
+        if buffer[pos:pos + 1] != "[":
+            raise ValueError(f"{path} does not contain a JSON array.")
+        pos += 1
+        expect_separator = False
+        # A ',' was just read, so the array must go on with an element.
+        after_comma = False
+        eof = False
+        read_size = chunk_size
+        while True:
+            pos = _skip_whitespace(buffer, pos)
+            if pos < len(buffer):
+                char = buffer[pos]
+                if char == "]":
+                    if after_comma:
+                        raise ValueError(f"Trailing ',' before ']' at character {pos} of the buffer in {path}.")
+                    _expect_end(f, buffer, pos + 1, chunk_size, path)
+                    return
+                if expect_separator:
+                    if char != ",":
+                        raise ValueError(f"Expected ',' or ']' at character {pos} of the buffer in {path}.")
+                    pos += 1
+                    expect_separator = False
+                    after_comma = True
+                    continue
+                try:
+                    element, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    # The element is cut by the end of the buffer, read more.
+                    if eof:
+                        raise
+                    element = _INCOMPLETE
+                if element is not _INCOMPLETE:
+                    # A number cut by the buffer end still decodes, so the element
+                    # only counts as complete once the following separator is read.
+                    next_pos = _skip_whitespace(buffer, end)
+                    complete = eof or (next_pos < len(buffer) and buffer[next_pos] in ",]")
+                else:
+                    complete = False
+                if complete:
+                    yield element
+                    pos = end
+                    expect_separator = True
+                    after_comma = False
+                    read_size = chunk_size
+                    continue
+            elif eof:
+                raise ValueError(f"Unexpected end of {path}.")
+
+            chunk = f.read(read_size)
+            eof = not chunk
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            # Grow reads for elements larger than a chunk to keep re-parsing linear.
+            read_size *= 2
+
+def _skip_whitespace(text, pos):
+    return _WHITESPACE.match(text, pos).end()
+
+
+class JsonArrayWriter:
+    """
+    Streams elements into a JSON array file.
+
+    The output is byte-for-byte what save_json would write for the full list.
+    Data goes to a temporary file which replaces the target on close, so it is
+    safe to write the file that is being read with iter_json_array.
+    """
+
+    def __init__(self, path, pretty=True, backend=None):
+        self.path = path
+        self.pretty = pretty
+        self.backend = backend
+        self.count = 0
+        self._tmp_path = f"{path}.tmp"
+        self._file = open(self._tmp_path, "wb")
+
+    def write(self, element):
+        data = dumps_json(element, self.pretty, self.backend)
+        if self.pretty:
+            data = b"  " + data.replace(b"\n", b"\n  ")
+            self._file.write(b"[\n" if self.count == 0 else b",\n")
+        else:
+            self._file.write(b"[" if self.count == 0 else b",")
+        self._file.write(data)
+        self.count += 1
+
+    def write_all(self, elements):
+        for element in elements:
+            self.write(element)
+
+    def close(self):
+        if self._file.closed:
+            return
+        if self.count == 0:
+            self._file.write(b"[]")
+        else:
+            self._file.write(b"\n]" if self.pretty else b"]")
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self):
+        """Discards everything written so far and leaves the target file untouched."""
+        if not self._file.closed:
+            self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
@@ -0,0 +1,262 @@
+import os
+import time
+import hashlib
+import logging
+import numpy as np
+from source_tables import load_table
+from array_store import save_arrays, load_arrays
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+KODIFIKATOR_DIR = os.path.join("assets", "kodifikator")
+COMPARISON_FILE = os.path.join(KODIFIKATOR_DIR, "Порівняльна таблиця.csv")
+TRANSITION_FILE = os.path.join(KODIFIKATOR_DIR, "Перехідна таблиця з КОАТУУ на Кодифікатор.csv")
+KOATUU_FILE = os.path.join(KODIFIKATOR_DIR, "KOATUU_26112020.csv")
+INDEX_FILE = os.path.join("assets", "data", "koatuu_crosswalk.npz")
+
+# Confidence of a KOATUU - KATOTTH pair, best first:
+# exact      - the pair is in both the comparison and the transition tables,
+# comparison - only in the comparison table (a hromada and the council of its center),
+# transition - only in the transition table (a KOATUU unit merged into the KATOTTH one),
+# parent     - the KOATUU code is not in the tables, its nearest listed parent is.
+CONFIDENCE = ("exact", "comparison", "transition", "parent")
+NOT_FOUND = ""
+
+# KOATUU levels: oblast (2 digits), district or city (3), council (3), settlement (2).
+KOATUU_PARENT_DIVISORS = (10 ** 2, 10 ** 5, 10 ** 8)
+
+
+def parse_koatuu(codes):
+    """KOATUU codes (strings or numbers, leading zero optional) to int64, -1 for invalid ones."""
+    values = np.empty(len(codes), dtype=np.int64)
+    for position, code in enumerate(codes):
+        code = str(code).strip()
+        values[position] = int(code) if code.isdigit() and len(code) <= 10 else -1
+    return values
+
+def parse_katotth(codes):
+    """KATOTTH codes (UA + 17 digits) to int64, -1 for invalid ones."""
+    values = np.empty(len(codes), dtype=np.int64)
+    for position, code in enumerate(codes):
+        code = str(code).strip().upper()
+        values[position] = int(code[2:]) if len(code) == 19 and code.startswith("UA") and code[2:].isdigit() else -1
+    return values
+
+def format_koatuu(values):
+    return np.where(values >= 0, np.char.zfill(values.astype(str), 10), NOT_FOUND)
+
+def format_katotth(values):
+    return np.where(values >= 0, np.char.add("UA", np.char.zfill(values.astype(str), 17)), NOT_FOUND)
+
+def source_hashes(*paths):
+    """Start of the sha256 of every source table, a saved crosswalk is only reused for the same tables."""
+    hashes = []
+    for path in paths:
+        with open(path, "rb") as f:
+            hashes.append(hashlib.sha256(f.read()).hexdigest()[:16])
+    return np.array(hashes)
+
+def _unique_codes(codes, parse):
+    """Parses only the distinct codes: legacy registries repeat the same codes over many rows."""
+    unique, inverse = np.unique(np.asarray(codes, dtype=str), return_inverse=True)
+    return parse(unique.tolist()), inverse.ravel()
+
+
+class KoatuuCrosswalk:
+    """
+    Many-to-many KOATUU - KATOTTH crosswalk from the comparison table, the transition
+    table and the KOATUU register.
+
+    Every pair is kept once with its confidence rank. Pairs are stored twice, sorted by
+    (koatuu, rank) and by (katotth, rank), with the distinct codes and CSR offsets of
+    each order, so bulk translation is a searchsorted over the distinct codes.
+    """
+
+    ARRAYS = ("koatuu_keys", "koatuu_offsets", "koatuu_pairs", "koatuu_ranks", "koatuu_best",
+              "katotth_keys", "katotth_offsets", "katotth_pairs", "katotth_ranks", "katotth_best",
+              "register_codes", "register_names", "register_name_offsets", "sources")
+
+    def __init__(self, **arrays):
+        for name in self.ARRAYS:
+            setattr(self, name, arrays[name])
+
+    @staticmethod
+    def _group(keys, values, ranks):
+        """Sorts pairs by (key, rank), returns distinct keys, offsets, values, ranks and best counts."""
+        order = np.lexsort((values, ranks, keys))
+        keys, values, ranks = keys[order], values[order], ranks[order]
+        unique_keys, starts, groups = np.unique(keys, return_index=True, return_inverse=True)
+        offsets = np.append(starts, len(keys)).astype(np.int64)
+        # Number of pairs sharing the best rank of every key, more than one means an ambiguous translation.
+        best = np.bincount(groups.ravel(), weights=ranks == ranks[starts][groups.ravel()], minlength=len(unique_keys))
+        return unique_keys, offsets, values, ranks.astype(np.int8), best.astype(np.int32)
+
+    @classmethod
+    def build(cls, comparison_file=COMPARISON_FILE, transition_file=TRANSITION_FILE, koatuu_file=KOATUU_FILE):
+        """Builds the crosswalk from the kodifikator CSV tables."""
+        comparison_table = load_table(comparison_file)
+        transition_table = load_table(transition_file)
+        comparison = set(zip(comparison_table.column(1), comparison_table.column(0)))
+        transition = set(zip(transition_table.column(0), transition_table.column(3)))
+        pairs = []
+        for koatuu, katotth in comparison | transition:
+            if (koatuu, katotth) in comparison and (koatuu, katotth) in transition:
+                rank = CONFIDENCE.index("exact")
+            elif (koatuu, katotth) in comparison:
+                rank = CONFIDENCE.index("comparison")
+            else:
+                rank = CONFIDENCE.index("transition")
+            pairs.append((koatuu, katotth, rank))
+        koatuu_codes = parse_koatuu([pair[0] for pair in pairs])
+        katotth_codes = parse_katotth([pair[1] for pair in pairs])
+        ranks = np.array([pair[2] for pair in pairs], dtype=np.int64)
+        # Comparison rows of new districts have "Новий район" instead of a KOATUU code.
+        valid = (koatuu_codes >= 0) & (katotth_codes >= 0)
+        koatuu_codes, katotth_codes, ranks = koatuu_codes[valid], katotth_codes[valid], ranks[valid]
+
+        register_table = load_table(koatuu_file)
+        register = {code: name.strip() for code, name in zip(register_table.column(0), register_table.column(2))}
+        register_codes = parse_koatuu(list(register))
+        order = np.argsort(register_codes)
+        # Names are kept as one UTF-8 buffer with offsets, fixed width unicode arrays would be 10 times larger.
+        register_names = list(register.values())
+        names = [register_names[position].encode("utf-8") for position in order.tolist()]
+        name_offsets = np.cumsum([0] + [len(name) for name in names]).astype(np.int64)
+
+        arrays = dict(
+            sources=source_hashes(comparison_file, transition_file, koatuu_file),
+            register_codes=register_codes[order],
+            register_names=np.frombuffer(b"".join(names), dtype=np.uint8),
+            register_name_offsets=name_offsets,
+        )
+        for prefix, keys, values in (("koatuu", koatuu_codes, katotth_codes), ("katotth", katotth_codes, koatuu_codes)):
+            grouped = cls._group(keys, values, ranks)
+            for name, array in zip(("keys", "offsets", "pairs", "ranks", "best"), grouped):
+                arrays[f"{prefix}_{name}"] = array
+        return cls(**arrays)
+
+    def save(self, path=INDEX_FILE):
+        save_arrays(path, {name: getattr(self, name) for name in self.ARRAYS})
+        logger.info(f"KOATUU crosswalk with {len(self.koatuu_pairs)} pairs saved to {path}")
+
+    @classmethod
+    def load(cls, path=INDEX_FILE):
+        return cls(**load_arrays(path, cls.ARRAYS))
+
+    def __len__(self):
+        return len(self.koatuu_pairs)
+
+    @staticmethod
+    def _lookup(keys, offsets, pairs, ranks, best, values):
+        """Best pair of every value: (pairs, ranks, candidates), -1 / 0 where a value has no pair."""
+        if len(keys) == 0:
+            return np.full(len(values), -1, dtype=np.int64), np.full(len(values), -1, dtype=np.int64), np.zeros(len(values), dtype=np.int64)
+        positions = np.minimum(np.searchsorted(keys, values), len(keys) - 1)
+        found = (values >= 0) & (keys[positions] == values)
+        first = offsets[positions]
+        result = np.where(found, pairs[first], -1)
+        rank = np.where(found, ranks[first], -1).astype(np.int64)
+        candidates = np.where(found, best[positions], 0)
+        return result, rank, candidates
+
+    def _translate(self, prefix, values):
+        arrays = [getattr(self, f"{prefix}_{name}") for name in ("keys", "offsets", "pairs", "ranks", "best")]
+        result, rank, candidates = self._lookup(*arrays, values)
+        if prefix == "koatuu":
+            # Codes missing from the tables fall back to their nearest listed parent.
+            for divisor in KOATUU_PARENT_DIVISORS:
+                missing = (result < 0) & (values >= 0)
+                if not missing.any():
+                    break
+                parents = values[missing] // divisor * divisor
+                parent_result, _, parent_candidates = self._lookup(*arrays, parents)
+                resolved = parent_result >= 0
+                rows = np.nonzero(missing)[0][resolved]
+                result[rows] = parent_result[resolved]
+                rank[rows] = CONFIDENCE.index("parent")
+                candidates[rows] = parent_candidates[resolved]
+        return result, rank, candidates
+
+    def _bulk(self, codes, source, parse, format_result):
+        values, inverse = _unique_codes(codes, parse)
+        result, rank, candidates = self._translate(source, values)
+        confidence = np.array(CONFIDENCE + (NOT_FOUND,))[rank]
+        return {
+            "code": format_result(result)[inverse],
+            "confidence": confidence[inverse],
+            "ambiguous": (candidates > 1)[inverse],
+        }
+
+    def to_katotth(self, koatuu_codes):
+        """
+        Translates KOATUU codes to KATOTTH codes in bulk.
+
+        Returns a dict of arrays aligned with the input: code (the best KATOTTH code, ""
+        if none), confidence (a CONFIDENCE value, "" if none) and ambiguous (several
+        codes share the best confidence, the first one is returned).
+        """
+        return self._bulk(koatuu_codes, "koatuu", parse_koatuu, format_katotth)
+
+    def to_koatuu(self, katotth_codes):
+        """Translates KATOTTH codes to KOATUU codes in bulk, same result as to_katotth."""
+        return self._bulk(katotth_codes, "katotth", parse_katotth, format_koatuu)
+
+    def candidates(self, code):
+        """Every pair of a single KOATUU or KATOTTH code as a list of (code, confidence), best first."""
+        source = "katotth" if str(code).strip().upper().startswith("UA") else "koatuu"
+        value = (parse_katotth if source == "katotth" else parse_koatuu)([code])[0]
+        keys, offsets, pairs, ranks = (getattr(self, f"{source}_{name}") for name in ("keys", "offsets", "pairs", "ranks"))
+        position = np.searchsorted(keys, value)
+        if value < 0 or position >= len(keys) or keys[position] != value:
+            return []
+        rows = slice(offsets[position], offsets[position + 1])
+        codes = (format_katotth if source == "koatuu" else format_koatuu)(pairs[rows])
+        return [(code, CONFIDENCE[rank]) for code, rank in zip(codes.tolist(), ranks[rows].tolist())]
+
+    def koatuu_names(self, koatuu_codes):
+        """Names of KOATUU codes in the KOATUU register, "" for codes not in it."""
+        values, inverse = _unique_codes(koatuu_codes, parse_koatuu)
+        if len(self.register_codes) == 0:
+            return np.full(len(inverse), NOT_FOUND)
+        positions = np.minimum(np.searchsorted(self.register_codes, values), len(self.register_codes) - 1)
+        found = (values >= 0) & (self.register_codes[positions] == values)
+        buffer = self.register_names.tobytes()
+        offsets = self.register_name_offsets
+        names = np.array([
+            buffer[offsets[position]:offsets[position + 1]].decode("utf-8") if is_found else NOT_FOUND
+            for position, is_found in zip(positions.tolist(), found.tolist())
+        ] or [NOT_FOUND])[:len(values)]
+        return names[inverse]
+
+
+def load_crosswalk(path=INDEX_FILE):
+    """
+    Loads the precompiled crosswalk, building it from the kodifikator tables if it is
+    missing. A crosswalk built from other tables is built again and saved.
+    """
+    if not os.path.exists(path):
+        return KoatuuCrosswalk.build()
+    try:
+        saved_sources = load_arrays(path, ("sources",))["sources"].tolist()
+    except KeyError:
+        saved_sources = None
+    if saved_sources == source_hashes(COMPARISON_FILE, TRANSITION_FILE, KOATUU_FILE).tolist():
+        return KoatuuCrosswalk.load(path)
+    logger.info(f"{path} was built from other kodifikator tables, building it again.")
+    crosswalk = KoatuuCrosswalk.build()
+    crosswalk.save(path)
+    return crosswalk
+
+def build_koatuu_crosswalk():
+    """Builds the crosswalk from the kodifikator tables and saves its binary form."""
+    start_time = time.time()
+    crosswalk = KoatuuCrosswalk.build()
+    logger.info(
+        f"KOATUU crosswalk built in {time.time() - start_time:.2f} seconds: {len(crosswalk)} pairs, "
+        f"{len(crosswalk.koatuu_keys)} KOATUU and {len(crosswalk.katotth_keys)} KATOTTH codes."
+    )
+    crosswalk.save(INDEX_FILE)
+
+if __name__ == '__main__':
+    build_koatuu_crosswalk()
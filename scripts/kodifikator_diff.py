@@ -0,0 +1,189 @@
+import os
+import re
+import glob
+import time
+import logging
+from collections import Counter
+from json_codec import dumps_json, loads_json, load_json, save_json
+from hierarchy import Hierarchy
+from step_1_generate_settlements import read_kodifikator, update_settlement, update_ancestor_names
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+KODIFIKATOR_DIR = os.path.join("assets", "kodifikator")
+CHANGESET_FILE = os.path.join("assets", "data", "kodifikator_changes.jsonl")
+
+# Compared fields of a kodifikator row and the change kind of each.
+FIELD_CHANGES = {"name": "renamed", "category": "recategorized", "parent_katotth": "reparented"}
+
+
+def find_releases(directory=KODIFIKATOR_DIR):
+    """Kodifikator release files (kodifikator-dd-mm-yyyy.csv) sorted by release date."""
+    releases = []
+    for path in glob.glob(os.path.join(directory, "kodifikator-*.csv")):
+        match = re.search(r"(\d{2})-(\d{2})-(\d{4})\.csv$", path)
+        if match:
+            day, month, year = match.groups()
+            releases.append((f"{year}{month}{day}", path))
+    return [path for _, path in sorted(releases)]
+
+def sorted_release(path):
+    """Rows of a release sorted by katotth_id, the first row of a repeated code wins."""
+    rows = dict()
+    for row in read_kodifikator(path):
+        if row["katotth_id"] in rows:
+            logger.warning(f"Duplicate katotth_id {row['katotth_id']} in {path} ignored.")
+            continue
+        rows[row["katotth_id"]] = row
+    return [rows[katotth_id] for katotth_id in sorted(rows)]
+
+def merge_join(old_rows, new_rows):
+    """
+    Walks two iterables of rows sorted by katotth_id in step, yields (old_row, new_row)
+    with None on the side that does not have the code.
+    """
+    old_rows, new_rows = iter(old_rows), iter(new_rows)
+    old_row, new_row = next(old_rows, None), next(new_rows, None)
+    while old_row is not None or new_row is not None:
+        if new_row is None or (old_row is not None and old_row["katotth_id"] < new_row["katotth_id"]):
+            yield old_row, None
+            old_row = next(old_rows, None)
+        elif old_row is None or new_row["katotth_id"] < old_row["katotth_id"]:
+            yield None, new_row
+            new_row = next(new_rows, None)
+        else:
+            yield old_row, new_row
+            old_row, new_row = next(old_rows, None), next(new_rows, None)
+
+def _fields(row):
+    return {field: row.get(field) for field in FIELD_CHANGES}
+
+def diff_releases(old_rows, new_rows):
+    """
+    Yields the changes between two releases sorted by katotth_id.
+
+    Every change is a dict with katotth_id, change (added, removed or modified), kinds
+    (the FIELD_CHANGES values of a modified row) and the compared fields before and after.
+    """
+    for old_row, new_row in merge_join(old_rows, new_rows):
+        if new_row is None:
+            yield {"katotth_id": old_row["katotth_id"], "change": "removed", "kinds": [], "before": _fields(old_row), "after": None}
+        elif old_row is None:
+            yield {"katotth_id": new_row["katotth_id"], "change": "added", "kinds": [], "before": None, "after": _fields(new_row)}
+        else:
+            kinds = [kind for field, kind in FIELD_CHANGES.items() if old_row.get(field) != new_row.get(field)]
+            if kinds:
+                yield {"katotth_id": new_row["katotth_id"], "change": "modified", "kinds": kinds, "before": _fields(old_row), "after": _fields(new_row)}
+
+def save_changeset(changes, path=CHANGESET_FILE):
+    """Writes changes as JSON lines, returns the number of changes written."""
+    count = 0
+    with open(path, "wb") as f:
+        for change in changes:
+            f.write(dumps_json(change, pretty=False) + b"\n")
+            count += 1
+    return count
+
+def load_changeset(path=CHANGESET_FILE):
+    """Yields the changes of a JSON lines changeset."""
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield loads_json(line)
+
+
+def apply_changeset(settlements, changes):
+    """
+    Applies a changeset to a list of settlements in place.
+
+    Removed codes are dropped, added ones get a new record and modified ones their new
+    fields. Ancestor ids and names are refreshed for the touched records and for the
+    subtrees of renamed and re-parented ones. Other fields (OSM, Wikidata, ...) are
+    left alone, so the network steps only have to fill the added records.
+
+    Returns the katotth_ids of the added and modified records.
+    """
+    removed = set()
+    rows = dict()
+    subtree_roots = set()
+    for change in changes:
+        if change["change"] == "removed":
+            removed.add(change["katotth_id"])
+            continue
+        rows[change["katotth_id"]] = {"katotth_id": change["katotth_id"], **change["after"]}
+        if "renamed" in change["kinds"] or "reparented" in change["kinds"]:
+            subtree_roots.add(change["katotth_id"])
+
+    settlements[:] = [settlement for settlement in settlements if settlement.get("katotth_id") not in removed]
+    existing = {settlement.get("katotth_id"): settlement for settlement in settlements}
+    for katotth_id, row in rows.items():
+        settlement = existing.get(katotth_id)
+        if settlement is None:
+            settlement = {"katotth_id": katotth_id}
+            existing[katotth_id] = settlement
+            settlements.append(settlement)
+        # The hierarchy below is built from the records, so they need the new tree fields first.
+        settlement["name"] = row["name"]
+        settlement["category"] = row["category"]
+        if row["parent_katotth"]:
+            settlement["parent_katotth"] = row["parent_katotth"]
+        else:
+            settlement.pop("parent_katotth", None)
+
+    hierarchy = Hierarchy(settlements)
+    refreshed = set(rows)
+    for katotth_id in subtree_roots:
+        refreshed.update(hierarchy.subtree(katotth_id))
+    for katotth_id in refreshed:
+        settlement = existing.get(katotth_id)
+        if settlement is None:
+            continue
+        row = rows.get(katotth_id) or {
+            "katotth_id": katotth_id,
+            "name": settlement.get("name"),
+            "category": settlement.get("category"),
+            "parent_katotth": settlement.get("parent_katotth"),
+        }
+        update_settlement(settlement, row, hierarchy)
+        update_ancestor_names(settlement, hierarchy)
+    logger.info(f"Changeset applied: {len(removed)} removed, {len(rows)} added or modified, {len(refreshed)} records refreshed.")
+    return sorted(rows)
+
+
+def diff_kodifikator(old_file=None, new_file=None, changeset_file=CHANGESET_FILE):
+    """
+    Diffs two kodifikator releases (by default the two latest ones in assets/kodifikator)
+    and saves the changeset. Returns the number of changes by kind.
+    """
+    if old_file is None or new_file is None:
+        releases = find_releases()
+        if len(releases) < 2:
+            logger.warning(f"Only {len(releases)} kodifikator release(s) found in {KODIFIKATOR_DIR}, nothing to diff.")
+            return Counter()
+        old_file, new_file = releases[-2], releases[-1]
+
+    start_time = time.time()
+    summary = Counter()
+
+    def counted(changes):
+        for change in changes:
+            summary[change["change"]] += 1
+            summary.update(change["kinds"])
+            yield change
+
+    count = save_changeset(counted(diff_releases(sorted_release(old_file), sorted_release(new_file))), changeset_file)
+    logger.info(f"{count} changes between {old_file} and {new_file} saved to {changeset_file} in {time.time() - start_time:.2f} seconds: {dict(summary)}")
+    return summary
+
+def apply_kodifikator_changes(changeset_file=CHANGESET_FILE):
+    """Applies a saved changeset to settlements.json, returns the touched katotth_ids."""
+    data_file = os.path.join("assets", "data", "settlements.json")
+    settlements = load_json(data_file)
+    touched = apply_changeset(settlements, load_changeset(changeset_file))
+    save_json(settlements, data_file)
+    logger.info(f"Settlements data saved to {data_file}")
+    return touched
+
+if __name__ == '__main__':
+    diff_kodifikator()
@@ -0,0 +1,390 @@
+import os
+import gzip
+import math
+import asyncio
+import hashlib
+import inspect
+import logging
+from urllib.parse import urlsplit, parse_qs, unquote
+from json_codec import dumps_json, loads_json
+from settlement_lookup import SettlementLookup, ID_FIELDS, INDEX_FILE as LOOKUP_FILE
+from reverse_geocoder import ReverseGeocoder, INDEX_FILE as REVERSE_GEOCODER_FILE
+from name_search import NameSearch, INDEX_FILE as NAME_SEARCH_FILE
+from postal_codes import PostalIndex, INDEX_FILE as POSTAL_INDEX_FILE
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+HOST = "127.0.0.1"
+PORT = 8080
+
+MAX_HEADERS = 100
+MAX_BODY_SIZE = 8 * 1024 * 1024
+# Most IDs or points resolved by one bulk request.
+MAX_BULK_ITEMS = 10000
+MAX_SEARCH_LIMIT = 100
+# Bulk requests are resolved in chunks of this many items, other connections are served between chunks.
+BULK_CHUNK = 100
+# Bodies smaller than this are sent uncompressed, gzip would not pay off.
+GZIP_MIN_SIZE = 1024
+# Larger bodies are compressed in a thread (zlib releases the GIL) instead of on the event loop.
+GZIP_THREAD_SIZE = 256 * 1024
+GZIP_LEVEL = 5
+
+STATUS_TEXT = {
+    200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 431: "Request Header Fields Too Large", 500: "Internal Server Error", 503: "Service Unavailable",
+}
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _json_number(value):
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+def _coordinate(lon, lat):
+    """(lon, lat) as floats, None unless both are finite and in range."""
+    lon, lat = float(lon), float(lat)
+    if not (math.isfinite(lon) and math.isfinite(lat) and -180 <= lon <= 180 and -90 <= lat <= 90):
+        return None
+    return lon, lat
+
+def _accepts_gzip(accept_encoding):
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        if coding.strip().lower() in ("gzip", "*"):
+            return params.replace(" ", "").lower() not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+def _etag_matches(if_none_match, etag):
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: W/"x" and "x" match.
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag.removeprefix("W/") in tags
+
+
+class LookupService:
+    """
+    Request handlers over the prebuilt indexes. The settlement lookup index is required,
+    the reverse geocoder, name search and postal index are served when their files exist.
+
+    GET responses only depend on the indexes and the URL, so their ETag is a hash of the
+    index versions and the URL: a matching If-None-Match is answered before any work.
+
+    Bulk handlers are generators that yield after every chunk of BULK_CHUNK items and
+    return the response data: handle runs them to the end, handle_async lets the
+    event loop serve other connections between chunks.
+    """
+
+    def __init__(self, lookup_file=LOOKUP_FILE, reverse_geocoder_file=REVERSE_GEOCODER_FILE, name_search_file=NAME_SEARCH_FILE,
+                 postal_index_file=POSTAL_INDEX_FILE):
+        self.lookup = SettlementLookup(lookup_file)
+        self.geocoder = ReverseGeocoder.load(reverse_geocoder_file) if os.path.exists(reverse_geocoder_file) else None
+        self.search = NameSearch.load(name_search_file) if os.path.exists(name_search_file) else None
+        self.postal = PostalIndex.load(postal_index_file) if os.path.exists(postal_index_file) else None
+        versions = hashlib.blake2b(digest_size=8)
+        for path in (lookup_file, reverse_geocoder_file, name_search_file, postal_index_file):
+            if os.path.exists(path):
+                stat = os.stat(path)
+                versions.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns};".encode("utf-8"))
+        self.version = versions.hexdigest()
+        self.routes = {
+            ("GET", "health"): self.get_health,
+            ("GET", "settlements"): self.get_settlement,
+            ("GET", "lookup"): self.get_lookup,
+            ("POST", "lookup"): self.post_lookup,
+            ("GET", "reverse"): self.get_reverse,
+            ("POST", "reverse"): self.post_reverse,
+            ("GET", "search"): self.get_search,
+            ("GET", "postal"): self.get_postal,
+            ("GET", "subtree"): self.get_subtree,
+        }
+
+    def etag(self, target):
+        """Weak ETag of a GET request, the same data in any content encoding."""
+        digest = hashlib.blake2b(f"{self.version} {target}".encode("utf-8"), digest_size=12)
+        return f'W/"{digest.hexdigest()}"'
+
+    def handle(self, method, target, body):
+        """Runs the handler of a request, returns the response data or raises HttpError."""
+        result = self._call(method, target, body)
+        if not inspect.isgenerator(result):
+            return result
+        while True:
+            try:
+                next(result)
+            except StopIteration as stop:
+                return stop.value
+
+    async def handle_async(self, method, target, body):
+        """handle for the event loop, yielding to other tasks between the chunks of bulk requests."""
+        result = self._call(method, target, body)
+        if not inspect.isgenerator(result):
+            return result
+        while True:
+            try:
+                next(result)
+            except StopIteration as stop:
+                return stop.value
+            await asyncio.sleep(0)
+
+    def _call(self, method, target, body):
+        url = urlsplit(target)
+        parts = [unquote(part) for part in url.path.split("/") if part]
+        if not parts:
+            raise HttpError(404, "Not found")
+        handler = self.routes.get((method, parts[0]))
+        if handler is None:
+            if any(route_path == parts[0] for _, route_path in self.routes):
+                raise HttpError(405, f"{method} is not allowed for /{parts[0]}")
+            raise HttpError(404, f"Unknown endpoint /{parts[0]}")
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        return handler(parts[1:], query, body)
+
+    # Handlers: (path parts after the endpoint, query dict, request body) -> data.
+
+    def get_health(self, parts, query, body):
+        return {"records": len(self.lookup), "version": self.version,
+                "reverse_geocoder": self.geocoder is not None, "name_search": self.search is not None,
+                "postal_index": self.postal is not None}
+
+    def get_settlement(self, parts, query, body):
+        if len(parts) != 1:
+            raise HttpError(404, "Use /settlements/<katotth_id>")
+        record = self.lookup.get(parts[0])
+        if record is None:
+            raise HttpError(404, f"Settlement {parts[0]} not found")
+        return record
+
+    def _id_field(self, parts, count):
+        if len(parts) != count or parts[0] not in ID_FIELDS:
+            raise HttpError(404, f"Use /lookup/<field>{'/<value>' if count == 2 else ''} with a field of {', '.join(ID_FIELDS)}")
+        return parts[0]
+
+    def get_lookup(self, parts, query, body):
+        field = self._id_field(parts, 2)
+        return {"field": field, "results": self.lookup.find(field, parts[1])}
+
+    def post_lookup(self, parts, query, body):
+        """Body: {"ids": [...]}, response: {"results": {id: [records]}}, missing IDs map to []."""
+        field = self._id_field(parts, 1)
+        ids = _bulk_items(body, "ids")
+        results = dict()
+        for start in range(0, len(ids), BULK_CHUNK):
+            results.update((str(value), self.lookup.find(field, value)) for value in ids[start:start + BULK_CHUNK])
+            yield
+        return {"field": field, "results": results}
+
+    def _geocoder(self):
+        if self.geocoder is None:
+            raise HttpError(503, "Reverse geocoder index is not built")
+        return self.geocoder
+
+    def get_reverse(self, parts, query, body):
+        try:
+            coordinate = _coordinate(query["lon"], query["lat"])
+        except (KeyError, ValueError):
+            raise HttpError(400, "lon and lat query parameters are required")
+        if coordinate is None:
+            raise HttpError(400, "lon and lat must be finite, lon in [-180, 180] and lat in [-90, 90]")
+        return self._reverse([coordinate])[0]
+
+    def post_reverse(self, parts, query, body):
+        """
+        Body: {"points": [[lon, lat], ...]}, response: {"results": [...]} in the same order,
+        null for points with non-finite or out of range coordinates.
+        """
+        points = _bulk_items(body, "points")
+        try:
+            coordinates = [_coordinate(lon, lat) for lon, lat in points]
+        except (TypeError, ValueError):
+            raise HttpError(400, "points must be [lon, lat] pairs")
+        valid = [coordinate for coordinate in coordinates if coordinate is not None]
+        located = []
+        for start in range(0, len(valid), BULK_CHUNK):
+            located.extend(self._reverse(valid[start:start + BULK_CHUNK]))
+            yield
+        located = iter(located)
+        return {"results": [next(located) if coordinate is not None else None for coordinate in coordinates]}
+
+    def _reverse(self, coordinates):
+        if not coordinates:
+            return []
+        result = self._geocoder().lookup_many(coordinates)
+        columns = {key: values.tolist() for key, values in result.items()}
+        return [
+            {key: (_json_number(values[row]) if key == "distance_km" else values[row] or None) for key, values in columns.items()}
+            for row in range(len(coordinates))
+        ]
+
+    def get_search(self, parts, query, body):
+        if self.search is None:
+            raise HttpError(503, "Name search index is not built")
+        text = query.get("q", "").strip()
+        if not text:
+            raise HttpError(400, "q query parameter is required")
+        try:
+            limit = int(query.get("limit", 10))
+        except ValueError:
+            limit = None
+        if limit is None or not 1 <= limit <= MAX_SEARCH_LIMIT:
+            raise HttpError(400, f"limit must be an integer from 1 to {MAX_SEARCH_LIMIT}")
+        category = query.get("category")
+        return {"query": text, "results": self.search.search(text, limit, category.split(",") if category else None)}
+
+    def get_postal(self, parts, query, body):
+        """/postal/<code>, /postal/<prefix> or /postal/<low>-<high>: candidate settlements of postal codes."""
+        if self.postal is None:
+            raise HttpError(503, "Postal index is not built")
+        if len(parts) != 1:
+            raise HttpError(404, "Use /postal/<code, prefix or range>")
+        return {"query": parts[0], "results": self.postal.search(parts[0])}
+
+    def get_subtree(self, parts, query, body):
+        if len(parts) != 1:
+            raise HttpError(404, "Use /subtree/<katotth_id>")
+        if parts[0] not in self.lookup:
+            raise HttpError(404, f"Settlement {parts[0]} not found")
+        return {"katotth_id": parts[0], "results": self.lookup.descendants(parts[0], query.get("category"))}
+
+
+def _bulk_items(body, key):
+    try:
+        data = loads_json(body) if body else None
+    except ValueError:
+        raise HttpError(400, "Body is not valid JSON")
+    items = data.get(key) if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        raise HttpError(400, f'Body must be {{"{key}": [...]}}')
+    if len(items) > MAX_BULK_ITEMS:
+        raise HttpError(413, f"At most {MAX_BULK_ITEMS} {key} per request")
+    return items
+
+
+async def _read_line(reader, status, message):
+    """Reads a line, a line longer than the stream limit is an HttpError."""
+    try:
+        return await reader.readline()
+    except (ValueError, asyncio.LimitOverrunError):
+        raise HttpError(status, message)
+
+async def read_request(reader):
+    """
+    Reads one request, returns (method, target, headers, body) or None when the client
+    closed the connection. Malformed requests raise HttpError, the connection is closed after it.
+    """
+    request_line = await _read_line(reader, 400, "Request line too long")
+    if not request_line.strip():
+        return None
+    try:
+        method, target, version = request_line.decode("latin-1").split()
+    except ValueError:
+        raise HttpError(400, "Malformed request line")
+    headers = {"__version__": version}
+    for _ in range(MAX_HEADERS + 1):
+        line = await _read_line(reader, 431, "Header line too long")
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    else:
+        raise HttpError(431, "Too many headers")
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise HttpError(400, "Invalid Content-Length")
+    if length < 0:
+        raise HttpError(400, "Invalid Content-Length")
+    if length > MAX_BODY_SIZE:
+        raise HttpError(413, f"Body larger than {MAX_BODY_SIZE} bytes")
+    try:
+        body = await reader.readexactly(length) if length > 0 else b""
+    except asyncio.IncompleteReadError:
+        raise HttpError(400, "Body shorter than Content-Length")
+    return method.upper(), target, headers, body
+
+def build_response(status, body=b"", etag=None, gzip_body=False, keep_alive=True):
+    headers = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}"]
+    if status != 304:
+        headers.append("Content-Type: application/json; charset=utf-8")
+    if gzip_body and len(body) >= GZIP_MIN_SIZE:
+        body = gzip.compress(body, compresslevel=GZIP_LEVEL)
+        headers.append("Content-Encoding: gzip")
+    if etag:
+        headers.append(f"ETag: {etag}")
+    headers.append("Vary: Accept-Encoding")
+    headers.append(f"Content-Length: {len(body)}")
+    headers.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+    return ("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body
+
+
+class LookupServer:
+    """HTTP/1.1 server with keep-alive connections over a LookupService."""
+
+    def __init__(self, service):
+        self.service = service
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except HttpError as error:
+                    writer.write(build_response(error.status, dumps_json({"error": error.message}, pretty=False), keep_alive=False))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                method, target, headers, body = request
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" and (headers["__version__"] != "HTTP/1.0" or connection == "keep-alive")
+                writer.write(await self.respond(method, target, headers, body, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, method, target, headers, body, keep_alive):
+        etag = self.service.etag(target) if method == "GET" else None
+        if etag and _etag_matches(headers.get("if-none-match", ""), etag):
+            return build_response(304, etag=etag, keep_alive=keep_alive)
+        try:
+            status, data = 200, await self.service.handle_async(method, target, body)
+        except HttpError as error:
+            status, data, etag = error.status, {"error": error.message}, None
+        except Exception:
+            logger.exception(f"Error handling {method} {target}")
+            status, data, etag = 500, {"error": "Internal server error"}, None
+        gzip_body = _accepts_gzip(headers.get("accept-encoding", ""))
+        payload = dumps_json(data, pretty=False)
+        if gzip_body and len(payload) >= GZIP_THREAD_SIZE:
+            return await asyncio.get_running_loop().run_in_executor(None, build_response, status, payload, etag, gzip_body, keep_alive)
+        return build_response(status, payload, etag, gzip_body, keep_alive)
+
+
+async def serve(host=HOST, port=PORT, service=None):
+    service = service or LookupService()
+    server = await asyncio.start_server(LookupServer(service).handle_connection, host, port)
+    logger.info(f"Lookup server with {len(service.lookup)} records listening on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+def run_server(host=HOST, port=PORT):
+    """Serves the lookup endpoints until interrupted."""
+    try:
+        asyncio.run(serve(host, port))
+    except KeyboardInterrupt:
+        logger.info("Lookup server stopped.")
+
+if __name__ == '__main__':
+    run_server()
@@ -10,6 +10,9 @@ from step_5_find_regions_osm_data import find_regions_osm_data
 from step_6_find_settlements_missing_osm_data import find_settlements_missing_osm_data
 from step_7_add_decentralization_data import add_decentralization_data
 from step_8_get_wikidata import get_wikidata
+from step_9_add_geometry_data import add_geometry_data
+from step_10_add_transliterations import add_transliterations
+from provenance import track_step
 
 from data_validation import check_generated_data
 
@@ -34,13 +37,16 @@ def main():
         "Step 6: Getting missing OSM data for settlements": find_settlements_missing_osm_data,
         #"Step 7: Add decentralization data for settlements": add_decentralization_data,
         #"Step 8: Getting Wikidata IDs": get_wikidata,
+        #"Step 9: Adding computed areas and locations from the maps": add_geometry_data,
+        #"Step 10: Adding transliterated English names": add_transliterations,
     }
 
     for description, step_function in steps.items():
         logger.info(f"{description}...")
         step_start_time = time.time()
         try:
-            step_function()
+            # Fields changed by the step are attributed to its source in provenance.json.
+            track_step(step_function)
             step_end_time = time.time()
             logger.info(f"{description} complete. Took {step_end_time - step_start_time:.2f} seconds.")
         except Exception as e:
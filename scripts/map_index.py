@@ -0,0 +1,68 @@
+import os
+import re
+import json
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Map layers with their files and the settlement categories they should cover.
+MAP_LAYERS = {
+    "oblasti": {"file": os.path.join("assets", "maps", "ukraine_oblasti.geojson"), "categories": {"O", "K"}, "title": "Oblast"},
+    "districts": {"file": os.path.join("assets", "maps", "districts.geojson"), "categories": {"P"}, "title": "District"},
+    "communities": {"file": os.path.join("assets", "maps", "communities.geojson"), "categories": {"H"}, "title": "Community"},
+}
+
+_PROPERTIES_KEY = re.compile(r'"properties"\s*:\s*')
+
+def read_feature_properties(path):
+    """
+    Yields the properties of every feature in a GeoJSON file without decoding the geometries.
+
+    Only the text after each "properties" key is decoded, coordinates are skipped as raw text.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        text = f.read()
+
+    pos = 0
+    while True:
+        match = _PROPERTIES_KEY.search(text, pos)
+        if not match:
+            return
+        if text.startswith("null", match.end()):
+            yield {}
+            pos = match.end() + 4
+            continue
+        properties, pos = decoder.raw_decode(text, match.end())
+        yield properties
+
+def build_katotth_index(path, key="katotth"):
+    """
+    Indexes the features of a GeoJSON file by a property.
+
+    Returns (index, duplicates, features_without_key) where index maps the property value
+    to the properties of its first feature.
+    """
+    index = dict()
+    duplicates = set()
+    features_without_key = 0
+    for properties in read_feature_properties(path):
+        value = properties.get(key)
+        if not value:
+            features_without_key += 1
+        elif value in index:
+            duplicates.add(value)
+        else:
+            index[value] = properties
+    return index, duplicates, features_without_key
+
+def load_map_indexes(layers=MAP_LAYERS):
+    """Builds the katotth index of every map layer that exists on disk."""
+    indexes = dict()
+    for layer, config in layers.items():
+        if not os.path.exists(config["file"]):
+            logger.warning(f"Map file {config['file']} not found, skipping {layer} layer.")
+            continue
+        indexes[layer] = build_katotth_index(config["file"])
+    return indexes
@@ -0,0 +1,239 @@
+import os
+import re
+import time
+import logging
+import unicodedata
+import numpy as np
+from json_codec import load_json, loads_json, dumps_json
+from rollup import parse_number
+from array_store import save_arrays, load_arrays
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = os.path.join("assets", "data", "name_search.npz")
+
+# Searched name fields, a match on an earlier field ranks higher.
+NAME_FIELDS = ("name", "old_name", "name:en", "name:ru", "name:pl")
+# Category order of equally good matches: cities, oblasts, towns, districts, villages, ...
+SEARCH_RANK = {"K": 0, "O": 1, "M": 2, "P": 3, "X": 4, "H": 5, "C": 6, "B": 7}
+CONTEXT_FIELDS = ("katotth_id", "name", "category", "hromada_name", "district_name", "oblast_name")
+
+MIN_SIMILARITY = 0.3
+_SEPARATORS = re.compile(r"[\s\-–—.,()/]+")
+_APOSTROPHES = re.compile(r"['’ʼ`\"]")
+
+
+def normalize(text):
+    """
+    Search form of a name: lower case without diacritics and apostrophes, words separated
+    by single spaces. Й and Ї fold into И and І, so queries typed without them still match.
+    """
+    text = unicodedata.normalize("NFKD", str(text).lower().replace("ё", "е"))
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    text = _APOSTROPHES.sub("", text)
+    return _SEPARATORS.sub(" ", text).strip()
+
+def trigrams(text):
+    """Distinct trigram keys of a normalized text padded with spaces, as int64 (3 x 21 bits)."""
+    padded = f"  {text} "
+    codes = np.array([ord(char) for char in padded], dtype=np.int64)
+    if len(codes) < 3:
+        return np.empty(0, dtype=np.int64)
+    return np.unique((codes[:-2] << 42) | (codes[1:-1] << 21) | codes[2:])
+
+
+class NameSearch:
+    """
+    Autocomplete and fuzzy search over the name fields of settlements.
+
+    Every distinct normalized name of a record is an entry. Prefix search runs on the
+    sorted UTF-8 keys of every word suffix of the entries ("нова водолага" is found by
+    "нова" and "водол"), so a query is two binary searches. Fuzzy search counts shared
+    trigrams through an inverted index and ranks by their Jaccard similarity.
+    """
+
+    ARRAYS = ("records", "entry_records", "entry_fields", "entry_lengths", "entry_ranks",
+              "keys", "key_entries", "key_starts", "trigram_keys", "trigram_offsets", "trigram_entries")
+
+    def __init__(self, **arrays):
+        for name in self.ARRAYS:
+            setattr(self, name, arrays[name])
+        # Context of every record, decoded once: (katotth_id, name, category, hromada, district, oblast).
+        self._records = [tuple(record) for record in loads_json(self.records.tobytes())]
+        self._entry_records = self.entry_records.tolist()
+        self._entry_fields = self.entry_fields.tolist()
+        self._entry_categories = np.array([self._records[record][2] or "" for record in self._entry_records], dtype=str)
+
+    @classmethod
+    def build(cls, settlements, categories=None):
+        """Builds the index over the named records, optionally of the given categories only."""
+        records = []
+        entry_records, entry_fields, entry_names, entry_ranks = [], [], [], []
+        for settlement in settlements:
+            if not settlement.get("name") or (categories and settlement.get("category") not in categories):
+                continue
+            record = len(records)
+            records.append([settlement.get(field) for field in CONTEXT_FIELDS])
+            population = parse_number(settlement.get("population")) or 0.0
+            seen = set()
+            for field_rank, field in enumerate(NAME_FIELDS):
+                name = normalize(settlement.get(field) or "")
+                if not name or name in seen:
+                    continue
+                seen.add(name)
+                entry_records.append(record)
+                entry_fields.append(field_rank)
+                entry_names.append(name)
+                # Static order of entries matching equally well, smaller is better.
+                entry_ranks.append((field_rank, SEARCH_RANK.get(settlement.get("category"), len(SEARCH_RANK)), -population))
+
+        order = sorted(range(len(entry_ranks)), key=entry_ranks.__getitem__)
+        rank_of_entry = np.empty(len(order), dtype=np.int32)
+        rank_of_entry[order] = np.arange(len(order))
+
+        keys, key_entries, key_starts = [], [], []
+        for entry, name in enumerate(entry_names):
+            for match in re.finditer(r"\S+", name):
+                keys.append(name[match.start():].encode("utf-8"))
+                key_entries.append(entry)
+                key_starts.append(match.start() == 0)
+        key_order = sorted(range(len(keys)), key=keys.__getitem__)
+
+        trigram_lists = [trigrams(name) for name in entry_names]
+        all_trigrams = np.concatenate(trigram_lists) if trigram_lists else np.empty(0, dtype=np.int64)
+        trigram_owners = np.repeat(np.arange(len(entry_names)), [len(items) for items in trigram_lists])
+        trigram_order = np.argsort(all_trigrams, kind="stable")
+        trigram_keys, trigram_starts = np.unique(all_trigrams[trigram_order], return_index=True)
+
+        return cls(
+            records=np.frombuffer(dumps_json(records, pretty=False), dtype=np.uint8),
+            entry_records=np.array(entry_records, dtype=np.int32),
+            entry_fields=np.array(entry_fields, dtype=np.int8),
+            entry_lengths=np.array([len(items) for items in trigram_lists], dtype=np.int16),
+            entry_ranks=rank_of_entry,
+            keys=np.array([keys[position] for position in key_order], dtype=bytes),
+            key_entries=np.array([key_entries[position] for position in key_order], dtype=np.int32),
+            key_starts=np.array([key_starts[position] for position in key_order], dtype=bool),
+            trigram_keys=trigram_keys,
+            trigram_offsets=np.append(trigram_starts, len(all_trigrams)).astype(np.int64),
+            trigram_entries=trigram_owners[trigram_order].astype(np.int32),
+        )
+
+    @classmethod
+    def from_file(cls, path, categories=None):
+        return cls.build(load_json(path), categories)
+
+    def save(self, path=INDEX_FILE):
+        save_arrays(path, {name: getattr(self, name) for name in self.ARRAYS})
+        logger.info(f"Name search index with {len(self.entry_records)} names saved to {path}")
+
+    @classmethod
+    def load(cls, path=INDEX_FILE):
+        return cls(**load_arrays(path, cls.ARRAYS))
+
+    def __len__(self):
+        return len(self._records)
+
+    def _category_mask(self, entries, category):
+        if category is None:
+            return np.ones(len(entries), dtype=bool)
+        categories = [category] if isinstance(category, str) else list(category)
+        return np.isin(self._entry_categories[entries], categories)
+
+    def _results(self, entries, scores, limit):
+        """Result dicts of the best entries, one per record."""
+        results = []
+        seen = set()
+        for entry, score in zip(entries.tolist(), scores.tolist()):
+            record = self._entry_records[entry]
+            if record in seen:
+                continue
+            seen.add(record)
+            context = dict(zip(CONTEXT_FIELDS, self._records[record]))
+            context["field"] = NAME_FIELDS[self._entry_fields[entry]]
+            context["score"] = round(score, 3)
+            results.append(context)
+            if len(results) == limit:
+                break
+        return results
+
+    def complete(self, query, limit=10, category=None):
+        """
+        Records with a name or a word of a name starting with the query. Whole name
+        matches rank first (exact ones before prefixes), then word matches, each by the
+        field, category and population order of the index. Score is 1 for exact matches.
+        """
+        prefix = normalize(query).encode("utf-8")
+        if not prefix or limit < 1:
+            return []
+        start = np.searchsorted(self.keys, prefix, side="left")
+        end = np.searchsorted(self.keys, prefix + b"\xff", side="left")
+        if start == end:
+            return []
+        rows = np.arange(start, end)
+        entries = self.key_entries[rows]
+        exact = (self.keys[rows] == prefix) & self.key_starts[rows]
+        mask = self._category_mask(entries, category)
+        entries, exact, starts = entries[mask], exact[mask], self.key_starts[rows][mask]
+        # Group (exact, name start, word start) first, the static entry order next.
+        group = np.where(exact, 0, np.where(starts, 1, 2))
+        order_keys = group.astype(np.int64) * len(self.entry_ranks) + self.entry_ranks[entries]
+        # One record can match through several entries (names, old names, words), so the
+        # best entries are taken in growing batches until they give limit distinct records.
+        size = 4 * limit
+        while True:
+            if len(order_keys) > size:
+                best = np.argpartition(order_keys, size)[:size]
+            else:
+                best = np.arange(len(order_keys))
+            best = best[np.argsort(order_keys[best], kind="stable")]
+            scores = np.choose(group[best], [1.0, 0.9, 0.8])
+            results = self._results(entries[best], scores, limit)
+            if len(results) == limit or len(best) == len(order_keys):
+                return results
+            size *= 4
+
+    def fuzzy(self, query, limit=10, category=None, min_similarity=MIN_SIMILARITY):
+        """Records with names sharing the most trigrams with the query, score is the Jaccard similarity."""
+        query_trigrams = trigrams(normalize(query))
+        if len(query_trigrams) == 0 or len(self.trigram_keys) == 0 or limit < 1:
+            return []
+        positions = np.minimum(np.searchsorted(self.trigram_keys, query_trigrams), len(self.trigram_keys) - 1)
+        positions = positions[self.trigram_keys[positions] == query_trigrams]
+        if len(positions) == 0:
+            return []
+        postings = np.concatenate([self.trigram_entries[self.trigram_offsets[position]:self.trigram_offsets[position + 1]] for position in positions.tolist()])
+        entries, shared = np.unique(postings, return_counts=True)
+        similarity = shared / (len(query_trigrams) + self.entry_lengths[entries] - shared)
+        keep = (similarity >= min_similarity) & self._category_mask(entries, category)
+        entries, similarity = entries[keep], similarity[keep]
+        order = np.lexsort((self.entry_ranks[entries], -similarity))
+        return self._results(entries[order], similarity[order], limit)
+
+    def search(self, query, limit=10, category=None):
+        """Autocomplete results, topped up with fuzzy matches when there are fewer than limit."""
+        results = self.complete(query, limit, category)
+        if len(results) < limit:
+            found = {result["katotth_id"] for result in results}
+            for result in self.fuzzy(query, limit + len(results), category):
+                if result["katotth_id"] not in found:
+                    # Fuzzy matches never rank above prefix matches.
+                    result["score"] = round(min(result["score"], 0.79), 3)
+                    results.append(result)
+                    found.add(result["katotth_id"])
+                if len(results) == limit:
+                    break
+        return results
+
+
+def build_name_search():
+    """Builds the name search index of settlements.json and saves it."""
+    start_time = time.time()
+    data_file = os.path.join("assets", "data", "settlements.json")
+    index = NameSearch.from_file(data_file)
+    logger.info(f"Name search index of {len(index)} records built in {time.time() - start_time:.2f} seconds.")
+    index.save(INDEX_FILE)
+
+if __name__ == '__main__':
+    build_name_search()
@@ -1,6 +1,7 @@
 import requests
 import logging
 import time
+from postal_codes import normalize_postal_code
 
 # Overpass API endpoint
 url = "http://overpass-api.de/api/interpreter"
@@ -101,6 +102,21 @@ def find_entities_by_propety(key, values, logger, type="node", retries=2):
         # Be respectful of the API rate limits
         time.sleep(1)
 
+def merge_osm_value(settlement, key, value):
+    """Value of a field after merging OSM data: postal codes are united with the known ones, other values replace them."""
+    if key == "postal_code":
+        return normalize_postal_code(settlement.get(key), value)
+    return value
+
+def merge_osm_data(settlement, osm_data, skip, fields=None):
+    """Merges the values of osm_data into a settlement, except the skip keys and, when fields are given, keys not in fields."""
+    merged = False
+    for k, v in osm_data.items():
+        if k not in skip and v is not None and (fields is None or k in fields):
+            settlement[k] = merge_osm_value(settlement, k, v)
+            merged = True
+    return merged
+
 def extract_entities_data(entities):
     """
     Extract relevant data from entities.
@@ -126,7 +142,7 @@ def extract_entities_data(entities):
             if entity['tags'].get('old_name'):
                 osm_data["old_name"] = entity['tags']['old_name']
             if entity['tags'].get('postal_code'):
-                osm_data["postal_code"] = entity['tags']['postal_code']
+                osm_data["postal_code"] = normalize_postal_code(entity['tags']['postal_code'])
             if entity['tags'].get('wikidata'):
                 osm_data["wikidata"] = entity['tags']['wikidata']
             if entity['tags'].get('wikipedia'):
@@ -0,0 +1,95 @@
+import numpy as np
+from geometry import EARTH_RADIUS_KM
+
+
+def _layer_rings(polygon_layer):
+    """
+    Flattens the rings of every feature of a PolygonLayer.
+
+    Returns (edges, edge_rings, ring_features, ring_roles) where ring_roles is +1 for
+    outer rings and -1 for holes.
+    """
+    edges = []
+    ring_features = []
+    ring_roles = []
+    for feature, polygons in enumerate(polygon_layer.rings):
+        for polygon in polygons:
+            for position, ring in enumerate(polygon):
+                edges.append(np.hstack([ring[:-1], ring[1:]]))
+                ring_features.append(feature)
+                ring_roles.append(1 if position == 0 else -1)
+    if not edges:
+        return np.empty((0, 4)), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0)
+    edge_rings = np.repeat(np.arange(len(edges)), [len(ring_edges) for ring_edges in edges])
+    return np.vstack(edges), edge_rings, np.array(ring_features), np.array(ring_roles, dtype=np.float64)
+
+def geodesic_areas_km2(polygon_layer):
+    """
+    Area of every feature on the sphere in square kilometers, outer rings minus holes.
+
+    Every ring is integrated with the spherical trapezoid formula
+    A = R^2 / 2 * |sum((lon2 - lon1) * (2 + sin(lat1) + sin(lat2)))| over its edges.
+    """
+    edges, edge_rings, ring_features, ring_roles = _layer_rings(polygon_layer)
+    if len(ring_features) == 0:
+        return np.zeros(len(polygon_layer))
+    lon1, lat1, lon2, lat2 = np.radians(edges.T)
+    terms = (lon2 - lon1) * (2 + np.sin(lat1) + np.sin(lat2))
+    ring_areas = np.abs(np.bincount(edge_rings, weights=terms, minlength=len(ring_features))) * EARTH_RADIUS_KM ** 2 / 2
+    return np.maximum(np.bincount(ring_features, weights=ring_roles * ring_areas, minlength=len(polygon_layer)), 0)
+
+def centroids(polygon_layer):
+    """
+    Area weighted centroid (lon, lat) of every feature, holes subtracted.
+
+    Computed with the shoelace formula on an equirectangular projection centered on
+    each feature's bounding box, which is accurate to meters at the size of an oblast.
+    """
+    edges, edge_rings, ring_features, ring_roles = _layer_rings(polygon_layer)
+    result = np.full((len(polygon_layer), 2), np.nan)
+    if len(ring_features) == 0:
+        return result
+    bboxes = polygon_layer.bboxes
+    origins = np.stack([(bboxes[:, 0] + bboxes[:, 2]) / 2, (bboxes[:, 1] + bboxes[:, 3]) / 2], axis=1)
+    scales = np.cos(np.radians(origins[:, 1]))
+
+    edge_features = ring_features[edge_rings]
+    x1 = (edges[:, 0] - origins[edge_features, 0]) * scales[edge_features]
+    x2 = (edges[:, 2] - origins[edge_features, 0]) * scales[edge_features]
+    y1 = edges[:, 1] - origins[edge_features, 1]
+    y2 = edges[:, 3] - origins[edge_features, 1]
+    cross = x1 * y2 - x2 * y1
+
+    # Orient every ring by its role: outer rings count positive and holes negative whatever their winding.
+    ring_signed = np.bincount(edge_rings, weights=cross, minlength=len(ring_features)) / 2
+    orientation = ring_roles * np.where(ring_signed < 0, -1.0, 1.0)
+    edge_orientation = orientation[edge_rings]
+    areas = np.bincount(edge_features, weights=edge_orientation * cross / 2, minlength=len(polygon_layer))
+    moment_x = np.bincount(edge_features, weights=edge_orientation * (x1 + x2) * cross / 6, minlength=len(polygon_layer))
+    moment_y = np.bincount(edge_features, weights=edge_orientation * (y1 + y2) * cross / 6, minlength=len(polygon_layer))
+
+    valid = areas > 0
+    result[valid, 0] = origins[valid, 0] + moment_x[valid] / areas[valid] / scales[valid]
+    result[valid, 1] = origins[valid, 1] + moment_y[valid] / areas[valid]
+    return result
+
+def interior_points(polygon_layer, points=None):
+    """
+    A point inside every feature: the centroid when it lies inside, otherwise the
+    middle of the widest span of the feature along the centroid latitude.
+    """
+    points = centroids(polygon_layer) if points is None else np.array(points, dtype=np.float64)
+    for row, (x, y) in enumerate(points):
+        if np.isnan(y) or polygon_layer.contains(row, [x], [y])[0]:
+            continue
+        edges = polygon_layer.edges[row]
+        crossing = (edges[:, 1] > y) != (edges[:, 3] > y)
+        if not crossing.any():
+            continue
+        edges = edges[crossing]
+        xs = np.sort(edges[:, 0] + (y - edges[:, 1]) * (edges[:, 2] - edges[:, 0]) / (edges[:, 3] - edges[:, 1]))
+        # Even-odd: the line is inside the feature between crossings 0-1, 2-3, ...
+        starts, ends = xs[0::2], xs[1::2]
+        widest = int(np.argmax(ends - starts[:len(ends)]))
+        points[row] = ((starts[widest] + ends[widest]) / 2, y)
+    return points
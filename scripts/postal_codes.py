@@ -0,0 +1,176 @@
+import os
+import re
+import time
+import logging
+import numpy as np
+from json_codec import load_json, loads_json, dumps_json
+from array_store import save_arrays, load_arrays
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = os.path.join("assets", "data", "postal_index.npz")
+
+CODE_LENGTH = 5
+CODE_SEPARATOR = ";"
+CONTEXT_FIELDS = ("katotth_id", "name", "category", "hromada_name", "district_name", "oblast_name", "postal_code")
+
+# A code or a range of codes ("61001", "61001-61099", "61001 – 61099").
+_CODE_TOKENS = re.compile(r"(\d+)(?:\s*[-–—]\s*(\d+))?")
+
+
+def _parse_code(digits):
+    """Code of a digit string, None if it is not a postal code. Codes read as numbers lost their leading zero."""
+    if len(digits) == CODE_LENGTH - 1:
+        digits = "0" + digits
+    return int(digits) if len(digits) == CODE_LENGTH else None
+
+def parse_postal_codes(value):
+    """
+    Sorted, merged (start, end) code intervals of a free-form value: a code, a range, a
+    list of them in a string with any separators, an int or a list. Invalid parts are skipped.
+    """
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return merge_intervals([interval for item in value for interval in parse_postal_codes(item)])
+    intervals = []
+    for match in _CODE_TOKENS.finditer(str(value)):
+        start = _parse_code(match.group(1))
+        end = _parse_code(match.group(2)) if match.group(2) else start
+        if start is None or end is None:
+            continue
+        intervals.append((min(start, end), max(start, end)))
+    return merge_intervals(intervals)
+
+def merge_intervals(intervals):
+    """Sorts intervals and merges the overlapping and adjacent ones."""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+def format_code(code):
+    return str(code).zfill(CODE_LENGTH)
+
+def format_postal_codes(intervals):
+    """Canonical string of code intervals: "01001;61001-61003", empty for no codes."""
+    return CODE_SEPARATOR.join(
+        format_code(start) if start == end else f"{format_code(start)}-{format_code(end)}" for start, end in intervals
+    )
+
+def normalize_postal_code(*values):
+    """Canonical postal_code of the union of the codes of values, None if there are none."""
+    return format_postal_codes(parse_postal_codes(list(values))) or None
+
+def expand_postal_codes(value):
+    """Every code of a value as a string."""
+    return [format_code(code) for start, end in parse_postal_codes(value) for code in range(start, end + 1)]
+
+
+class PostalIndex:
+    """
+    Inverted postal code -> settlements index.
+
+    Every record contributes its code intervals. Intervals are sorted by start, so the
+    intervals overlapping a query range start between (low - longest interval) and high,
+    found with two binary searches: exact, prefix and range queries are all range queries.
+    """
+
+    ARRAYS = ("records", "starts", "ends", "interval_records")
+
+    def __init__(self, **arrays):
+        for name in self.ARRAYS:
+            setattr(self, name, arrays[name])
+        self._records = [tuple(record) for record in loads_json(self.records.tobytes())]
+        self.max_span = int((self.ends - self.starts).max()) if len(self.starts) else 0
+
+    @classmethod
+    def build(cls, settlements):
+        """Builds the index over the records with a postal_code."""
+        records, starts, ends, interval_records = [], [], [], []
+        for settlement in settlements:
+            intervals = parse_postal_codes(settlement.get("postal_code"))
+            if not intervals:
+                continue
+            for start, end in intervals:
+                starts.append(start)
+                ends.append(end)
+                interval_records.append(len(records))
+            records.append([settlement.get(field) for field in CONTEXT_FIELDS])
+        starts, ends, interval_records = (np.array(values, dtype=np.int32) for values in (starts, ends, interval_records))
+        order = np.lexsort((interval_records, ends, starts))
+        return cls(
+            records=np.frombuffer(dumps_json(records, pretty=False), dtype=np.uint8),
+            starts=starts[order],
+            ends=ends[order],
+            interval_records=interval_records[order],
+        )
+
+    @classmethod
+    def from_file(cls, path):
+        return cls.build(load_json(path))
+
+    def save(self, path=INDEX_FILE):
+        save_arrays(path, {name: getattr(self, name) for name in self.ARRAYS})
+        logger.info(f"Postal index with {len(self.starts)} code intervals of {len(self)} records saved to {path}")
+
+    @classmethod
+    def load(cls, path=INDEX_FILE):
+        return cls(**load_arrays(path, cls.ARRAYS))
+
+    def __len__(self):
+        return len(self._records)
+
+    def range(self, low, high):
+        """Records with a code in [low, high], by their lowest matching code."""
+        low, high = int(low), int(high)
+        first = np.searchsorted(self.starts, low - self.max_span, side="left")
+        last = np.searchsorted(self.starts, high, side="right")
+        rows = np.arange(first, last)
+        rows = rows[self.ends[rows] >= low]
+        results = []
+        seen = set()
+        for record in self.interval_records[rows].tolist():
+            if record not in seen:
+                seen.add(record)
+                results.append(dict(zip(CONTEXT_FIELDS, self._records[record])))
+        return results
+
+    def exact(self, code):
+        """Records with a code (a string or an int)."""
+        code = _parse_code(str(code).strip())
+        return [] if code is None else self.range(code, code)
+
+    def prefix(self, prefix):
+        """Records with a code starting with the digits of prefix ("61" gives 61000-61999)."""
+        prefix = str(prefix).strip()
+        if not prefix.isdigit() or len(prefix) > CODE_LENGTH:
+            return []
+        scale = 10 ** (CODE_LENGTH - len(prefix))
+        return self.range(int(prefix) * scale, (int(prefix) + 1) * scale - 1)
+
+    def search(self, query):
+        """Records for a code ("61001"), a prefix ("610" or "610*") or a range ("61001-61099")."""
+        query = str(query).strip().rstrip("*")
+        intervals = parse_postal_codes(query) if re.fullmatch(r"\d+\s*[-–—]\s*\d+", query) else []
+        if intervals:
+            return self.range(*intervals[0])
+        if len(query) == CODE_LENGTH:
+            return self.exact(query)
+        return self.prefix(query)
+
+
+def build_postal_index():
+    """Builds the postal index of settlements.json and saves it."""
+    start_time = time.time()
+    data_file = os.path.join("assets", "data", "settlements.json")
+    index = PostalIndex.from_file(data_file)
+    logger.info(f"Postal index of {len(index)} records built in {time.time() - start_time:.2f} seconds.")
+    index.save(INDEX_FILE)
+
+if __name__ == '__main__':
+    build_postal_index()
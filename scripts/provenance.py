@@ -0,0 +1,221 @@
+import os
+import zlib
+import hashlib
+import logging
+from datetime import datetime, timezone
+from json_codec import load_json, save_json
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PROVENANCE_FILE = os.path.join("assets", "data", "provenance.json")
+
+# Sources of the settlement fields. ttl_days is how long a value is trusted (None: until
+# the source changes), file is hashed as the source revision (None: no revision).
+SOURCES = {
+    "kodifikator": {"ttl_days": None, "file": os.path.join("assets", "kodifikator", "kodifikator-02-07-2025.csv")},
+    "koatuu_crosswalk": {"ttl_days": None, "file": os.path.join("assets", "kodifikator", "Порівняльна таблиця.csv")},
+    "ua-name-places": {"ttl_days": None, "file": os.path.join("assets", "ua-name-places.csv")},
+    "overpass": {"ttl_days": 90, "file": None},
+    "wikidata": {"ttl_days": 60, "file": None},
+    "decentralization": {"ttl_days": 180, "file": None},
+    "maps": {"ttl_days": None, "file": None},
+    "transliteration": {"ttl_days": None, "file": None},
+}
+
+# Sources computed from other fields rather than read from data. Their values are only
+# placeholders, a step with a real value replaces them.
+COMPUTED_SOURCES = {"transliteration"}
+
+# Source of every step of main.py, the fields a step changes are attributed to it.
+STEP_SOURCES = {
+    "generate_settlements": "kodifikator",
+    "map_koatuu": "koatuu_crosswalk",
+    "add_osm_postal": "ua-name-places",
+    "get_osm_data": "overpass",
+    "find_regions_osm_data": "overpass",
+    "find_settlements_missing_osm_data": "overpass",
+    "add_decentralization_data": "decentralization",
+    "get_wikidata": "wikidata",
+    "add_geometry_data": "maps",
+    "add_transliterations": "transliteration",
+}
+
+# Usual source of every tracked field, used to stamp values set before provenance was kept.
+FIELD_SOURCES = {
+    "name": "kodifikator", "category": "kodifikator", "parent_katotth": "kodifikator",
+    "koatuu_id": "koatuu_crosswalk",
+    "osm_id": "ua-name-places", "postal_code": "ua-name-places",
+    "location": "overpass",
+    "wikidata": "wikidata", "wikipedia": "wikidata", "name:en": "wikidata", "name:ru": "wikidata", "name:pl": "wikidata", "old_name": "wikidata",
+    "population": "decentralization", "square": "decentralization", "hromada_center": "decentralization",
+    "computed_square": "maps",
+}
+TRACKED_FIELDS = tuple(FIELD_SOURCES)
+
+# TTLs are shortened by up to this share per record, so values stamped on the same day do
+# not all expire on the same day and routine refreshes stay small.
+TTL_JITTER = 0.5
+
+
+def now_utc():
+    return datetime.now(timezone.utc).replace(microsecond=0)
+
+def source_revision(source):
+    """Revision of a source: the start of the hash of its file, None for sources without a file."""
+    path = SOURCES.get(source, {}).get("file")
+    if not path or not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+def snapshot(settlements, fields=TRACKED_FIELDS):
+    """Tracked field values of every record, keyed by katotth_id."""
+    return {
+        settlement.get("katotth_id"): {field: settlement[field] for field in fields if field in settlement}
+        for settlement in settlements if settlement.get("katotth_id")
+    }
+
+def _ttl_scale(katotth_id):
+    """Stable per record factor in [1 - TTL_JITTER, 1]."""
+    return 1 - TTL_JITTER * (zlib.crc32(katotth_id.encode("utf-8")) % 1000) / 1000
+
+
+class Provenance:
+    """
+    Source, time and source revision of every tracked field.
+
+    Values written by the same run share one entry of the runs table, so every field
+    costs a single run number: fields[katotth_id][field] = run.
+    """
+
+    def __init__(self, runs=None, fields=None):
+        self.runs = runs or []
+        self.fields = fields or dict()
+        self._run_index = {tuple(run): position for position, run in enumerate(self.runs)}
+
+    @classmethod
+    def load(cls, path=PROVENANCE_FILE):
+        if not os.path.exists(path):
+            return cls()
+        data = load_json(path)
+        return cls([tuple(run) for run in data.get("runs", [])], data.get("fields", {}))
+
+    def save(self, path=PROVENANCE_FILE):
+        save_json({"runs": [list(run) for run in self.runs], "fields": self.fields}, path, pretty=False)
+        logger.info(f"Provenance of {sum(len(fields) for fields in self.fields.values())} fields saved to {path}")
+
+    def run(self, source, updated=None, revision=None):
+        """Number of the (source, updated, revision) run, added on first use."""
+        key = (source, (updated or now_utc()).isoformat(), revision)
+        if key not in self._run_index:
+            self._run_index[key] = len(self.runs)
+            self.runs.append(key)
+        return self._run_index[key]
+
+    def get(self, katotth_id, field):
+        """(source, updated datetime, revision) of a field or None."""
+        run = self.fields.get(katotth_id, {}).get(field)
+        if run is None:
+            return None
+        source, updated, revision = self.runs[run]
+        return source, datetime.fromisoformat(updated), revision
+
+    def is_computed(self, katotth_id, field):
+        """True if a field was computed (COMPUTED_SOURCES) and has no source value."""
+        run = self.fields.get(katotth_id, {}).get(field)
+        return run is not None and self.runs[run][0] in COMPUTED_SOURCES
+
+    def record(self, katotth_id, field, run):
+        self.fields.setdefault(katotth_id, {})[field] = run
+
+    def forget(self, katotth_id, field=None):
+        if field is None:
+            self.fields.pop(katotth_id, None)
+        else:
+            self.fields.get(katotth_id, {}).pop(field, None)
+
+    def record_changes(self, before, settlements, source, updated=None, revision=None):
+        """
+        Attributes the fields that differ from the before snapshot to a run of source.
+        Fields removed by the step lose their provenance.
+
+        Returns the number of fields recorded.
+        """
+        run = None
+        recorded = 0
+        after = snapshot(settlements)
+        for katotth_id, values in after.items():
+            old_values = before.get(katotth_id, {})
+            for field, value in values.items():
+                if old_values.get(field, None) != value:
+                    run = self.run(source, updated, revision) if run is None else run
+                    self.record(katotth_id, field, run)
+                    recorded += 1
+            for field in old_values.keys() - values.keys():
+                self.forget(katotth_id, field)
+        for katotth_id in before.keys() - after.keys():
+            self.forget(katotth_id)
+        return recorded
+
+    def stamp_untracked(self, settlements, updated=None):
+        """Gives values without provenance their usual source (FIELD_SOURCES), returns their number."""
+        runs = dict()
+        stamped = 0
+        for katotth_id, values in snapshot(settlements).items():
+            known = self.fields.get(katotth_id, {})
+            for field in values:
+                if field in known:
+                    continue
+                source = FIELD_SOURCES[field]
+                if source not in runs:
+                    runs[source] = self.run(source, updated, source_revision(source))
+                self.record(katotth_id, field, runs[source])
+                stamped += 1
+        return stamped
+
+    def plan_refresh(self, settlements, now=None, revisions=None, sources=None):
+        """
+        Stale fields by source: {source: {katotth_id: [fields]}}.
+
+        A field is stale when it is older than the TTL of its source (shortened per record
+        by up to TTL_JITTER), or when it was set from another revision of the source file.
+        Fields without provenance are stale too.
+        """
+        now = now or now_utc()
+        revisions = revisions if revisions is not None else {source: source_revision(source) for source in SOURCES}
+        run_stale = []
+        for source, updated, revision in self.runs:
+            config = SOURCES.get(source, {})
+            age_days = (now - datetime.fromisoformat(updated)).total_seconds() / 86400
+            changed = revisions.get(source) is not None and revision != revisions.get(source)
+            run_stale.append((source, age_days, config.get("ttl_days"), changed))
+
+        plan = dict()
+        for katotth_id, values in snapshot(settlements).items():
+            known = self.fields.get(katotth_id, {})
+            for field in values:
+                run = known.get(field)
+                if run is None:
+                    source, stale = FIELD_SOURCES[field], True
+                else:
+                    source, age_days, ttl_days, changed = run_stale[run]
+                    stale = changed or (ttl_days is not None and age_days > ttl_days * _ttl_scale(katotth_id))
+                if stale and (sources is None or source in sources):
+                    plan.setdefault(source, {}).setdefault(katotth_id, []).append(field)
+        return plan
+
+
+def track_step(step_function, data_file=os.path.join("assets", "data", "settlements.json"), path=PROVENANCE_FILE):
+    """
+    Runs a pipeline step and attributes the fields it changed in settlements.json to the
+    source of the step (STEP_SOURCES, the step name itself if it is not listed).
+    """
+    source = STEP_SOURCES.get(step_function.__name__, step_function.__name__)
+    before = snapshot(load_json(data_file)) if os.path.exists(data_file) else dict()
+    result = step_function()
+    provenance = Provenance.load(path)
+    recorded = provenance.record_changes(before, load_json(data_file), source, revision=source_revision(source))
+    provenance.save(path)
+    logger.info(f"{recorded} fields attributed to {source}.")
+    return result
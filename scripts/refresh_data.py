@@ -0,0 +1,98 @@
+import os
+import time
+import logging
+from json_codec import load_json, save_json
+from provenance import Provenance, snapshot, source_revision
+from step_2_map_koatuu import map_koatuu
+from step_3_add_osm_postal import add_osm_postal
+from step_4_get_osm_data import get_osm_data
+from step_5_find_regions_osm_data import find_regions_osm_data
+from step_6_find_settlements_missing_osm_data import find_settlements_missing_osm_data
+from step_7_add_decentralization_data import add_decentralization_data
+from step_8_get_wikidata import get_wikidata
+from step_9_add_geometry_data import add_geometry_data
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Steps that fill the fields of a source again once they are cleared. Kodifikator
+# changes are applied with kodifikator_diff instead.
+REFRESH_STEPS = {
+    "koatuu_crosswalk": (map_koatuu,),
+    "ua-name-places": (add_osm_postal,),
+    "overpass": (get_osm_data, find_regions_osm_data, find_settlements_missing_osm_data),
+    "decentralization": (add_decentralization_data,),
+    "wikidata": (get_wikidata,),
+    "maps": (add_geometry_data,),
+}
+# Steps that take the planned {katotth_id: fields} and only query and write those,
+# the others fill whatever fields are missing.
+PLANNED_STEPS = {get_osm_data, find_regions_osm_data, find_settlements_missing_osm_data}
+
+
+def refresh_source(source, stale, data_file, provenance):
+    """
+    Clears the stale fields of a source, reruns its steps and stamps what they filled.
+    Values the steps could not fill again are restored and stay stale.
+    """
+    settlements = load_json(data_file)
+    cleared = dict()
+    for settlement in settlements:
+        for field in stale.get(settlement.get("katotth_id"), ()):
+            if field in settlement:
+                cleared.setdefault(settlement["katotth_id"], {})[field] = settlement.pop(field)
+    before = snapshot(settlements)
+    save_json(settlements, data_file)
+
+    try:
+        for step_function in REFRESH_STEPS[source]:
+            logger.info(f"Refreshing {source} with {step_function.__name__}...")
+            if step_function in PLANNED_STEPS:
+                step_function(stale)
+            else:
+                step_function()
+    finally:
+        settlements = load_json(data_file)
+        recorded = provenance.record_changes(before, settlements, source, revision=source_revision(source))
+        restored = 0
+        for settlement in settlements:
+            for field, value in cleared.get(settlement.get("katotth_id"), {}).items():
+                if field not in settlement:
+                    settlement[field] = value
+                    restored += 1
+        save_json(settlements, data_file)
+        provenance.save()
+        logger.info(f"{source}: {recorded} fields refreshed, {restored} values kept as they were not found again.")
+
+def refresh_stale_fields(sources=None, dry_run=False):
+    """
+    Plans and runs a refresh of the fields that are older than the TTL of their source
+    or were set from an older revision of it. Values set before provenance was kept are
+    stamped as of now on the first run. Returns the plan.
+    """
+    data_file = os.path.join("assets", "data", "settlements.json")
+    settlements = load_json(data_file)
+    provenance = Provenance.load()
+    stamped = provenance.stamp_untracked(settlements)
+    if stamped:
+        logger.info(f"{stamped} fields without provenance stamped with their usual source.")
+        provenance.save()
+
+    plan = provenance.plan_refresh(settlements, sources=sources)
+    for source, stale in sorted(plan.items()):
+        fields = sum(len(stale_fields) for stale_fields in stale.values())
+        logger.info(f"{source}: {fields} stale fields in {len(stale)} records ({100 * len(stale) / max(len(settlements), 1):.1f}% of records).")
+    if dry_run:
+        return plan
+
+    for source, stale in plan.items():
+        if source not in REFRESH_STEPS:
+            logger.warning(f"No refresh steps for {source}, {len(stale)} records left stale.")
+            continue
+        start_time = time.time()
+        refresh_source(source, stale, data_file, provenance)
+        logger.info(f"{source} refreshed in {time.time() - start_time:.2f} seconds.")
+    return plan
+
+if __name__ == '__main__':
+    refresh_stale_fields(dry_run=True)
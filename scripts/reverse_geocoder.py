@@ -0,0 +1,368 @@
+import os
+import time
+import logging
+import numpy as np
+from categories import SETTLEMENT_TYPES
+from hierarchy import Hierarchy, DEPTH_OBLAST, DEPTH_DISTRICT, DEPTH_HROMADA
+from json_codec import load_json
+from geometry import points_in_edges, haversine_km, KM_PER_DEGREE
+from spatial_validation import load_polygon_layers
+from array_store import save_arrays, load_arrays
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = os.path.join("assets", "data", "reverse_geocoder.npz")
+
+# Layers from the finest to the coarsest, a point takes its chain from the first layer that contains it.
+LAYER_ORDER = ("communities", "districts", "oblasti")
+CHAIN_FIELDS = ("oblast_id", "district_id", "hromada_id")
+CHAIN_DEPTHS = (DEPTH_OBLAST, DEPTH_DISTRICT, DEPTH_HROMADA)
+
+RASTER_CELL_SIZE = 0.02
+POINT_CELL_SIZE = 0.05
+# Nearest settlements farther than this are not returned, every point of Ukraine has one closer.
+MAX_SETTLEMENT_KM = 100.0
+
+# Raster values besides feature rows.
+OUTSIDE = -1
+BOUNDARY = -2
+
+
+def _csr(keys, values, size):
+    """Groups values by integer keys in [0, size) into (offsets, items) arrays."""
+    order = np.argsort(keys, kind="stable")
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(keys, minlength=size))]).astype(np.int64)
+    return offsets, values[order]
+
+def _expand(offsets, items, groups):
+    """Pairs every position with the items of its group, returns (positions, items)."""
+    counts = offsets[groups + 1] - offsets[groups]
+    positions = np.repeat(np.arange(len(groups)), counts)
+    starts = np.repeat(offsets[groups] - np.cumsum(counts) + counts, counts)
+    return positions, items[starts + np.arange(len(positions))]
+
+
+class RasterLayer:
+    """
+    Polygon layer rasterized to a grid. Cells that no edge crosses store the row of the
+    feature covering them (or OUTSIDE), the other cells are BOUNDARY cells that keep a
+    short list of candidate features for an exact point in polygon test.
+    """
+
+    ARRAYS = ("raster", "edges", "edge_offsets", "chains", "boundary_cells", "boundary_offsets", "boundary_items")
+
+    def __init__(self, origin, cell_size, **arrays):
+        self.origin = origin
+        self.cell_size = cell_size
+        for name in self.ARRAYS:
+            setattr(self, name, arrays[name])
+
+    @classmethod
+    def build(cls, polygon_layer, chains, cell_size=RASTER_CELL_SIZE):
+        bboxes = polygon_layer.bboxes
+        origin = (float(bboxes[:, 0].min()) - cell_size, float(bboxes[:, 1].min()) - cell_size)
+        columns = int((bboxes[:, 2].max() - origin[0]) / cell_size) + 2
+        rows = int((bboxes[:, 3].max() - origin[1]) / cell_size) + 2
+
+        # Sample every edge at half a cell and dilate the sampled cells by one cell, so each
+        # cell an edge passes through is marked even if the edge only clips its corner.
+        touched = []
+        for row, edges in enumerate(polygon_layer.edges):
+            lengths = np.hypot(edges[:, 2] - edges[:, 0], edges[:, 3] - edges[:, 1])
+            counts = np.ceil(lengths / (cell_size / 2)).astype(np.int64) + 1
+            edge_index = np.repeat(np.arange(len(edges)), counts)
+            t = (np.arange(len(edge_index)) - np.repeat(np.cumsum(counts) - counts, counts)) / np.repeat(np.maximum(counts - 1, 1), counts)
+            xs = edges[edge_index, 0] + t * (edges[edge_index, 2] - edges[edge_index, 0])
+            ys = edges[edge_index, 1] + t * (edges[edge_index, 3] - edges[edge_index, 1])
+            cell_x = ((xs - origin[0]) / cell_size).astype(np.int64)
+            cell_y = ((ys - origin[1]) / cell_size).astype(np.int64)
+            cells = np.unique(cell_y * columns + cell_x)
+            cell_x, cell_y = cells % columns, cells // columns
+            dilated = [
+                np.clip(cell_y + dy, 0, rows - 1) * columns + np.clip(cell_x + dx, 0, columns - 1)
+                for dy in (-1, 0, 1) for dx in (-1, 0, 1)
+            ]
+            cells = np.unique(np.concatenate(dilated))
+            touched.append(np.stack([cells, np.full(len(cells), row)], axis=1))
+        touched = np.unique(np.concatenate(touched), axis=0) if touched else np.empty((0, 2), dtype=np.int64)
+
+        # Cell centers decide the cells no edge crosses, and the covering feature of boundary cells.
+        center_x = origin[0] + (np.arange(columns) + 0.5) * cell_size
+        center_y = origin[1] + (np.arange(rows) + 0.5) * cell_size
+        grid_x, grid_y = np.meshgrid(center_x, center_y)
+        raster = polygon_layer.locate(grid_x.ravel(), grid_y.ravel()).astype(np.int32)
+
+        boundary_cells = np.unique(touched[:, 0])
+        center_rows = raster[boundary_cells]
+        candidates = np.concatenate([touched, np.stack([boundary_cells, center_rows], axis=1)[center_rows >= 0]])
+        candidates = np.unique(candidates, axis=0)
+        boundary_index = np.searchsorted(boundary_cells, candidates[:, 0])
+        boundary_offsets, boundary_items = _csr(boundary_index, candidates[:, 1].astype(np.int32), len(boundary_cells))
+        raster[boundary_cells] = BOUNDARY
+
+        edge_offsets = np.concatenate([[0], np.cumsum([len(edges) for edges in polygon_layer.edges])]).astype(np.int64)
+        return cls(
+            origin,
+            cell_size,
+            raster=raster.reshape(rows, columns),
+            edges=np.vstack(polygon_layer.edges) if polygon_layer.edges else np.empty((0, 4)),
+            edge_offsets=edge_offsets,
+            chains=chains,
+            boundary_cells=boundary_cells,
+            boundary_offsets=boundary_offsets,
+            boundary_items=boundary_items,
+        )
+
+    def feature_edges(self, row):
+        return self.edges[self.edge_offsets[row]:self.edge_offsets[row + 1]]
+
+    def locate(self, xs, ys):
+        """Returns the feature row of each point, OUTSIDE where no feature contains it."""
+        rows, columns = self.raster.shape
+        cell_x = np.floor((xs - self.origin[0]) / self.cell_size).astype(np.int64)
+        cell_y = np.floor((ys - self.origin[1]) / self.cell_size).astype(np.int64)
+        valid = (cell_x >= 0) & (cell_x < columns) & (cell_y >= 0) & (cell_y < rows)
+        result = np.full(len(xs), OUTSIDE, dtype=np.int64)
+        result[valid] = self.raster[cell_y[valid], cell_x[valid]]
+
+        boundary = np.nonzero(result == BOUNDARY)[0]
+        if len(boundary) == 0:
+            return result
+        result[boundary] = OUTSIDE
+        cells = cell_y[boundary] * columns + cell_x[boundary]
+        groups = np.searchsorted(self.boundary_cells, cells)
+        positions, feature_rows = _expand(self.boundary_offsets, self.boundary_items, groups)
+        points = boundary[positions]
+        order = np.argsort(feature_rows, kind="stable")
+        points, feature_rows = points[order], feature_rows[order]
+        unique_rows, starts = np.unique(feature_rows, return_index=True)
+        ends = np.append(starts[1:], len(feature_rows))
+        for row, start, end in zip(unique_rows, starts, ends):
+            candidates = points[start:end]
+            candidates = candidates[result[candidates] == OUTSIDE]
+            if len(candidates):
+                inside = points_in_edges(xs[candidates], ys[candidates], self.feature_edges(row))
+                result[candidates[inside]] = row
+        return result
+
+
+class PointGrid:
+    """Points bucketed into a uniform grid, cells keep the point rows as (offsets, items)."""
+
+    def __init__(self, origin, cell_size, shape, offsets, items):
+        self.origin = origin
+        self.cell_size = cell_size
+        self.shape = shape
+        self.offsets = offsets
+        self.items = items
+
+    @classmethod
+    def build(cls, points, cell_size):
+        if len(points) == 0:
+            origin, shape = (0.0, 0.0), (1, 1)
+        else:
+            origin = (float(points[:, 0].min()), float(points[:, 1].min()))
+            shape = (int((points[:, 1].max() - origin[1]) / cell_size) + 1, int((points[:, 0].max() - origin[0]) / cell_size) + 1)
+        cells = ((points[:, 1] - origin[1]) / cell_size).astype(np.int64) * shape[1] + ((points[:, 0] - origin[0]) / cell_size).astype(np.int64)
+        offsets, items = _csr(cells, np.arange(len(points), dtype=np.int32), shape[0] * shape[1])
+        return cls(origin, cell_size, shape, offsets, items)
+
+    def to_arrays(self, prefix):
+        return {
+            f"{prefix}.grid": np.array([*self.origin, self.cell_size, *self.shape], dtype=np.float64),
+            f"{prefix}.offsets": self.offsets,
+            f"{prefix}.items": self.items,
+        }
+
+    @classmethod
+    def from_arrays(cls, data, prefix):
+        grid = data[f"{prefix}.grid"]
+        return cls((grid[0], grid[1]), grid[2], (int(grid[3]), int(grid[4])), data[f"{prefix}.offsets"], data[f"{prefix}.items"])
+
+    def ring_pairs(self, xs, ys, queries, radius):
+        """Pairs queries with the points in the ring of cells at the given Chebyshev radius around them."""
+        rows, columns = self.shape
+        ring = np.array([(dx, dy) for dy in range(-radius, radius + 1) for dx in range(-radius, radius + 1) if max(abs(dx), abs(dy)) == radius])
+        cell_x = (np.floor((xs[queries] - self.origin[0]) / self.cell_size).astype(np.int64)[:, None] + ring[:, 0]).ravel()
+        cell_y = (np.floor((ys[queries] - self.origin[1]) / self.cell_size).astype(np.int64)[:, None] + ring[:, 1]).ravel()
+        valid = np.nonzero((cell_x >= 0) & (cell_x < columns) & (cell_y >= 0) & (cell_y < rows))[0]
+        positions, items = _expand(self.offsets, self.items, cell_y[valid] * columns + cell_x[valid])
+        return queries[valid[positions] // len(ring)], items.astype(np.int64)
+
+
+class ReverseGeocoder:
+    """
+    Offline reverse geocoder from coordinates to the KATOTTH chain (oblast, district,
+    hromada) and the nearest settlement.
+
+    Build it once from the map layers and settlements.json, save it and load the
+    compiled index in services.
+    """
+
+    def __init__(self, layers, points, point_ids, point_names, point_grid):
+        self.layers = layers
+        self.points = points
+        self.point_ids = point_ids
+        self.point_names = point_names
+        self.point_grid = point_grid
+
+    @classmethod
+    def build(cls, settlements, polygon_layers=None, cell_size=RASTER_CELL_SIZE):
+        """Builds the index from settlement dicts and the polygon layers of the maps."""
+        settlements = list(settlements)
+        hierarchy = Hierarchy(settlements)
+        if polygon_layers is None:
+            polygon_layers = load_polygon_layers()
+
+        layers = dict()
+        for layer in LAYER_ORDER:
+            polygon_layer = polygon_layers.get(layer)
+            if polygon_layer is None or len(polygon_layer) == 0:
+                continue
+            chains = np.array([
+                [hierarchy.ancestor(feature_id, depth) or "" for depth in CHAIN_DEPTHS] if feature_id in hierarchy
+                else [feature_id if depth == DEPTH_OBLAST and layer == "oblasti" else "" for depth in CHAIN_DEPTHS]
+                for feature_id in polygon_layer.ids
+            ], dtype=str).reshape(-1, len(CHAIN_DEPTHS))
+            start_time = time.time()
+            layers[layer] = RasterLayer.build(polygon_layer, chains, cell_size)
+            logger.info(f"Rasterized {layer} layer with {len(polygon_layer)} features in {time.time() - start_time:.2f} seconds.")
+
+        located = [s for s in settlements if s.get("category") in SETTLEMENT_TYPES and s.get("location") and len(s["location"]) >= 2]
+        points = np.array([s["location"][:2] for s in located], dtype=np.float64).reshape(-1, 2)
+        point_ids = np.array([s.get("katotth_id") or "" for s in located], dtype=str)
+        point_names = np.array([s.get("name") or "" for s in located], dtype=str)
+        return cls(layers, points, point_ids, point_names, PointGrid.build(points, POINT_CELL_SIZE))
+
+    def save(self, path=INDEX_FILE):
+        arrays = {
+            "points": self.points,
+            "point_ids": self.point_ids,
+            "point_names": self.point_names,
+            "layers": np.array(list(self.layers), dtype=str),
+            **self.point_grid.to_arrays("point_grid"),
+        }
+        for layer, raster_layer in self.layers.items():
+            arrays[f"{layer}.grid"] = np.array([*raster_layer.origin, raster_layer.cell_size], dtype=np.float64)
+            for name in RasterLayer.ARRAYS:
+                arrays[f"{layer}.{name}"] = getattr(raster_layer, name)
+        save_arrays(path, arrays)
+        logger.info(f"Reverse geocoder index saved to {path} ({os.path.getsize(path) / 1024 / 1024:.1f} MB)")
+
+    @classmethod
+    def load(cls, path=INDEX_FILE):
+        """Loads a compiled index saved with save()."""
+        data = load_arrays(path)
+        layers = dict()
+        for layer in data["layers"]:
+            grid = data[f"{layer}.grid"]
+            layers[str(layer)] = RasterLayer((grid[0], grid[1]), grid[2], **{name: data[f"{layer}.{name}"] for name in RasterLayer.ARRAYS})
+        return cls(layers, data["points"], data["point_ids"], data["point_names"], PointGrid.from_arrays(data, "point_grid"))
+
+    def locate_chains(self, xs, ys):
+        """Returns an (n, 3) array of oblast, district and hromada ids, '' where unknown."""
+        chains = np.full((len(xs), len(CHAIN_FIELDS)), "", dtype=object)
+        pending = np.arange(len(xs))
+        for layer in LAYER_ORDER:
+            raster_layer = self.layers.get(layer)
+            if raster_layer is None or len(pending) == 0:
+                continue
+            rows = raster_layer.locate(xs[pending], ys[pending])
+            found = rows >= 0
+            chains[pending[found]] = raster_layer.chains[rows[found]]
+            pending = pending[~found]
+        return chains
+
+    def nearest_settlements(self, xs, ys, max_km=MAX_SETTLEMENT_KM):
+        """
+        Returns (rows, distances_km) of the nearest settlement to each point, -1 and inf
+        when there is none within max_km.
+
+        The point grid is scanned in rings of cells around every query, a query is done
+        once its best distance is shorter than the distance to the next ring or the ring
+        is farther than max_km. Queries farther than max_km from the grid extent (outside
+        of Ukraine or bad coordinates) are not scanned at all.
+        """
+        rows = np.full(len(xs), -1, dtype=np.int64)
+        distances = np.full(len(xs), np.inf)
+        if len(self.points) == 0 or len(xs) == 0:
+            return rows, distances
+
+        cell_size = self.point_grid.cell_size
+        min_x, min_y = self.point_grid.origin
+        max_x = min_x + self.point_grid.shape[1] * cell_size
+        max_y = min_y + self.point_grid.shape[0] * cell_size
+        # A degree of longitude is shortest at the latitude farthest from the equator.
+        lat_margin = max_km / KM_PER_DEGREE
+        max_lat = min(max(abs(min_y - lat_margin), abs(max_y + lat_margin)), 89.0)
+        lon_margin = lat_margin / np.cos(np.radians(max_lat))
+        near = ((xs >= min_x - lon_margin) & (xs <= max_x + lon_margin)
+                & (ys >= min_y - lat_margin) & (ys <= max_y + lat_margin))
+
+        pending = np.flatnonzero(near)
+        radius = 0
+        while len(pending):
+            queries, candidates = self.point_grid.ring_pairs(xs, ys, pending, radius)
+            self._update_nearest(xs, ys, queries, candidates, rows, distances)
+
+            # Points outside of the scanned rings are at least radius cells away.
+            cell_km = cell_size * KM_PER_DEGREE * np.cos(np.radians(np.minimum(np.abs(ys[pending]) + (radius + 1) * cell_size, 90)))
+            ring_km = radius * cell_km
+            pending = pending[(distances[pending] > ring_km) & (ring_km < max_km)]
+            radius += 1
+
+        far = distances > max_km
+        rows[far] = -1
+        distances[far] = np.inf
+        return rows, distances
+
+    def _update_nearest(self, xs, ys, queries, candidates, rows, distances):
+        if len(queries) == 0:
+            return
+        pair_distances = haversine_km(xs[queries], ys[queries], self.points[candidates, 0], self.points[candidates, 1])
+        order = np.lexsort((pair_distances, queries))
+        queries, candidates, pair_distances = queries[order], candidates[order], pair_distances[order]
+        first = np.concatenate([[True], queries[1:] != queries[:-1]])
+        queries, candidates, pair_distances = queries[first], candidates[first], pair_distances[first]
+        closer = pair_distances < distances[queries]
+        rows[queries[closer]] = candidates[closer]
+        distances[queries[closer]] = pair_distances[closer]
+
+    def lookup_many(self, coordinates):
+        """
+        Reverse geocodes an (n, 2) array of lon/lat.
+
+        Returns a dict of arrays: oblast_id, district_id, hromada_id, settlement_id,
+        settlement_name and distance_km to the nearest settlement.
+        """
+        coordinates = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+        xs, ys = coordinates[:, 0], coordinates[:, 1]
+        chains = self.locate_chains(xs, ys)
+        rows, distances = self.nearest_settlements(xs, ys)
+        found = rows >= 0
+        settlement_ids = np.full(len(xs), "", dtype=object)
+        settlement_names = np.full(len(xs), "", dtype=object)
+        settlement_ids[found] = self.point_ids[rows[found]]
+        settlement_names[found] = self.point_names[rows[found]]
+        result = {field: chains[:, column] for column, field in enumerate(CHAIN_FIELDS)}
+        result.update({"settlement_id": settlement_ids, "settlement_name": settlement_names, "distance_km": distances})
+        return result
+
+    def lookup(self, lon, lat):
+        """Reverse geocodes a single point, returns a dict with the KATOTTH chain and the nearest settlement."""
+        result = self.lookup_many([[lon, lat]])
+        return {key: (values[0] or None) if key != "distance_km" else float(values[0]) for key, values in result.items()}
+
+
+def build_reverse_geocoder():
+    """Builds the reverse geocoder index from settlements.json and the maps."""
+    data_file = os.path.join("assets", "data", "settlements.json")
+    start_time = time.time()
+    geocoder = ReverseGeocoder.build(load_json(data_file))
+    geocoder.save(INDEX_FILE)
+    logger.info(f"Reverse geocoder built in {time.time() - start_time:.2f} seconds.")
+    return geocoder
+
+if __name__ == '__main__':
+    build_reverse_geocoder()
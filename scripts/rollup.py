@@ -0,0 +1,219 @@
+import csv
+import os
+import logging
+from array import array
+from categories import ALL_TYPES, get_category_name
+from hierarchy import Hierarchy, HIERARCHY_FIELDS
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+ROLLUP_FIELDS = ("population", "square")
+
+def parse_number(value):
+    """Parses population and square values like 1234, "1 234" or "12,5". Returns None if not a number."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip().replace("\u00a0", "").replace(" ", "").replace(",", ".")
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+def format_number(field, value):
+    """Formats an aggregated value the way the sources write it."""
+    if field == "population":
+        return f"{round(value)}"
+    value = round(value, 2)
+    return f"{int(value)}" if value.is_integer() else f"{value}"
+
+
+class Rollup:
+    """
+    Bottom-up aggregates of numeric fields and settlement counts over the KATOTTH tree.
+
+    Computed in one pass over the hierarchy rows in reverse preorder, so every node is
+    finished before its parent. A child contributes its own source value, or its
+    computed aggregate when it has no source value but all of its children are covered.
+    """
+
+    def __init__(self, hierarchy, fields=ROLLUP_FIELDS):
+        self.hierarchy = hierarchy
+        self.fields = fields
+        size = len(hierarchy)
+        self.source = {field: [None] * size for field in fields}
+        self.computed = {field: array("d", bytes(8 * size)) for field in fields}
+        self.covered = {field: array("i", bytes(4 * size)) for field in fields}
+        self.children_count = array("i", bytes(4 * size))
+        self.counts = {category: array("i", bytes(4 * size)) for category in ALL_TYPES}
+
+        parents = hierarchy.parents
+        for row in range(size - 1, -1, -1):
+            record = hierarchy.records[row]
+            for field in fields:
+                self.source[field][row] = parse_number(record.get(field))
+
+            parent_row = parents[row]
+            if parent_row < 0:
+                continue
+            self.children_count[parent_row] += 1
+            category = record.get("category")
+            for count_category, counts in self.counts.items():
+                counts[parent_row] += counts[row] + (count_category == category)
+            for field in fields:
+                value = self.value(field, row)
+                if value is not None:
+                    self.computed[field][parent_row] += value
+                    self.covered[field][parent_row] += 1
+
+    @classmethod
+    def from_file(cls, path, fields=ROLLUP_FIELDS):
+        """Builds the roll-up straight from settlements.json."""
+        return cls(Hierarchy.from_file(path, HIERARCHY_FIELDS + tuple(fields)), fields)
+
+    def is_complete(self, field, row):
+        """True if every child of the node contributed to its computed value."""
+        return self.children_count[row] > 0 and self.covered[field][row] == self.children_count[row]
+
+    def value(self, field, row):
+        """Source value of a node, or its computed value when complete, or None."""
+        source = self.source[field][row]
+        if source is not None:
+            return source
+        if self.is_complete(field, row):
+            return self.computed[field][row]
+        return None
+
+    def get(self, katotth_id, field):
+        """Returns (source, computed, complete) of a node."""
+        row = self.hierarchy.index[katotth_id]
+        return self.source[field][row], self.computed[field][row], self.is_complete(field, row)
+
+    def get_counts(self, katotth_id):
+        """Returns the number of descendants of a node per category."""
+        row = self.hierarchy.index[katotth_id]
+        return {category: counts[row] for category, counts in self.counts.items() if counts[row]}
+
+    def find_deltas(self, threshold=0.05):
+        """
+        Lists nodes whose source value differs from the complete computed aggregate by more than threshold (relative).
+        """
+        deltas = []
+        for field in self.fields:
+            source_values = self.source[field]
+            computed_values = self.computed[field]
+            for row, source in enumerate(source_values):
+                if not source or not self.is_complete(field, row):
+                    continue
+                delta = (computed_values[row] - source) / source
+                if abs(delta) > threshold:
+                    record = self.hierarchy.records[row]
+                    deltas.append({
+                        "katotth_id": record.get("katotth_id"),
+                        "name": record.get("name"),
+                        "category": record.get("category"),
+                        "field": field,
+                        "source": source,
+                        "computed": computed_values[row],
+                        "delta": delta,
+                    })
+        return deltas
+
+    def fill_missing(self, fields=None):
+        """
+        Writes complete computed aggregates into records that have no source value.
+
+        Returns the number of values written.
+        """
+        filled = 0
+        for field in fields or self.fields:
+            for row, source in enumerate(self.source[field]):
+                if source is None and self.is_complete(field, row):
+                    self.hierarchy.records[row][field] = format_number(field, self.computed[field][row])
+                    filled += 1
+        return filled
+
+    def summary_table(self):
+        """Returns one row per category with node counts, coverage and totals of each field."""
+        rows = {category: {"category": category, "type": get_category_name(category), "count": 0} for category in ALL_TYPES}
+        for category_row in rows.values():
+            for field in self.fields:
+                category_row.update({f"{field}_source": 0, f"{field}_computed": 0, f"{field}_sum": 0.0})
+
+        for row, record in enumerate(self.hierarchy.records):
+            category_row = rows.get(record.get("category"))
+            if not category_row:
+                continue
+            category_row["count"] += 1
+            for field in self.fields:
+                if self.source[field][row] is not None:
+                    category_row[f"{field}_source"] += 1
+                elif self.is_complete(field, row):
+                    category_row[f"{field}_computed"] += 1
+                value = self.value(field, row)
+                if value is not None:
+                    category_row[f"{field}_sum"] += value
+        for category_row in rows.values():
+            for field in self.fields:
+                category_row[f"{field}_sum"] = round(category_row[f"{field}_sum"], 2)
+        return [category_row for category_row in rows.values() if category_row["count"]]
+
+    def level_table(self, category):
+        """Returns one row per node of a category with its values and descendant counts."""
+        table = []
+        for row, record in enumerate(self.hierarchy.records):
+            if record.get("category") != category:
+                continue
+            table_row = {"katotth_id": record.get("katotth_id"), "name": record.get("name")}
+            for field in self.fields:
+                table_row[field] = self.source[field][row]
+                table_row[f"{field}_computed"] = round(self.computed[field][row], 2)
+                table_row[f"{field}_coverage"] = f"{self.covered[field][row]}/{self.children_count[row]}"
+            for count_category, counts in self.counts.items():
+                table_row[count_category] = counts[row]
+            table.append(table_row)
+        return table
+
+
+def save_table(table, path):
+    """Saves a list of row dicts as CSV."""
+    if not table:
+        return
+    with open(path, 'w', encoding='utf-8', newline='') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=list(table[0].keys()))
+        writer.writeheader()
+        writer.writerows(table)
+
+def log_rollup_report(rollup, threshold=0.05):
+    """Logs the per-category summary and the nodes with large deltas."""
+    for category_row in rollup.summary_table():
+        details = ", ".join(
+            f"{field}: {category_row[f'{field}_source']} from source, {category_row[f'{field}_computed']} computed, total {category_row[f'{field}_sum']:.0f}"
+            for field in rollup.fields
+        )
+        logger.info(f"'{category_row['type']}' ({category_row['count']}): {details}")
+
+    for delta in rollup.find_deltas(threshold):
+        logger.warning(
+            f"{delta['field']} of {delta['katotth_id']} {delta['name']} is {delta['source']:g} in source "
+            f"but {delta['computed']:g} summed over its children ({delta['delta']:+.1%})."
+        )
+
+def rollup_settlements():
+    """Builds the roll-up for settlements.json and saves per-level summary tables."""
+    data_file = os.path.join("assets", "data", "settlements.json")
+    output_dir = os.path.join("assets", "data", "rollup")
+    os.makedirs(output_dir, exist_ok=True)
+
+    rollup = Rollup.from_file(data_file)
+    log_rollup_report(rollup)
+
+    save_table(rollup.summary_table(), os.path.join(output_dir, "summary.csv"))
+    for category in ("O", "P", "H"):
+        save_table(rollup.level_table(category), os.path.join(output_dir, f"level_{category}.csv"))
+    logger.info(f"Roll-up tables saved to {output_dir}")
+
+if __name__ == '__main__':
+    rollup_settlements()
@@ -0,0 +1,280 @@
+import os
+import heapq
+import logging
+import numpy as np
+from categories import ALL_TYPES, SETTLEMENT_TYPES
+from geometry import EARTH_RADIUS_KM
+from json_codec import load_json
+from array_store import save_arrays, load_arrays
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = os.path.join("assets", "data", "settlement_index.npz")
+
+LEAF_SIZE = 16
+CATEGORY_BITS = {category: 1 << bit for bit, category in enumerate(ALL_TYPES)}
+
+
+def to_unit_vectors(lons, lats):
+    """Converts lon/lat degrees to points on the unit sphere, chord length grows with great-circle distance."""
+    lons = np.radians(np.asarray(lons, dtype=np.float64))
+    lats = np.radians(np.asarray(lats, dtype=np.float64))
+    cos_lat = np.cos(lats)
+    return np.stack([cos_lat * np.cos(lons), cos_lat * np.sin(lons), np.sin(lats)], axis=-1)
+
+def chord_to_km(chord):
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(np.asarray(chord) / 2, 0, 1))
+
+def km_to_chord(distance_km):
+    return 2 * np.sin(np.minimum(np.asarray(distance_km, dtype=np.float64) / EARTH_RADIUS_KM, np.pi) / 2)
+
+
+class SettlementIndex:
+    """
+    KD-tree over settlement locations on the unit sphere for k nearest and radius
+    queries with great-circle distances in kilometers.
+
+    Every node keeps a bit mask of the categories and oblasts below it, so filtered
+    queries skip whole subtrees without matching settlements.
+    """
+
+    ARRAYS = ("locations", "ids", "names", "categories", "oblast_ids", "oblasts", "order",
+              "node_start", "node_end", "node_left", "node_right", "node_min", "node_max", "node_categories", "node_oblasts")
+
+    def __init__(self, **arrays):
+        for name in self.ARRAYS:
+            setattr(self, name, arrays[name])
+        self.vectors = to_unit_vectors(self.locations[:, 0], self.locations[:, 1])
+        self.oblast_bits = {oblast: 1 << bit for bit, oblast in enumerate(self.oblasts.tolist())}
+        # Tree traversal reads single nodes, plain lists are much faster than numpy scalars there.
+        self._nodes = list(zip(
+            self.node_start.tolist(), self.node_end.tolist(), self.node_left.tolist(), self.node_right.tolist(),
+            self.node_min.tolist(), self.node_max.tolist(), self.node_categories.tolist(), self.node_oblasts.tolist(),
+        ))
+        self._point_categories = np.array([CATEGORY_BITS.get(category, 0) for category in self.categories.tolist()], dtype=np.int64)
+        self._point_oblasts = np.array([self.oblast_bits.get(oblast, 0) for oblast in self.oblast_ids.tolist()], dtype=np.int64)
+
+    @classmethod
+    def build(cls, settlements, categories=SETTLEMENT_TYPES, leaf_size=LEAF_SIZE):
+        """Builds the index over the located settlements of the given categories."""
+        located = [
+            s for s in settlements
+            if s.get("category") in categories and s.get("location") and len(s["location"]) >= 2
+        ]
+        locations = np.array([s["location"][:2] for s in located], dtype=np.float64).reshape(-1, 2)
+        oblast_ids = [s.get("oblast_id") or (s.get("katotth_id") if s.get("category") in ("O", "K") else "") or "" for s in located]
+        oblasts = sorted(set(oblast_ids) - {""})
+        if len(oblasts) > 63:
+            raise ValueError(f"Too many oblasts for the node masks: {len(oblasts)}")
+        oblast_bits = {oblast: 1 << bit for bit, oblast in enumerate(oblasts)}
+        point_categories = np.array([CATEGORY_BITS.get(s.get("category"), 0) for s in located], dtype=np.int64)
+        point_oblasts = np.array([oblast_bits.get(oblast, 0) for oblast in oblast_ids], dtype=np.int64)
+
+        vectors = to_unit_vectors(locations[:, 0], locations[:, 1])
+        order = np.arange(len(located))
+        nodes = []
+
+        def build_node(start, end):
+            node = len(nodes)
+            rows = order[start:end]
+            points = vectors[rows]
+            node_min = points.min(axis=0) if len(rows) else np.zeros(3)
+            node_max = points.max(axis=0) if len(rows) else np.zeros(3)
+            nodes.append([
+                start, end, -1, -1, node_min, node_max,
+                int(np.bitwise_or.reduce(point_categories[rows])) if len(rows) else 0,
+                int(np.bitwise_or.reduce(point_oblasts[rows])) if len(rows) else 0,
+            ])
+            if end - start > leaf_size:
+                axis = int(np.argmax(node_max - node_min))
+                middle = (end - start) // 2
+                order[start:end] = rows[np.argpartition(points[:, axis], middle)]
+                nodes[node][2] = build_node(start, start + middle)
+                nodes[node][3] = build_node(start + middle, end)
+            return node
+
+        build_node(0, len(located))
+        return cls(
+            locations=locations,
+            ids=np.array([s.get("katotth_id") or "" for s in located], dtype=str),
+            names=np.array([s.get("name") or "" for s in located], dtype=str),
+            categories=np.array([s.get("category") or "" for s in located], dtype=str),
+            oblast_ids=np.array(oblast_ids, dtype=str),
+            oblasts=np.array(oblasts, dtype=str),
+            order=order,
+            node_start=np.array([node[0] for node in nodes], dtype=np.int64),
+            node_end=np.array([node[1] for node in nodes], dtype=np.int64),
+            node_left=np.array([node[2] for node in nodes], dtype=np.int64),
+            node_right=np.array([node[3] for node in nodes], dtype=np.int64),
+            node_min=np.array([node[4] for node in nodes], dtype=np.float64).reshape(-1, 3),
+            node_max=np.array([node[5] for node in nodes], dtype=np.float64).reshape(-1, 3),
+            node_categories=np.array([node[6] for node in nodes], dtype=np.int64),
+            node_oblasts=np.array([node[7] for node in nodes], dtype=np.int64),
+        )
+
+    @classmethod
+    def from_file(cls, path, categories=SETTLEMENT_TYPES):
+        return cls.build(load_json(path), categories)
+
+    def save(self, path=INDEX_FILE):
+        save_arrays(path, {name: getattr(self, name) for name in self.ARRAYS})
+        logger.info(f"Settlement index with {len(self)} points saved to {path}")
+
+    @classmethod
+    def load(cls, path=INDEX_FILE):
+        return cls(**load_arrays(path, cls.ARRAYS))
+
+    def __len__(self):
+        return len(self.locations)
+
+    def _filter_masks(self, category, oblast_id):
+        """Turns category and oblast_id filters (a value or a collection) into bit masks, -1 for no filter."""
+        masks = []
+        for value, bits in ((category, CATEGORY_BITS), (oblast_id, self.oblast_bits)):
+            if value is None:
+                masks.append(-1)
+                continue
+            values = [value] if isinstance(value, str) else value
+            masks.append(sum(bits.get(item, 0) for item in set(values)))
+        return masks
+
+    def _leaf_rows(self, start, end, category_mask, oblast_mask):
+        rows = self.order[start:end]
+        if category_mask != -1:
+            rows = rows[(self._point_categories[rows] & category_mask) != 0]
+        if oblast_mask != -1:
+            rows = rows[(self._point_oblasts[rows] & oblast_mask) != 0]
+        return rows
+
+    @staticmethod
+    def _box_distance(vector, node_min, node_max):
+        """Squared distance from a point to a node box, a lower bound of the squared chord to its points."""
+        distance = 0.0
+        for value, low, high in zip(vector, node_min, node_max):
+            if value < low:
+                distance += (low - value) ** 2
+            elif value > high:
+                distance += (value - high) ** 2
+        return distance
+
+    def _knn(self, vector, k, category_mask, oblast_mask, max_chord):
+        best_rows = np.empty(0, dtype=np.int64)
+        best_distances = np.empty(0)
+        bound = max_chord * max_chord
+        heap = [(0.0, 0)]
+        while heap:
+            node_distance, node = heapq.heappop(heap)
+            if node_distance > bound:
+                break
+            start, end, left, right, _, _, _, _ = self._nodes[node]
+            if left < 0:
+                rows = self._leaf_rows(start, end, category_mask, oblast_mask)
+                if len(rows) == 0:
+                    continue
+                distances = ((self.vectors[rows] - vector) ** 2).sum(axis=1)
+                best_rows = np.concatenate([best_rows, rows])
+                best_distances = np.concatenate([best_distances, distances])
+                if len(best_rows) > k:
+                    keep = np.argpartition(best_distances, k - 1)[:k]
+                    best_rows, best_distances = best_rows[keep], best_distances[keep]
+                if len(best_rows) == k:
+                    bound = min(bound, float(best_distances.max()))
+                continue
+            for child in (left, right):
+                _, _, _, _, node_min, node_max, categories, oblasts = self._nodes[child]
+                if not (categories & category_mask and oblasts & oblast_mask):
+                    continue
+                child_distance = self._box_distance(vector, node_min, node_max)
+                if child_distance <= bound:
+                    heapq.heappush(heap, (child_distance, child))
+
+        within = best_distances <= max_chord * max_chord
+        best_rows, best_distances = best_rows[within], best_distances[within]
+        order = np.argsort(best_distances, kind="stable")
+        return best_rows[order], chord_to_km(np.sqrt(best_distances[order]))
+
+    def _radius(self, vector, chord, category_mask, oblast_mask):
+        found_rows = []
+        bound = chord * chord
+        stack = [0]
+        while stack:
+            start, end, left, right, node_min, node_max, categories, oblasts = self._nodes[stack.pop()]
+            if not (categories & category_mask and oblasts & oblast_mask) or self._box_distance(vector, node_min, node_max) > bound:
+                continue
+            if left >= 0:
+                stack.extend((right, left))
+                continue
+            rows = self._leaf_rows(start, end, category_mask, oblast_mask)
+            found_rows.append(rows[((self.vectors[rows] - vector) ** 2).sum(axis=1) <= bound])
+
+        rows = np.concatenate(found_rows) if found_rows else np.empty(0, dtype=np.int64)
+        distances = chord_to_km(np.sqrt(((self.vectors[rows] - vector) ** 2).sum(axis=1)))
+        order = np.argsort(distances, kind="stable")
+        return rows[order], distances[order]
+
+    def knn(self, lon, lat, k=1, category=None, oblast_id=None, max_distance_km=None):
+        """
+        Returns (rows, distances_km) of the k nearest settlements sorted by distance,
+        optionally filtered by category and oblast_id and limited to max_distance_km.
+        """
+        category_mask, oblast_mask = self._filter_masks(category, oblast_id)
+        max_chord = 2.0 if max_distance_km is None else float(km_to_chord(max_distance_km))
+        return self._knn(to_unit_vectors(lon, lat), k, category_mask, oblast_mask, max_chord)
+
+    def radius(self, lon, lat, radius_km, category=None, oblast_id=None):
+        """Returns (rows, distances_km) of the settlements within radius_km sorted by distance."""
+        category_mask, oblast_mask = self._filter_masks(category, oblast_id)
+        return self._radius(to_unit_vectors(lon, lat), float(km_to_chord(radius_km)), category_mask, oblast_mask)
+
+    def knn_many(self, coordinates, k=1, category=None, oblast_id=None, max_distance_km=None):
+        """
+        Batched knn over an (n, 2) array of lon/lat. Returns (n, k) arrays of rows and
+        distances, padded with -1 and inf where fewer than k settlements match.
+        """
+        coordinates = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+        category_mask, oblast_mask = self._filter_masks(category, oblast_id)
+        max_chord = 2.0 if max_distance_km is None else float(km_to_chord(max_distance_km))
+        rows = np.full((len(coordinates), k), -1, dtype=np.int64)
+        distances = np.full((len(coordinates), k), np.inf)
+        for query, vector in enumerate(to_unit_vectors(coordinates[:, 0], coordinates[:, 1])):
+            found_rows, found_distances = self._knn(vector, k, category_mask, oblast_mask, max_chord)
+            rows[query, :len(found_rows)] = found_rows
+            distances[query, :len(found_rows)] = found_distances
+        return rows, distances
+
+    def radius_many(self, coordinates, radius_km, category=None, oblast_id=None):
+        """Batched radius query over an (n, 2) array of lon/lat, returns a list of (rows, distances_km)."""
+        coordinates = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+        category_mask, oblast_mask = self._filter_masks(category, oblast_id)
+        chord = float(km_to_chord(radius_km))
+        return [self._radius(vector, chord, category_mask, oblast_mask) for vector in to_unit_vectors(coordinates[:, 0], coordinates[:, 1])]
+
+    def records(self, rows, distances=None):
+        """Describes result rows as dicts with katotth_id, name, category, oblast_id, location and distance_km."""
+        result = []
+        for position, row in enumerate(rows):
+            if row < 0:
+                continue
+            record = {
+                "katotth_id": str(self.ids[row]),
+                "name": str(self.names[row]),
+                "category": str(self.categories[row]),
+                "oblast_id": str(self.oblast_ids[row]) or None,
+                "location": self.locations[row].tolist(),
+            }
+            if distances is not None:
+                record["distance_km"] = round(float(distances[position]), 3)
+            result.append(record)
+        return result
+
+
+def build_settlement_index():
+    """Builds the settlement index from settlements.json and saves it."""
+    data_file = os.path.join("assets", "data", "settlements.json")
+    index = SettlementIndex.from_file(data_file)
+    index.save(INDEX_FILE)
+    return index
+
+if __name__ == '__main__':
+    build_settlement_index()
@@ -0,0 +1,305 @@
+import os
+import sys
+import mmap
+import time
+import zlib
+import logging
+from array import array
+from json_codec import dumps_json, loads_json, load_json
+from hierarchy import Hierarchy
+from postal_codes import expand_postal_codes
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = os.path.join("assets", "data", "settlement_lookup.bin")
+
+MAGIC = b"UASLKUP1"
+ALIGNMENT = 8
+# Fields with a hash table, katotth_id is unique, the others may be shared by several records.
+ID_FIELDS = ("katotth_id", "koatuu_id", "osm_id", "wikidata", "postal_code")
+# Fields holding several values in one string and the function splitting them into keys.
+MULTI_VALUE_FIELDS = {"postal_code": expand_postal_codes}
+
+
+def _keys(field, value):
+    if value is None or value == "":
+        return []
+    if field in MULTI_VALUE_FIELDS:
+        return MULTI_VALUE_FIELDS[field](value)
+    return [str(value)]
+
+def _hash(key):
+    """Stable hash of the UTF-8 bytes of a key, the same in every process."""
+    return zlib.crc32(key)
+
+def _hash_table(field, rows_by_key):
+    """Sections of the open addressing table of a field: slots, keys and the rows of every key."""
+    keys = list(rows_by_key)
+    size = 1
+    while size < 2 * len(keys):
+        size *= 2
+    slots = array("i", [-1]) * size
+    key_offsets = array("q", [0])
+    key_blob = bytearray()
+    row_offsets = array("i", [0])
+    rows = array("i")
+    for entry, key in enumerate(keys):
+        slot = _hash(key) & (size - 1)
+        while slots[slot] != -1:
+            slot = (slot + 1) & (size - 1)
+        slots[slot] = entry
+        key_blob += key
+        key_offsets.append(len(key_blob))
+        rows.extend(rows_by_key[key])
+        row_offsets.append(len(rows))
+    return {
+        f"{field}:slots": slots,
+        f"{field}:key_offsets": key_offsets,
+        f"{field}:keys": bytes(key_blob),
+        f"{field}:row_offsets": row_offsets,
+        f"{field}:rows": rows,
+    }
+
+def write_lookup_index(settlements, path=INDEX_FILE):
+    """
+    Writes the lookup index of settlements, returns the number of records.
+
+    Records are stored as compact JSON in DFS preorder of the hierarchy, so a subtree is
+    a row range. The file is a header (magic, JSON section table) and 8 byte aligned
+    native-endian sections.
+    """
+    hierarchy = Hierarchy(settlements)
+    records = hierarchy.records
+    record_offsets = array("q", [0])
+    record_blob = bytearray()
+    for record in records:
+        record_blob += dumps_json(dict(record), pretty=False)
+        record_offsets.append(len(record_blob))
+
+    # Children in preorder are in row order, grouped by parent they form a CSR list.
+    child_lists = [[] for _ in records]
+    for row, parent_row in enumerate(hierarchy.parents):
+        if parent_row >= 0:
+            child_lists[parent_row].append(row)
+    child_offsets = array("i", [0])
+    children = array("i")
+    for child_list in child_lists:
+        children.extend(child_list)
+        child_offsets.append(len(children))
+
+    sections = {
+        "record_offsets": record_offsets,
+        "records": bytes(record_blob),
+        "parents": hierarchy.parents,
+        "exits": hierarchy.exits,
+        "child_offsets": child_offsets,
+        "children": children,
+    }
+    for field in ID_FIELDS:
+        rows_by_key = dict()
+        for row, record in enumerate(records):
+            for key in _keys(field, record.get(field)):
+                rows = rows_by_key.setdefault(key.encode("utf-8"), [])
+                if not rows or rows[-1] != row:
+                    rows.append(row)
+        sections.update(_hash_table(field, rows_by_key))
+
+    data = {name: bytes(section) for name, section in sections.items()}
+    formats = {name: section.typecode if isinstance(section, array) else "B" for name, section in sections.items()}
+
+    def layout(header_size):
+        offset = header_size
+        table = dict()
+        for name, blob in data.items():
+            offset += -offset % ALIGNMENT
+            table[name] = [offset, len(blob), formats[name]]
+            offset += len(blob)
+        return {"byteorder": sys.byteorder, "count": len(records), "sections": table}
+
+    # Section offsets depend on the header size, repeat until the encoded header fits.
+    header_size = 0
+    while True:
+        header = dumps_json(layout(header_size), pretty=False)
+        size = len(MAGIC) + 4 + len(header)
+        size += -size % ALIGNMENT
+        if size <= header_size:
+            break
+        header_size = size
+
+    offsets = {name: offset for name, (offset, _, _) in layout(header_size)["sections"].items()}
+    with open(path, "wb") as f:
+        f.write(MAGIC + len(header).to_bytes(4, "little") + header)
+        for name, blob in data.items():
+            f.write(b"\0" * (offsets[name] - f.tell()))
+            f.write(blob)
+    return len(records)
+
+
+class SettlementLookup:
+    """
+    Read-only settlements with lookups by any ID and hierarchy navigation, backed by a
+    memory-mapped index file written by write_lookup_index.
+
+    Opening only maps the file and reads its header; records are decoded from JSON when
+    they are requested. Worker processes mapping the same file share its pages.
+    """
+
+    def __init__(self, path=INDEX_FILE):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        if view[:len(MAGIC)] != MAGIC:
+            view.release()
+            self._mmap.close()
+            raise ValueError(f"{path} is not a settlement lookup index")
+        header_end = len(MAGIC) + 4 + int.from_bytes(view[len(MAGIC):len(MAGIC) + 4], "little")
+        header = loads_json(bytes(view[len(MAGIC) + 4:header_end]))
+        if header["byteorder"] != sys.byteorder:
+            view.release()
+            self._mmap.close()
+            raise ValueError(f"{path} was written on a {header['byteorder']} endian machine")
+        self.count = header["count"]
+        self._views = [view]
+        self._sections = dict()
+        for name, (offset, length, fmt) in header["sections"].items():
+            section = view[offset:offset + length]
+            self._sections[name] = section if fmt == "B" else section.cast(fmt)
+            self._views.append(section)
+        self._records = self._sections["records"]
+        self._record_offsets = self._sections["record_offsets"]
+        self._parents = self._sections["parents"]
+        self._exits = self._sections["exits"]
+        self._child_offsets = self._sections["child_offsets"]
+        self._children = self._sections["children"]
+        self._tables = {
+            field: tuple(self._sections[f"{field}:{part}"] for part in ("slots", "key_offsets", "keys", "row_offsets", "rows"))
+            for field in ID_FIELDS
+        }
+
+    @classmethod
+    def load(cls, path=INDEX_FILE):
+        return cls(path)
+
+    def close(self):
+        for section in self._sections.values():
+            section.release()
+        for view in self._views:
+            view.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def record(self, row):
+        """Decodes the record at a row."""
+        return loads_json(bytes(self._records[self._record_offsets[row]:self._record_offsets[row + 1]]))
+
+    def rows(self, field, value):
+        """Rows of the records with a value of an ID field (one of several for MULTI_VALUE_FIELDS)."""
+        slots, key_offsets, keys, row_offsets, rows = self._tables[field]
+        key = str(value).encode("utf-8")
+        mask = len(slots) - 1
+        slot = _hash(key) & mask
+        while True:
+            entry = slots[slot]
+            if entry == -1:
+                return []
+            if keys[key_offsets[entry]:key_offsets[entry + 1]] == key:
+                return rows[row_offsets[entry]:row_offsets[entry + 1]].tolist()
+            slot = (slot + 1) & mask
+
+    def row(self, katotth_id):
+        """Row of a katotth_id or None."""
+        rows = self.rows("katotth_id", katotth_id)
+        return rows[0] if rows else None
+
+    def find(self, field, value):
+        """Records with a value of an ID field."""
+        return [self.record(row) for row in self.rows(field, value)]
+
+    def find_one(self, field, value):
+        """First record with a value of an ID field or None."""
+        rows = self.rows(field, value)
+        return self.record(rows[0]) if rows else None
+
+    def get(self, katotth_id):
+        """Returns the record of a katotth_id or None."""
+        return self.find_one("katotth_id", katotth_id)
+
+    def __contains__(self, katotth_id):
+        return self.row(katotth_id) is not None
+
+    def katotth_id(self, row):
+        """katotth_id of a row without decoding the record, katotth_id entries are numbered by row."""
+        _, key_offsets, keys, _, _ = self._tables["katotth_id"]
+        return bytes(keys[key_offsets[row]:key_offsets[row + 1]]).decode("utf-8")
+
+    def parent(self, katotth_id):
+        """Returns the katotth_id of the parent or None."""
+        row = self.row(katotth_id)
+        if row is None or self._parents[row] < 0:
+            return None
+        return self.katotth_id(self._parents[row])
+
+    def ancestors(self, katotth_id):
+        """Returns ancestor katotth_ids from the root down to the parent."""
+        row = self.row(katotth_id)
+        ancestors = []
+        while row is not None and self._parents[row] >= 0:
+            row = self._parents[row]
+            ancestors.append(self.katotth_id(row))
+        return ancestors[::-1]
+
+    def children(self, katotth_id):
+        """Returns katotth_ids of the direct children."""
+        row = self.row(katotth_id)
+        if row is None:
+            return []
+        return [self.katotth_id(child) for child in self._children[self._child_offsets[row]:self._child_offsets[row + 1]]]
+
+    def is_ancestor(self, ancestor_id, katotth_id):
+        """True if ancestor_id is a proper ancestor of katotth_id."""
+        ancestor_row = self.row(ancestor_id)
+        row = self.row(katotth_id)
+        if ancestor_row is None or row is None:
+            return False
+        return ancestor_row < row < self._exits[ancestor_row]
+
+    def subtree(self, katotth_id):
+        """Returns katotth_ids of the node and all its descendants in preorder."""
+        row = self.row(katotth_id)
+        if row is None:
+            return []
+        return [self.katotth_id(descendant) for descendant in range(row, self._exits[row])]
+
+    def descendants(self, katotth_id, category=None):
+        """Returns records of all descendants, optionally of one category."""
+        row = self.row(katotth_id)
+        if row is None:
+            return []
+        records = [self.record(descendant) for descendant in range(row + 1, self._exits[row])]
+        if category:
+            records = [record for record in records if record.get("category") == category]
+        return records
+
+    def __iter__(self):
+        return (self.record(row) for row in range(self.count))
+
+
+def build_settlement_lookup():
+    """Writes the lookup index of settlements.json."""
+    start_time = time.time()
+    data_file = os.path.join("assets", "data", "settlements.json")
+    count = write_lookup_index(load_json(data_file), INDEX_FILE)
+    logger.info(f"Lookup index of {count} records saved to {INDEX_FILE} ({os.path.getsize(INDEX_FILE) / 1024 / 1024:.1f} MB) in {time.time() - start_time:.2f} seconds.")
+
+if __name__ == '__main__':
+    build_settlement_lookup()
@@ -0,0 +1,196 @@
+import sys
+import logging
+from array import array
+from collections.abc import MutableMapping
+from json_codec import iter_json_array, JsonArrayWriter
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Known settlement fields, each one gets its own slot in SettlementRecord.
+FIELDS = (
+    "name", "category", "katotth_id", "type", "parent_katotth", "koatuu_id",
+    "osm_id", "postal_code", "location", "wikidata", "wikipedia", "population",
+    "square", "hromada_center", "admin_level", "oblast_id", "oblast_name",
+    "district_id", "district_name", "hromada_id", "hromada_name", "old_name",
+    "name:en", "name:ru", "name:pl", "computed_square",
+)
+
+# Fields whose values repeat across thousands of records and are shared via sys.intern.
+INTERNED_FIELDS = {
+    "category", "katotth_id", "type", "parent_katotth", "admin_level",
+    "oblast_id", "oblast_name", "district_id", "district_name", "hromada_id", "hromada_name",
+}
+
+_SLOTS = {field: field.replace(":", "_") for field in FIELDS}
+_MISSING = object()
+
+# Key order tuples are shared between records with the same layout, so a record
+# keeps the order of its dict without storing a copy of it.
+_key_orders = {}
+
+
+def _shared_key_order(keys):
+    keys = tuple(keys)
+    return _key_orders.setdefault(keys, keys)
+
+
+class SettlementRecord(MutableMapping):
+    """
+    Memory compact, dict-like settlement.
+
+    Known fields live in slots and unknown ones in a small overflow dict, key order
+    is preserved so to_dict() gives back exactly what was stored.
+    """
+    __slots__ = tuple(_SLOTS.values()) + ("_keys", "_extra")
+
+    def __init__(self, settlement=None):
+        self._keys = ()
+        self._extra = None
+        if settlement:
+            keys = []
+            for key, value in settlement.items():
+                self._set(key, value)
+                keys.append(key)
+            self._keys = _shared_key_order(keys)
+
+    def _set(self, key, value):
+        slot = _SLOTS.get(key)
+        if slot is None:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+            return
+        if key in INTERNED_FIELDS and type(value) is str:
+            value = sys.intern(value)
+        setattr(self, slot, value)
+
+    def __getitem__(self, key):
+        slot = _SLOTS.get(key)
+        if slot is None:
+            if self._extra is None:
+                raise KeyError(key)
+            return self._extra[key]
+        value = getattr(self, slot, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        if key not in self:
+            self._keys = _shared_key_order(self._keys + (key,))
+        self._set(key, value)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        slot = _SLOTS.get(key)
+        if slot is None:
+            del self._extra[key]
+            if not self._extra:
+                self._extra = None
+        else:
+            delattr(self, slot)
+        self._keys = _shared_key_order(k for k in self._keys if k != key)
+
+    def __contains__(self, key):
+        slot = _SLOTS.get(key)
+        if slot is None:
+            return self._extra is not None and key in self._extra
+        return hasattr(self, slot)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def get(self, key, default=None):
+        slot = _SLOTS.get(key)
+        if slot is None:
+            return default if self._extra is None else self._extra.get(key, default)
+        return getattr(self, slot, default)
+
+    def to_dict(self):
+        return {key: self[key] for key in self._keys}
+
+    def __repr__(self):
+        return f"SettlementRecord({self.to_dict()!r})"
+
+
+class SettlementStore:
+    """
+    List of SettlementRecord objects with a katotth_id index and a parent row column.
+
+    Records behave like the settlement dicts used by the steps, so code that reads
+    settlements with .get() and [] works with the store unchanged.
+    """
+
+    def __init__(self, settlements=()):
+        self.records = []
+        self.index = {}
+        self.parent_rows = array("i")
+        self._unresolved = []
+        for settlement in settlements:
+            self.append(settlement)
+        self.resolve_parents()
+
+    @classmethod
+    def from_file(cls, path):
+        """Builds a store from settlements.json without materializing the list of dicts."""
+        return cls(iter_json_array(path))
+
+    def append(self, settlement):
+        record = settlement if isinstance(settlement, SettlementRecord) else SettlementRecord(settlement)
+        row = len(self.records)
+        self.records.append(record)
+        katotth_id = record.get("katotth_id")
+        if katotth_id:
+            self.index[katotth_id] = row
+        parent_row = self.index.get(record.get("parent_katotth"), -1)
+        self.parent_rows.append(parent_row)
+        if parent_row == -1 and record.get("parent_katotth"):
+            self._unresolved.append(row)
+        return record
+
+    def resolve_parents(self):
+        """Fills parent rows for records that were added before their parents."""
+        unresolved = []
+        for row in self._unresolved:
+            parent_row = self.index.get(self.records[row].get("parent_katotth"), -1)
+            self.parent_rows[row] = parent_row
+            if parent_row == -1:
+                unresolved.append(row)
+        self._unresolved = unresolved
+
+    def get(self, katotth_id):
+        """Returns the record with the given katotth_id or None."""
+        row = self.index.get(katotth_id)
+        return None if row is None else self.records[row]
+
+    def parent(self, record):
+        """Returns the parent record of a record or None."""
+        row = self.index.get(record.get("katotth_id"))
+        if row is None:
+            return self.get(record.get("parent_katotth"))
+        parent_row = self.parent_rows[row]
+        return None if parent_row == -1 else self.records[parent_row]
+
+    def to_list(self):
+        """Returns the settlements as plain dicts."""
+        return [record.to_dict() for record in self.records]
+
+    def save(self, path):
+        """Writes the settlements in the same layout as save_json."""
+        with JsonArrayWriter(path) as writer:
+            for record in self.records:
+                writer.write(record.to_dict())
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __getitem__(self, row):
+        return self.records[row]
@@ -0,0 +1,199 @@
+import io
+import os
+import csv
+import json
+import time
+import codecs
+import hashlib
+import logging
+import numpy as np
+from array_store import save_arrays, load_arrays
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.join(".cache", "source_tables")
+# Bumped whenever the cached layout changes, so stale caches are never read.
+CACHE_VERSION = 1
+
+ENCODINGS = ("utf-8", "cp1251")
+DELIMITERS = ";,\t|"
+# Integers above this are kept as strings (codes like KATOTTH do not fit into int64 anyway).
+MAX_INT = 2 ** 53
+# Separates the distinct values of a column in the cache, a control character never found in the sources.
+VALUE_SEPARATOR = "\x1f"
+
+
+def detect_encoding(data):
+    """Encoding of raw file bytes: utf-8-sig with a BOM, else the first of ENCODINGS that decodes."""
+    if data.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    for encoding in ENCODINGS:
+        try:
+            data.decode(encoding)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return "latin-1"
+
+def detect_delimiter(text):
+    """Most frequent of DELIMITERS in the header line, the csv default (comma) if none is there."""
+    header = text.split("\n", 1)[0]
+    counts = {delimiter: header.count(delimiter) for delimiter in DELIMITERS}
+    delimiter = max(counts, key=counts.get)
+    return delimiter if counts[delimiter] else ","
+
+
+def _encode_strings(values):
+    """Dictionary encodes strings: (int32 codes, list of the distinct values)."""
+    distinct = dict()
+    codes = np.array([distinct.setdefault(value, len(distinct)) for value in values], dtype=np.int32)
+    return codes, list(distinct)
+
+def _pack_strings(values):
+    """Joins strings into one UTF-8 buffer, split back in a single call on load."""
+    return np.frombuffer(VALUE_SEPARATOR.join(values).encode("utf-8"), dtype=np.uint8)
+
+def _unpack_strings(buffer, count):
+    return buffer.tobytes().decode("utf-8").split(VALUE_SEPARATOR) if count else []
+
+def _is_int_column(values):
+    """True if every value is a canonical integer, so str(int(value)) gives it back unchanged."""
+    for value in values:
+        if not value or not (value.isdigit() or (value[0] == "-" and value[1:].isdigit())):
+            return False
+        if value != str(int(value)) or abs(int(value)) >= MAX_INT:
+            return False
+    return bool(values)
+
+
+class SourceTable:
+    """
+    A parsed CSV source as typed columns.
+
+    Columns where every value is a canonical integer are int64 arrays, the others are
+    dictionary encoded strings (int32 codes into the distinct values), which is compact
+    for the repeated ids, categories and names of the kodifikator tables. Short rows are
+    padded with "" and keep their original length in row_lengths.
+    """
+
+    def __init__(self, header, columns, row_lengths, encoding, delimiter):
+        self.header = header
+        self.columns = columns
+        self.row_lengths = row_lengths
+        self.encoding = encoding
+        self.delimiter = delimiter
+
+    @classmethod
+    def parse(cls, data, encoding=None, delimiter=None):
+        """Parses raw CSV bytes, detecting the encoding and delimiter unless given."""
+        encoding = encoding or detect_encoding(data)
+        text = data.decode(encoding)
+        delimiter = delimiter or detect_delimiter(text)
+        reader = csv.reader(io.StringIO(text, newline=""), delimiter=delimiter)
+        header = next(reader, [])
+        rows = [row for row in reader if row]
+        width = max([len(header)] + [len(row) for row in rows])
+        row_lengths = np.array([len(row) for row in rows], dtype=np.int16)
+        columns = []
+        for position in range(width):
+            values = [row[position] if position < len(row) else "" for row in rows]
+            if _is_int_column(values):
+                columns.append(np.array([int(value) for value in values], dtype=np.int64))
+            else:
+                columns.append(_encode_strings(values))
+        return cls(header, columns, row_lengths, encoding, delimiter)
+
+    def save(self, path):
+        """Saves the table to the cache, string columns as codes and their distinct values."""
+        arrays = {"row_lengths": self.row_lengths}
+        kinds = []
+        for position, column in enumerate(self.columns):
+            if isinstance(column, np.ndarray):
+                arrays[f"column_{position}"] = column
+                kinds.append("int")
+            else:
+                codes, distinct = column
+                if any(VALUE_SEPARATOR in value for value in distinct):
+                    raise ValueError(f"Column {position} contains the value separator, it cannot be cached.")
+                arrays[f"column_{position}"] = codes
+                arrays[f"values_{position}"] = _pack_strings(distinct)
+                kinds.append(len(distinct))
+        # kinds holds "int" for integer columns and the number of distinct values for string columns.
+        meta = {"version": CACHE_VERSION, "header": self.header, "kinds": kinds, "encoding": self.encoding, "delimiter": self.delimiter}
+        arrays["meta"] = np.frombuffer(json.dumps(meta, ensure_ascii=False).encode("utf-8"), dtype=np.uint8)
+        save_arrays(path, arrays)
+
+    @classmethod
+    def load(cls, path):
+        """Loads a saved table, None if it was saved by another CACHE_VERSION."""
+        data = load_arrays(path)
+        meta = json.loads(data["meta"].tobytes().decode("utf-8"))
+        if meta.get("version") != CACHE_VERSION:
+            return None
+        columns = []
+        for position, kind in enumerate(meta["kinds"]):
+            if kind == "int":
+                columns.append(data[f"column_{position}"])
+            else:
+                columns.append((data[f"column_{position}"], _unpack_strings(data[f"values_{position}"], kind)))
+        return cls(meta["header"], columns, data["row_lengths"], meta["encoding"], meta["delimiter"])
+
+    def __len__(self):
+        return len(self.row_lengths)
+
+    def column(self, key):
+        """Values of a column by name or position: an int64 array or a list of strings."""
+        position = self.header.index(key) if isinstance(key, str) else key
+        column = self.columns[position]
+        if isinstance(column, np.ndarray):
+            return column
+        codes, distinct = column
+        return np.array(distinct, dtype=object)[codes].tolist()
+
+    def rows(self):
+        """Rows as lists of strings, exactly as csv.reader returns them after the header."""
+        columns = [
+            [str(value) for value in column.tolist()] if isinstance(column, np.ndarray) else self.column(position)
+            for position, column in enumerate(self.columns)
+        ]
+        if len(self) and (self.row_lengths == len(self.columns)).all():
+            yield from map(list, zip(*columns))
+            return
+        for row, length in zip(zip(*columns), self.row_lengths.tolist()):
+            yield list(row[:length])
+
+    def dicts(self):
+        """Rows as dicts keyed by the header, like csv.DictReader."""
+        for row in self.rows():
+            yield dict(zip(self.header, row))
+
+
+def load_table(path, cache_dir=CACHE_DIR):
+    """
+    Parses a CSV source once and caches it under cache_dir keyed by the hash of its
+    content, later calls with the same content load the cached table.
+
+    Raises FileNotFoundError if the source does not exist.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    cache_file = os.path.join(cache_dir, f"{hashlib.sha256(data).hexdigest()}.npz") if cache_dir else None
+    if cache_file and os.path.exists(cache_file):
+        try:
+            table = SourceTable.load(cache_file)
+            if table is not None:
+                return table
+        except (OSError, ValueError, KeyError):
+            logger.warning(f"Broken cache {cache_file} for {path}, parsing it again.")
+
+    start_time = time.time()
+    table = SourceTable.parse(data)
+    if cache_file:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Written under a temporary name first, so an interrupted run never leaves a partial cache.
+        temporary_file = f"{cache_file}.{os.getpid()}.tmp"
+        table.save(temporary_file)
+        os.replace(temporary_file, cache_file)
+    logger.info(f"Parsed {path} ({table.encoding}, '{table.delimiter}') into {len(table)} rows in {time.time() - start_time:.2f} seconds.")
+    return table
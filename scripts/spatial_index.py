@@ -0,0 +1,156 @@
+import logging
+import numpy as np
+from json_codec import load_json
+from geometry import geometry_rings, rings_edges, points_in_edges, distance_to_edges_km
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_CELL_SIZE = 0.1
+
+
+class PolygonLayer:
+    """
+    Polygons of a GeoJSON map layer keyed by a feature property, with a uniform grid
+    index over their bounding boxes.
+
+    Every grid cell lists the features whose bounding box touches it, so a point is
+    only tested against the few polygons around it.
+    """
+
+    def __init__(self, features, key="katotth", cell_size=DEFAULT_CELL_SIZE):
+        self.key = key
+        self.ids = []
+        self.properties = []
+        self.edges = []
+        self.rings = []
+        bboxes = []
+        for feature in features:
+            properties = feature.get("properties") or {}
+            feature_id = properties.get(key)
+            polygons = geometry_rings(feature.get("geometry"))
+            if not feature_id or not polygons:
+                continue
+            rings = [ring for polygon in polygons for ring in polygon]
+            points = np.vstack(rings)
+            self.ids.append(feature_id)
+            self.properties.append(properties)
+            self.rings.append(polygons)
+            self.edges.append(rings_edges(rings))
+            bboxes.append((points[:, 0].min(), points[:, 1].min(), points[:, 0].max(), points[:, 1].max()))
+
+        self.index = {feature_id: row for row, feature_id in reversed(list(enumerate(self.ids)))}
+        self.bboxes = np.array(bboxes, dtype=np.float64).reshape(-1, 4)
+        self._build_grid(cell_size)
+
+    @classmethod
+    def from_file(cls, path, key="katotth", cell_size=DEFAULT_CELL_SIZE):
+        data = load_json(path) or {}
+        return cls(data.get("features", []), key, cell_size)
+
+    def _build_grid(self, cell_size):
+        self.cell_size = cell_size
+        if len(self.bboxes) == 0:
+            self.origin = (0.0, 0.0)
+            self.grid_shape = (0, 0)
+            self.cell_offsets = np.zeros(1, dtype=np.int64)
+            self.cell_items = np.zeros(0, dtype=np.int32)
+            return
+
+        self.origin = (float(self.bboxes[:, 0].min()), float(self.bboxes[:, 1].min()))
+        columns = int(np.floor((self.bboxes[:, 2].max() - self.origin[0]) / cell_size)) + 1
+        rows = int(np.floor((self.bboxes[:, 3].max() - self.origin[1]) / cell_size)) + 1
+        self.grid_shape = (rows, columns)
+
+        cells = []
+        items = []
+        for row, (min_x, min_y, max_x, max_y) in enumerate(self.bboxes):
+            x0, y0 = self._cell_xy(min_x, min_y)
+            x1, y1 = self._cell_xy(max_x, max_y)
+            grid_x, grid_y = np.meshgrid(np.arange(x0, x1 + 1), np.arange(y0, y1 + 1))
+            feature_cells = (grid_y * columns + grid_x).ravel()
+            cells.append(feature_cells)
+            items.append(np.full(len(feature_cells), row, dtype=np.int32))
+        cells = np.concatenate(cells)
+        items = np.concatenate(items)
+        order = np.argsort(cells, kind="stable")
+        self.cell_items = items[order]
+        self.cell_offsets = np.concatenate([[0], np.cumsum(np.bincount(cells, minlength=rows * columns))])
+
+    def _cell_xy(self, xs, ys):
+        x = np.floor((np.asarray(xs) - self.origin[0]) / self.cell_size).astype(np.int64)
+        y = np.floor((np.asarray(ys) - self.origin[1]) / self.cell_size).astype(np.int64)
+        return x, y
+
+    def cells(self, xs, ys):
+        """Returns the grid cell of each point, -1 outside of the grid."""
+        x, y = self._cell_xy(xs, ys)
+        rows, columns = self.grid_shape
+        valid = (x >= 0) & (x < columns) & (y >= 0) & (y < rows)
+        return np.where(valid, y * columns + x, -1)
+
+    def candidates(self, cell):
+        """Returns the rows of the features whose bounding box touches a cell."""
+        if cell < 0:
+            return self.cell_items[:0]
+        return self.cell_items[self.cell_offsets[cell]:self.cell_offsets[cell + 1]]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def contains(self, row, xs, ys):
+        """Tests which points lie inside the feature in the given row."""
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        min_x, min_y, max_x, max_y = self.bboxes[row]
+        in_bbox = (xs >= min_x) & (xs <= max_x) & (ys >= min_y) & (ys <= max_y)
+        inside = np.zeros(len(xs), dtype=bool)
+        inside[in_bbox] = points_in_edges(xs[in_bbox], ys[in_bbox], self.edges[row])
+        return inside
+
+    def distance_km(self, row, xs, ys):
+        """Distance from each point to the feature in the given row, 0 for points inside."""
+        distances = distance_to_edges_km(xs, ys, self.edges[row])
+        distances[self.contains(row, xs, ys)] = 0.0
+        return distances
+
+    def locate(self, xs, ys):
+        """
+        Returns the row of the feature containing each point, -1 where no feature does.
+
+        Every point is paired with the candidate features of its grid cell, pairs that
+        pass the bounding box test are grouped by feature and each group goes through
+        one vectorized point in polygon test.
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        result = np.full(len(xs), -1, dtype=np.int64)
+        cells = self.cells(xs, ys)
+        points = np.nonzero(cells >= 0)[0]
+        cells = cells[points]
+        counts = self.cell_offsets[cells + 1] - self.cell_offsets[cells]
+        pair_points = np.repeat(points, counts)
+        pair_offsets = np.repeat(self.cell_offsets[cells] - np.cumsum(counts) + counts, counts)
+        pair_rows = self.cell_items[pair_offsets + np.arange(len(pair_points))]
+
+        bboxes = self.bboxes[pair_rows]
+        pair_xs, pair_ys = xs[pair_points], ys[pair_points]
+        in_bbox = (pair_xs >= bboxes[:, 0]) & (pair_xs <= bboxes[:, 2]) & (pair_ys >= bboxes[:, 1]) & (pair_ys <= bboxes[:, 3])
+        pair_points, pair_rows = pair_points[in_bbox], pair_rows[in_bbox]
+
+        order = np.argsort(pair_rows, kind="stable")
+        pair_points, pair_rows = pair_points[order], pair_rows[order]
+        rows, starts = np.unique(pair_rows, return_index=True)
+        ends = np.append(starts[1:], len(pair_rows))
+        for row, start, end in zip(rows, starts, ends):
+            candidates = pair_points[start:end]
+            candidates = candidates[result[candidates] < 0]
+            if len(candidates) == 0:
+                continue
+            inside = points_in_edges(xs[candidates], ys[candidates], self.edges[row])
+            result[candidates[inside]] = row
+        return result
+
+    def locate_ids(self, xs, ys):
+        """Same as locate, returning feature ids (None where no feature contains the point)."""
+        return [self.ids[row] if row >= 0 else None for row in self.locate(xs, ys)]
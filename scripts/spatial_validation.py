@@ -0,0 +1,98 @@
+import os
+import time
+import logging
+import numpy as np
+from map_index import MAP_LAYERS
+from spatial_index import PolygonLayer
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Map layer, settlement field with the expected feature, categories that are features of the layer themselves.
+SPATIAL_CHECKS = (
+    ("oblasti", "oblast_id", {"O", "K"}),
+    ("districts", "district_id", {"P"}),
+    ("communities", "hromada_id", {"H"}),
+)
+
+def load_polygon_layers(layers=MAP_LAYERS):
+    """Loads every map layer that exists on disk as a PolygonLayer."""
+    polygon_layers = dict()
+    for layer, config in layers.items():
+        if not os.path.exists(config["file"]):
+            logger.warning(f"Map file {config['file']} not found, skipping {layer} layer.")
+            continue
+        polygon_layers[layer] = PolygonLayer.from_file(config["file"])
+    return polygon_layers
+
+def validate_locations(settlements, polygon_layers=None, tolerance_km=0.0, verbose=True):
+    """
+    Checks that the location of every settlement lies inside the polygons of its
+    oblast, district and hromada (or its own polygon for oblasts, districts and hromadas).
+
+    Returns the list of mismatches with the distance to the expected polygon and the
+    feature that actually contains the point, logged one by one when verbose.
+    """
+    start_time = time.time()
+    if polygon_layers is None:
+        polygon_layers = load_polygon_layers()
+
+    records = []
+    coordinates = []
+    expected = {layer: dict() for layer, _, _ in SPATIAL_CHECKS}
+    for settlement in settlements:
+        location = settlement.get("location")
+        if not location or len(location) < 2:
+            continue
+        point = len(records)
+        records.append((settlement.get("katotth_id"), settlement.get("name")))
+        coordinates.append(location[:2])
+        for layer, id_key, own_categories in SPATIAL_CHECKS:
+            feature_id = settlement.get("katotth_id") if settlement.get("category") in own_categories else settlement.get(id_key)
+            if feature_id:
+                expected[layer].setdefault(feature_id, []).append(point)
+
+    coordinates = np.array(coordinates, dtype=np.float64).reshape(-1, 2)
+    xs, ys = coordinates[:, 0], coordinates[:, 1]
+
+    mismatches = []
+    for layer, id_key, _ in SPATIAL_CHECKS:
+        polygon_layer = polygon_layers.get(layer)
+        if polygon_layer is None:
+            continue
+        checked = 0
+        for feature_id, points in expected[layer].items():
+            row = polygon_layer.index.get(feature_id)
+            if row is None:
+                continue
+            points = np.array(points)
+            checked += len(points)
+            outside = points[~polygon_layer.contains(row, xs[points], ys[points])]
+            if len(outside) == 0:
+                continue
+            distances = polygon_layer.distance_km(row, xs[outside], ys[outside])
+            found = polygon_layer.locate(xs[outside], ys[outside])
+            for point, distance, found_row in zip(outside, distances, found):
+                if distance <= tolerance_km:
+                    continue
+                katotth_id, name = records[point]
+                mismatches.append({
+                    "katotth_id": katotth_id,
+                    "name": name,
+                    "layer": layer,
+                    "field": id_key,
+                    "expected": feature_id,
+                    "found": polygon_layer.ids[found_row] if found_row >= 0 else None,
+                    "distance_km": round(float(distance), 3),
+                    "location": coordinates[point].tolist(),
+                })
+        logger.info(f"Checked {checked} locations against {layer} map.")
+
+    for mismatch in mismatches if verbose else ():
+        logger.warning(
+            f"Settlement {mismatch['katotth_id']} - {mismatch['name']} at {mismatch['location']} is "
+            f"{mismatch['distance_km']} km outside of its {mismatch['field']} {mismatch['expected']}"
+            f" (found in {mismatch['found'] or 'no feature'})."
+        )
+    logger.info(f"Spatial validation found {len(mismatches)} mismatches in {time.time() - start_time:.2f} seconds.")
+    return mismatches
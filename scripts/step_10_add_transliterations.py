@@ -0,0 +1,49 @@
+import os
+import time
+import logging
+from json_codec import load_json, save_json
+from provenance import Provenance, snapshot
+from transliteration import transliterate_many
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def update_transliterations(settlements, provenance):
+    """
+    Fills name:en with the transliterated name where no source gave one. Values computed
+    before are transliterated again, so renamed records get the new name.
+
+    Returns the updated records.
+    """
+    targets = [
+        settlement for settlement in settlements
+        if settlement.get("name") and (
+            not settlement.get("name:en") or provenance.is_computed(settlement.get("katotth_id"), "name:en")
+        )
+    ]
+    for settlement, name_en in zip(targets, transliterate_many(settlement["name"] for settlement in targets)):
+        settlement["name:en"] = name_en
+    return targets
+
+def add_transliterations():
+    """
+    Add name:en transliterated from name (KMU 2010 rules) to settlements without one,
+    marked as computed in provenance.json.
+    """
+    data_file = os.path.join("assets", "data", "settlements.json")
+
+    settlements = load_json(data_file)
+    provenance = Provenance.load()
+    before = snapshot(settlements)
+    start_time = time.time()
+    updated = update_transliterations(settlements, provenance)
+    logger.info(f"Transliterated {len(updated)} names in {1000 * (time.time() - start_time):.1f} ms.")
+
+    provenance.record_changes(before, settlements, "transliteration")
+    provenance.save()
+    save_json(settlements, data_file)
+    logger.info(f"Settlements data saved to {data_file}")
+
+if __name__ == '__main__':
+    add_transliterations()
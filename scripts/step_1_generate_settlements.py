@@ -1,12 +1,74 @@
-import csv
-import json
 import os
 import logging
 from categories import get_category_name, get_admin_level
+from json_codec import load_json, save_json
+from hierarchy import Hierarchy, DEPTH_OBLAST, DEPTH_DISTRICT, DEPTH_HROMADA
+from source_tables import load_table
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def read_kodifikator(kodifikator_file):
+    """
+    Reads the kodifikator rows as dicts with katotth_id, parent_katotth, name and category.
+    """
+    rows = []
+    for row in load_table(kodifikator_file).rows():
+        # Ensure row has enough columns to prevent IndexError
+        if len(row) < 7:
+            print(f"Skipping row with insufficient columns: {row}")
+            continue
+
+        katotth_hierarchy = [elem.strip() for elem in [row[0], row[1], row[2], row[3], row[4]] if elem.strip()]
+        katotth_id = len(katotth_hierarchy) > 0 and katotth_hierarchy[-1] or None
+        parent_katotth = len(katotth_hierarchy) > 1 and katotth_hierarchy[-2] or None
+
+        if not katotth_id:
+            logger.warning(f"Skipping row with missing katotth_id: {row}")
+            continue
+
+        rows.append({"katotth_id": katotth_id, "parent_katotth": parent_katotth, "name": row[6].strip(), "category": row[5]})
+    return rows
+
+def update_settlement(settlement, row, hierarchy):
+    """
+    Sets name, category, type, admin_level, parent and ancestor ids of a settlement from its kodifikator row.
+    """
+    katotth_id = row["katotth_id"]
+    category = row["category"]
+    settlement["name"] = row["name"]
+    settlement["category"] = category
+    settlement["type"] = get_category_name(category)
+
+    admin_level = get_admin_level(settlement)
+    settlement["admin_level"] = f"{admin_level}"
+
+    # Ancestors come from the tree, so rows that repeat a code in several
+    # columns (e.g. towns of the exclusion zone) do not get bogus ids.
+    depth = hierarchy.depth(katotth_id)
+    for level, levels, level_depth in (("oblast", (2, 3, 4), DEPTH_OBLAST), ("district", (3, 4), DEPTH_DISTRICT), ("hromada", (4,), DEPTH_HROMADA)):
+        if admin_level in levels and depth > level_depth:
+            settlement[f"{level}_id"] = hierarchy.ancestor(katotth_id, level_depth)
+        else:
+            settlement.pop(f"{level}_id", None)
+            settlement.pop(f"{level}_name", None)
+
+    if(row["parent_katotth"]):
+        settlement["parent_katotth"] = row["parent_katotth"]
+
+def update_ancestor_names(settlement, hierarchy):
+    """Sets oblast_name, district_name and hromada_name from the ancestor ids of a settlement."""
+    oblast_id = settlement.get("oblast_id")
+    if(oblast_id and hierarchy.name(oblast_id)):
+        settlement["oblast_name"] = hierarchy.name(oblast_id)
+
+    district_id = settlement.get("district_id")
+    if(district_id and hierarchy.name(district_id)):
+        settlement["district_name"] = hierarchy.name(district_id)
+    hromada_id = settlement.get("hromada_id")
+    if(hromada_id and hierarchy.name(hromada_id)):
+        settlement["hromada_name"] = hierarchy.name(hromada_id)
+
 def generate_settlements():
     """
     Generates the initial settlements.json file from the KATOТTH kodifikator.
@@ -15,80 +77,28 @@ def generate_settlements():
     kodifikator_file = os.path.join(base_path, "kodifikator-02-07-2025.csv")
     output_file = os.path.join("assets", "data", "settlements.json")
 
-    settlements = []
-    with open(output_file, 'r', encoding='utf-8') as f:
-        settlements = json.load(f)
-
-    with open(kodifikator_file, 'r', encoding='utf-8-sig') as csvfile:
-        reader = csv.reader(csvfile, delimiter=';')
-        header = next(reader) # Skip header
-        
-        settlements_dict = dict()
-
-        for row in reader:
-            # Ensure row has enough columns to prevent IndexError
-            if len(row) < 7:
-                print(f"Skipping row with insufficient columns: {row}")
-                continue
-
-            category = row[5]
-
-            katotth_hierarchy = [elem.strip() for elem in [row[0], row[1], row[2], row[3], row[4]] if elem.strip()]
-            katotth_id = len(katotth_hierarchy) > 0 and katotth_hierarchy[-1] or None
-            parent_katotth = len(katotth_hierarchy) > 1 and katotth_hierarchy[-2] or None
-
-            if katotth_id:
-                settlement = {"katotth_id": katotth_id}
-                for existing in settlements:
-                    if existing.get("katotth_id") == katotth_id:
-                        settlement = existing
-                        break
-                
-                if not settlement:
-                    settlement = {"katotth_id": katotth_id}
-                    settlements.append(settlement)
-
-                parent_katotth = parent_katotth
-                settlement["name"] = row[6].strip()
-                settlement["category"] = category
-                settlement["type"] = get_category_name(category)
-
-                settlements_dict[katotth_id] = settlement["name"]
-
-                admin_level = get_admin_level(settlement)
-                settlement["admin_level"] = f"{admin_level}"
-
-                if((admin_level == 2 or admin_level == 3 or admin_level == 4) and len(katotth_hierarchy) > 1):
-                    settlement["oblast_id"] = katotth_hierarchy[0]
-
-                if((admin_level == 3 or admin_level == 4) and len(katotth_hierarchy) > 2):
-                    settlement["district_id"] = katotth_hierarchy[1]
-                
-                if((admin_level == 4) and len(katotth_hierarchy) > 3):
-                    settlement["hromada_id"] = katotth_hierarchy[2]
-
-                if(parent_katotth):
-                    settlement["parent_katotth"] = parent_katotth
-                
-            else:
-                logger.warning(f"Skipping row with missing katotth_id: {row}")
+    settlements = load_json(output_file)
+    existing_settlements = {settlement.get("katotth_id"): settlement for settlement in settlements}
 
-    for settlement in settlements:
-        oblast_id = settlement.get("oblast_id")
-        if(oblast_id and settlements_dict.get(oblast_id)):
-            settlement["oblast_name"] = settlements_dict[oblast_id]
+    kodifikator_rows = read_kodifikator(kodifikator_file)
+    hierarchy = Hierarchy(kodifikator_rows)
 
-        district_id = settlement.get("district_id")
-        if(district_id and settlements_dict.get(district_id)):
-            settlement["district_name"] = settlements_dict[district_id]
-        hromada_id = settlement.get("hromada_id")
-        if(hromada_id and settlements_dict.get(hromada_id)):
-            settlement["hromada_name"] = settlements_dict[hromada_id]
+    for row in kodifikator_rows:
+        katotth_id = row["katotth_id"]
+        settlement = existing_settlements.get(katotth_id)
+        if not settlement:
+            settlement = {"katotth_id": katotth_id}
+            existing_settlements[katotth_id] = settlement
+            settlements.append(settlement)
+
+        update_settlement(settlement, row, hierarchy)
+
+    for settlement in settlements:
+        update_ancestor_names(settlement, hierarchy)
 
     # Save the settlements data to the output file
-    with open(output_file, 'w', encoding='utf-8') as jsonfile:
-        json.dump(settlements, jsonfile, ensure_ascii=False, indent=2)
-        logger.info(f"Generated settlements.json with {len(settlements)} entries.")
+    save_json(settlements, output_file)
+    logger.info(f"Generated settlements.json with {len(settlements)} entries.")
 
 if __name__ == '__main__':
     generate_settlements()
@@ -1,36 +1,33 @@
-import csv
-import json
 import os
+import logging
+from collections import Counter
+from json_codec import load_json, save_json
+from koatuu_crosswalk import load_crosswalk
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 def map_comparison_table():
-    """Maps KOATUU IDs to the settlements from the comparison table."""
+    """Maps KOATUU IDs to the settlements through the KOATUU - KATOTTH crosswalk."""
     data_file = os.path.join("assets", "data", "settlements.json")
-    comparison_file = os.path.join("assets", "kodifikator", "Порівняльна таблиця.csv")
-
-    # 1. Create a mapping from KATOTTH to KOATUU
-    koatuu_map = {}
-    with open(comparison_file, 'r', encoding='utf-8-sig') as csvfile:
-        reader = csv.reader(csvfile, delimiter=';')
-        header = next(reader) # Skip header
-        for row in reader:
-            if len(row) >= 2:
-                katotth_id, koatuu_id = row[:2]
-                if katotth_id and koatuu_id and koatuu_id.isdigit():
-                    koatuu_map[str(katotth_id)] = str(koatuu_id)
+
+    # 1. Load the crosswalk of the comparison and transition tables
+    crosswalk = load_crosswalk()
 
     # 2. Load existing settlements data
-    with open(data_file, 'r', encoding='utf-8') as f:
-        settlements = json.load(f)
+    settlements = load_json(data_file)
 
-    # 3. Add koatuu_id to each settlement if found
-    for settlement in settlements:
-        katotth_id = settlement.get("katotth_id")
-        if katotth_id in koatuu_map:
-            settlement["koatuu_id"] = koatuu_map[katotth_id]
+    # 3. Add koatuu_id to each settlement with an unambiguous translation
+    translated = crosswalk.to_koatuu([settlement.get("katotth_id") or "" for settlement in settlements])
+    confidences = Counter()
+    for settlement, koatuu_id, confidence, ambiguous in zip(settlements, translated["code"].tolist(), translated["confidence"].tolist(), translated["ambiguous"].tolist()):
+        if koatuu_id and not ambiguous:
+            settlement["koatuu_id"] = koatuu_id
+            confidences[confidence] += 1
+    logger.info(f"KOATUU IDs mapped by confidence: {dict(confidences)}")
 
     # 4. Write the updated data back to the file
-    with open(data_file, 'w', encoding='utf-8') as f:
-        json.dump(settlements, f, ensure_ascii=False, indent=2)
+    save_json(settlements, data_file)
 
 def map_koatuu():
    map_comparison_table()
@@ -38,4 +35,4 @@ def map_koatuu():
 
 if __name__ == '__main__':
     map_koatuu()
-    print("KOATUU IDs mapped successfully.")
\ No newline at end of file
+    print("KOATUU IDs mapped successfully.")
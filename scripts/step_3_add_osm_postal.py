@@ -1,6 +1,7 @@
-import csv
-import json
 import os
+from json_codec import load_json, save_json
+from source_tables import load_table
+from postal_codes import normalize_postal_code
 
 def add_osm_postal():
     """Adds osm_id and postal_code from ua-name-places.csv."""
@@ -10,22 +11,19 @@ def add_osm_postal():
     # 1. Create a mapping from KATOTTH to (osm_id, postal_code)
     places_map = {}
     try:
-        with open(places_file, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                if row.get('katotth'):
-                    places_map[row['katotth']] = {
-                        "osm_id": row.get('osm_id'),
-                        "koatuu": row.get('koatuu'),
-                        "postal_code": row.get('postal_code')
-                    }
+        for row in load_table(places_file).dicts():
+            if row.get('katotth'):
+                places_map[row['katotth']] = {
+                    "osm_id": row.get('osm_id'),
+                    "koatuu": row.get('koatuu'),
+                    "postal_code": normalize_postal_code(row.get('postal_code'))
+                }
     except FileNotFoundError:
         print(f"Warning: {places_file} not found. Skipping this step.")
         return
 
     # 2. Load existing settlements data
-    with open(data_file, 'r', encoding='utf-8') as f:
-        settlements = json.load(f)
+    settlements = load_json(data_file)
 
     # 3. Add osm_id and postal_code to each settlement
     for settlement in settlements:
@@ -37,8 +35,7 @@ def add_osm_postal():
                 settlement["postal_code"] = place_data["postal_code"]
 
     # 4. Write the updated data back
-    with open(data_file, 'w', encoding='utf-8') as f:
-        json.dump(settlements, f, ensure_ascii=False, indent=2)
+    save_json(settlements, data_file)
 
 if __name__ == '__main__':
     add_osm_postal()
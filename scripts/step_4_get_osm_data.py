@@ -1,9 +1,9 @@
-import json
 import os
 import time
 import requests
 import logging
-from overpass import find_nodes_by_osm_ids
+from overpass import find_nodes_by_osm_ids, merge_osm_data
+from json_codec import load_json, save_json
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -15,7 +15,7 @@ def chunk_list(data, chunk_size):
 
 
     
-def update_settlements_locations(settlements):
+def update_settlements_locations(settlements, stale=None):
     """
     Process a list of settlements in chunks, make an HTTP POST request for each chunk,
     and update each settlement with the location data returned from the API.
@@ -23,13 +23,15 @@ def update_settlements_locations(settlements):
     Args:
         settlements (list): List of settlement names.
         api_url (str): URL of the API endpoint to get location data.
+        stale (dict): Optional {katotth_id: fields} of a refresh, only these are queried and written.
     
     Returns:
         list: List of dictionaries with updated settlement data.
     """
 
     # Filter out settlements that do not have an OSM ID and prepare new list with key "osm_id" and "location" as value
-    osm_data = [{"osm_id": settlement.get("osm_id")} for settlement in settlements if settlement.get("osm_id") and not settlement.get("location")]
+    osm_data = [{"osm_id": settlement.get("osm_id")} for settlement in settlements if settlement.get("osm_id") and not settlement.get("location")
+                and (stale is None or settlement.get("katotth_id") in stale)]
     # filter  out osm_ids with prefix "w" or "r" as they are not nodes
     osm_data = [osm for osm in osm_data if not osm["osm_id"].startswith(('w', 'r'))]
     # remove prefix "n" from osm_id if it exists
@@ -72,7 +74,7 @@ def update_settlements_locations(settlements):
                     bad_osm_ids.append(req_item.get("osm_id"))
                     logger.warning(f"No location found for settlement with OSM ID: {req_item.get('osm_id')}")
         drop_bad_osm_ids(settlements, bad_osm_ids)
-        save_settlements(settlements, group)
+        save_settlements(settlements, group, stale)
         step_end_time = time.time()
         logger.info(f"Processed {len(group)} OSM IDs in {step_end_time - step_start_time:.2f} seconds.")
 
@@ -109,7 +111,7 @@ def drop_bad_osm_ids(settlements, bad_osm_ids):
 #             time.sleep(1)
 #     return None
 
-def save_settlements(settlements, updated_data):
+def save_settlements(settlements, updated_data, stale=None):
      # Update the original settlements with the new location data
     need__to_update = False
     for settlement in settlements:
@@ -118,25 +120,22 @@ def save_settlements(settlements, updated_data):
             # Find the corresponding location data
             location_data = next((data for data in updated_data if data["osm_id"] == osm_id or data["osm_id"] == f"n{osm_id}"), None)
             if location_data:
-                for k,v in location_data.items():
-                    if k != "katotth_id" and  k != "koatuu_id" and  k != "osm_id" and v is not None:
-                        need__to_update = True
-                        settlement[k] = v
+                fields = None if stale is None else stale.get(settlement.get("katotth_id"), ())
+                if merge_osm_data(settlement, location_data, ("katotth_id", "koatuu_id", "osm_id"), fields):
+                    need__to_update = True
 
     if not need__to_update:
         return
     data_file = os.path.join("assets", "data", "settlements.json")
-    with open(data_file, 'w', encoding='utf-8') as f:
-        json.dump(settlements, f, ensure_ascii=False, indent=2)
+    save_json(settlements, data_file)
 
-def get_osm_data():
-    """Finds and adds location data for settlements based on osm_id."""
+def get_osm_data(stale=None):
+    """Finds and adds location data for settlements based on osm_id, or only for the stale ({katotth_id: fields}) ones."""
     data_file = os.path.join("assets", "data", "settlements.json")
 
-    with open(data_file, 'r', encoding='utf-8') as f:
-        settlements = json.load(f)
+    settlements = load_json(data_file)
 
-    update_settlements_locations(settlements)
+    update_settlements_locations(settlements, stale)
     logger.info("Location data fetching complete.")
 
 if __name__ == '__main__':
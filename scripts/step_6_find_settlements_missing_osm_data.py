@@ -1,9 +1,9 @@
-import json
 import os
 import time
 import logging
-from overpass import find_entities_by_propety
+from overpass import find_entities_by_propety, merge_osm_data
 from categories import is_area_type
+from json_codec import load_json, save_json
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -13,9 +13,10 @@ def chunk_list(data, chunk_size):
     for i in range(0, len(data), chunk_size):
         yield data[i:i + chunk_size]
 
-def get_settlements_list(settlements):
+def get_settlements_list(settlements, stale=None):
     """
     Find settlements by their settlement IDs using Overpass API.
+    With stale ({katotth_id: fields}) only the stale settlements are listed.
     """
     if not settlements:
         logger.warning("No settlements provided.")
@@ -23,7 +24,10 @@ def get_settlements_list(settlements):
 
     # Extract unique administrative IDs from settlements
     admin_ids = set()  # Use a set to avoid duplicates
-    admin_ids |= {settlement.get("katotth_id") for settlement in settlements if settlement.get("katotth_id") and (not settlement.get("osm_id") or not settlement.get("location")) and not is_area_type(settlement)}
+    if stale is None:
+        admin_ids |= {settlement.get("katotth_id") for settlement in settlements if settlement.get("katotth_id") and (not settlement.get("osm_id") or not settlement.get("location")) and not is_area_type(settlement)}
+    else:
+        admin_ids |= {settlement.get("katotth_id") for settlement in settlements if settlement.get("katotth_id") in stale and not is_area_type(settlement)}
 
     if not admin_ids:
         logger.warning("No administrative IDs found in settlements.")
@@ -35,7 +39,7 @@ def get_settlements_list(settlements):
     return admin_ids
 
 
-def find_osm_data(settlements):
+def find_osm_data(settlements, stale=None):
     """
     Find settlements by their administrative IDs using Overpass API.
     """
@@ -44,7 +48,7 @@ def find_osm_data(settlements):
         return []
 
     # Extract unique administrative IDs from settlements
-    admin_ids = get_settlements_list(settlements)
+    admin_ids = get_settlements_list(settlements, stale)
     total_admin_ids = len(admin_ids)
     logger.info(f"Found {total_admin_ids} unique administrative IDs.")
     regions = dict()
@@ -79,12 +83,13 @@ def find_osm_data(settlements):
 
     return regions
 
-def update_settlements_data(settlements):
+def update_settlements_data(settlements, stale=None):
     """
     Update settlements with OSM data based on katotth IDs.
     
     Args:
         settlements (list): List of settlement dictionaries.
+        stale (dict): Optional {katotth_id: fields} of a refresh, only these are queried and written.
     
     Returns:
         None
@@ -93,7 +98,7 @@ def update_settlements_data(settlements):
         logger.warning("No settlements provided.")
         return
 
-    updated_data = find_osm_data(settlements)
+    updated_data = find_osm_data(settlements, stale)
     if not updated_data:
         logger.warning("No settlements found.")
         return
@@ -103,37 +108,35 @@ def update_settlements_data(settlements):
     for settlement in settlements:
         admin_id = settlement.get("katotth_id")
         if admin_id and admin_id in updated_data:
-            location_data = updated_data[admin_id]
-            for k,v in location_data.items():
-                if k != "katotth_id" and k != "koatuu_id" and v is not None:
-                    settlement[k] = v
+            fields = None if stale is None else stale.get(admin_id, ())
+            merge_osm_data(settlement, updated_data[admin_id], ("katotth_id", "koatuu_id"), fields)
 
     save_settlements(settlements)
 
 def save_settlements(settlements):
     data_file = os.path.join("assets", "data", "settlements.json")
-    with open(data_file, 'w', encoding='utf-8') as f:
-        json.dump(settlements, f, ensure_ascii=False, indent=2)
+    save_json(settlements, data_file)
 
-def find_settlements_missing_osm_data():
-    """Finds and adds osm data for settlements based on katotth ids."""
+def find_settlements_missing_osm_data(stale=None):
+    """Finds and adds osm data for settlements based on katotth ids, or only the stale ({katotth_id: fields}) ones."""
     data_file = os.path.join("assets", "data", "settlements.json")
 
-    with open(data_file, 'r', encoding='utf-8') as f:
-        settlements = json.load(f)
+    settlements = load_json(data_file)
 
-    update_settlements_data(settlements)
+    update_settlements_data(settlements, stale)
     logger.info("OSM data fetching complete.")
 
-    find_osm_by_wikidata(settlements)
+    find_osm_by_wikidata(settlements, stale)
     logger.info("OSM data fetching complete.")
 
-def find_osm_by_wikidata(settlements):
+def find_osm_by_wikidata(settlements, stale=None):
     """ Find settlements by their wikidata IDs using Overpass API.
     """
     for settlement in settlements:
         if settlement.get("osm_id"):
             continue
+        if stale is not None and settlement.get("katotth_id") not in stale:
+            continue
         wikidata_id = settlement.get("wikidata")
         if not wikidata_id:
             continue
@@ -146,9 +149,8 @@ def find_osm_by_wikidata(settlements):
         
         # Use the first entity found
         osm = entities[0]
-        for k,v in osm.items():
-            if k != "wikidata" and k != "katotth_id" and v is not None:
-                settlement[k] = v
+        fields = None if stale is None else stale[settlement["katotth_id"]]
+        merge_osm_data(settlement, osm, ("wikidata", "katotth_id"), fields)
 
     # Save the updated settlements data
     save_settlements(settlements)
@@ -1,16 +1,17 @@
-import json
 import os
 import time
 import logging
 import requests
+from json_codec import load_json, save_json
+from hierarchy import Hierarchy
+from rollup import Rollup, log_rollup_report
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 def save_settlements(settlements):
     data_file = os.path.join("assets", "data", "settlements.json")
-    with open(data_file, 'w', encoding='utf-8') as f:
-        json.dump(settlements, f, ensure_ascii=False, indent=2)
+    save_json(settlements, data_file)
 
 def get_communities_data():
     """
@@ -128,36 +129,51 @@ def update_settlements_data(settlements, communities_data,regions_data,areas_dat
     """
     Update settlements with communities data.
     """
+    hierarchy = Hierarchy(settlements)
+    communities_by_katotth = dict()
+    for community in communities_data:
+        communities_by_katotth.setdefault(community.get("katotth"), community)
+    regions_by_id = {region.get("id"): region for region in reversed(regions_data)}
+    areas_by_id = {area.get("id"): area for area in reversed(areas_data)}
+
     regions_to_update = dict()
     for settlement in settlements:
-        for community in communities_data:
-            if settlement.get("katotth_id") == community.get("katotth"):
-                if(community.get("population")):
-                    settlement["population"] = community.get("population")
-                if(community.get("square")):
-                    settlement["square"] = community.get("square")
-                if(community.get("hromada_center")):
-                    settlement["hromada_center"] = community.get("hromada_center")
-                for region in regions_data:
-                    if region.get("id") == community.get("district_id"):
-                        regions_to_update[settlement["parent_katotth"]] = {"population": region.get("population"), "square": region.get("square")}
-                        
-                        for area in areas_data:
-                            if area.get("id") == community.get("oblast_id"):
-                                for rayon in settlements:
-                                    if(settlement["parent_katotth"] == rayon.get("katotth_id")):
-                                        regions_to_update[rayon.get("parent_katotth")] = {"population": area.get("population"), "square": area.get("square")}
-                                        break
-                                break
-                        break
-                break
+        community = communities_by_katotth.get(settlement.get("katotth_id"))
+        if not community:
+            continue
+        if(community.get("population")):
+            settlement["population"] = community.get("population")
+        if(community.get("square")):
+            settlement["square"] = community.get("square")
+        if(community.get("hromada_center")):
+            settlement["hromada_center"] = community.get("hromada_center")
+
+        region = regions_by_id.get(community.get("district_id"))
+        if not region:
+            continue
+        rayon_id = hierarchy.parent(settlement["katotth_id"])
+        regions_to_update[rayon_id] = {"population": region.get("population"), "square": region.get("square")}
+
+        area = areas_by_id.get(community.get("oblast_id"))
+        oblast_id = hierarchy.parent(rayon_id)
+        if area and oblast_id:
+            regions_to_update[oblast_id] = {"population": area.get("population"), "square": area.get("square")}
+
     for k,v in regions_to_update.items():
-        for settlement in settlements:
-            if settlement.get("katotth_id") == k:
-                if(v.get("population")):
-                    settlement["population"] = v.get("population")
-                if(v.get("square")):
-                    settlement["square"] = v.get("square")
+        settlement = hierarchy.get(k)
+        if settlement:
+            if(v.get("population")):
+                settlement["population"] = v.get("population")
+            if(v.get("square")):
+                settlement["square"] = v.get("square")
+
+    # Cross-check the API values against sums over the hierarchy and fill the gaps
+    # of units whose children are all covered.
+    rollup = Rollup(hierarchy)
+    log_rollup_report(rollup)
+    filled = rollup.fill_missing()
+    if filled:
+        logger.info(f"Filled {filled} missing population and square values from the hierarchy.")
 
     save_settlements(settlements)
     logger.info("Decentralization data added to settlements.")
@@ -198,29 +214,28 @@ def update_communities_map(communities_data, settlements):
 
     map_file = os.path.join("assets", "maps", "communities.geojson")
     
-    with open(map_file, 'r', encoding='utf-8') as f:
-        communities_map = json.load(f)
+    communities_map = load_json(map_file)
     if not communities_map:
         communities_map = {"type":"FeatureCollection", "features": []}
     map_features = communities_map.get("features", [])
-    for settlement in settlements:
-        koatth_id = settlement.get("katotth_id")
-        for community in communities_data:
-            if koatth_id and koatth_id == community.get("katotth"):
-                community["parent_katotth"] = settlement.get("parent_katotth")
-                break
+    hierarchy = Hierarchy(settlements)
+    for community in communities_data:
+        settlement = hierarchy.get(community.get("katotth"))
+        if settlement:
+            community["parent_katotth"] = settlement.get("parent_katotth")
+
+    features_by_katotth = dict()
+    for map_feature in reversed(map_features):
+        features_by_katotth[map_feature.get("properties", {}).get("katotth")] = map_feature
     for community in communities_data:
         id = community.get("id")
         katotth = community.get("katotth")
         if id and katotth:
-            community_map_feature = None
-            for map_feature in map_features:
-                if map_feature.get("properties", {}).get("katotth") == katotth:
-                    community_map_feature =  map_feature
-                    break
+            community_map_feature = features_by_katotth.get(katotth)
             if(not community_map_feature):
                 community_map_feature = get_community_map(id)
                 map_features.append(community_map_feature)
+                features_by_katotth[katotth] = community_map_feature
             community_map_feature.get("properties", {}).update(community)
             if(not community_map_feature.get("geometry")):
                 logger.warning(f"Community {community.get('name')} with KOATUU ID {katotth} has no geometry data.")
@@ -228,8 +243,7 @@ def update_communities_map(communities_data, settlements):
             
     logger.info(f"Created communities map with {len(communities_map)} entries.")
 
-    with open(map_file, 'w', encoding='utf-8') as f:
-        json.dump(communities_map, f, ensure_ascii=False, indent=2)
+    save_json(communities_map, map_file)
     logger.info(f"Communities map saved to {map_file}")
 
     return communities_map  
@@ -246,8 +260,7 @@ def update_district_maps(settlements):
     """
     try:
         map_file = os.path.join("assets", "maps", "districts.geojson")
-        with open(map_file, 'r', encoding='utf-8') as f:
-            districts_map = json.load(f)
+        districts_map = load_json(map_file)
         
         if not districts_map:
             logger.warning("No districts map found.")
@@ -257,6 +270,7 @@ def update_district_maps(settlements):
             return
 
         features = districts_map.get("features", [])
+        hierarchy = Hierarchy(settlements)
 
         for district in features:
             if(not district.get("properties")):
@@ -269,18 +283,16 @@ def update_district_maps(settlements):
                 logger.warning("District feature has no KOATUU ID.")
                 continue
 
-            for settlement in settlements:
-                if settlement.get("katotth_id") == koatth_id:
-                    district_properties["parent_katotth"] = settlement.get("parent_katotth")
-                    district_properties["name"] = f"{settlement.get('name')} район"
-                    if( settlement.get("population")):
-                        district_properties["population"] = settlement.get("population")
-                    if( settlement.get("square")):
-                        district_properties["square"] = settlement.get("square")
-                    break
+            settlement = hierarchy.get(koatth_id)
+            if settlement:
+                district_properties["parent_katotth"] = settlement.get("parent_katotth")
+                district_properties["name"] = f"{settlement.get('name')} район"
+                if( settlement.get("population")):
+                    district_properties["population"] = settlement.get("population")
+                if( settlement.get("square")):
+                    district_properties["square"] = settlement.get("square")
     
-        with open(map_file, 'w', encoding='utf-8') as f:
-            json.dump(districts_map, f, ensure_ascii=False, indent=2)
+        save_json(districts_map, map_file)
         
         logger.info(f"Districts map saved to {map_file}")
     except Exception as e:
@@ -293,8 +305,7 @@ def add_decentralization_data():
     """
     data_file = os.path.join("assets", "data", "settlements.json")
 
-    with open(data_file, 'r', encoding='utf-8') as f:
-        settlements = json.load(f)
+    settlements = load_json(data_file)
 
     communities_data = get_communities_data()
     if not communities_data:
@@ -321,13 +332,11 @@ def update_communities_features_by_prevmap(settlements):
     map_file = os.path.join("assets", "maps", "communities.geojson")
     admin3_prev_map_file = os.path.join("assets", "maps", "old_maps","ua-2021","ADMIN_3.geojson")
     
-    with open(map_file, 'r', encoding='utf-8') as f:
-        communities_map = json.load(f)
+    communities_map = load_json(map_file)
     if not communities_map:
         communities_map = {"type":"FeatureCollection", "features": []}
 
-    with open(admin3_prev_map_file, 'r', encoding='utf-8') as f:
-        admin3_prev_map = json.load(f)
+    admin3_prev_map = load_json(admin3_prev_map_file)
     if not admin3_prev_map:
         logger.error("No previous admin 3 map found.")
         return
@@ -336,7 +345,12 @@ def update_communities_features_by_prevmap(settlements):
     if(not map_features):
         logger.error("No features found in the ADMIN 3 map.")
         return
-    
+
+    hierarchy = Hierarchy(settlements)
+    features_by_katotth = dict()
+    for cmap_feature in reversed(communities_map.get("features", [])):
+        features_by_katotth[cmap_feature.get("properties", {}).get("katotth")] = cmap_feature
+
     for feature in map_features:
         if(not feature.get("properties")):
             logger.warning("Feature has no properties.")
@@ -347,26 +361,19 @@ def update_communities_features_by_prevmap(settlements):
             logger.warning(f"Feature has no katotth ID.")
             continue
 
-        community_instance = None
-        for settlement in settlements:
-            if settlement.get("katotth_id") == katotth:
-                community_instance = settlement
-                break
+        community_instance = hierarchy.get(katotth)
 
         if not community_instance:
             logger.warning(f"Settlement with katotth ID {katotth} not found in the settlements data.")
             continue
         
-        community_map_feature = None
-        for cmap_feature in communities_map.get("features", []):
-            if cmap_feature.get("properties", {}).get("katotth") == katotth:
-                community_map_feature =  cmap_feature
-                break
+        community_map_feature = features_by_katotth.get(katotth)
         
         if(not community_map_feature):
             logger.warning(f"Community with katotth ID {katotth} not found in the communities map.")
             community_map_feature = {"type":"Feature", "properties": {}, "geometry": {}}
             communities_map.get("features", []).append(community_map_feature)
+            features_by_katotth[katotth] = community_map_feature
         
         if(not community_map_feature.get("geometry")):
             community_map_feature["geometry"] = feature.get("geometry", {})
@@ -394,14 +401,12 @@ def update_communities_features_by_prevmap(settlements):
         community_map_feature.get("properties", {}).update(properties)
 
     # Save the updated community map feature
-    with open(map_file, 'w', encoding='utf-8') as f:
-        json.dump(communities_map, f, ensure_ascii=False, indent=2)
+    save_json(communities_map, map_file)
     logger.info(f"Communities map saved to {map_file}")
 
     # Save updated settlements data
     data_file = os.path.join("assets", "data", "settlements.json")
-    with open(data_file, 'w', encoding='utf-8') as f:
-        json.dump(settlements, f, ensure_ascii=False, indent=2)
+    save_json(settlements, data_file)
     logger.info(f"Settlements data saved to {data_file}")
 
 if __name__ == '__main__':
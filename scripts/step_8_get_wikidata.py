@@ -1,9 +1,11 @@
-import json
 import os
 import time
 import requests
 import logging
 from categories import is_area_type
+from json_codec import load_json, save_json
+from provenance import Provenance
+from postal_codes import normalize_postal_code
 
 qury_endpoint_url = "https://query.wikidata.org/sparql"
 sparql_headers = {'User-Agent': 'UASettlementsBot/1.0'}
@@ -224,7 +226,7 @@ def get_missing_data(settlements):
             if postal_code:
                 postal_code_value = postal_code[0].get('mainsnak', {}).get('datavalue', {}).get('value')
                 if postal_code_value:
-                    data_to_update["postal_code"] = postal_code_value
+                    data_to_update["postal_code"] = normalize_postal_code(postal_code_value)
 
             en_name = entity.get('labels', {}).get('en', {}).get('value')
             if en_name:
@@ -256,12 +258,14 @@ def get_missing_data(settlements):
         logger.info(f"Processed Wikidata IDs {procedsed_wikidata_ids } of {total_records_to_process}")
            
     
+    # Computed values (transliterated names) give way to the Wikidata ones.
+    provenance = Provenance.load()
     for settlement in settlements:
         wikidata_id = settlement.get("wikidata")
         if wikidata_id and wikidata_id in wikidata_to_update:
             data_to_update = wikidata_to_update[wikidata_id]
             for key, value in data_to_update.items():
-                if value and not settlement.get(key):
+                if value and (not settlement.get(key) or provenance.is_computed(settlement.get("katotth_id"), key)):
                     if( key == "osm_id" and value.startswith("r") and not is_area_type(settlement)):
                        continue
                     settlement[key] = value
@@ -271,21 +275,18 @@ def get_wikidata():
    
     data_file = os.path.join("assets", "data", "settlements.json")
 
-    with open(data_file, 'r', encoding='utf-8') as f:
-        settlements = json.load(f)
+    settlements = load_json(data_file)
 
     find_wikidata_ids(settlements)
     find_wikidata_id_by_koatuu(settlements)
 
-    with open(data_file, 'w', encoding='utf-8') as f:
-        json.dump(settlements, f, ensure_ascii=False, indent=2)
+    save_json(settlements, data_file)
 
     logger.info("Saved settlements with Wikidata IDs.")
 
     get_missing_data(settlements)
   
-    with open(data_file, 'w', encoding='utf-8') as f:
-        json.dump(settlements, f, ensure_ascii=False, indent=2)
+    save_json(settlements, data_file)
 
     logger.info("Saved settlements with missing data from Wikidata.")
 
@@ -0,0 +1,83 @@
+import os
+import logging
+from json_codec import load_json, save_json
+from polygon_metrics import geodesic_areas_km2, interior_points
+from rollup import parse_number, format_number, save_table
+from spatial_validation import SPATIAL_CHECKS, load_polygon_layers
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Relative difference between the computed area and the source square reported as a deviation.
+SQUARE_DEVIATION_THRESHOLD = 0.1
+
+def update_geometry_data(settlements, polygon_layers):
+    """
+    Fills computed_square for every admin record with a polygon in the maps and its
+    location (a point inside the polygon) where the record has none.
+
+    Returns the list of records whose source square deviates from the computed area.
+    """
+    records = dict()
+    for layer, _, own_categories in SPATIAL_CHECKS:
+        for settlement in settlements:
+            if settlement.get("category") in own_categories:
+                records.setdefault(layer, dict())[settlement.get("katotth_id")] = settlement
+
+    deviations = []
+    for layer, _, _ in SPATIAL_CHECKS:
+        polygon_layer = polygon_layers.get(layer)
+        if polygon_layer is None or len(polygon_layer) == 0:
+            continue
+        areas = geodesic_areas_km2(polygon_layer)
+        points = interior_points(polygon_layer)
+        located = 0
+        measured = 0
+        for row, feature_id in enumerate(polygon_layer.ids):
+            settlement = records.get(layer, {}).get(feature_id)
+            if settlement is None:
+                continue
+            measured += 1
+            settlement["computed_square"] = format_number("square", round(float(areas[row]), 1))
+            if not settlement.get("location"):
+                settlement["location"] = [round(float(points[row][0]), 7), round(float(points[row][1]), 7)]
+                located += 1
+
+            square = parse_number(settlement.get("square"))
+            if square and abs(areas[row] - square) / square > SQUARE_DEVIATION_THRESHOLD:
+                deviations.append({
+                    "katotth_id": feature_id,
+                    "name": settlement.get("name"),
+                    "category": settlement.get("category"),
+                    "square": settlement.get("square"),
+                    "computed_square": settlement["computed_square"],
+                    "deviation": round((areas[row] - square) / square, 3),
+                })
+        logger.info(f"{layer}: computed area for {measured} records, filled {located} missing locations.")
+
+    for deviation in deviations:
+        logger.warning(
+            f"{deviation['category']} {deviation['katotth_id']} - {deviation['name']}: square {deviation['square']} "
+            f"differs from the computed {deviation['computed_square']} by {100 * deviation['deviation']:.1f}%"
+        )
+    return deviations
+
+def add_geometry_data():
+    """
+    Add computed areas and locations of oblasts, districts and hromadas from the maps.
+    """
+    data_file = os.path.join("assets", "data", "settlements.json")
+    report_file = os.path.join("assets", "data", "square_deviations.csv")
+
+    settlements = load_json(data_file)
+    deviations = update_geometry_data(settlements, load_polygon_layers())
+    logger.info(f"{len(deviations)} square deviations over {100 * SQUARE_DEVIATION_THRESHOLD:.0f}%.")
+    if deviations:
+        save_table(deviations, report_file)
+        logger.info(f"Square deviations report saved to {report_file}")
+
+    save_json(settlements, data_file)
+    logger.info(f"Settlements data saved to {data_file}")
+
+if __name__ == '__main__':
+    add_geometry_data()
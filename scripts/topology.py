@@ -0,0 +1,287 @@
+import numpy as np
+from geometry import geometry_rings
+
+DEFAULT_QUANTIZATION = 1_000_000
+
+
+class Topology:
+    """
+    TopoJSON-style topology of a polygon (or border line) layer.
+
+    Coordinates are quantized to an integer grid, rings and lines are cut into arcs at
+    junctions (vertices where the neighbours differ between paths) and every arc is stored once,
+    so a border shared by two features is the same arc for both and stays consistent
+    when arcs are simplified.
+    """
+
+    def __init__(self, features, key=None, quantization=DEFAULT_QUANTIZATION):
+        self.quantization = quantization
+        self.ids = []
+        self.properties = []
+        shapes = []
+        for feature in features:
+            geometry = feature.get("geometry")
+            if geometry and geometry.get("type") in ("LineString", "MultiLineString"):
+                shape = ("lines", geometry_lines(geometry))
+            else:
+                shape = ("polygons", geometry_rings(geometry))
+            if not shape[1]:
+                continue
+            properties = feature.get("properties") or {}
+            self.ids.append(properties.get(key) if key else None)
+            self.properties.append(properties)
+            shapes.append(shape)
+
+        coordinates = [part for kind, parts in shapes for part in (parts if kind == "lines" else [ring for polygon in parts for ring in polygon])]
+        points = np.vstack(coordinates) if coordinates else np.zeros((1, 2))
+        self.translate = points.min(axis=0)
+        extent = np.maximum(points.max(axis=0) - self.translate, 1e-9)
+        self.scale = extent / (quantization - 1)
+
+        paths = []
+        closed = []
+        self.geometries = []
+        for kind, parts in shapes:
+            if kind == "lines":
+                geometry = []
+                for line in parts:
+                    quantized = self._quantize_path(line, closed=False)
+                    if quantized is not None:
+                        geometry.append(len(paths))
+                        paths.append(quantized)
+                        closed.append(False)
+            else:
+                geometry = []
+                for polygon in parts:
+                    polygon_rings = []
+                    for ring in polygon:
+                        quantized = self._quantize_path(ring, closed=True)
+                        if quantized is not None:
+                            polygon_rings.append(len(paths))
+                            paths.append(quantized)
+                            closed.append(True)
+                    if polygon_rings:
+                        geometry.append(polygon_rings)
+            self.geometries.append((kind, geometry))
+
+        self.arcs = []
+        path_arcs = self._cut_paths(paths, np.array(closed, dtype=bool))
+        self.geometries = [
+            (kind, [path_arcs[line] for line in geometry] if kind == "lines" else [[path_arcs[ring] for ring in polygon] for polygon in geometry])
+            for kind, geometry in self.geometries
+        ]
+
+    def _quantize_path(self, path, closed):
+        """
+        Quantizes a ring or a line and drops repeated points. Rings are returned open
+        (without the closing point). Returns None if the path collapses.
+        """
+        quantized = np.round((path - self.translate) / self.scale).astype(np.int64)
+        keep = np.ones(len(quantized), dtype=bool)
+        keep[1:] = np.any(quantized[1:] != quantized[:-1], axis=1)
+        quantized = quantized[keep]
+        if not closed:
+            return quantized if len(quantized) >= 2 else None
+        if len(quantized) > 1 and np.array_equal(quantized[0], quantized[-1]):
+            quantized = quantized[:-1]
+        return quantized if len(quantized) >= 3 else None
+
+    def _cut_paths(self, paths, closed):
+        """Cuts open rings and lines into shared arcs, returns the arc references of every path."""
+        if not paths:
+            return []
+        lengths = np.array([len(path) for path in paths])
+        starts = np.cumsum(lengths) - lengths
+        vertices = np.vstack(paths)
+        keys = vertices[:, 0] * (self.quantization + 1) + vertices[:, 1]
+
+        index = np.arange(len(vertices))
+        path_starts = np.repeat(starts, lengths)
+        path_ends = path_starts + np.repeat(lengths, lengths) - 1
+        path_closed = np.repeat(closed, lengths)
+        previous_keys = keys[np.where(index == path_starts, path_ends, index - 1)]
+        next_keys = keys[np.where(index == path_ends, path_starts, index + 1)]
+        # Line ends have a single neighbour.
+        previous_keys[(index == path_starts) & ~path_closed] = -1
+        next_keys[(index == path_ends) & ~path_closed] = -1
+
+        # A vertex is a junction when it is reached from different neighbour pairs.
+        neighbours = np.stack([keys, np.minimum(previous_keys, next_keys), np.maximum(previous_keys, next_keys)], axis=1)
+        unique_neighbours = np.unique(neighbours, axis=0)
+        unique_keys, counts = np.unique(unique_neighbours[:, 0], return_counts=True)
+        is_junction = np.isin(keys, unique_keys[counts > 1])
+        is_junction[~path_closed & ((index == path_starts) | (index == path_ends))] = True
+
+        arc_index = dict()
+        path_arcs = []
+        for path, start, length, path_is_closed in zip(paths, starts, lengths, closed):
+            junctions = np.nonzero(is_junction[start:start + length])[0]
+            if not path_is_closed:
+                path_arcs.append([self._add_arc(path[cut:next_cut + 1], arc_index) for cut, next_cut in zip(junctions[:-1], junctions[1:])])
+                continue
+
+            if len(junctions) == 0:
+                # A ring without junctions is one closed arc, rotated to a canonical start
+                # so that the same ring of two features (an enclave and its hole) is found.
+                path_keys = keys[start:start + length]
+                first = int(np.argmin(path_keys))
+                rotated = np.roll(path, -first, axis=0)
+                reverse = path_keys[(first + 1) % length] > path_keys[first - 1]
+                if reverse:
+                    rotated = np.roll(rotated[::-1], 1, axis=0)
+                reference = self._add_arc(np.vstack([rotated, rotated[:1]]), arc_index)
+                path_arcs.append([~reference if reverse else reference])
+                continue
+
+            rotated = np.roll(path, -junctions[0], axis=0)
+            rotated = np.vstack([rotated, rotated[:1]])
+            cuts = np.append(junctions - junctions[0], length)
+            path_arcs.append([self._add_arc(rotated[cut:next_cut + 1], arc_index) for cut, next_cut in zip(cuts[:-1], cuts[1:])])
+        return path_arcs
+
+    def _add_arc(self, arc, arc_index):
+        """Returns the reference of an arc, ~index when the arc is stored reversed."""
+        forward = arc.tobytes()
+        if forward in arc_index:
+            return arc_index[forward]
+        backward = arc[::-1].tobytes()
+        if backward in arc_index:
+            return ~arc_index[backward]
+        arc_index[forward] = len(self.arcs)
+        self.arcs.append(arc)
+        return len(self.arcs) - 1
+
+    def vertex_count(self):
+        return sum(len(arc) for arc in self.arcs)
+
+    def importance(self):
+        """
+        Douglas-Peucker importance of every arc vertex in degrees (of latitude), the
+        largest tolerance at which the vertex survives simplification. Arc ends are
+        never dropped, closed arcs keep at least two inner vertices.
+
+        All arcs are simplified together: every pass splits all open segments at
+        their farthest vertex, so the number of passes is the depth of the recursion.
+        """
+        if not self.arcs:
+            return []
+        lengths = np.array([len(arc) for arc in self.arcs], dtype=np.int64)
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+        points = np.vstack(self.arcs).astype(np.float64) * self.scale + self.translate
+        points[:, 0] *= np.cos(np.radians(points[:, 1].mean()))
+
+        importance = np.zeros(len(points))
+        importance[offsets[:-1]] = np.inf
+        importance[offsets[1:] - 1] = np.inf
+        segment_starts = offsets[:-1][lengths > 2]
+        segment_ends = offsets[1:][lengths > 2] - 1
+        segment_bounds = np.full(len(segment_starts), np.inf)
+        while len(segment_starts):
+            counts = segment_ends - segment_starts - 1
+            segment = np.repeat(np.arange(len(segment_starts)), counts)
+            inner = np.arange(len(segment)) - np.repeat(np.cumsum(counts) - counts, counts) + segment_starts[segment] + 1
+            distances = _segment_distances(points[inner], points[segment_starts[segment]], points[segment_ends[segment]])
+
+            # Farthest inner vertex of every segment.
+            order = np.lexsort((-distances, segment))
+            first = np.concatenate([[True], segment[order][1:] != segment[order][:-1]])
+            farthest = inner[order][first]
+            importance[farthest] = np.minimum(distances[order][first], segment_bounds)
+
+            bounds = importance[farthest]
+            segment_starts, segment_ends, segment_bounds = (
+                np.concatenate([segment_starts, farthest]),
+                np.concatenate([farthest, segment_ends]),
+                np.concatenate([bounds, bounds]),
+            )
+            open_segments = segment_ends - segment_starts > 1
+            segment_starts, segment_ends, segment_bounds = segment_starts[open_segments], segment_ends[open_segments], segment_bounds[open_segments]
+
+        for arc, (start, end) in enumerate(zip(offsets[:-1], offsets[1:])):
+            if end - start > 3 and np.array_equal(self.arcs[arc][0], self.arcs[arc][-1]):
+                kept = start + 1 + np.argsort(importance[start + 1:end - 1])[-2:]
+                importance[kept] = np.inf
+        return [importance[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+    def to_topojson(self, name, tolerance=0.0, importance=None, step=None):
+        """
+        Returns a TopoJSON topology with one GeometryCollection object.
+
+        Vertices less important than the tolerance are dropped and coordinates are
+        requantized to a grid of step degrees (tolerance / 2 by default), arcs are delta encoded.
+        """
+        if importance is None:
+            importance = self.importance()
+        step = step or (tolerance / 2 if tolerance > 0 else None)
+        scale = np.array([step, step]) if step else self.scale
+        arcs = []
+        for arc, arc_importance in zip(self.arcs, importance):
+            arc = arc[arc_importance >= tolerance] if tolerance > 0 else arc
+            arc = np.round((arc * self.scale) / scale).astype(np.int64)
+            keep = np.ones(len(arc), dtype=bool)
+            keep[1:] = np.any(arc[1:] != arc[:-1], axis=1)
+            keep[-1] = True
+            arc = arc[keep]
+            arcs.append(np.vstack([arc[:1], np.diff(arc, axis=0)]).tolist())
+
+        geometries = []
+        for feature_id, properties, (kind, geometry) in zip(self.ids, self.properties, self.geometries):
+            if kind == "lines":
+                topo_geometry = {"type": "LineString", "arcs": geometry[0]} if len(geometry) == 1 else {"type": "MultiLineString", "arcs": geometry}
+            else:
+                topo_geometry = {"type": "Polygon", "arcs": geometry[0]} if len(geometry) == 1 else {"type": "MultiPolygon", "arcs": geometry}
+            if feature_id is not None:
+                topo_geometry["id"] = feature_id
+            topo_geometry["properties"] = properties
+            geometries.append(topo_geometry)
+
+        return {
+            "type": "Topology",
+            "transform": {"scale": scale.tolist(), "translate": self.translate.tolist()},
+            "objects": {name: {"type": "GeometryCollection", "geometries": geometries}},
+            "arcs": arcs,
+        }
+
+
+def geometry_lines(geometry):
+    """Returns the lines of a GeoJSON LineString or MultiLineString as (n, 2) float arrays."""
+    coordinates = geometry.get("coordinates") or []
+    lines = [coordinates] if geometry.get("type") == "LineString" else coordinates
+    return [np.asarray(line, dtype=np.float64)[:, :2] for line in lines if len(line) >= 2]
+
+def _segment_distances(points, starts, ends):
+    """Distance from every point to the segment between its start and end."""
+    direction = ends - starts
+    length = (direction ** 2).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.clip(((points - starts) * direction).sum(axis=1) / length, 0, 1)
+    t = np.where(length > 0, t, 0)
+    return np.hypot(*(starts + t[:, None] * direction - points).T)
+
+def decode_arcs(topology):
+    """Decodes the delta encoded arcs of a TopoJSON topology to lists of lon/lat."""
+    scale = np.array(topology["transform"]["scale"])
+    translate = np.array(topology["transform"]["translate"])
+    return [np.cumsum(np.array(arc, dtype=np.float64).reshape(-1, 2), axis=0) * scale + translate for arc in topology["arcs"]]
+
+def topojson_to_geojson(topology, name, precision=6):
+    """Converts a TopoJSON object back to a GeoJSON FeatureCollection with rounded coordinates."""
+    arcs = decode_arcs(topology)
+
+    def path_coordinates(references):
+        points = []
+        for reference in references:
+            arc = arcs[reference] if reference >= 0 else arcs[~reference][::-1]
+            points.extend(arc[1:] if points else arc)
+        return np.round(np.array(points), precision).tolist()
+
+    features = []
+    for geometry in topology["objects"][name]["geometries"]:
+        if geometry["type"] == "LineString":
+            coordinates = path_coordinates(geometry["arcs"])
+        elif geometry["type"] in ("Polygon", "MultiLineString"):
+            coordinates = [path_coordinates(path) for path in geometry["arcs"]]
+        else:
+            coordinates = [[path_coordinates(ring) for ring in polygon] for polygon in geometry["arcs"]]
+        features.append({"type": "Feature", "properties": geometry.get("properties", {}), "geometry": {"type": geometry["type"], "coordinates": coordinates}})
+    return {"type": "FeatureCollection", "name": name, "features": features}
@@ -0,0 +1,104 @@
+import numpy as np
+
+# Ukrainian romanization of the Cabinet of Ministers resolution No. 55 of 27.01.2010.
+LETTERS = {
+    "а": "a", "б": "b", "в": "v", "г": "h", "ґ": "g", "д": "d", "е": "e", "є": "ie", "ж": "zh",
+    "з": "z", "и": "y", "і": "i", "ї": "i", "й": "i", "к": "k", "л": "l", "м": "m", "н": "n",
+    "о": "o", "п": "p", "р": "r", "с": "s", "т": "t", "у": "u", "ф": "f", "х": "kh", "ц": "ts",
+    "ч": "ch", "ш": "sh", "щ": "shch", "ь": "", "ю": "iu", "я": "ia",
+}
+# Є, Ї, Й, Ю, Я at the start of a word.
+INITIAL_LETTERS = {"є": "ye", "ї": "yi", "й": "y", "ю": "yu", "я": "ya"}
+# Г after З is written "gh", so "зг" is not read as "ж".
+AFTER_Z_LETTERS = {"г": "gh"}
+# Apostrophes are not transliterated and do not start a word.
+APOSTROPHES = "'’ʼ`"
+
+# Lookup tables cover the code points below TABLE_SIZE (Latin, Cyrillic), other characters are kept.
+TABLE_SIZE = 0x500
+MAX_OUTPUT = 4
+NORMAL, INITIAL, AFTER_Z = 0, 1, 2
+LOWER, TITLE, UPPER = 0, 1, 2
+
+
+def _build_tables():
+    """
+    Output code points by [variant, case, code point], padded with zeros, and per code
+    point word and upper case flags.
+    """
+    output = np.zeros((3, 3, TABLE_SIZE, MAX_OUTPUT), dtype=np.uint32)
+    output[:, :, :, 0] = np.arange(TABLE_SIZE)
+    word = np.array([chr(code).isalpha() for code in range(TABLE_SIZE)])
+    upper = np.array([chr(code).isupper() for code in range(TABLE_SIZE)])
+    for variant, letters in ((NORMAL, LETTERS), (INITIAL, {**LETTERS, **INITIAL_LETTERS}), (AFTER_Z, {**LETTERS, **AFTER_Z_LETTERS})):
+        for letter, value in letters.items():
+            for source, case, text in (
+                (letter, LOWER, value),
+                (letter.upper(), TITLE, value[:1].upper() + value[1:]),
+                (letter.upper(), UPPER, value.upper()),
+            ):
+                code = ord(source)
+                for other_case in ((LOWER, TITLE, UPPER) if source == letter else (case,)):
+                    output[variant, other_case, code] = 0
+                    output[variant, other_case, code, :len(text)] = [ord(char) for char in text]
+    for apostrophe in APOSTROPHES:
+        if ord(apostrophe) < TABLE_SIZE:
+            output[:, :, ord(apostrophe)] = 0
+            word[ord(apostrophe)] = True
+    return output, word, upper
+
+_OUTPUT, _WORD, _UPPER = _build_tables()
+# Flat view indexed by (variant * 3 + case) * TABLE_SIZE + code point.
+_FLAT_OUTPUT = _OUTPUT.reshape(-1, MAX_OUTPUT)
+_INITIAL_CODES = np.zeros(TABLE_SIZE, dtype=bool)
+_INITIAL_CODES[[ord(char) for letter in INITIAL_LETTERS for char in (letter, letter.upper())]] = True
+_AFTER_Z_CODES = np.zeros(TABLE_SIZE, dtype=bool)
+_AFTER_Z_CODES[[ord(char) for letter in AFTER_Z_LETTERS for char in (letter, letter.upper())]] = True
+_Z_CODES = np.zeros(TABLE_SIZE, dtype=bool)
+_Z_CODES[[ord("з"), ord("З")]] = True
+
+
+def _shift(flags, step):
+    """flags of the previous (step 1) or next (step -1) character, False past the ends."""
+    shifted = np.zeros_like(flags)
+    if step > 0:
+        shifted[step:] = flags[:-step]
+    else:
+        shifted[:step] = flags[-step:]
+    return shifted
+
+def transliterate_many(texts, separator="\n"):
+    """
+    Romanizes Ukrainian texts. Latin letters, digits and punctuation are kept as they are.
+
+    All texts are joined and mapped at once through lookup tables by code point. The
+    table variant depends on the previous character (start of a word, after З) and the
+    case on the neighbours: a capital next to another capital is in an all-caps word and
+    gives "SHCH", otherwise "Shch". Unused output slots are zeros and dropped before
+    decoding (so are NUL characters of the input). When a text contains the separator,
+    the texts are joined with an unused private-use character instead.
+    """
+    texts = list(texts)
+    if not texts:
+        return []
+    if any(separator in text for text in texts):
+        separator = next(chr(code) for code in range(0xE000, 0xF900) if not any(chr(code) in text for text in texts))
+    codes = np.frombuffer(separator.join(texts).encode("utf-32-le"), dtype=np.uint32).astype(np.int32)
+    codes[codes == ord("’")] = ord("'")
+    small = codes < TABLE_SIZE
+    table_codes = np.where(small, codes, 0)
+
+    word = _WORD[table_codes] & small
+    variant = np.where(~_shift(word, 1) & _INITIAL_CODES[table_codes], INITIAL, NORMAL)
+    variant = np.where(_shift(_Z_CODES[table_codes], 1) & _AFTER_Z_CODES[table_codes], AFTER_Z, variant)
+    upper = _UPPER[table_codes] & small
+    case = np.where(upper, np.where(_shift(upper, 1) | _shift(upper, -1), UPPER, TITLE), LOWER)
+
+    output = np.take(_FLAT_OUTPUT, (variant * 3 + case) * TABLE_SIZE + table_codes, axis=0)
+    output[~small, 0] = codes[~small]
+    output = output.ravel()
+    return output.compress(output != 0).tobytes().decode("utf-32-le").split(separator)
+
+def transliterate(text):
+    """Romanizes a single Ukrainian text, see transliterate_many."""
+    return transliterate_many([text])[0] if text else text
@@ -0,0 +1,303 @@
+import os
+import zlib
+import time
+import logging
+import numpy as np
+from collections import Counter
+from datetime import datetime, timezone
+from json_codec import dumps_json, load_json, save_json
+from hierarchy import Hierarchy
+from array_store import save_arrays, load_arrays
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+REPORT_FILE = os.path.join("assets", "data", "validation_report.json")
+STATE_FILE = os.path.join("assets", "data", "validation_state.npz")
+
+SEVERITIES = ("error", "warning", "info")
+# Rule scopes: "record" rules check one settlement at a time, "batch" rules a list of
+# settlements at once (vectorized checks), "dataset" rules need all settlements.
+SCOPES = ("record", "batch", "dataset")
+
+
+class Rule:
+    """
+    A validation rule and the settlement fields its result depends on.
+
+    A record rule returns a message or None for a settlement, batch and dataset rules
+    yield (katotth_id, message) pairs. categories limits a rule to settlements of those
+    categories, ancestors marks rules that also depend on the parents of a settlement,
+    resources are the paths of the files a rule reads besides the settlements.
+    """
+
+    def __init__(self, name, check, fields, severity="warning", scope="record", categories=None, ancestors=False, resources=()):
+        if severity not in SEVERITIES or scope not in SCOPES:
+            raise ValueError(f"Rule {name}: unknown severity {severity} or scope {scope}")
+        self.name = name
+        self.check = check
+        self.categories = set(categories) if categories else None
+        # Whether a rule applies depends on the category too.
+        self.fields = frozenset(fields) | ({"category"} if categories else frozenset())
+        self.severity = severity
+        self.scope = scope
+        self.ancestors = ancestors
+        self.resources = tuple(resources)
+
+    def applies(self, settlement):
+        return self.categories is None or settlement.get("category") in self.categories
+
+    def resource_version(self):
+        """Size and modification time of every resource file, the rule checks everything again when it changes."""
+        versions = []
+        for path in self.resources:
+            stat = os.stat(path) if os.path.exists(path) else None
+            versions.append(f"{path}:{stat.st_size}:{stat.st_mtime_ns}" if stat else f"{path}:missing")
+        return ";".join(versions)
+
+
+class RuleRegistry:
+    """Named rules, added with the register decorator."""
+
+    def __init__(self):
+        self.rules = dict()
+
+    def register(self, name, fields, severity="warning", scope="record", categories=None, ancestors=False, resources=()):
+        def decorator(check):
+            if name in self.rules:
+                raise ValueError(f"Rule {name} is already registered")
+            self.rules[name] = Rule(name, check, fields, severity, scope, categories, ancestors, resources)
+            return check
+        return decorator
+
+    def __iter__(self):
+        return iter(self.rules.values())
+
+    def fields(self):
+        """Sorted union of the fields of all rules, parent_katotth included for the ancestor rules."""
+        fields = set().union(*(rule.fields for rule in self)) if self.rules else set()
+        return tuple(sorted(fields | {"parent_katotth"}))
+
+    def signature(self):
+        """Rules and their dependencies, a saved state is only reused for the same signature."""
+        return dumps_json([[rule.name, sorted(rule.fields), rule.scope, sorted(rule.categories or ()), rule.ancestors, list(rule.resources)] for rule in self], pretty=False).decode("utf-8")
+
+
+class ValidationContext:
+    """The settlements being validated and resources shared by the rules, loaded on first use."""
+
+    def __init__(self, settlements):
+        self.settlements = settlements
+        self.by_id = {settlement.get("katotth_id"): settlement for settlement in settlements if settlement.get("katotth_id")}
+        self._resources = dict()
+
+    def resource(self, name, load):
+        if name not in self._resources:
+            self._resources[name] = load()
+        return self._resources[name]
+
+    @property
+    def hierarchy(self):
+        return self.resource("hierarchy", lambda: Hierarchy(self.settlements))
+
+
+def _digest(value):
+    return zlib.crc32(dumps_json(value, pretty=False))
+
+def _oblast_id(settlement):
+    if settlement.get("category") in ("O", "K"):
+        return settlement.get("katotth_id")
+    return settlement.get("oblast_id")
+
+def _issue(rule, katotth_id, message, settlement):
+    settlement = settlement or dict()
+    return {
+        "rule": rule.name,
+        "severity": rule.severity,
+        "katotth_id": katotth_id,
+        "name": settlement.get("name"),
+        "category": settlement.get("category"),
+        "oblast_id": _oblast_id(settlement),
+        "message": message,
+    }
+
+
+class ValidationState:
+    """Digests of the rule fields of every record at the last validation, saved as .npz."""
+
+    ARRAYS = ("ids", "record_digests", "field_digests", "fields", "signature")
+
+    def __init__(self, **arrays):
+        for name in self.ARRAYS:
+            setattr(self, name, arrays[name])
+        self.rows = {katotth_id: row for row, katotth_id in enumerate(self.ids.tolist())}
+
+    @classmethod
+    def build(cls, ids, record_digests, field_digests, fields, signature):
+        return cls(
+            ids=np.array(ids, dtype=str),
+            record_digests=np.array(record_digests, dtype=np.uint32),
+            field_digests=np.array(field_digests, dtype=np.uint32).reshape(len(ids), len(fields)),
+            fields=np.array(fields, dtype=str),
+            signature=np.array(signature),
+        )
+
+    def save(self, path=STATE_FILE):
+        save_arrays(path, {name: getattr(self, name) for name in self.ARRAYS})
+
+    @classmethod
+    def load(cls, path=STATE_FILE):
+        return cls(**load_arrays(path, cls.ARRAYS))
+
+
+def changed_fields(settlements, fields, state):
+    """
+    Changed rule fields of every new or modified record ({katotth_id: set of fields}),
+    the removed katotth_ids and the new state arrays. Without a state every record is new.
+    """
+    ids, record_digests, field_digests = [], [], []
+    changed = dict()
+    all_fields = set(fields)
+    for settlement in settlements:
+        katotth_id = settlement.get("katotth_id")
+        if not katotth_id:
+            continue
+        values = [settlement.get(field) for field in fields]
+        digest = _digest(values)
+        row = state.rows.get(katotth_id) if state is not None else None
+        if row is not None and digest == state.record_digests[row]:
+            digests = state.field_digests[row]
+        else:
+            # Field digests are computed only for records whose record digest differs.
+            digests = [_digest(value) for value in values]
+            changed[katotth_id] = all_fields if row is None else {
+                field for field, new, old in zip(fields, digests, state.field_digests[row].tolist()) if new != old
+            }
+        ids.append(katotth_id)
+        record_digests.append(digest)
+        field_digests.append(digests)
+    removed = set(state.rows) - set(ids) if state is not None else set()
+    return changed, removed, (ids, record_digests, field_digests)
+
+
+def validate(settlements, registry, previous_report=None, state=None):
+    """
+    Runs the rules of a registry and returns (report, state).
+
+    With the report and state of an earlier run, record and batch rules only check the
+    records whose fields they depend on changed (and the descendants of re-parented or
+    removed records for ancestor rules); dataset rules run again if any of their fields
+    changed. Rules whose resource files changed check every record again. Issues of the
+    other records are carried over from the earlier report, with the current name,
+    category and oblast of their record.
+    """
+    start_time = time.time()
+    settlements = list(settlements)
+    fields = registry.fields()
+    signature = registry.signature()
+    if state is not None and (state.fields.tolist() != list(fields) or str(state.signature) != signature or previous_report is None):
+        state = None
+    changed, removed, arrays = changed_fields(settlements, fields, state)
+    context = ValidationContext(settlements)
+
+    # Records under a removed or re-parented record have new ancestors.
+    moved = {katotth_id for katotth_id, changed_set in changed.items() if "parent_katotth" in changed_set}
+    if removed:
+        moved.update(katotth_id for katotth_id, settlement in context.by_id.items() if settlement.get("parent_katotth") in removed)
+    moved_subtrees = set()
+    if state is not None:
+        for katotth_id in moved:
+            moved_subtrees.update(context.hierarchy.subtree(katotth_id))
+
+    resources = {rule.name: rule.resource_version() for rule in registry if rule.resources}
+    previous_resources = previous_report.get("resources", {}) if state is not None else {}
+    issues = []
+    checked = Counter()
+    previous_issues = previous_report.get("issues", []) if state is not None else []
+    for rule in registry:
+        stale = state is None or resources.get(rule.name) != previous_resources.get(rule.name)
+        rule_issues = [
+            _issue(rule, issue["katotth_id"], issue["message"], context.by_id.get(issue["katotth_id"]))
+            for issue in previous_issues if issue["rule"] == rule.name and issue["katotth_id"] not in removed
+        ]
+        if rule.scope == "dataset":
+            if stale or removed or any(changed_set & rule.fields for changed_set in changed.values()):
+                rule_issues = [_issue(rule, katotth_id, message, context.by_id.get(katotth_id)) for katotth_id, message in rule.check(settlements, context)]
+                checked[rule.name] = len(settlements)
+            issues.extend(rule_issues)
+            continue
+
+        if stale:
+            dirty = set(context.by_id)
+        else:
+            dirty = {katotth_id for katotth_id, changed_set in changed.items() if changed_set & rule.fields}
+        if rule.ancestors:
+            dirty |= moved_subtrees
+        dirty &= context.by_id.keys()
+        rule_issues = [issue for issue in rule_issues if issue["katotth_id"] not in dirty]
+        records = [context.by_id[katotth_id] for katotth_id in dirty if rule.applies(context.by_id[katotth_id])]
+        if rule.scope == "record":
+            for settlement in records:
+                message = rule.check(settlement, context)
+                if message:
+                    rule_issues.append(_issue(rule, settlement["katotth_id"], message, settlement))
+        elif records:
+            rule_issues.extend(_issue(rule, katotth_id, message, context.by_id.get(katotth_id)) for katotth_id, message in rule.check(records, context))
+        checked[rule.name] = len(records)
+        issues.extend(rule_issues)
+
+    report = {
+        "generated": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        "records": len(context.by_id),
+        "incremental": state is not None,
+        "changed_records": len(changed),
+        "removed_records": len(removed),
+        "checked": dict(checked),
+        "resources": resources,
+        "seconds": round(time.time() - start_time, 3),
+        "summary": summarize(issues, registry),
+        "issues": issues,
+    }
+    return report, ValidationState.build(*arrays, fields, signature)
+
+def summarize(issues, registry):
+    """Issue counts of every rule, in total and by category and oblast."""
+    summary = {
+        rule.name: {"severity": rule.severity, "scope": rule.scope, "fields": sorted(rule.fields), "count": 0, "by_category": Counter(), "by_oblast": Counter()}
+        for rule in registry
+    }
+    for issue in issues:
+        rule_summary = summary[issue["rule"]]
+        rule_summary["count"] += 1
+        rule_summary["by_category"][issue["category"] or ""] += 1
+        rule_summary["by_oblast"][issue["oblast_id"] or ""] += 1
+    for rule_summary in summary.values():
+        rule_summary["by_category"] = dict(sorted(rule_summary["by_category"].items()))
+        rule_summary["by_oblast"] = dict(sorted(rule_summary["by_oblast"].items()))
+    return summary
+
+def run_validation(registry, data_file=os.path.join("assets", "data", "settlements.json"), report_file=REPORT_FILE, state_file=STATE_FILE, full=False):
+    """
+    Validates settlements.json, incrementally when a report and state of an earlier run
+    exist (full=True checks everything again), and saves the report and the state.
+    """
+    previous_report = state = None
+    if not full and os.path.exists(report_file) and os.path.exists(state_file):
+        previous_report = load_json(report_file)
+        state = ValidationState.load(state_file)
+    report, state = validate(load_json(data_file), registry, previous_report, state)
+    save_json(report, report_file, pretty=False)
+    state.save(state_file)
+    mode = f"incremental, {report['changed_records']} changed and {report['removed_records']} removed records" if report["incremental"] else "full"
+    logger.info(f"Validation ({mode}) took {report['seconds']:.2f} seconds, report saved to {report_file}")
+    return report
+
+def log_report(report):
+    """Logs the issue counts of every rule, errors first."""
+    order = {severity: position for position, severity in enumerate(SEVERITIES)}
+    for name, rule_summary in sorted(report["summary"].items(), key=lambda item: (order[item[1]["severity"]], item[0])):
+        if not rule_summary["count"]:
+            continue
+        categories = ", ".join(f"{category or '-'}: {count}" for category, count in rule_summary["by_category"].items())
+        log = logger.error if rule_summary["severity"] == "error" else logger.warning if rule_summary["severity"] == "warning" else logger.info
+        log(f"{name}: {rule_summary['count']} ({categories})")